@@ -0,0 +1,51 @@
+"""Add transcript_segments full-text search index
+
+Revision ID: 040
+Revises: 039
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "040"
+down_revision = "039"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcript_segments",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column("recording_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(length=26), nullable=False),
+        sa.Column("segment_index", sa.Integer(), nullable=False),
+        sa.Column("start_time", sa.Float(), nullable=False),
+        sa.Column("end_time", sa.Float(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("ts_config", sa.String(length=32), nullable=False, server_default="simple"),
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=False),
+        sa.ForeignKeyConstraint(["recording_id"], ["recordings.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_transcript_segments_user_id", "transcript_segments", ["user_id"])
+    op.create_index(
+        "ix_transcript_segments_recording_segment", "transcript_segments", ["recording_id", "segment_index"]
+    )
+    op.create_index(
+        "ix_transcript_segments_search_vector",
+        "transcript_segments",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transcript_segments_search_vector", table_name="transcript_segments")
+    op.drop_index("ix_transcript_segments_recording_segment", table_name="transcript_segments")
+    op.drop_index("ix_transcript_segments_user_id", table_name="transcript_segments")
+    op.drop_table("transcript_segments")
@@ -0,0 +1,46 @@
+"""Add transcription_cache for content-hash keyed ASR results
+
+Revision ID: 041
+Revises: 040
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "041"
+down_revision = "040"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcription_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("user_id", sa.String(length=26), nullable=False),
+        sa.Column("source_recording_id", sa.Integer(), nullable=True),
+        sa.Column("audio_sha256", sa.String(length=64), nullable=False),
+        sa.Column("language", sa.String(length=16), nullable=True),
+        sa.Column("speech_model", sa.String(length=64), nullable=False),
+        sa.Column("keyterms_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("result", postgresql.JSONB(), nullable=False),
+        sa.Column("words_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_hit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["source_recording_id"], ["recordings.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index("ix_transcription_cache_user_id", "transcription_cache", ["user_id"])
+    op.create_index("ix_transcription_cache_audio_sha256", "transcription_cache", ["audio_sha256"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transcription_cache_audio_sha256", table_name="transcription_cache")
+    op.drop_index("ix_transcription_cache_user_id", table_name="transcription_cache")
+    op.drop_table("transcription_cache")
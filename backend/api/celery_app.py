@@ -15,11 +15,15 @@ from celery import Celery  # noqa: E402
 from celery.signals import (  # noqa: E402
     after_setup_logger,
     before_task_publish,
+    celeryd_after_setup,
     task_failure,
     task_postrun,
     task_prerun,
     task_retry,
+    worker_init,
     worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
 )
 
 
@@ -132,6 +136,7 @@ from contextlib import ExitStack  # noqa: E402
 
 from config.settings import get_settings  # noqa: E402
 from logger import get_logger, setup_logger, short_task_id, short_user_id  # noqa: E402
+from utils.worker_loop import shutdown_worker_loops, start_worker_loop  # noqa: E402
 
 settings = get_settings()
 database_url = settings.database.sync_url
@@ -170,21 +175,36 @@ celery_app.conf.update(
     beat_dburi=database_url,
 )
 
-celery_app.conf.task_routes = {
-    "api.tasks.processing.trim_video": {"queue": "processing_cpu"},
-    "api.tasks.processing.generate_poster": {"queue": "processing_cpu"},
-    "api.tasks.processing.download_recording": {"queue": "downloads"},
-    "api.tasks.upload.*": {"queue": "uploads"},
-    "api.tasks.processing.transcribe_recording": {"queue": "async_operations"},
-    "api.tasks.processing.extract_topics": {"queue": "async_operations"},
-    "api.tasks.processing.generate_subtitles": {"queue": "async_operations"},
-    "api.tasks.processing.run_recording": {"queue": "async_operations"},
-    "api.tasks.processing.launch_uploads": {"queue": "async_operations"},
-    "api.tasks.template.*": {"queue": "async_operations"},
-    "api.tasks.sync.*": {"queue": "async_operations"},
-    "automation.*": {"queue": "async_operations"},
-    "maintenance.*": {"queue": "maintenance"},
-}
+from api.services.node_affinity import route_stage_to_node  # noqa: E402
+from api.services.progress_events import publish_task_state, register_stage_event_hooks  # noqa: E402
+
+# Routers are tried in order: node affinity first (None unless the recording is pinned
+# to a live node with room), then the static map of shared queues.
+celery_app.conf.task_routes = (
+    route_stage_to_node,
+    {
+        "api.tasks.processing.trim_video": {"queue": "processing_cpu"},
+        "api.tasks.processing.generate_poster": {"queue": "processing_cpu"},
+        "api.tasks.processing.download_recording": {"queue": "downloads"},
+        "api.tasks.upload.*": {"queue": "uploads"},
+        "api.tasks.processing.transcribe_recording": {"queue": "async_operations"},
+        "api.tasks.processing.extract_topics": {"queue": "async_operations"},
+        "api.tasks.processing.extract_topics_batch": {"queue": "async_operations"},
+        "api.tasks.processing.generate_subtitles": {"queue": "async_operations"},
+        "api.tasks.processing.run_recording": {"queue": "async_operations"},
+        "api.tasks.processing.launch_uploads": {"queue": "async_operations"},
+        "api.tasks.processing.await_trim": {"queue": "async_operations"},
+        "api.tasks.processing.complete_transcription": {"queue": "async_operations"},
+        "api.tasks.processing.resume_transcription": {"queue": "async_operations"},
+        "api.tasks.processing.poll_pending_transcripts": {"queue": "async_operations"},
+        "api.tasks.processing.dispatch_fair_share": {"queue": "async_operations"},
+        "api.tasks.processing.promote_deferred_pipelines": {"queue": "async_operations"},
+        "api.tasks.template.*": {"queue": "async_operations"},
+        "api.tasks.sync.*": {"queue": "async_operations"},
+        "automation.*": {"queue": "async_operations"},
+        "maintenance.*": {"queue": "maintenance"},
+    },
+)
 
 from celery.schedules import crontab  # noqa: E402
 
@@ -205,6 +225,10 @@ celery_app.conf.beat_schedule = {
         "task": "maintenance.hard_delete_recordings",
         "schedule": crontab(hour=5, minute=0),
     },
+    "evict-llm-cache": {
+        "task": "maintenance.evict_llm_cache",
+        "schedule": crontab(hour=5, minute=30),
+    },
     "cleanup-temp-files": {
         "task": "maintenance.cleanup_temp_files",
         "schedule": crontab(minute=15),
@@ -213,6 +237,20 @@ celery_app.conf.beat_schedule = {
         "task": "maintenance.reset_stale_active_recordings",
         "schedule": crontab(minute="*/30"),
     },
+    "poll-pending-transcripts": {
+        "task": "api.tasks.processing.poll_pending_transcripts",
+        "schedule": settings.assemblyai.pending_poll_interval,
+    },
+    "dispatch-fair-share": {
+        "task": "api.tasks.processing.dispatch_fair_share",
+        "schedule": settings.celery.fair_share_interval,
+        "options": {"expires": settings.celery.fair_share_interval},
+    },
+    "promote-deferred-pipelines": {
+        "task": "api.tasks.processing.promote_deferred_pipelines",
+        "schedule": settings.celery.pipeline_slot_promote_interval,
+        "options": {"expires": settings.celery.pipeline_slot_promote_interval},
+    },
 }
 
 
@@ -227,6 +265,46 @@ def _reinit_loguru_in_child(**_kwargs):
     setup_logger()
 
 
+# One event loop + pooled DB engine per worker thread/process, reused by every task
+@worker_process_init.connect
+def _start_worker_loop(**_kwargs):
+    start_worker_loop()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _shutdown_worker_loops(**_kwargs):
+    shutdown_worker_loops()
+
+
+# Node affinity: consume <queue>.<node> next to the shared queues this worker serves
+@celeryd_after_setup.connect
+def _consume_node_queues(_sender=None, instance=None, **_kwargs):
+    from api.services.node_affinity import start_node_queues
+
+    if instance is not None:
+        start_node_queues(instance.app.amqp.queues)
+
+
+@worker_shutdown.connect
+def _stop_node_queues(**_kwargs):
+    from api.services.node_affinity import stop_node_queues
+
+    stop_node_queues()
+
+
+# Progress events (SSE): committed stage/recording transitions and task outcomes.
+# Registered before the pool starts, so forked children inherit the hooks.
+@worker_init.connect
+def _register_progress_events(**_kwargs):
+    register_stage_event_hooks()
+
+
+@task_postrun.connect
+def _publish_task_state(task_id, task, args=None, kwargs=None, *, state, **_kwargs):
+    publish_task_state(task, task_id, state, args, kwargs)
+
+
 def _task_queue(task) -> str:
     delivery_info = getattr(task.request, "delivery_info", None) or {}
     return delivery_info.get("routing_key") or delivery_info.get("exchange") or "celery"
@@ -0,0 +1,86 @@
+"""AsyncIOPool: Celery execution pool for network-bound queues.
+
+Transcription polling, LLM calls, platform uploads and sync tasks spend almost
+all their time awaiting the network. Under ``--pool=threads`` each of them owns
+an event loop and a DB pool for its whole run. This pool runs every task
+coroutine of the worker process on one shared loop (``utils.worker_loop``), so
+one process keeps hundreds of recordings in flight with a single DB pool.
+
+Task bodies stay synchronous (Celery's tracer, ``BaseTask`` progress/results,
+retries and ``on_failure`` are unchanged): each in-flight task holds a thin
+thread that only waits on its coroutine's future. Soft/hard time limits are
+enforced on the loop, and ``revoke(terminate=True)`` cancels the task's
+coroutine. ``--concurrency`` is therefore still a number of OS threads, idle
+but each with its own stack; what it saves is event loops and DB pools.
+
+Progress writes from task coroutines (``update_progress``) run on a background
+thread. Other short sync Redis calls made from coroutines (pipeline slot
+release, node-affinity counters) still run on the loop: a round trip or two,
+once or twice per task.
+
+Usage::
+
+    celery -A api.celery_app worker -Q async_operations,uploads \\
+        --pool=api.celery_pool:AsyncIOPool --concurrency=200
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from celery.concurrency.base import apply_target
+from celery.concurrency.thread import ApplyResult, TaskPool as ThreadTaskPool
+
+from config.settings import get_settings
+from logger import format_details, get_logger
+from utils.worker_loop import AsyncJob, bind_job, start_shared_loop, stop_shared_loop
+
+logger = get_logger()
+
+
+class AsyncApplyResult(ApplyResult):
+    """Thread pool result whose ``terminate`` cancels the task's coroutines."""
+
+    def __init__(self, future, job: AsyncJob) -> None:
+        super().__init__(future)
+        self.job = job
+
+    def terminate(self, signal: int | None = None) -> None:  # noqa: ARG002
+        self.job.cancel()
+
+
+def _run_job(job: AsyncJob, target, args, kwargs, callback, accept_callback) -> None:
+    with bind_job(job):
+        apply_target(target, args, kwargs, callback, accept_callback)
+
+
+class AsyncIOPool(ThreadTaskPool):
+    """Thread-backed pool whose tasks all await on one shared event loop."""
+
+    def on_start(self) -> None:
+        start_shared_loop(get_settings().celery.asyncio_blocking_threads)
+        logger.info(f"AsyncIOPool started | {format_details(concurrency=self.limit)}")
+
+    def on_stop(self) -> None:
+        super().on_stop()
+        stop_shared_loop()
+
+    def on_apply(
+        self,
+        target,
+        args: tuple[Any, ...] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        callback=None,
+        accept_callback=None,
+        soft_timeout: float | None = None,
+        timeout: float | None = None,
+        **_: Any,
+    ) -> AsyncApplyResult:
+        job = AsyncJob(soft_timeout=soft_timeout, timeout=timeout)
+        future = self.executor.submit(_run_job, job, target, args, kwargs, callback, accept_callback)
+        return AsyncApplyResult(future, job)
+
+    def terminate_job(self, pid, signal=None) -> None:
+        # All tasks share this process: termination cancels the task's coroutine
+        # through AsyncApplyResult.terminate instead of signalling a pid.
+        pass
@@ -11,6 +11,7 @@ from sqlalchemy.pool import NullPool
 
 from api.services.email_service import EmailService
 from config.settings import get_settings
+from utils.worker_loop import shared_loop_active, worker_engine
 
 settings = get_settings()
 
@@ -30,21 +31,41 @@ def _is_celery_worker() -> bool:
 def get_async_engine():
     """Get async engine for SQLAlchemy.
 
-    Uses NullPool in Celery workers to avoid event loop issues with asyncpg.
-    In Celery workers with threads pool, each task may run in a different thread
-    with a different event loop, so we can't reuse connection pools.
-
-    Note: NO @lru_cache for Celery workers - engine must be created fresh
-    for each asyncio.run() call to avoid event loop issues.
+    Celery workers get the pooled engine of the current worker thread's event
+    loop (see ``utils.worker_loop``): asyncpg pools are bound to one loop, and
+    every worker thread keeps its loop for its whole life. Code running on any
+    other loop (a nested ``asyncio.run()``) gets a throwaway NullPool engine.
     """
     if _is_celery_worker():
-        # NullPool: no connection pooling, create new connection for each request
-        # No caching - fresh engine for each asyncio.run() call
+        engine = worker_engine(_create_worker_engine)
+        if engine is not None:
+            return engine
+        # Foreign loop: no connection pooling, create new connection for each request
         return create_async_engine(settings.database.url, echo=False, poolclass=NullPool)
     # Normal pooling for FastAPI (web server) - cached
     return _get_cached_engine()
 
 
+def _create_worker_engine():
+    """Pooled engine for one worker event loop.
+
+    Per-thread loops run one task at a time and get a small pool; the shared
+    loop of an AsyncIOPool worker serves every in-flight task and gets a bigger one.
+    """
+    if shared_loop_active():
+        pool_size, max_overflow = settings.database.async_pool_size, settings.database.async_max_overflow
+    else:
+        pool_size, max_overflow = settings.database.worker_pool_size, settings.database.worker_max_overflow
+    return create_async_engine(
+        settings.database.url,
+        echo=False,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=settings.database.worker_pool_recycle,
+        pool_pre_ping=True,
+    )
+
+
 @lru_cache
 def _get_cached_engine():
     """Cached engine for FastAPI web server only."""
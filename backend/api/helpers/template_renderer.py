@@ -550,7 +550,7 @@ class TemplateRenderer:
         context["record_datetime_iso"] = format_datetime_for_template(rl, "datetime") if rl else ""
         context["publish_datetime_iso"] = format_datetime_for_template(publish_local, "datetime")
 
-        # ``extracted_data`` (active version dict from extracted.json) must be loaded
+        # ``extracted_data`` (active topic version dict from the extracted/ manifest) must be loaded
         # by the async caller and passed in. We cannot call the (now async)
         # TranscriptionManager from this sync helper. If not provided, fields default
         # to empty — callers that need them must fetch the data upstream.
@@ -1,5 +1,8 @@
 """FastAPI application entrypoint and router configuration."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -43,14 +46,26 @@ from api.routers import (
     thumbnails,
     user_config,
     users,
+    webhooks,
 )
+from api.services.progress_events import register_stage_event_hooks
 from api.shared.exceptions import APIException
 from config.settings import get_settings
+from utils.http_clients import close_http_clients
 
 settings = get_settings()
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Register progress event hooks on startup; release shared outbound HTTP pools on shutdown."""
+    register_stage_event_hooks()
+    yield
+    await close_http_clients()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.app.name,
     version=settings.app.version,
     description=settings.app.description,
@@ -103,6 +118,7 @@ app.include_router(thumbnails.router)
 app.include_router(storage.router)
 app.include_router(admin.router)
 app.include_router(tasks.router)
+app.include_router(webhooks.router)
 
 
 @app.get("/")
@@ -1,17 +1,33 @@
 from api.observability.metrics import (
     ENQUEUE_KEY_PREFIX,
+    artifact_fetch_bytes_total,
+    external_api_connections_total,
     external_api_duration_seconds,
+    external_api_retries_total,
+    llm_cache_lookups_total,
+    llm_cache_saved_tokens_total,
+    llm_stream_aborts_total,
     pipeline_stage_duration_seconds,
+    recording_artifact_bytes,
     setup_prometheus,
     track_external_api,
     track_pipeline_stage,
+    transcription_cache_lookups_total,
 )
 
 __all__ = [
     "ENQUEUE_KEY_PREFIX",
+    "artifact_fetch_bytes_total",
+    "external_api_connections_total",
     "external_api_duration_seconds",
+    "external_api_retries_total",
+    "llm_cache_lookups_total",
+    "llm_cache_saved_tokens_total",
+    "llm_stream_aborts_total",
     "pipeline_stage_duration_seconds",
+    "recording_artifact_bytes",
     "setup_prometheus",
     "track_external_api",
     "track_pipeline_stage",
+    "transcription_cache_lookups_total",
 ]
@@ -6,11 +6,12 @@ import os
 import time
 from collections.abc import Iterator
 from contextlib import contextmanager
+from typing import cast
 
 import redis
 from fastapi import FastAPI
 from fastapi.responses import Response
-from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Histogram, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
 from prometheus_client.core import GaugeMetricFamily
 from prometheus_fastapi_instrumentator import Instrumentator, metrics
 
@@ -51,8 +52,68 @@ external_api_duration_seconds = Histogram(
     buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
 )
 
+# Shared pooled HTTP clients (utils/http_clients.py). `connection` is "new" when
+# the request had to open a TCP connection and "reused" when it got a pooled one.
+external_api_connections_total = Counter(
+    "leap_external_api_connections_total",
+    "Outbound requests by whether a pooled connection was reused.",
+    labelnames=("provider", "connection"),
+)
+
+# Automatic retries of idempotent outbound requests. `outcome` is "retried" or
+# "budget_exhausted" (the provider's retry budget refused the retry).
+external_api_retries_total = Counter(
+    "leap_external_api_retries_total",
+    "Retries of outbound requests to external APIs.",
+    labelnames=("provider", "outcome"),
+)
+
+# Transcription result cache (content hash of audio + parameters).
+# `result` is "hit", "miss" or "error" (audio could not be hashed; ASR runs).
+transcription_cache_lookups_total = Counter(
+    "leap_transcription_cache_lookups_total",
+    "Transcription result cache lookups.",
+    labelnames=("result",),
+)
+
+# LLM response cache (topic extraction). `result` is "hit", "miss" or "bypass" (forced regeneration).
+llm_cache_lookups_total = Counter(
+    "leap_llm_cache_lookups_total",
+    "LLM response cache lookups.",
+    labelnames=("result",),
+)
+llm_cache_saved_tokens_total = Counter(
+    "leap_llm_cache_saved_tokens_total",
+    "Tokens not sent to the LLM provider thanks to cache hits.",
+)
+
+# Streamed topic-extraction completions cut short. `reason` is "malformed" or "stalled".
+llm_stream_aborts_total = Counter(
+    "leap_llm_stream_aborts_total",
+    "Streamed LLM completions aborted before the end.",
+    labelnames=("reason",),
+)
+
+# Pipeline artifacts (source/processed video) materialized by a stage. `source` is
+# "storage" (downloaded from the storage backend) or "scratch" (node-local copy, node affinity).
+artifact_fetch_bytes_total = Counter(
+    "leap_artifact_fetch_bytes_total",
+    "Bytes of pipeline artifacts materialized by a stage, by where they were read from.",
+    labelnames=("stage", "source"),
+)
+
+# Per-recording totals of the above, observed when the recording's node pin is released.
+recording_artifact_bytes = Histogram(
+    "leap_recording_artifact_bytes",
+    "Artifact bytes read per recording (download to upload), by source.",
+    labelnames=("source",),
+    buckets=(2**26, 2**28, 2**29, 2**30, 2**31, 2**32, 2**33, 2**34),
+)
+
 _QUEUES_TRACKED = ("downloads", "uploads", "async_operations", "processing_cpu", "maintenance")
 ENQUEUE_KEY_PREFIX = "leap:enq:"
+# Per-tenant wait of the fair-share queues: leap:enq:fair:<queue>:<user_id>
+FAIR_SHARE_ENQUEUE_PREFIX = f"{ENQUEUE_KEY_PREFIX}fair:"
 
 
 class _QueueAgeCollector:
@@ -77,6 +138,16 @@ class _QueueAgeCollector:
             "Age of the oldest pending task in a Celery queue, in seconds.",
             labels=["queue"],
         )
+        tenant_age = GaugeMetricFamily(
+            "leap_tenant_queue_oldest_task_age_seconds",
+            "Age of the oldest task waiting in a tenant's fair-share queue, in seconds.",
+            labels=["queue", "tenant"],
+        )
+        tenant_depth = GaugeMetricFamily(
+            "leap_tenant_queue_depth",
+            "Tasks waiting in a tenant's fair-share queue.",
+            labels=["queue", "tenant"],
+        )
         try:
             client = self._redis()
             now = time.time()
@@ -86,9 +157,21 @@ class _QueueAgeCollector:
                 oldest = client.zrange(f"{ENQUEUE_KEY_PREFIX}{queue}", 0, 0, withscores=True)
                 age = max(0.0, now - oldest[0][1]) if oldest else 0.0  # type: ignore[index]
                 gauge.add_metric([queue], age)
+
+            # Fair-share queues (api.services.fair_share): leap:enq:fair:<queue>:<user_id>.
+            # Redis drops empty sorted sets, so only tenants with waiting work show up.
+            for key in client.scan_iter(match=f"{FAIR_SHARE_ENQUEUE_PREFIX}*", count=500):
+                queue, _, tenant = key.removeprefix(FAIR_SHARE_ENQUEUE_PREFIX).partition(":")
+                tenant_oldest = cast("list[tuple[str, float]]", client.zrange(key, 0, 0, withscores=True))
+                if not tenant_oldest:
+                    continue
+                tenant_age.add_metric([queue, tenant], max(0.0, now - tenant_oldest[0][1]))
+                tenant_depth.add_metric([queue, tenant], client.zcard(key))
         except Exception as exc:
             logger.warning("Queue age collector failed: {}", exc)
         yield gauge
+        yield tenant_age
+        yield tenant_depth
 
 
 _queue_age_collector = _QueueAgeCollector()
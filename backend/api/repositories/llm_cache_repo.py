@@ -0,0 +1,108 @@
+"""Repository for the request-keyed LLM response cache (llm_response_cache)."""
+
+import hashlib
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import LLMResponseCacheModel
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+# Bump when prompts are post-processed differently: old entries stop matching.
+CACHE_FORMAT_VERSION = 1
+
+
+def llm_cache_key(*, system_prompt: str, prompt: str, model: str, params: dict[str, Any]) -> str:
+    """Key for one exact chat request: any change in prompt, model or sampling params misses."""
+    material = json.dumps(
+        {
+            "v": CACHE_FORMAT_VERSION,
+            "system": system_prompt,
+            "prompt": prompt,
+            "model": model,
+            "params": params,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class LLMCacheRepository:
+    """Store, look up and evict cached LLM completions."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, cache_key: str) -> dict[str, Any] | None:
+        """Return ``{"content", "usage"}`` of a live entry and count the hit (single UPDATE ... RETURNING)."""
+        now = datetime.now(UTC)
+        stmt = (
+            update(LLMResponseCacheModel)
+            .where(LLMResponseCacheModel.cache_key == cache_key, LLMResponseCacheModel.expires_at > now)
+            .values(hit_count=LLMResponseCacheModel.hit_count + 1, last_hit_at=now)
+            .returning(LLMResponseCacheModel.content, LLMResponseCacheModel.usage)
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return {"content": row.content, "usage": row.usage}
+
+    async def put(
+        self,
+        cache_key: str,
+        *,
+        model: str,
+        content: str,
+        usage: dict[str, int] | None,
+        ttl: timedelta,
+    ) -> None:
+        """Insert or overwrite an entry (a forced regeneration replaces the old completion)."""
+        now = datetime.now(UTC)
+        values = {
+            "model": model,
+            "content": content,
+            "usage": usage,
+            "total_tokens": (usage or {}).get("total_tokens", 0),
+            "size_bytes": len(content.encode()),
+            "created_at": now,
+            "expires_at": now + ttl,
+        }
+        stmt = insert(LLMResponseCacheModel).values(cache_key=cache_key, hit_count=0, **values)
+        stmt = stmt.on_conflict_do_update(index_elements=[LLMResponseCacheModel.cache_key], set_=values)
+        await self.session.execute(stmt)
+        logger.debug(f"LLM cache stored | {format_details(key=cache_key[:12], tokens=values['total_tokens'])}")
+
+    async def evict(self, max_bytes: int) -> dict[str, int]:
+        """Drop expired entries, then least recently used ones until the table fits ``max_bytes``."""
+        expired = cast(
+            "CursorResult",
+            await self.session.execute(
+                delete(LLMResponseCacheModel).where(LLMResponseCacheModel.expires_at <= datetime.now(UTC))
+            ),
+        )
+
+        # Running total from the most recently used entry; everything past the budget goes
+        last_used = func.coalesce(LLMResponseCacheModel.last_hit_at, LLMResponseCacheModel.created_at)
+        running = (
+            select(
+                LLMResponseCacheModel.cache_key,
+                func.sum(LLMResponseCacheModel.size_bytes)
+                .over(order_by=(last_used.desc(), LLMResponseCacheModel.cache_key))
+                .label("running_bytes"),
+            )
+        ).subquery()
+        over_budget = select(running.c.cache_key).where(running.c.running_bytes > max_bytes)
+        trimmed = cast(
+            "CursorResult",
+            await self.session.execute(
+                delete(LLMResponseCacheModel).where(LLMResponseCacheModel.cache_key.in_(over_budget))
+            ),
+        )
+        return {"expired": expired.rowcount, "evicted": trimmed.rowcount}
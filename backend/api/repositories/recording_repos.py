@@ -26,7 +26,9 @@ class RecordingRepository:
         """
         self.session = session
 
-    async def get_by_id(self, recording_id: int, user_id: str, include_deleted: bool = False) -> RecordingModel | None:
+    async def get_by_id(
+        self, recording_id: int, user_id: str, include_deleted: bool = False, *, for_update: bool = False
+    ) -> RecordingModel | None:
         """
         Get recording by ID with user ownership check.
 
@@ -34,6 +36,7 @@ class RecordingRepository:
             recording_id: Recording ID
             user_id: User ID
             include_deleted: Include deleted recordings
+            for_update: Lock the recording row until the transaction ends (SELECT ... FOR UPDATE)
 
         Returns:
             Recording or None
@@ -56,6 +59,8 @@ class RecordingRepository:
 
         if not include_deleted:
             query = query.where(RecordingModel.deleted == False)  # noqa: E712
+        if for_update:
+            query = query.with_for_update(of=RecordingModel)
 
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
@@ -980,7 +985,7 @@ class RecordingRepository:
     async def cleanup_recording_files(self, recording: RecordingModel) -> int:
         """
         Delete large files (videos, audio) for recording.
-        Keeps: master.json, extracted.json (transcription_dir), DB metadata.
+        Keeps: master.json, extracted/ topic versions (transcription_dir), DB metadata.
 
         Used by maintenance tasks and hard delete.
 
@@ -1050,7 +1055,7 @@ class RecordingRepository:
         if recording.delete_state != "hard":
             total_bytes += await self.cleanup_recording_files(recording)
 
-        # Delete transcription directory (master.json, extracted.json, cache/*) via storage.
+        # Delete transcription directory (master.json, extracted/*, cache/*) via storage.
         # transcription_dir is stored as a builder path like ``storage/users/.../transcriptions``;
         # normalize to a storage key prefix and bulk-delete every object underneath.
         if recording.transcription_dir:
@@ -286,7 +286,9 @@ class QuotaUsageRepository:
         await self.session.refresh(db_usage)
         return QuotaUsageInDB.model_validate(db_usage)
 
-    async def _increment_counter(self, user_id: str, period: int, field: str, count: int = 1) -> None:
+    async def _increment_counter(
+        self, user_id: str, period: int, field: str, count: int = 1, *, commit: bool = True
+    ) -> None:
         result = await self.session.execute(
             select(QuotaUsageModel).where(QuotaUsageModel.user_id == user_id, QuotaUsageModel.period == period)
         )
@@ -297,13 +299,16 @@ class QuotaUsageRepository:
         else:
             db_usage = QuotaUsageModel(user_id=user_id, period=period, **{field: count})
             self.session.add(db_usage)
-        await self.session.commit()
+        if commit:
+            await self.session.commit()
+        else:
+            await self.session.flush()
 
     async def increment_transcriptions(self, user_id: str, period: int, count: int = 1) -> None:
         await self._increment_counter(user_id, period, "transcriptions_count", count)
 
-    async def increment_processing(self, user_id: str, period: int, count: int = 1) -> None:
-        await self._increment_counter(user_id, period, "processing_count", count)
+    async def increment_processing(self, user_id: str, period: int, count: int = 1, *, commit: bool = True) -> None:
+        await self._increment_counter(user_id, period, "processing_count", count, commit=commit)
 
     async def increment_uploads(self, user_id: str, period: int, count: int = 1) -> None:
         await self._increment_counter(user_id, period, "uploads_count", count)
@@ -0,0 +1,169 @@
+"""Repository for transcript full-text search (transcript_segments)."""
+
+from typing import Any
+
+from sqlalchemy import cast, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import REGCONFIG, to_tsvector, ts_headline, websearch_to_tsquery
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import RecordingModel, TranscriptSegmentModel
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+# ISO language code -> Postgres text search configuration. Anything else is
+# indexed with ``simple`` (lowercased tokens, no stemming).
+LANGUAGE_TS_CONFIGS: dict[str, str] = {
+    "ru": "russian",
+    "en": "english",
+}
+DEFAULT_TS_CONFIG = "simple"
+
+# Query side ORs one tsquery per configuration so a single GIN scan covers the
+# whole archive regardless of which language each recording was indexed with.
+SEARCH_TS_CONFIGS: tuple[str, ...] = (*dict.fromkeys(LANGUAGE_TS_CONFIGS.values()), DEFAULT_TS_CONFIG)
+
+INSERT_BATCH_SIZE = 1000
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=12, MaxFragments=1"
+
+
+def ts_config_for_language(language: str | None) -> str:
+    """Map a transcript language (``ru``, ``en-US``, ``auto``) to a text search config."""
+    if not language:
+        return DEFAULT_TS_CONFIG
+    return LANGUAGE_TS_CONFIGS.get(language.lower().split("-")[0], DEFAULT_TS_CONFIG)
+
+
+class TranscriptSearchRepository:
+    """Index and search transcript segments across a user's recordings."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def replace_for_recording(
+        self,
+        recording_id: int,
+        user_id: str,
+        segments: list[dict[str, Any]],
+        language: str | None,
+    ) -> int:
+        """Replace the indexed segments of one recording. Returns number of rows written.
+
+        Only this recording's rows are touched, so re-transcribing one lecture never
+        rebuilds the rest of the archive. Vectors are computed server-side in the
+        same INSERT (``to_tsvector``), batched to keep bind parameters bounded.
+        """
+        await self.session.execute(
+            delete(TranscriptSegmentModel).where(TranscriptSegmentModel.recording_id == recording_id)
+        )
+
+        ts_config = ts_config_for_language(language)
+        rows = [
+            {
+                "recording_id": recording_id,
+                "user_id": user_id,
+                "segment_index": idx,
+                "start_time": float(seg.get("start", 0.0)),
+                "end_time": float(seg.get("end", 0.0)),
+                "text": text,
+                "ts_config": ts_config,
+                "search_vector": to_tsvector(ts_config, text),
+            }
+            for idx, seg in enumerate(segments)
+            if (text := (seg.get("text") or "").strip())
+        ]
+
+        for i in range(0, len(rows), INSERT_BATCH_SIZE):
+            await self.session.execute(insert(TranscriptSegmentModel).values(rows[i : i + INSERT_BATCH_SIZE]))
+
+        logger.debug(
+            f"Transcript indexed | {format_details(rec=recording_id, segments=len(rows), ts_config=ts_config)}"
+        )
+        return len(rows)
+
+    async def delete_for_recording(self, recording_id: int) -> None:
+        """Drop all indexed segments of a recording (transcription reset)."""
+        await self.session.execute(
+            delete(TranscriptSegmentModel).where(TranscriptSegmentModel.recording_id == recording_id)
+        )
+
+    async def search(
+        self,
+        user_id: str,
+        query: str,
+        *,
+        recording_ids: list[int] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Ranked segment hits for ``query`` across the user's non-deleted recordings.
+
+        Ranking and pagination run on the GIN-matched rows only; ``ts_headline``
+        (which re-parses the text) is evaluated in the outer query for the
+        returned page, not for every match.
+
+        Returns:
+            Dicts with recording_id, display_name, segment_index, start, end, snippet, rank
+        """
+        tsquery = websearch_to_tsquery(SEARCH_TS_CONFIGS[0], query)
+        for ts_config in SEARCH_TS_CONFIGS[1:]:
+            tsquery = tsquery.op("||")(websearch_to_tsquery(ts_config, query))
+
+        rank = func.ts_rank_cd(TranscriptSegmentModel.search_vector, tsquery)
+
+        matched = (
+            select(
+                TranscriptSegmentModel.recording_id,
+                TranscriptSegmentModel.segment_index,
+                TranscriptSegmentModel.start_time,
+                TranscriptSegmentModel.end_time,
+                TranscriptSegmentModel.text,
+                TranscriptSegmentModel.ts_config,
+                RecordingModel.display_name,
+                rank.label("rank"),
+            )
+            .join(RecordingModel, RecordingModel.id == TranscriptSegmentModel.recording_id)
+            .where(
+                TranscriptSegmentModel.user_id == user_id,
+                TranscriptSegmentModel.search_vector.op("@@")(tsquery),
+                RecordingModel.deleted == False,  # noqa: E712
+            )
+        )
+        if recording_ids:
+            matched = matched.where(TranscriptSegmentModel.recording_id.in_(recording_ids))
+
+        page = (
+            matched.order_by(
+                rank.desc(),
+                TranscriptSegmentModel.recording_id,
+                TranscriptSegmentModel.segment_index,
+            )
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+
+        stmt = select(
+            page.c.recording_id,
+            page.c.display_name,
+            page.c.segment_index,
+            page.c.start_time,
+            page.c.end_time,
+            page.c.rank,
+            ts_headline(cast(page.c.ts_config, REGCONFIG), page.c.text, tsquery, HEADLINE_OPTIONS).label("snippet"),
+        ).order_by(page.c.rank.desc(), page.c.recording_id, page.c.segment_index)
+
+        result = await self.session.execute(stmt)
+        return [
+            {
+                "recording_id": row.recording_id,
+                "display_name": row.display_name,
+                "segment_index": row.segment_index,
+                "start": row.start_time,
+                "end": row.end_time,
+                "snippet": row.snippet,
+                "rank": float(row.rank),
+            }
+            for row in result.all()
+        ]
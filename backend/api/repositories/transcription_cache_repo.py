@@ -0,0 +1,149 @@
+"""Repository for the content-hash keyed transcription result cache (transcription_cache)."""
+
+import hashlib
+import json
+from datetime import UTC, datetime
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import TranscriptionCacheModel
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+# Bump when the normalized result format changes: old entries stop matching.
+CACHE_FORMAT_VERSION = 1
+
+
+def transcription_cache_key(
+    *,
+    user_id: str,
+    audio_sha256: str,
+    language: str | None,
+    language_detection: bool,
+    speech_models: list[str],
+    keyterms: list[str],
+) -> str:
+    """Key for one (user, audio content, transcription parameters) combination.
+
+    Scoped per user so an entry never reveals that someone else transcribed the
+    same file. Keyterms keep their order: it is what AssemblyAI receives.
+    """
+    material = json.dumps(
+        {
+            "v": CACHE_FORMAT_VERSION,
+            "user": user_id,
+            "audio": audio_sha256,
+            "language": None if language_detection else language,
+            "detect": language_detection,
+            "models": list(speech_models),
+            "keyterms": list(keyterms),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class TranscriptionCacheRepository:
+    """Store, look up and evict cached normalized ASR results."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_result(self, cache_key: str) -> dict[str, Any] | None:
+        """Return the cached result and count the hit (single UPDATE ... RETURNING)."""
+        stmt = (
+            update(TranscriptionCacheModel)
+            .where(TranscriptionCacheModel.cache_key == cache_key)
+            .values(
+                hit_count=TranscriptionCacheModel.hit_count + 1,
+                last_hit_at=datetime.now(UTC),
+            )
+            .returning(TranscriptionCacheModel.result)
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def put(
+        self,
+        cache_key: str,
+        *,
+        user_id: str,
+        audio_sha256: str,
+        language: str | None,
+        speech_model: str,
+        keyterms_count: int,
+        source_recording_id: int | None,
+        result: dict[str, Any],
+    ) -> None:
+        """Insert or overwrite an entry (a fresh transcription replaces a stale one)."""
+        payload = {
+            "text": result.get("text", ""),
+            "words": result.get("words", []),
+            "segments": result.get("segments", []),
+            "language": result.get("language"),
+        }
+        values = {
+            "user_id": user_id,
+            "source_recording_id": source_recording_id,
+            "audio_sha256": audio_sha256,
+            "language": language,
+            "speech_model": speech_model,
+            "keyterms_count": keyterms_count,
+            "result": payload,
+            "words_count": len(payload["words"]),
+            "size_bytes": len(json.dumps(payload, ensure_ascii=False).encode()),
+            "created_at": datetime.now(UTC),
+        }
+        stmt = insert(TranscriptionCacheModel).values(cache_key=cache_key, hit_count=0, **values)
+        stmt = stmt.on_conflict_do_update(index_elements=[TranscriptionCacheModel.cache_key], set_=values)
+        await self.session.execute(stmt)
+        logger.debug(f"Transcription cache stored | {format_details(key=cache_key[:12], words=values['words_count'])}")
+
+    async def get(self, cache_key: str) -> TranscriptionCacheModel | None:
+        """Entry metadata (``result`` stays unloaded)."""
+        return await self.session.get(TranscriptionCacheModel, cache_key)
+
+    async def list_entries(
+        self,
+        *,
+        user_id: str | None = None,
+        audio_sha256: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[TranscriptionCacheModel], int]:
+        """Entries newest first plus the total count for the same filters."""
+        query = select(TranscriptionCacheModel)
+        if user_id:
+            query = query.where(TranscriptionCacheModel.user_id == user_id)
+        if audio_sha256:
+            query = query.where(TranscriptionCacheModel.audio_sha256 == audio_sha256)
+
+        total = await self.session.scalar(select(func.count()).select_from(query.subquery())) or 0
+        result = await self.session.execute(
+            query.order_by(TranscriptionCacheModel.created_at.desc()).limit(limit).offset(offset)
+        )
+        return list(result.scalars().all()), total
+
+    async def delete(self, cache_key: str) -> bool:
+        """Evict one entry. Returns False if it did not exist."""
+        result = cast(
+            "CursorResult",
+            await self.session.execute(
+                delete(TranscriptionCacheModel).where(TranscriptionCacheModel.cache_key == cache_key)
+            ),
+        )
+        return result.rowcount > 0
+
+    async def delete_for_user(self, user_id: str) -> int:
+        """Evict all entries of a user. Returns number of rows removed."""
+        result = cast(
+            "CursorResult",
+            await self.session.execute(
+                delete(TranscriptionCacheModel).where(TranscriptionCacheModel.user_id == user_id)
+            ),
+        )
+        return result.rowcount
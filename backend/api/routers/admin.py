@@ -11,6 +11,7 @@ from api.auth.admin import get_current_admin
 from api.auth.device import extract_client_ip
 from api.dependencies import get_db_session
 from api.repositories.audit_repo import AdminAuditLogRepository, diff_fields
+from api.repositories.transcription_cache_repo import TranscriptionCacheRepository
 from api.schemas.admin import (
     AdminOverviewStats,
     AdminQuotaStats,
@@ -21,6 +22,9 @@ from api.schemas.admin import (
     AdminUserUpdate,
     AuditLogListResponse,
     PlanUsageStats,
+    TranscriptionCacheEntry,
+    TranscriptionCacheEvictResponse,
+    TranscriptionCacheListResponse,
     UsageEventResponse,
     UserQuotaDetails,
 )
@@ -602,3 +606,82 @@ async def admin_update_plan(
     )
     await session.commit()
     return {"plan": plan}
+
+
+# =============================================================================
+# Transcription cache
+# =============================================================================
+
+
+@router.get("/transcription-cache", response_model=TranscriptionCacheListResponse)
+async def admin_list_transcription_cache(
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    user_id: str | None = Query(None, description="Only entries of this user"),
+    audio_sha256: str | None = Query(None, min_length=64, max_length=64, description="Only entries for this audio"),
+    session: AsyncSession = Depends(get_db_session),
+    _admin: UserInDB = Depends(get_current_admin),
+):
+    """Cached transcription results, newest first, with hit counters (admin only)."""
+    entries, total = await TranscriptionCacheRepository(session).list_entries(
+        user_id=user_id,
+        audio_sha256=audio_sha256,
+        limit=per_page,
+        offset=(page - 1) * per_page,
+    )
+    return TranscriptionCacheListResponse(
+        items=[TranscriptionCacheEntry.model_validate(e) for e in entries],
+        page=page,
+        per_page=per_page,
+        total=total,
+        total_pages=max(1, (total + per_page - 1) // per_page),
+    )
+
+
+@router.get("/transcription-cache/{cache_key}", response_model=TranscriptionCacheEntry)
+async def admin_get_transcription_cache_entry(
+    cache_key: str,
+    session: AsyncSession = Depends(get_db_session),
+    _admin: UserInDB = Depends(get_current_admin),
+):
+    """One cache entry (admin only)."""
+    entry = await TranscriptionCacheRepository(session).get(cache_key)
+    if not entry:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cache entry not found")
+    return TranscriptionCacheEntry.model_validate(entry)
+
+
+@router.delete("/transcription-cache/{cache_key}", status_code=status.HTTP_204_NO_CONTENT)
+async def admin_evict_transcription_cache_entry(
+    request: Request,
+    cache_key: str,
+    session: AsyncSession = Depends(get_db_session),
+    admin: UserInDB = Depends(get_current_admin),
+) -> None:
+    """Evict one entry; the next run of that audio goes to ASR again (admin only)."""
+    if not await TranscriptionCacheRepository(session).delete(cache_key):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cache entry not found")
+
+    await _audit(request, session, admin, AuditAction.TRANSCRIPTION_CACHE_EVICTED, details={"cache_key": cache_key})
+    await session.commit()
+
+
+@router.delete("/users/{user_id}/transcription-cache", response_model=TranscriptionCacheEvictResponse)
+async def admin_evict_user_transcription_cache(
+    request: Request,
+    user_id: str,
+    session: AsyncSession = Depends(get_db_session),
+    admin: UserInDB = Depends(get_current_admin),
+):
+    """Evict all cached transcriptions of a user (admin only)."""
+    evicted = await TranscriptionCacheRepository(session).delete_for_user(user_id)
+    await _audit(
+        request,
+        session,
+        admin,
+        AuditAction.TRANSCRIPTION_CACHE_EVICTED,
+        target_user_id=user_id,
+        details={"evicted": evicted},
+    )
+    await session.commit()
+    return TranscriptionCacheEvictResponse(evicted=evicted)
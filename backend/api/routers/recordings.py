@@ -14,6 +14,7 @@ from api.core.context import ServiceContext
 from api.core.dependencies import get_service_context
 from api.repositories.config_repos import UserConfigRepository
 from api.repositories.recording_repos import RecordingRepository
+from api.repositories.transcript_search_repo import TranscriptSearchRepository
 from api.routers.recordings_helpers import (
     _CONFIG_RESOLUTION_HTTP_ERRORS,
     _build_export_row,
@@ -78,9 +79,13 @@ from api.schemas.recording.response import (
     RecordingListItem,
     RecordingListResponse,
     SourceResponse,
+    TranscriptSearchHit,
+    TranscriptSearchResponse,
 )
 from api.services.config_utils import resolve_full_config
+from api.services.pipeline_slots import release_pipeline_slot
 from api.shared.enums import Granularity
+from api.shared.types import VERSION_ID_REGEX
 from config.settings import get_settings, storage_video_ingress_suffixes
 from database.auth_models import UserModel
 from database.models import RecordingModel
@@ -389,6 +394,41 @@ async def list_recordings(
     )
 
 
+@router.get("/search/transcripts", response_model=TranscriptSearchResponse)
+async def search_transcripts(
+    q: str = Query(
+        ..., min_length=2, max_length=200, description='Search query (websearch syntax: "phrase", -word, or)'
+    ),
+    recording_ids_query: list[int] = Query(
+        default=[],
+        alias="recording_id",
+        description="Restrict to recording IDs (repeat param: ?recording_id=1&recording_id=2)",
+    ),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+    ctx: ServiceContext = Depends(get_service_context),
+):
+    """Full-text search across the user's transcripts; returns ranked, timestamped segment hits."""
+    search_repo = TranscriptSearchRepository(ctx.session)
+    recording_ids = sorted({i for i in recording_ids_query if i > 0}) or None
+    # One extra row tells us whether a next page exists without a COUNT(*) over all matches
+    hits = await search_repo.search(
+        ctx.user_id,
+        q,
+        recording_ids=recording_ids,
+        limit=per_page + 1,
+        offset=(page - 1) * per_page,
+    )
+
+    return TranscriptSearchResponse(
+        query=q,
+        page=page,
+        per_page=per_page,
+        has_more=len(hits) > per_page,
+        items=[TranscriptSearchHit(**hit) for hit in hits[:per_page]],
+    )
+
+
 @router.post("/export")
 async def export_recordings(
     data: ExportRecordingsRequest,
@@ -816,7 +856,7 @@ async def get_recording(
     else:
         transcription_data = {"exists": False}
 
-    # Topics (all versions) from extracted.json - hide _metadata from user
+    # Topics (all versions) from the extraction store - hide _metadata from user
     if await transcription_manager.has_extracted(recording_id, user_slug):
         try:
             extracted_file = await transcription_manager.load_extracted(recording_id, user_slug)
@@ -1288,16 +1328,19 @@ async def add_playlist_by_url(
 
     await _track_recordings_created(ctx, [rec["recording_id"] for rec in created_recordings if rec.get("is_new")])
 
-    # Auto-run all newly created recordings
+    # Auto-run all newly created recordings (through the tenant's fair-share queue)
     if data.auto_run:
+        weight = await _fair_share_weight(ctx)
         for rec in created_recordings:
             if rec.get("is_new"):
                 try:
-                    tid = await _auto_run_recording(rec["recording_id"], ctx.user_id)
+                    tid = await _auto_run_recording(rec["recording_id"], ctx.user_id, fair_share_weight=weight)
                     if tid:
                         task_ids.append(tid)
                 except Exception as e:
                     logger.warning(f"Failed to auto-run | {format_details(rec=rec['recording_id'], error=str(e))}")
+        if task_ids and weight is not None:
+            _kick_fair_share_dispatch()
 
     logger.info(
         f"Added playlist | {format_details(total=len(entries), created=created_count, updated=updated_count, auto_run=data.auto_run)}"
@@ -1315,20 +1358,55 @@ async def add_playlist_by_url(
     )
 
 
-async def _auto_run_recording(recording_id: int, user_id: str) -> str | None:
+async def _auto_run_recording(recording_id: int, user_id: str, fair_share_weight: int | None = None) -> str | None:
     """Start full pipeline for a recording. Returns task_id or None."""
-    from api.tasks.processing import run_recording_task
-
-    task = run_recording_task.apply_async(
-        kwargs={
-            "recording_id": recording_id,
-            "user_id": user_id,
-        }
-    )
+    task = _dispatch_pipeline(recording_id, user_id, fair_share_weight=fair_share_weight)
     logger.info(f"Auto-run pipeline | {format_details(rec=recording_id, task=short_task_id(task.id))}")
     return task.id
 
 
+async def _fair_share_weight(ctx: ServiceContext) -> int | None:
+    """Tenant weight for queuing a bulk run fairly, or None when fair share is disabled."""
+    if not get_settings().celery.fair_share_enabled:
+        return None
+    from api.services.fair_share import fair_share_weight
+    from api.services.quota_service import QuotaService
+
+    return fair_share_weight(await QuotaService(ctx.session).get_effective_quotas(ctx.user_id))
+
+
+def _dispatch_pipeline(
+    recording_id: int,
+    user_id: str,
+    manual_override: dict | None = None,
+    fair_share_weight: int | None = None,
+):
+    """Publish ``run_recording`` now, or queue it in the tenant's fair-share queue when a weight is given.
+
+    Returns the task's AsyncResult; a queued run keeps the id it is published with later.
+    """
+    from api.tasks.processing import run_recording_task
+
+    kwargs = {"recording_id": recording_id, "user_id": user_id, "manual_override": manual_override}
+    if fair_share_weight is None:
+        return run_recording_task.delay(**kwargs)
+
+    from api.services.fair_share import get_fair_share_queue
+
+    task_id = get_fair_share_queue().submit(user_id, run_recording_task.name, kwargs, weight=fair_share_weight)
+    return run_recording_task.AsyncResult(task_id)
+
+
+def _kick_fair_share_dispatch() -> None:
+    """Release queued runs now instead of on the next dispatcher beat tick."""
+    from api.tasks.processing import dispatch_fair_share_task
+
+    try:
+        dispatch_fair_share_task.delay()
+    except Exception as e:
+        logger.warning(f"Fair-share dispatch kick failed | {format_details(error=repr(e))}")
+
+
 @bulk_router.post("/bulk/run", response_model=RecordingBulkOperationResponse | BulkProcessDryRunResponse)
 async def bulk_run_recordings(
     data: BulkRunRequest,
@@ -1369,6 +1447,8 @@ async def bulk_run_recordings(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Template {data.template_id} not found")
 
     recordings_map = await recording_repo.get_by_ids(recording_ids, ctx.user_id)
+    # Pipelines of a bulk run wait in the tenant's fair-share queue instead of flooding Celery
+    weight = await _fair_share_weight(ctx)
 
     for recording_id in recording_ids:
         try:
@@ -1411,6 +1491,7 @@ async def bulk_run_recordings(
                 recording_id,
                 ctx,
                 manual_override=manual_override if manual_override else None,
+                fair_share_weight=weight,
             )
 
             tasks.append(
@@ -1447,6 +1528,8 @@ async def bulk_run_recordings(
 
     queued_count = len([t for t in tasks if t["status"] == "queued"])
     skipped_count = len([t for t in tasks if t["status"] in ("skipped", "completed")])
+    if queued_count and weight is not None:
+        _kick_fair_share_dispatch()
 
     # Commit template bindings if any
     if data.template_id and data.bind_template:
@@ -1653,6 +1736,9 @@ async def bulk_pause_recordings(
 
     if paused_count > 0:
         await ctx.session.commit()
+        for task in tasks:
+            if task["status"] == "queued":
+                release_pipeline_slot(ctx.user_id, task["recording_id"])
 
     logger.info(f"Bulk pause | {format_details(paused=paused_count, total=len(recording_ids))}")
 
@@ -1813,8 +1899,12 @@ async def bulk_extract_topics(
     ctx: ServiceContext = Depends(get_service_context),
     _feat: UserInDB = Depends(require_feature("can_process_video")),
 ) -> RecordingBulkOperationResponse:
-    """Bulk extract topics from transcriptions."""
-    from api.tasks.processing import extract_topics_task
+    """Bulk extract topics from transcriptions.
+
+    Recordings are grouped into extract_topics_batch tasks of ``TOPIC_BATCH_SIZE``
+    (one worker, one DeepSeek client and a shared request limit per batch).
+    """
+    from api.tasks.processing import extract_topics_batch_task
 
     # Resolve recording IDs
     recording_ids = await _resolve_recording_ids(data.recording_ids, data.filters, data.limit, ctx)
@@ -1823,30 +1913,35 @@ async def bulk_extract_topics(
     tasks = []
 
     recordings_map = await recording_repo.get_by_ids(recording_ids, ctx.user_id)
+    eligible_ids = [
+        recording_id
+        for recording_id in recording_ids
+        if (recording := recordings_map.get(recording_id)) and not recording.blank_record
+    ]
 
-    for recording_id in recording_ids:
+    batch_size = get_settings().topic_extraction.batch_size
+    for offset in range(0, len(eligible_ids), batch_size):
+        batch_ids = eligible_ids[offset : offset + batch_size]
         try:
-            recording = recordings_map.get(recording_id)
-            if not recording or recording.blank_record:
-                continue
-
-            task = extract_topics_task.delay(
-                recording_id=recording_id,
+            task = extract_topics_batch_task.delay(
+                recording_ids=batch_ids,
                 user_id=ctx.user_id,
                 granularity=data.granularity,
                 version_id=data.version_id,
+                bypass_cache=data.bypass_cache,
             )
 
-            tasks.append(
+            tasks.extend(
                 {
                     "recording_id": recording_id,
                     "status": "queued",
                     "task_id": task.id,
                 }
+                for recording_id in batch_ids
             )
 
         except Exception as e:
-            logger.error(f"Failed to queue topics | {format_details(rec=recording_id, error=str(e))}")
+            logger.error(f"Failed to queue topics batch | {format_details(recs=len(batch_ids), error=str(e))}")
 
     queued_count = len([t for t in tasks if t["status"] == "queued"])
     skipped_count = len([t for t in tasks if t["status"] == "skipped"])
@@ -2283,6 +2378,7 @@ async def _execute_smart_run(
     recording_id: int,
     ctx: ServiceContext,
     manual_override: dict | None = None,
+    fair_share_weight: int | None = None,
 ) -> RecordingOperationResponse:
     """
     Unified smart run: determine the right action based on current state.
@@ -2297,8 +2393,11 @@ async def _execute_smart_run(
 
     on_pause is cleared here so a paused recording resumes normally through the
     status-based routing below (status is already stable after hard pause).
+
+    With ``fair_share_weight`` (bulk run) pipelines are queued in the tenant's
+    fair-share queue instead of being published straight away.
     """
-    from api.tasks.processing import _launch_uploads_task, run_recording_task
+    from api.tasks.processing import _launch_uploads_task
 
     current_status = recording.status
 
@@ -2348,11 +2447,7 @@ async def _execute_smart_run(
         recording.on_air = True
         await ctx.session.commit()
         try:
-            task = run_recording_task.delay(
-                recording_id=recording_id,
-                user_id=ctx.user_id,
-                manual_override=manual_override,
-            )
+            task = _dispatch_pipeline(recording_id, ctx.user_id, manual_override, fair_share_weight)
         except Exception as exc:
             recording.on_air = False
             await ctx.session.commit()
@@ -2375,11 +2470,7 @@ async def _execute_smart_run(
         recording.on_air = True
         await ctx.session.commit()
         try:
-            task = run_recording_task.delay(
-                recording_id=recording_id,
-                user_id=ctx.user_id,
-                manual_override=manual_override,
-            )
+            task = _dispatch_pipeline(recording_id, ctx.user_id, manual_override, fair_share_weight)
         except Exception as exc:
             recording.on_air = False
             await ctx.session.commit()
@@ -2409,11 +2500,7 @@ async def _execute_smart_run(
             recording.on_air = True
             await ctx.session.commit()
             try:
-                task = run_recording_task.delay(
-                    recording_id=recording_id,
-                    user_id=ctx.user_id,
-                    manual_override=manual_override,
-                )
+                task = _dispatch_pipeline(recording_id, ctx.user_id, manual_override, fair_share_weight)
             except Exception as exc:
                 recording.on_air = False
                 await ctx.session.commit()
@@ -2683,7 +2770,8 @@ async def upload_recording(
 async def extract_topics(
     recording_id: int,
     granularity: Granularity = Query(Granularity.LONG, description="Topics granularity: short, medium, or long"),
-    version_id: str | None = Query(None, description="Version ID (optional)"),
+    version_id: str | None = Query(None, pattern=VERSION_ID_REGEX, description="Version ID (optional)"),
+    bypass_cache: bool = Query(False, description="Regenerate instead of reusing cached LLM responses"),
     ctx: ServiceContext = Depends(get_service_context),
     _feat: UserInDB = Depends(require_feature("can_process_video")),
 ) -> RecordingOperationResponse:
@@ -2717,6 +2805,7 @@ async def extract_topics(
         user_id=ctx.user_id,
         granularity=granularity,
         version_id=version_id,
+        bypass_cache=bypass_cache,
     )
 
     logger.info(
@@ -2740,7 +2829,8 @@ async def update_topics(
     ctx: ServiceContext = Depends(get_service_context),
 ) -> dict:
     """Partially update AI-generated content (summary, questions, main_topics, topic_timestamps)
-    of the active extracted.json version. Sets manually_edited=True on the version."""
+    of the active extraction version. Sets manually_edited=True on the version."""
+    from file_storage import PreconditionFailedError
     from transcription_module.manager import get_transcription_manager
 
     recording_repo = RecordingRepository(ctx.session)
@@ -2760,7 +2850,12 @@ async def update_topics(
     if "topic_timestamps" in payload:
         payload["topic_timestamps"] = [t.model_dump(exclude_none=True) for t in (data.topic_timestamps or [])]
 
-    updated_version = await transcription_manager.update_active_version(recording_id, user_slug, payload)
+    try:
+        updated_version = await transcription_manager.update_active_version(recording_id, user_slug, payload)
+    except PreconditionFailedError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Topics are being modified concurrently, retry the request"
+        ) from None
 
     # Keep DB cache in sync if main_topics changed
     if data.main_topics is not None:
@@ -3063,6 +3158,7 @@ async def pause_recording(
     recording.pipeline_task_id = None
     recording.pause_requested_at = datetime.now(UTC)
     await ctx.session.commit()
+    release_pipeline_slot(ctx.user_id, recording_id)
 
     logger.info(f"Paused (hard) | {format_details(rec=recording_id, rolled_back_to=stable_status)}")
 
@@ -3123,7 +3219,7 @@ async def reset_recording(
             await _delete_key("processed_video", recording.processed_video_path)
         await _delete_key("processed_audio_file", recording.processed_audio_path)
 
-        # Transcription artifacts are a prefix (master.json, extracted.json, cache/*).
+        # Transcription artifacts are a prefix (master.json, extracted/*, cache/*).
         if recording.transcription_dir:
             tx_prefix = _to_key(recording.transcription_dir)
             try:
@@ -3185,6 +3281,9 @@ async def reset_recording(
     # Delete processing_stages
     await ctx.session.execute(delete(ProcessingStageModel).where(ProcessingStageModel.recording_id == recording_id))
 
+    # Transcript is gone, so are its search hits
+    await TranscriptSearchRepository(ctx.session).delete_for_recording(recording_id)
+
     await ctx.session.commit()
 
     logger.info(
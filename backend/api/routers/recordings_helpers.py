@@ -243,7 +243,7 @@ def _build_export_row(
         recording: Recording model with outputs, main_topics, etc.
         platforms: List of platform keys (youtube, vk, ...) to include.
         verbosity: short (core + urls) or long (full details).
-        questions: Self-check questions from extracted.json (for verbosity=long).
+        questions: Self-check questions of the active topic version (for verbosity=long).
 
     Returns:
         Flat dict suitable for JSON/CSV/XLSX export.
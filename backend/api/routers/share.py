@@ -112,7 +112,7 @@ async def get_public_recording(
     }
     available_files = [key for key, path in candidate_keys.items() if await storage.exists(path)]
 
-    # Load active topic version from extracted.json for summary, questions, description
+    # Load active topic version (extracted/ manifest + version object) for summary, questions, description
     from api.helpers.template_renderer import TemplateRenderer, compute_metadata_preview
 
     summary: str | None = None
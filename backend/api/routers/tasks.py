@@ -1,15 +1,61 @@
 """Celery task status endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.auth.dependencies import get_current_user
+from api.dependencies import get_db_session, get_redis
 from api.schemas.auth import UserInDB
 from api.schemas.task import TaskCancelResponse, TaskStatusResponse
+from api.services.progress_events import get_progress_hub, stream_events
 from api.services.task_access_service import TaskAccessService
+from config.settings import get_settings
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["Tasks"])
 
 
+@router.get("/events", response_class=StreamingResponse)
+async def stream_task_events(
+    last_event_id: str | None = Header(default=None),
+    current_user: UserInDB = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> StreamingResponse:
+    """
+    Stream the current user's task progress and stage transitions (Server-Sent Events).
+
+    Events:
+        - progress: task progress update (task_id, recording_id, progress, status, step)
+        - task: task returned (task_id, recording_id, state)
+        - stage: processing stage status changed (recording_id, stage, status)
+        - recording: recording status changed (recording_id, status)
+        - resync: events since Last-Event-ID are no longer buffered, refetch state
+
+    Resume:
+        EventSource reconnects with the Last-Event-ID header; missed events are
+        replayed from the per-user buffer before live delivery continues.
+
+    Security:
+        Only events of the authenticated user are streamed
+    """
+    # Auth is done: don't hold a pooled DB connection for the lifetime of the stream
+    await session.close()
+
+    redis_client = await get_redis()
+    body = stream_events(
+        get_progress_hub(redis_client),
+        redis_client,
+        current_user.id,
+        last_event_id,
+        keepalive=get_settings().celery.progress_events_keepalive,
+    )
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{task_id}", response_model=TaskStatusResponse)
 async def get_task_status(
     task_id: str,
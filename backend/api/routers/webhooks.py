@@ -0,0 +1,44 @@
+"""Inbound webhooks from external providers (no user session; shared-secret auth)."""
+
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException, status
+
+from api.schemas.transcription import AssemblyAIWebhookPayload, WebhookAckResponse
+from assemblyai_module.service import TERMINAL_STATUSES, WEBHOOK_AUTH_HEADER
+from config.settings import get_settings
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/api/v1/webhooks", tags=["Webhooks"])
+
+
+@router.post("/assemblyai", response_model=WebhookAckResponse, status_code=status.HTTP_202_ACCEPTED)
+async def assemblyai_webhook(
+    payload: AssemblyAIWebhookPayload,
+    token: str | None = Header(None, alias=WEBHOOK_AUTH_HEADER),
+) -> WebhookAckResponse:
+    """Transcript finished: hand it to a worker that resumes the parked pipeline chain.
+
+    The heavy part (fetching words, saving master.json) runs in ``complete_transcription``;
+    this endpoint only authenticates and enqueues. Duplicate deliveries are harmless:
+    the pending job is claimed once.
+    """
+    aai = get_settings().assemblyai
+    if not aai.webhook_url:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Webhook not enabled")
+    if not aai.webhook_secret:
+        # Settings refuse this combination; never accept unauthenticated deliveries anyway
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Webhook secret not configured")
+    if not secrets.compare_digest(token or "", aai.webhook_secret):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook token")
+
+    if payload.status not in TERMINAL_STATUSES:
+        return WebhookAckResponse(accepted=False, transcript_id=payload.transcript_id)
+
+    from api.tasks.processing import resume_transcription_task
+
+    resume_transcription_task.delay(payload.transcript_id)
+    logger.info(f"AssemblyAI webhook | {format_details(transcript=payload.transcript_id, status=payload.status)}")
+    return WebhookAckResponse(accepted=True, transcript_id=payload.transcript_id)
@@ -11,6 +11,9 @@ from .stats import (
     AuditLogItem,
     AuditLogListResponse,
     PlanUsageStats,
+    TranscriptionCacheEntry,
+    TranscriptionCacheEvictResponse,
+    TranscriptionCacheListResponse,
     UsageEventResponse,
     UserQuotaDetails,
 )
@@ -26,6 +29,9 @@ __all__ = [
     "AuditLogItem",
     "AuditLogListResponse",
     "PlanUsageStats",
+    "TranscriptionCacheEntry",
+    "TranscriptionCacheEvictResponse",
+    "TranscriptionCacheListResponse",
     "UsageEventResponse",
     "UserQuotaDetails",
 ]
@@ -156,3 +156,34 @@ class AuditLogListResponse(PaginatedResponse):
     """Paginated administrative audit trail."""
 
     items: list[AuditLogItem]
+
+
+class TranscriptionCacheEntry(BaseModel):
+    """Cached ASR result metadata (the transcript itself is never returned)."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    cache_key: str
+    user_id: str
+    source_recording_id: int | None = None
+    audio_sha256: str
+    language: str | None = None
+    speech_model: str
+    keyterms_count: int
+    words_count: int
+    size_bytes: int
+    hit_count: int
+    last_hit_at: datetime | None = None
+    created_at: datetime
+
+
+class TranscriptionCacheListResponse(PaginatedResponse):
+    """Paginated transcription cache entries, newest first."""
+
+    items: list[TranscriptionCacheEntry]
+
+
+class TranscriptionCacheEvictResponse(BaseModel):
+    """Result of a bulk eviction."""
+
+    evicted: int
@@ -316,6 +316,8 @@ class QuotaStatusResponse(BaseModel):
     recordings: dict[str, int | None]  # {"used": 5, "limit": 10, "available": 5}
     storage: dict[str, float | None]  # {"used_gb": 2.5, "limit_gb": 5, "available_gb": 2.5}
     concurrent_tasks: dict[str, int | None]
+    # Admission semaphore: {"used": 2, "limit": 3, "available": 1, "deferred": 4}
+    pipeline_slots: dict[str, int | None] = Field(default_factory=dict)
     automation_jobs: dict[str, int | None]
     transcriptions: dict[str, int | None] = Field(default_factory=dict)
     processing: dict[str, int | None] = Field(default_factory=dict)
@@ -16,6 +16,10 @@ class TrimmingConfig(BaseModel):
     min_silence_duration: float = Field(default=2.0, ge=0.0)
     padding_before: float = Field(default=5.0, ge=0.0)
     padding_after: float = Field(default=5.0, ge=0.0)
+    compact_mode: bool = False
+    compact_min_gap_seconds: float = Field(default=480.0, ge=30.0)
+    compact_padding_seconds: float = Field(default=2.0, ge=0.0)
+    compact_video: bool = False
 
 
 class TranscriptionConfig(BaseModel):
@@ -47,6 +51,7 @@ class DownloadConfig(BaseModel):
 class UploadConfig(BaseModel):
     auto_upload: bool = False
     upload_captions: bool = True
+    early_upload: bool = False
     default_platforms: list[str] = Field(default_factory=list)
     default_preset_ids: dict[str, int] = Field(default_factory=dict)
 
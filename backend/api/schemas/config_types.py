@@ -21,6 +21,12 @@ class TrimmingConfigData(BaseModel):
     padding_before: float = Field(5.0, ge=0.0, description="Padding before audio (sec)")
     padding_after: float = Field(5.0, ge=0.0, description="Padding after audio (sec)")
 
+    # Compact mode: cut long internal breaks before transcription
+    compact_mode: bool = Field(False, description="Cut internal silences before transcription")
+    compact_min_gap_seconds: float = Field(480.0, ge=30.0, description="Shortest silence to cut (sec)")
+    compact_padding_seconds: float = Field(2.0, ge=0.0, description="Silence kept on each side of a cut (sec)")
+    compact_video: bool = Field(False, description="Cut the same silences from the video")
+
     # Trimming
     remove_intro: bool = Field(False, description="Remove intro")
     remove_outro: bool = Field(False, description="Remove outro")
@@ -41,6 +41,8 @@ from .response import (
     RecordingListItem,
     RecordingListResponse,
     RecordingResponse,
+    TranscriptSearchHit,
+    TranscriptSearchResponse,
 )
 
 __all__ = [
@@ -79,5 +81,7 @@ __all__ = [
     "TemplateBindResponse",
     "TemplateInfoResponse",
     "TemplateUnbindResponse",
+    "TranscriptSearchHit",
+    "TranscriptSearchResponse",
     "TrimVideoRequest",
 ]
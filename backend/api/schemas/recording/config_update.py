@@ -56,6 +56,7 @@ class OutputConfigUpdate(BaseModel):
     )
     auto_upload: bool | None = Field(None, description="Auto-upload after processing")
     upload_captions: bool | None = Field(None, description="Upload subtitles with video")
+    early_upload: bool | None = Field(None, description="Upload privately after trim, publish after topics")
 
     @field_validator("preset_ids")
     @classmethod
@@ -10,6 +10,7 @@ from api.schemas.recording.filters import RecordingFilters
 from api.schemas.template.metadata_config import TemplateMetadataConfig
 from api.schemas.validators import DateRangeMixin
 from api.shared.enums import Granularity
+from api.shared.types import VERSION_ID_REGEX
 
 # ============================================================================
 # Add by URL / Playlist / Yandex Disk
@@ -447,7 +448,12 @@ class BulkTopicsRequest(BulkOperationRequest):
     granularity: Granularity = Field(
         Granularity.LONG, description="Extraction mode: short (large), medium, or long (detailed)"
     )
-    version_id: str | None = Field(None, description="Version ID (if not specified, generated automatically)")
+    version_id: str | None = Field(
+        None,
+        pattern=VERSION_ID_REGEX,
+        description="Version ID (if not specified, generated automatically)",
+    )
+    bypass_cache: bool = Field(False, description="Regenerate instead of reusing cached LLM responses")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -635,7 +641,7 @@ class TopicTimestampUpdate(BaseModel):
 
 
 class TopicsUpdateRequest(BaseModel):
-    """Partial update of the active extracted.json version (AI-generated content)."""
+    """Partial update of the active extraction version (AI-generated content)."""
 
     summary: str | None = None
     description: str | None = None
@@ -329,6 +329,28 @@ class RecordingListResponse(PaginatedResponse):
     items: list[RecordingListItem]
 
 
+class TranscriptSearchHit(BaseModel):
+    """Single transcript segment matching a search query."""
+
+    recording_id: int
+    display_name: str
+    segment_index: int
+    start: float = Field(..., description="Segment start, seconds from recording start")
+    end: float
+    snippet: str = Field(..., description="Segment text with matches wrapped in <mark></mark>")
+    rank: float
+
+
+class TranscriptSearchResponse(BaseModel):
+    """Ranked transcript search hits (no total: counting every match is not free on large archives)."""
+
+    query: str
+    page: int
+    per_page: int
+    has_more: bool
+    items: list[TranscriptSearchHit]
+
+
 class DetailedRecordingResponse(RecordingResponse):
     """Extended response model with detailed information."""
 
@@ -26,6 +26,7 @@ class TemplateOutputConfig(BaseModel):
     - preset_ids: list of presets for auto-upload (empty = manual upload only)
     - auto_upload: automatic upload after processing
     - upload_captions: upload subtitles with video (if platform supports)
+    - early_upload: upload privately right after trim, publish once topics are ready
     """
 
     model_config = BASE_MODEL_CONFIG
@@ -46,6 +47,11 @@ class TemplateOutputConfig(BaseModel):
         description="Upload captions with video (if platform supports)",
     )
 
+    early_upload: bool = Field(
+        False,
+        description="Start YouTube/VK uploads privately right after trim; patch metadata and publish after topics",
+    )
+
     default_platforms: list[str] = Field(
         default_factory=list,
         description="Legacy upload.default_platforms carried through resolver merge",
@@ -196,3 +196,17 @@ class BatchTranscribeResponse(BaseModel):
     queued: int
     errors: int
     tasks: list[BatchTranscribeTaskInfo]
+
+
+class AssemblyAIWebhookPayload(BaseModel):
+    """Body AssemblyAI POSTs to ``webhook_url`` when a transcript reaches a final state."""
+
+    transcript_id: str
+    status: str
+
+
+class WebhookAckResponse(BaseModel):
+    """Webhook acknowledgement."""
+
+    accepted: bool
+    transcript_id: str
@@ -0,0 +1,118 @@
+"""Per-account admission semaphore for AssemblyAI jobs (``account_concurrency``)."""
+
+import asyncio
+import hashlib
+import time
+import uuid
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+import redis
+
+from config.settings import get_settings
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+ASR_JOB_SLOTS_KEY_PREFIX = "leap:asr:jobs:"
+ASR_JOB_SLOT_LEASE_SECONDS = 120
+
+
+def account_id(api_key: str) -> str:
+    """Stable key for an AssemblyAI account that does not put the API key into Redis."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+class AsrJobSlots:
+    """Redis counting semaphore: one slot per AssemblyAI job in flight, ``limit`` per account.
+
+    Same lease scheme as ``PipelineSlots``: holders are job tokens scored by lease
+    expiry, so a chunk whose worker crashed stops counting once its lease runs
+    out (a holder renews it while its job is in flight). Every worker transcribing
+    chunks on the same API key shares the cap.
+
+    Key: ``leap:asr:jobs:<account>`` — sorted set ``token -> lease expiry``
+    """
+
+    def __init__(self, redis_client: redis.Redis, lease_seconds: int = ASR_JOB_SLOT_LEASE_SECONDS):
+        self.redis = redis_client
+        self.lease_seconds = lease_seconds
+
+    def _holders_key(self, account: str) -> str:
+        return f"{ASR_JOB_SLOTS_KEY_PREFIX}{account}"
+
+    def acquire(self, account: str, token: str, limit: int) -> bool:
+        """Take a slot for ``token`` (re-acquiring a held slot renews it)."""
+        key = self._holders_key(account)
+
+        def _try(pipe) -> bool:
+            now = time.time()
+            held = pipe.zscore(key, token)
+            active = int(pipe.zcount(key, now, "+inf"))
+            if held is None and active >= limit:
+                return False
+            pipe.multi()
+            pipe.zremrangebyscore(key, "-inf", now)
+            pipe.zadd(key, {token: now + self.lease_seconds})
+            pipe.expire(key, self.lease_seconds)
+            return True
+
+        # WATCH/MULTI: a concurrent acquire on the same account retries instead of overbooking
+        return bool(self.redis.transaction(_try, key, value_from_callable=True))
+
+    def renew(self, account: str, token: str) -> None:
+        """Extend a held lease (no-op if the token holds no slot)."""
+        key = self._holders_key(account)
+        if self.redis.zadd(key, {token: time.time() + self.lease_seconds}, xx=True, ch=True):
+            self.redis.expire(key, self.lease_seconds)
+
+    def release(self, account: str, token: str) -> bool:
+        """Free the token's slot. True if it held one."""
+        return bool(self.redis.zrem(self._holders_key(account), token))
+
+    def usage(self, account: str) -> int:
+        """Slots in use for the account."""
+        return int(self.redis.zcount(self._holders_key(account), time.time(), "+inf"))
+
+    @asynccontextmanager
+    async def hold(self, api_key: str, limit: int, wait_interval: float) -> AsyncGenerator[None, None]:
+        """Wait for a free slot on the key's account, keep its lease renewed while the body runs, then free it.
+
+        Redis calls go through a thread so a waiting chunk does not stall the worker loop.
+        """
+        account = account_id(api_key)
+        token = uuid.uuid4().hex
+        while not await asyncio.to_thread(self.acquire, account, token, limit):
+            await asyncio.sleep(wait_interval)
+
+        async def _renew() -> None:
+            while True:
+                await asyncio.sleep(self.lease_seconds / 3)
+                try:
+                    await asyncio.to_thread(self.renew, account, token)
+                except Exception as e:
+                    logger.warning(f"ASR job slot renew failed | {format_details(error=repr(e))}")
+
+        renewer = asyncio.create_task(_renew())
+        try:
+            yield
+        finally:
+            renewer.cancel()
+            try:
+                await asyncio.to_thread(self.release, account, token)
+            except Exception as e:
+                # The lease expires anyway; do not mask the job's own outcome
+                logger.warning(f"ASR job slot release failed | {format_details(error=repr(e))}")
+
+
+_slots: AsrJobSlots | None = None
+
+
+def get_asr_job_slots() -> AsrJobSlots:
+    """Process-wide semaphore on a sync Redis client."""
+    global _slots
+    if _slots is None:
+        settings = get_settings()
+        client = redis.Redis.from_url(settings.celery.broker_url, decode_responses=True)
+        _slots = AsrJobSlots(client)
+    return _slots
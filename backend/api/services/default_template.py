@@ -18,7 +18,7 @@ def upload_config_to_output(upload: dict[str, Any]) -> dict[str, Any]:
     result: dict[str, Any] = {"preset_ids": [], "auto_upload": False, "upload_captions": True}
     if not upload:
         return result
-    for key in ("auto_upload", "upload_captions", "default_platforms"):
+    for key in ("auto_upload", "upload_captions", "early_upload", "default_platforms"):
         if key in upload:
             result[key] = copy.deepcopy(upload[key])
     preset_ids = upload.get("default_preset_ids")
@@ -0,0 +1,184 @@
+"""Tenant fair-share dispatch of bulk pipeline runs (per-tenant virtual queues in Redis)."""
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any, cast
+from uuid import uuid4
+
+import redis
+
+from api.observability.metrics import ENQUEUE_KEY_PREFIX, FAIR_SHARE_ENQUEUE_PREFIX
+from config.settings import get_settings
+from logger import format_details, get_logger, short_user_id
+
+logger = get_logger()
+
+FAIR_SHARE_KEY_PREFIX = "leap:fair:"
+# Celery queues whose backlog bounds how much the dispatcher releases per tick
+PIPELINE_QUEUES = ("downloads", "processing_cpu", "async_operations")
+
+
+class FairShareQueue:
+    """Per-tenant virtual queues drained into Celery by weighted fair queuing.
+
+    Bulk entry points (playlist auto-run, bulk run) push tasks here instead of
+    straight into Celery. Every dispatch advances the tenant's virtual time by
+    ``1 / weight`` and the tenant with the lowest virtual time goes next, so
+    tenants are interleaved in proportion to their weight. A tenant joining the
+    queue starts at the current minimum: a 500-video playlist cannot bank credit
+    ahead of the others.
+
+    Keys (``<q>`` is the Celery queue the tasks are routed to):
+
+    - ``leap:fair:<q>:<user_id>`` — list of pending task payloads (FIFO)
+    - ``leap:fair:<q>:tenants`` — sorted set ``user_id -> virtual time``
+    - ``leap:fair:<q>:weights`` — hash ``user_id -> weight``
+    - ``leap:enq:fair:<q>:<user_id>`` — sorted set ``task_id -> enqueued at``,
+      read by the queue age collector (``api.observability.metrics``)
+
+    Only the dispatcher pops (under ``lock()``); submitters only append.
+    """
+
+    def __init__(self, redis_client: redis.Redis, queue: str = "async_operations"):
+        self.redis = redis_client
+        self.queue = queue
+        self.prefix = f"{FAIR_SHARE_KEY_PREFIX}{queue}:"
+        self.tenants_key = f"{self.prefix}tenants"
+        self.weights_key = f"{self.prefix}weights"
+
+    def _items_key(self, user_id: str) -> str:
+        return f"{self.prefix}{user_id}"
+
+    def _wait_key(self, user_id: str) -> str:
+        return f"{FAIR_SHARE_ENQUEUE_PREFIX}{self.queue}:{user_id}"
+
+    def _lowest(self) -> tuple[str, float] | None:
+        lowest = cast("list[tuple[str, float]]", self.redis.zrange(self.tenants_key, 0, 0, withscores=True))
+        return (lowest[0][0], float(lowest[0][1])) if lowest else None
+
+    def submit(self, user_id: str, task_name: str, kwargs: dict[str, Any], weight: int = 1) -> str:
+        """Queue a task for ``user_id``. Returns the task id it will be published with."""
+        task_id = str(uuid4())
+        now = time.time()
+        payload = {"task": task_name, "task_id": task_id, "kwargs": kwargs, "enqueued_at": now}
+
+        self.redis.rpush(self._items_key(user_id), json.dumps(payload))
+        self.redis.zadd(self._wait_key(user_id), {task_id: now})
+        self.redis.hset(self.weights_key, user_id, max(int(weight), 1))
+        self._join(user_id)
+        return task_id
+
+    def _join(self, user_id: str) -> None:
+        """Enter a tenant at the current minimum virtual time (no-op if already queued)."""
+        lowest = self._lowest()
+        self.redis.zadd(self.tenants_key, {user_id: lowest[1] if lowest else 0.0}, nx=True)
+
+    def pop(self) -> tuple[str, dict[str, Any]] | None:
+        """Next ``(user_id, payload)`` in fair-share order, or None when all queues are empty."""
+        while (lowest := self._lowest()) is not None:
+            user_id, vtime = lowest
+            raw = self.redis.lpop(self._items_key(user_id))
+            if raw is None:
+                self._retire(user_id)
+                continue
+
+            weight = float(self.redis.hget(self.weights_key, user_id) or 1)
+            self.redis.zadd(self.tenants_key, {user_id: vtime + 1 / weight}, xx=True)
+            payload = json.loads(raw)
+            self.redis.zrem(self._wait_key(user_id), payload["task_id"])
+            if not self.redis.llen(self._items_key(user_id)):
+                self._retire(user_id)
+            return user_id, payload
+        return None
+
+    def _retire(self, user_id: str) -> None:
+        """Drop an empty tenant, re-adding it if a submit raced the removal."""
+        self.redis.zrem(self.tenants_key, user_id)
+        if self.redis.llen(self._items_key(user_id)):
+            self._join(user_id)
+        else:
+            self.redis.hdel(self.weights_key, user_id)
+
+    def requeue(self, user_id: str, payload: dict[str, Any]) -> None:
+        """Put a popped payload back at the head of the tenant's queue (publish failed)."""
+        self.redis.lpush(self._items_key(user_id), json.dumps(payload))
+        self.redis.zadd(self._wait_key(user_id), {payload["task_id"]: payload["enqueued_at"]})
+        self._join(user_id)
+
+    def drain(self, budget: int, publish: Callable[[dict[str, Any]], Any]) -> int:
+        """Publish up to ``budget`` queued tasks in fair-share order via ``publish(payload)``."""
+        dispatched = 0
+        while dispatched < budget:
+            item = self.pop()
+            if item is None:
+                break
+            user_id, payload = item
+            try:
+                publish(payload)
+            except Exception as e:
+                self.requeue(user_id, payload)
+                logger.warning(
+                    f"Fair-share publish failed | {format_details(user=short_user_id(user_id), error=repr(e))}"
+                )
+                break
+            dispatched += 1
+        return dispatched
+
+    def depth(self) -> dict[str, int]:
+        """Pending tasks per tenant."""
+        return {
+            user_id: int(self.redis.llen(self._items_key(user_id)))
+            for user_id in cast("list[str]", self.redis.zrange(self.tenants_key, 0, -1))
+        }
+
+    def lock(self, timeout: int) -> str | None:
+        """Take the single-dispatcher lock (released by expiry or ``unlock``). Returns its token."""
+        token = uuid4().hex
+        return token if self.redis.set(f"{self.prefix}lock", token, nx=True, ex=timeout) else None
+
+    def unlock(self, token: str) -> None:
+        """Release the lock if it is still ours: after expiry it may belong to another dispatcher."""
+        key = f"{self.prefix}lock"
+
+        def _release(pipe) -> None:
+            if pipe.get(key) == token:
+                pipe.multi()
+                pipe.delete(key)
+
+        # WATCH/MULTI: a lock re-taken between GET and DEL aborts the delete
+        self.redis.transaction(_release, key)
+
+
+def pending_pipeline_tasks(redis_client: redis.Redis, stale_after: float) -> int:
+    """Published-but-not-started tasks across the pipeline queues (from the enqueue timestamps).
+
+    Entries older than ``stale_after`` are ignored: revoked tasks never start and
+    would otherwise hold the dispatcher's budget forever.
+    """
+    since = time.time() - stale_after
+    return sum(int(redis_client.zcount(f"{ENQUEUE_KEY_PREFIX}{q}", since, "+inf")) for q in PIPELINE_QUEUES)
+
+
+def fair_share_weight(quotas: dict[str, int | None]) -> int:
+    """Tenant weight from its effective plan quotas: ``max_concurrent_tasks``, capped.
+
+    Unlimited plans (``None``) get the cap.
+    """
+    max_weight = get_settings().celery.fair_share_max_weight
+    max_tasks = quotas.get("max_concurrent_tasks")
+    if max_tasks is None:
+        return max_weight
+    return min(max(int(max_tasks), 1), max_weight)
+
+
+_queue: FairShareQueue | None = None
+
+
+def get_fair_share_queue() -> FairShareQueue:
+    """Process-wide queue for pipeline runs on a sync Redis client."""
+    global _queue
+    if _queue is None:
+        client = redis.Redis.from_url(get_settings().celery.broker_url, decode_responses=True)
+        _queue = FairShareQueue(client)
+    return _queue
@@ -0,0 +1,331 @@
+"""Node affinity for a recording's heavy stages (download -> trim -> upload).
+
+Each chain stage normally lands on whatever worker takes it from the shared
+queue, and every stage round-trips the video through storage. With affinity
+enabled, the node that runs download (then trim) pins the recording: trim and
+upload are routed to that node's own queue (``<queue>.<node>``) and read the
+artifacts from its local scratch (``file_storage.scratch``). A stage falls back
+to the shared queue when the pinned node has no heartbeat or its queue is
+backlogged; it then reads from storage as before.
+"""
+
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any, cast
+
+import redis
+from celery import states
+
+from api.observability.metrics import artifact_fetch_bytes_total, recording_artifact_bytes
+from config.settings import get_settings
+from file_storage.backends.base import StorageBackend
+from file_storage.scratch import ArtifactScratch, get_artifact_scratch
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+AFFINITY_KEY_PREFIX = "leap:affinity:"
+# Stage tasks that follow the pinned node -> shared queue they fall back to
+AFFINITY_TASKS = {
+    "api.tasks.processing.download_recording": "downloads",
+    "api.tasks.processing.trim_video": "processing_cpu",
+    "api.tasks.upload.upload_recording_to_platform": "uploads",
+}
+# Stages that (re)pin the recording to the node they run on
+PINNING_TASKS = ("api.tasks.processing.download_recording", "api.tasks.processing.trim_video")
+ARTIFACT_SOURCES = ("storage", "scratch")
+SCRATCH_SWEEP_INTERVAL = 300
+
+
+def current_node() -> str:
+    return get_settings().celery.affinity_node or socket.gethostname()
+
+
+def node_queue(queue: str, node: str) -> str:
+    return f"{queue}.{node}"
+
+
+class NodeAffinity:
+    """Recording -> node pins, node queue liveness and artifact transfer accounting.
+
+    Keys:
+
+    - ``leap:affinity:rec:<recording_id>`` — hash: ``node``, ``uploads`` (uploads in
+      flight), ``done`` (pipeline finished), ``storage_bytes`` / ``scratch_bytes``
+    - ``leap:affinity:alive:<queue>.<node>`` — consumer heartbeat of a node queue (TTL)
+
+    A pin lives until the pipeline is finished and its last upload has returned
+    (or ``pin_ttl``); the node's scratch copies of the recording go with it.
+    """
+
+    def __init__(self, redis_client: redis.Redis, pin_ttl: int, heartbeat_ttl: int, max_backlog: int):
+        self.redis = redis_client
+        self.pin_ttl = pin_ttl
+        self.heartbeat_ttl = heartbeat_ttl
+        self.max_backlog = max_backlog
+
+    def _pin_key(self, recording_id: int) -> str:
+        return f"{AFFINITY_KEY_PREFIX}rec:{recording_id}"
+
+    def _alive_key(self, queue: str) -> str:
+        return f"{AFFINITY_KEY_PREFIX}alive:{queue}"
+
+    def pin(self, recording_id: int, node: str) -> None:
+        key = self._pin_key(recording_id)
+        self.redis.hset(key, "node", node)
+        self.redis.expire(key, self.pin_ttl)
+
+    def pinned_node(self, recording_id: int) -> str | None:
+        return self.redis.hget(self._pin_key(recording_id), "node")
+
+    def route(self, recording_id: int, queue: str) -> str | None:
+        """Node queue for a stage of ``recording_id``, or None to use the shared ``queue``."""
+        node = self.pinned_node(recording_id)
+        if node is None:
+            return None
+        target = node_queue(queue, node)
+        if not self.redis.exists(self._alive_key(target)):
+            return None
+        if int(self.redis.llen(target)) >= self.max_backlog:
+            return None
+        return target
+
+    def heartbeat(self, queues: list[str]) -> None:
+        for queue in queues:
+            self.redis.set(self._alive_key(queue), "1", ex=self.heartbeat_ttl)
+
+    def count(self, recording_id: int, source: str, nbytes: int) -> None:
+        key = self._pin_key(recording_id)
+        self.redis.hincrby(key, f"{source}_bytes", nbytes)
+        self.redis.expire(key, self.pin_ttl)
+
+    def hold(self, recording_id: int) -> None:
+        """An upload that reads the recording's artifacts was launched."""
+        key = self._pin_key(recording_id)
+        self.redis.hincrby(key, "uploads", 1)
+        self.redis.expire(key, self.pin_ttl)
+
+    def release(self, recording_id: int) -> dict[str, int] | None:
+        """An upload returned for good. Returns the transfer totals if this unpinned the recording."""
+        self.redis.hincrby(self._pin_key(recording_id), "uploads", -1)
+        return self._unpin_if_idle(recording_id)
+
+    def finish(self, recording_id: int) -> dict[str, int] | None:
+        """The pipeline ended. Returns the transfer totals if this unpinned the recording."""
+        self.redis.hset(self._pin_key(recording_id), "done", 1)
+        return self._unpin_if_idle(recording_id)
+
+    def _unpin_if_idle(self, recording_id: int) -> dict[str, int] | None:
+        key = self._pin_key(recording_id)
+        pin = cast("dict[str, str]", self.redis.hgetall(key))
+        if not pin.get("done") or int(pin.get("uploads", 0)) > 0:
+            self.redis.expire(key, self.pin_ttl)
+            return None
+        if not self.redis.delete(key):
+            return None  # a concurrent release/finish already unpinned it
+        return {source: int(pin.get(f"{source}_bytes", 0)) for source in ARTIFACT_SOURCES}
+
+
+_affinity: NodeAffinity | None = None
+
+
+def get_node_affinity() -> NodeAffinity:
+    """Process-wide affinity state on a sync Redis client."""
+    global _affinity
+    if _affinity is None:
+        celery = get_settings().celery
+        client = redis.Redis.from_url(celery.broker_url, decode_responses=True)
+        _affinity = NodeAffinity(
+            client,
+            pin_ttl=celery.affinity_scratch_ttl,
+            heartbeat_ttl=celery.affinity_heartbeat_ttl,
+            max_backlog=celery.affinity_max_backlog,
+        )
+    return _affinity
+
+
+def _enabled() -> bool:
+    return get_settings().celery.affinity_enabled
+
+
+def route_stage_to_node(name, args, kwargs, options, task=None, **_kw) -> dict[str, str] | None:  # noqa: ARG001
+    """Celery router: pin download/trim/upload of a recording to its node's queue when that node can take it."""
+    queue = AFFINITY_TASKS.get(name)
+    if queue is None or not _enabled():
+        return None
+    recording_id = args[0] if args else (kwargs or {}).get("recording_id")
+    if recording_id is None:
+        return None
+    try:
+        target = get_node_affinity().route(recording_id, queue)
+    except Exception as e:
+        logger.debug(f"Affinity routing skipped: {e!r}")
+        return None
+    return {"queue": target} if target else None
+
+
+def pin_recording(task_name: str, recording_id: int) -> None:
+    """Best-effort: pin the recording to this node when a pinning stage starts here."""
+    if task_name not in PINNING_TASKS or not _enabled():
+        return
+    try:
+        get_node_affinity().pin(recording_id, current_node())
+    except Exception as e:
+        logger.debug(f"Affinity pin failed: {e!r}")
+
+
+def hold_recording_artifacts(recording_id: int) -> None:
+    """Best-effort: keep the recording pinned until the launched upload returns."""
+    if not _enabled():
+        return
+    try:
+        get_node_affinity().hold(recording_id)
+    except Exception as e:
+        logger.debug(f"Affinity hold failed: {e!r}")
+
+
+def release_recording_artifacts(recording_id: int, state: str) -> None:
+    """Best-effort: an upload returned. Retries (``state`` not ready) keep the hold."""
+    if not _enabled() or state not in states.READY_STATES:
+        return
+    try:
+        totals = get_node_affinity().release(recording_id)
+    except Exception as e:
+        logger.debug(f"Affinity release failed: {e!r}")
+        return
+    _report_unpinned(recording_id, totals)
+
+
+def finish_recording_artifacts(recording_id: int) -> None:
+    """Best-effort: the pipeline ended (finalize or failure); unpin once no upload holds the artifacts."""
+    if not _enabled():
+        return
+    try:
+        totals = get_node_affinity().finish(recording_id)
+    except Exception as e:
+        logger.debug(f"Affinity finish failed: {e!r}")
+        return
+    _report_unpinned(recording_id, totals)
+
+
+def _report_unpinned(recording_id: int, totals: dict[str, int] | None) -> None:
+    if totals is None:
+        return
+    for source, nbytes in totals.items():
+        recording_artifact_bytes.labels(source=source).observe(nbytes)
+    read = sum(totals.values())
+    saved = f"{totals['scratch'] / read:.0%}" if read else "-"
+    logger.info(
+        f"Recording unpinned | {format_details(rec=recording_id, storage_mb=totals['storage'] // 2**20, scratch_mb=totals['scratch'] // 2**20, saved=saved)}"
+    )
+
+
+def keep_artifact(key: str, local_path: Path) -> None:
+    """Keep a node-local copy of an artifact just written to storage (no-op without affinity)."""
+    scratch = get_artifact_scratch()
+    if scratch is not None:
+        scratch.keep(key, local_path)
+
+
+async def fetch_artifact(storage: StorageBackend, key: str, local_path: Path, *, recording_id: int, stage: str) -> None:
+    """Materialize an artifact into ``local_path``: node scratch copy if current, else storage.
+
+    Bytes are counted per source (``leap_artifact_fetch_bytes_total``) and, with
+    affinity enabled, per recording.
+    """
+    scratch = get_artifact_scratch()
+    source = "storage"
+    if scratch is not None and scratch.materialize(key, local_path, await storage.get_size(key)):
+        source = "scratch"
+    else:
+        await storage.download_to_file(key, local_path)
+
+    nbytes = local_path.stat().st_size
+    artifact_fetch_bytes_total.labels(stage=stage, source=source).inc(nbytes)
+    logger.debug(f"Artifact materialized | {format_details(key=key, source=source, mb=nbytes // 2**20)}")
+    if scratch is not None:
+        try:
+            get_node_affinity().count(recording_id, source, nbytes)
+        except Exception as e:
+            logger.debug(f"Affinity transfer count failed: {e!r}")
+
+
+class _NodeHeartbeat(threading.Thread):
+    """Worker thread: heartbeats this node's queues and sweeps unpinned scratch copies."""
+
+    def __init__(self, node: str, queues: list[str]):
+        super().__init__(name="affinity-heartbeat", daemon=True)
+        self.node = node
+        self.queues = queues
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        affinity = get_node_affinity()
+        interval = max(affinity.heartbeat_ttl / 3, 1)
+        last_sweep = 0.0
+        while not self.stopped.is_set():
+            try:
+                affinity.heartbeat(self.queues)
+                if time.monotonic() - last_sweep >= SCRATCH_SWEEP_INTERVAL:
+                    last_sweep = time.monotonic()
+                    sweep_scratch(affinity, self.node)
+            except Exception as e:
+                logger.warning(f"Affinity heartbeat failed | {format_details(error=repr(e))}")
+            self.stopped.wait(interval)
+
+    def stop(self) -> None:
+        self.stopped.set()
+        try:
+            get_node_affinity().redis.delete(*(f"{AFFINITY_KEY_PREFIX}alive:{queue}" for queue in self.queues))
+        except Exception as e:
+            logger.debug(f"Affinity heartbeat cleanup failed: {e!r}")
+
+
+def sweep_scratch(affinity: NodeAffinity, node: str, scratch: ArtifactScratch | None = None) -> int:
+    """Evict scratch copies of recordings no longer pinned to ``node``, then apply the size/age limits."""
+    scratch = scratch or get_artifact_scratch()
+    if scratch is None:
+        return 0
+    freed = 0
+    for recording_id, directory in list(scratch.recording_dirs()):
+        if affinity.pinned_node(recording_id) != node:
+            freed += scratch.evict(directory)
+    freed += scratch.enforce_limits()
+    if freed:
+        logger.info(f"Scratch swept | {format_details(node=node, freed_mb=freed // 2**20)}")
+    return freed
+
+
+_heartbeat: _NodeHeartbeat | None = None
+
+
+def start_node_queues(amqp_queues: Any) -> list[str]:
+    """Consume this node's queues next to the shared ones and start heartbeating them.
+
+    Called from ``celeryd_after_setup`` with the worker's ``app.amqp.queues``.
+    Returns the added node queues (none when affinity is disabled or the worker
+    consumes no affinity queue).
+    """
+    global _heartbeat
+    if not _enabled() or _heartbeat is not None:
+        return []
+    node = current_node()
+    consumed = amqp_queues.consume_from
+    shared = [q for q in dict.fromkeys(AFFINITY_TASKS.values()) if consumed is None or q in consumed]
+    added = [node_queue(queue, node) for queue in shared]
+    for queue in added:
+        amqp_queues.select_add(queue)
+    if added:
+        _heartbeat = _NodeHeartbeat(node, added)
+        _heartbeat.start()
+        logger.info(f"Node queues consumed | {format_details(node=node, queues=added)}")
+    return added
+
+
+def stop_node_queues() -> None:
+    global _heartbeat
+    heartbeat, _heartbeat = _heartbeat, None
+    if heartbeat is not None:
+        heartbeat.stop()
@@ -0,0 +1,60 @@
+"""Registry of submitted-but-unfinished ASR transcripts (non-blocking transcription)."""
+
+import json
+import time
+from typing import Any, cast
+
+import redis
+
+from config.settings import get_settings
+from logger import get_logger
+
+logger = get_logger()
+
+PENDING_TRANSCRIPTS_KEY = "leap:asr:pending"
+
+
+class PendingTranscriptStore:
+    """Redis hash ``transcript_id -> job`` shared by the submit task, webhook and poller.
+
+    A job carries everything needed to finish transcription in a fresh task and the
+    serialized rest of the Celery chain. ``claim`` is atomic, so a transcript resumed
+    by the webhook is never resumed a second time by the poller (or vice versa).
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self.key = PENDING_TRANSCRIPTS_KEY
+
+    def add(self, transcript_id: str, job: dict[str, Any]) -> None:
+        """Register a submitted transcript."""
+        payload = {**job, "submitted_at": job.get("submitted_at") or time.time()}
+        self.redis.hset(self.key, transcript_id, json.dumps(payload))
+        logger.debug(f"Pending transcript registered: id={transcript_id} rec={job.get('recording_id')}")
+
+    def claim(self, transcript_id: str) -> dict[str, Any] | None:
+        """Remove and return the job (one-time). None if unknown or already claimed."""
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hget(self.key, transcript_id)
+        pipe.hdel(self.key, transcript_id)
+        raw, deleted = pipe.execute()
+        if not raw or not deleted:
+            return None
+        return json.loads(raw)
+
+    def all(self) -> dict[str, dict[str, Any]]:
+        """All outstanding jobs keyed by transcript id."""
+        jobs = cast("dict[str, str]", self.redis.hgetall(self.key))
+        return {tid: json.loads(raw) for tid, raw in jobs.items()}
+
+
+_store: PendingTranscriptStore | None = None
+
+
+def get_pending_transcript_store() -> PendingTranscriptStore:
+    """Process-wide store on a sync Redis client (safe across per-task event loops)."""
+    global _store
+    if _store is None:
+        client = redis.Redis.from_url(get_settings().celery.broker_url, decode_responses=True)
+        _store = PendingTranscriptStore(client)
+    return _store
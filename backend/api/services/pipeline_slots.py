@@ -0,0 +1,148 @@
+"""Per-tenant admission semaphore for running pipelines (``max_concurrent_tasks``)."""
+
+import json
+import time
+from typing import Any
+
+import redis
+
+from config.settings import get_settings
+from logger import format_details, get_logger, short_user_id
+
+logger = get_logger()
+
+PIPELINE_SLOTS_KEY_PREFIX = "leap:slots:"
+RUN_RECORDING_TASK = "api.tasks.processing.run_recording"
+
+
+class PipelineSlots:
+    """Redis counting semaphore: one slot per running pipeline, ``max_concurrent_tasks`` per tenant.
+
+    A slot is a lease, not a counter: holders are recording ids scored by lease
+    expiry, so a pipeline whose worker crashed stops counting once its lease runs
+    out (pipeline steps renew it). Runs that find no free slot wait in the
+    tenant's deferred queue and are re-published when a slot is released.
+
+    Keys:
+
+    - ``leap:slots:<user_id>`` — sorted set ``recording_id -> lease expiry``
+    - ``leap:slots:<user_id>:deferred`` — list of deferred ``run_recording`` kwargs (FIFO)
+    - ``leap:slots:deferred`` — set of tenants with deferred runs (for the promoter)
+    """
+
+    def __init__(self, redis_client: redis.Redis, lease_seconds: int):
+        self.redis = redis_client
+        self.lease_seconds = lease_seconds
+        self.deferred_tenants_key = f"{PIPELINE_SLOTS_KEY_PREFIX}deferred"
+
+    def _holders_key(self, user_id: str) -> str:
+        return f"{PIPELINE_SLOTS_KEY_PREFIX}{user_id}"
+
+    def _deferred_key(self, user_id: str) -> str:
+        return f"{PIPELINE_SLOTS_KEY_PREFIX}{user_id}:deferred"
+
+    def acquire(self, user_id: str, recording_id: int, limit: int | None) -> bool:
+        """Take a slot for ``recording_id`` (re-acquiring a held slot renews it). None = unlimited."""
+        key = self._holders_key(user_id)
+        member = str(recording_id)
+
+        def _try(pipe) -> bool:
+            now = time.time()
+            held = pipe.zscore(key, member)
+            active = int(pipe.zcount(key, now, "+inf"))
+            if limit is not None and held is None and active >= limit:
+                return False
+            pipe.multi()
+            pipe.zremrangebyscore(key, "-inf", now)
+            pipe.zadd(key, {member: now + self.lease_seconds})
+            pipe.expire(key, self.lease_seconds)
+            return True
+
+        # WATCH/MULTI: a concurrent acquire for the same tenant retries instead of overbooking
+        return bool(self.redis.transaction(_try, key, value_from_callable=True))
+
+    def renew(self, user_id: str, recording_id: int) -> None:
+        """Extend a held lease (no-op if the recording holds no slot)."""
+        key = self._holders_key(user_id)
+        if self.redis.zadd(key, {str(recording_id): time.time() + self.lease_seconds}, xx=True, ch=True):
+            self.redis.expire(key, self.lease_seconds)
+
+    def release(self, user_id: str, recording_id: int) -> bool:
+        """Free the recording's slot. True if it held one."""
+        return bool(self.redis.zrem(self._holders_key(user_id), str(recording_id)))
+
+    def defer(self, user_id: str, run_kwargs: dict[str, Any], limit: int | None) -> int:
+        """Queue a run that found no free slot. Returns the tenant's deferred count."""
+        payload = {"kwargs": run_kwargs, "limit": limit, "deferred_at": time.time()}
+        depth = int(self.redis.rpush(self._deferred_key(user_id), json.dumps(payload)))
+        self.redis.sadd(self.deferred_tenants_key, user_id)
+        return depth
+
+    def usage(self, user_id: str) -> tuple[int, int]:
+        """``(slots in use, deferred runs)`` for the tenant."""
+        used = int(self.redis.zcount(self._holders_key(user_id), time.time(), "+inf"))
+        return used, int(self.redis.llen(self._deferred_key(user_id)))
+
+    def take_deferred(self, user_id: str) -> list[dict[str, Any]]:
+        """Pop as many deferred runs as the tenant has free slots (by the limit stored with them)."""
+        taken: list[dict[str, Any]] = []
+        key = self._deferred_key(user_id)
+        used, _ = self.usage(user_id)
+        while True:
+            head = self.redis.lindex(key, 0)
+            if head is None:
+                self.redis.srem(self.deferred_tenants_key, user_id)
+                if self.redis.llen(key):  # a defer raced the removal
+                    self.redis.sadd(self.deferred_tenants_key, user_id)
+                break
+            limit = json.loads(head)["limit"]
+            if limit is not None and used + len(taken) >= limit:
+                break
+            raw = self.redis.lpop(key)
+            if raw is None:
+                continue
+            taken.append(json.loads(raw))
+        return taken
+
+    def deferred_tenants(self) -> list[str]:
+        return list(self.redis.smembers(self.deferred_tenants_key))
+
+
+_slots: PipelineSlots | None = None
+
+
+def get_pipeline_slots() -> PipelineSlots:
+    """Process-wide semaphore on a sync Redis client."""
+    global _slots
+    if _slots is None:
+        settings = get_settings()
+        client = redis.Redis.from_url(settings.celery.broker_url, decode_responses=True)
+        _slots = PipelineSlots(client, lease_seconds=settings.celery.pipeline_slot_lease)
+    return _slots
+
+
+def promote_deferred_runs(user_id: str) -> int:
+    """Re-publish the tenant's deferred runs that now fit into free slots. Returns how many."""
+    from api.celery_app import celery_app
+
+    slots = get_pipeline_slots()
+    promoted = 0
+    for payload in slots.take_deferred(user_id):
+        celery_app.send_task(RUN_RECORDING_TASK, kwargs=payload["kwargs"])
+        promoted += 1
+    if promoted:
+        logger.info(f"Deferred pipelines promoted | {format_details(user=short_user_id(user_id), count=promoted)}")
+    return promoted
+
+
+def release_pipeline_slot(user_id: str, recording_id: int) -> None:
+    """Best-effort: free the recording's slot and start the tenant's next deferred run.
+
+    Called from every path that ends a pipeline (finalize, failure handlers, pause,
+    stale reset). Redis errors are logged, never raised: the lease expires anyway.
+    """
+    try:
+        if get_pipeline_slots().release(user_id, recording_id):
+            promote_deferred_runs(user_id)
+    except Exception as e:
+        logger.warning(f"Pipeline slot release failed | {format_details(rec=recording_id, error=repr(e))}")
@@ -0,0 +1,381 @@
+"""Push-based progress events for the UI (SSE at ``GET /api/v1/tasks/events``).
+
+Workers publish task progress (``BaseTask.update_progress``), task outcomes and
+committed stage / recording status transitions; the API streams them to the
+owning user instead of the UI polling ``/tasks/{id}`` and ``/recordings``.
+
+Keys (per user):
+
+- ``leap:events:<user_id>`` — stream of the last ``progress_events_maxlen`` events;
+  entry ids are the SSE event ids, so a reconnecting client replays what it
+  missed from ``Last-Event-ID``
+- ``leap:events:<user_id>:live`` — pub/sub channel with the same events
+  (``{"id", "event", "data"}``); each API process holds one pub/sub connection
+  and fans messages out to its SSE clients (``ProgressHub``)
+
+Publishing is best-effort and never blocks the caller: events are handed to one
+background thread that writes each in a single round trip (Lua script) with
+short socket timeouts, so a slow or down Redis never stalls the API event loop,
+a commit or a task. Past ``PUBLISH_BACKLOG`` queued events new ones are dropped.
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import re
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any, cast
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from config.settings import get_settings
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+EVENTS_KEY_PREFIX = "leap:events:"
+SESSION_EVENTS_KEY = "progress_events"
+CLIENT_QUEUE_SIZE = 256
+RETRY_MS = 3000
+PUBLISH_TIMEOUT = 2.0
+PUBLISH_BACKLOG = 1000
+
+# XADD + EXPIRE + PUBLISH in one round trip; the live message carries the stream id
+_PUBLISH_SCRIPT = """
+local id = redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[1], '*', 'event', ARGV[2], 'data', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('PUBLISH', KEYS[2], cjson.encode({id = id, event = ARGV[2], data = ARGV[3]}))
+return id
+"""
+
+_EVENT_ID_RE = re.compile(r"^\d+-\d+$")
+
+
+def stream_key(user_id: str) -> str:
+    return f"{EVENTS_KEY_PREFIX}{user_id}"
+
+
+def live_channel(user_id: str) -> str:
+    return f"{EVENTS_KEY_PREFIX}{user_id}:live"
+
+
+def _event_id_key(event_id: str) -> tuple[int, int]:
+    ms, seq = event_id.split("-")
+    return int(ms), int(seq)
+
+
+def format_sse(event_name: str, data: str, event_id: str | None = None) -> str:
+    """One SSE message. ``data`` is compact JSON (no newlines)."""
+    head = f"id: {event_id}\n" if event_id else ""
+    return f"{head}event: {event_name}\ndata: {data}\n\n"
+
+
+class ProgressEvents:
+    """Publisher: append to the user's replay stream, then announce on the live channel."""
+
+    def __init__(self, redis_client: redis.Redis, maxlen: int, ttl: int):
+        self.redis = redis_client
+        self.maxlen = maxlen
+        self.ttl = ttl
+        self._publish_script = redis_client.register_script(_PUBLISH_SCRIPT)
+
+    def publish(self, user_id: str, event_name: str, data: dict[str, Any]) -> str:
+        """Publish one event to ``user_id``. Returns its event id."""
+        payload = json.dumps(data, default=str)
+        return cast(
+            "str",
+            self._publish_script(
+                keys=[stream_key(user_id), live_channel(user_id)], args=[self.maxlen, event_name, payload, self.ttl]
+            ),
+        )
+
+
+_progress_events: ProgressEvents | None = None
+
+
+def get_progress_events() -> ProgressEvents:
+    """Process-wide publisher on the broker Redis."""
+    global _progress_events
+    if _progress_events is None:
+        celery = get_settings().celery
+        _progress_events = ProgressEvents(
+            redis.Redis.from_url(
+                celery.broker_url,
+                decode_responses=True,
+                socket_timeout=PUBLISH_TIMEOUT,
+                socket_connect_timeout=PUBLISH_TIMEOUT,
+            ),
+            maxlen=celery.progress_events_maxlen,
+            ttl=celery.progress_events_ttl,
+        )
+    return _progress_events
+
+
+_publisher: concurrent.futures.ThreadPoolExecutor | None = None
+_publisher_lock = threading.Lock()
+_backlog = threading.BoundedSemaphore(PUBLISH_BACKLOG)
+
+
+def _get_publisher() -> concurrent.futures.ThreadPoolExecutor:
+    global _publisher
+    with _publisher_lock:
+        if _publisher is None:
+            _publisher = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="progress-events")
+        return _publisher
+
+
+def publish_event(user_id: str | None, event_name: str, data: dict[str, Any]) -> None:
+    """Queue an event for the background publisher; never blocks, never raises."""
+    if not user_id or not get_settings().celery.progress_events_enabled:
+        return
+    if not _backlog.acquire(blocking=False):
+        logger.debug(f"Progress event dropped, publisher backlog full | {format_details(event=event_name)}")
+        return
+    try:
+        _get_publisher().submit(_publish, user_id, event_name, data)
+    except RuntimeError:  # interpreter shutting down
+        _backlog.release()
+
+
+def _publish(user_id: str, event_name: str, data: dict[str, Any]) -> None:
+    try:
+        get_progress_events().publish(user_id, event_name, data)
+    except Exception as e:
+        logger.debug(f"Progress event publish failed | {format_details(event=event_name, error=repr(e))}")
+    finally:
+        _backlog.release()
+
+
+def _task_context(args, kwargs) -> tuple[int | None, str | None]:
+    """``(recording_id, user_id)`` of a task call, by the ``(recording_id, user_id, ...)`` convention."""
+    args = args or []
+    kwargs = kwargs or {}
+    recording_id = kwargs.get("recording_id")
+    user_id = kwargs.get("user_id")
+    if recording_id is None and len(args) >= 1 and isinstance(args[0], int):
+        recording_id = args[0]
+    if user_id is None and len(args) >= 2 and isinstance(args[1], str):
+        user_id = args[1]
+    return recording_id, user_id
+
+
+def publish_task_progress(task, user_id: str, progress: int, status: str, step: str | None = None) -> None:
+    """``progress`` event for ``BaseTask.update_progress``."""
+    recording_id, _ = _task_context(task.request.args, task.request.kwargs)
+    publish_event(
+        user_id,
+        "progress",
+        {
+            "task_id": task.request.id,
+            "task": task.name.rsplit(".", 1)[-1],
+            "recording_id": recording_id,
+            "progress": progress,
+            "status": status,
+            "step": step,
+        },
+    )
+
+
+def publish_task_state(task, task_id: str, state: str, args, kwargs) -> None:
+    """``task`` event when a task returns (SUCCESS / FAILURE / RETRY / ...)."""
+    recording_id, user_id = _task_context(args, kwargs)
+    publish_event(
+        user_id,
+        "task",
+        {"task_id": task_id, "task": task.name.rsplit(".", 1)[-1], "recording_id": recording_id, "state": state},
+    )
+
+
+# --- Stage / recording transitions -------------------------------------------------
+# Collected at flush, published after commit: clients never see a transition that
+# was rolled back, and a refetch triggered by an event already sees the new state.
+
+
+def _status_changed(obj) -> bool:
+    return inspect(obj).attrs.status.history.has_changes()
+
+
+def _value(status) -> str:
+    return getattr(status, "value", status)
+
+
+def _collect_transitions(session: Session, _flush_context) -> None:
+    from database.models import ProcessingStageModel, RecordingModel
+
+    pending = session.info.setdefault(SESSION_EVENTS_KEY, [])
+    for obj in (*session.new, *session.dirty):
+        if isinstance(obj, ProcessingStageModel) and _status_changed(obj):
+            data = {"recording_id": obj.recording_id, "stage": _value(obj.stage_type), "status": _value(obj.status)}
+            if obj.failed_reason and obj.failed:
+                data["failed_reason"] = obj.failed_reason
+            pending.append((obj.user_id, "stage", data))
+        elif isinstance(obj, RecordingModel) and _status_changed(obj):
+            pending.append((obj.user_id, "recording", {"recording_id": obj.id, "status": _value(obj.status)}))
+
+
+def _publish_committed(session: Session) -> None:
+    for user_id, event_name, data in session.info.pop(SESSION_EVENTS_KEY, []):
+        publish_event(user_id, event_name, data)
+
+
+def _discard_pending(session: Session, *_args) -> None:
+    session.info.pop(SESSION_EVENTS_KEY, None)
+
+
+def register_stage_event_hooks() -> None:
+    """Publish committed stage and recording status changes (idempotent).
+
+    Called at API startup (lifespan) and worker startup (``worker_init``).
+    """
+    for name, fn in (
+        ("after_flush", _collect_transitions),
+        ("after_commit", _publish_committed),
+        ("after_rollback", _discard_pending),
+    ):
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
+
+
+# --- API side: replay + live fan-out ----------------------------------------------
+
+
+async def replay(redis_client: aioredis.Redis, user_id: str, last_event_id: str) -> tuple[list, bool]:
+    """Events after ``last_event_id`` as ``[(id, fields)]``, and whether that is all of them.
+
+    Incomplete when the id is malformed, the buffer expired, or older events were
+    trimmed past it: the client should then refetch its state (``resync``).
+    """
+    if not _EVENT_ID_RE.match(last_event_id):
+        return [], False
+    key = stream_key(user_id)
+    oldest = await redis_client.xrange(key, count=1)
+    if not oldest:
+        return [], False
+    complete = _event_id_key(oldest[0][0]) <= _event_id_key(last_event_id)
+    return await redis_client.xrange(key, min=f"({last_event_id}"), complete
+
+
+class _ClientQueue(asyncio.Queue):
+    """Live messages for one SSE client; ``lagged`` when it fell behind and messages were dropped."""
+
+    def __init__(self):
+        super().__init__(maxsize=CLIENT_QUEUE_SIZE)
+        self.lagged = False
+
+    def offer(self, message: str) -> None:
+        try:
+            self.put_nowait(message)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+
+class ProgressHub:
+    """Per-process fan-out: one pub/sub connection, channels subscribed while a client of that user is connected."""
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+        self._clients: dict[str, set[_ClientQueue]] = {}
+        self._lock = asyncio.Lock()
+        self._pubsub: aioredis.client.PubSub | None = None
+        self._reader: asyncio.Task | None = None
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: str) -> AsyncGenerator[_ClientQueue, None]:
+        queue = _ClientQueue()
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            pubsub = self._pubsub
+            if user_id not in self._clients:
+                await pubsub.subscribe(live_channel(user_id))
+            self._clients.setdefault(user_id, set()).add(queue)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read())
+        try:
+            yield queue
+        finally:
+            async with self._lock:
+                clients = self._clients.get(user_id, set())
+                clients.discard(queue)
+                if not clients:
+                    self._clients.pop(user_id, None)
+                    with suppress(Exception):
+                        await pubsub.unsubscribe(live_channel(user_id))
+
+    async def _read(self) -> None:
+        pubsub = self._pubsub
+        if pubsub is None:
+            return
+        while self._clients:
+            try:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except Exception as e:
+                logger.warning(f"Progress events pub/sub read failed | {format_details(error=repr(e))}")
+                await asyncio.sleep(1)
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            user_id = message["channel"].removeprefix(EVENTS_KEY_PREFIX).removesuffix(":live")
+            for queue in self._clients.get(user_id, ()):
+                queue.offer(message["data"])
+
+
+_hub: ProgressHub | None = None
+
+
+def get_progress_hub(redis_client: aioredis.Redis) -> ProgressHub:
+    global _hub
+    if _hub is None:
+        _hub = ProgressHub(redis_client)
+    return _hub
+
+
+async def stream_events(
+    hub: ProgressHub, redis_client: aioredis.Redis, user_id: str, last_event_id: str | None, keepalive: float
+) -> AsyncIterator[str]:
+    """SSE body: replay after ``last_event_id``, then live events, with keepalive comments.
+
+    Subscribes before replaying so nothing published in between is lost; the
+    overlap is dropped by event id. A disconnected client is noticed at the next
+    write (at most ``keepalive`` seconds later).
+    """
+    yield f"retry: {RETRY_MS}\n\n"
+    async with hub.subscribe(user_id) as queue:
+        last_id = None
+        if last_event_id:
+            missed, complete = await replay(redis_client, user_id, last_event_id)
+            if not complete:
+                yield format_sse("resync", "{}")
+            for event_id, fields in missed:
+                yield format_sse(fields["event"], fields["data"], event_id)
+                last_id = event_id
+            last_id = last_id or (last_event_id if complete else None)
+
+        while True:
+            try:
+                raw = await asyncio.wait_for(queue.get(), timeout=keepalive)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if queue.lagged:
+                # Slow client: live messages were dropped, catch up from the stream instead
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.lagged = False
+                missed, complete = await replay(redis_client, user_id, last_id) if last_id else ([], False)
+                if not complete:
+                    yield format_sse("resync", "{}")
+                for event_id, fields in missed:
+                    yield format_sse(fields["event"], fields["data"], event_id)
+                    last_id = event_id
+                continue
+            message = json.loads(raw)
+            if last_id and _event_id_key(message["id"]) <= _event_id_key(last_id):
+                continue
+            yield format_sse(message["event"], message["data"], message["id"])
+            last_id = message["id"]
@@ -19,12 +19,13 @@ from api.schemas.auth import (
     SubscriptionPlanResponse,
     UserSubscriptionResponse,
 )
+from api.services.pipeline_slots import get_pipeline_slots
 from config.settings import DEFAULT_QUOTAS
 from database.auth_models import UserCredentialModel
 from database.models import RecordingModel
 from database.template_models import RecordingTemplateModel
 from file_storage.factory import get_storage_backend
-from logger import get_logger
+from logger import format_details, get_logger
 
 logger = get_logger()
 
@@ -196,6 +197,7 @@ class QuotaService:
         max_credentials = quotas.get("max_credentials")
         templates_used = await self._count_rows(RecordingTemplateModel, user_id)
         credentials_used = await self._count_rows(UserCredentialModel, user_id)
+        pipeline_slots = self._pipeline_slot_usage(user_id, max_tasks)
 
         # Subscription info (optional)
         subscription = await self.subscription_repo.get_by_user_id(user_id)
@@ -257,6 +259,7 @@ class QuotaService:
                 "limit": max_tasks,
                 "available": max_tasks - tasks_used if max_tasks is not None else None,
             },
+            pipeline_slots=pipeline_slots,
             automation_jobs={
                 "used": 0,
                 "limit": max_jobs,
@@ -293,6 +296,21 @@ class QuotaService:
     # HELPERS
     # ========================================
 
+    @staticmethod
+    def _pipeline_slot_usage(user_id: str, max_tasks: int | None) -> dict[str, int | None]:
+        """Held/deferred pipeline slots from the admission semaphore (empty if Redis is unreachable)."""
+        try:
+            used, deferred = get_pipeline_slots().usage(user_id)
+        except Exception as e:
+            logger.warning(f"Pipeline slot usage unavailable | {format_details(error=repr(e))}")
+            return {}
+        return {
+            "used": used,
+            "limit": max_tasks,
+            "available": max(max_tasks - used, 0) if max_tasks is not None else None,
+            "deferred": deferred,
+        }
+
     @staticmethod
     async def _calc_storage_bytes(user_slug: int) -> int:
         """Calculate total storage usage for a user's folder via the active storage backend."""
@@ -3,3 +3,6 @@
 from typing import TypeVar
 
 T = TypeVar("T")
+
+# Topic version ids become object names (extracted/versions/{id}.json)
+VERSION_ID_REGEX = r"^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$"
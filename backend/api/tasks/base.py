@@ -6,13 +6,16 @@ Provides common functionality for all Celery tasks:
 - Logging hooks with contextualize() for structured output
 """
 
-import asyncio
 from collections.abc import Awaitable
 from typing import TypeVar
 
 from celery import Task
 
+from api.services.node_affinity import finish_recording_artifacts, pin_recording, release_recording_artifacts
+from api.services.pipeline_slots import release_pipeline_slot
+from api.services.progress_events import publish_task_progress
 from logger import format_details, get_logger, short_task_id, short_user_id
+from utils.worker_loop import current_task_request, run_in_worker_loop, run_off_loop
 
 logger = get_logger()
 
@@ -39,16 +42,11 @@ class BaseTask(Task):
 
     def run_async(self, coro: Awaitable[T]) -> T:
         """
-        Run async coroutine in Celery worker with proper event loop management.
+        Run async coroutine on the worker thread's persistent event loop.
 
-        Uses asyncio.run() which creates a completely fresh event loop for each task.
-        This is the recommended approach for running async code in sync context.
-
-        Benefits:
-        - Creates new event loop + sets it as current + closes it automatically
-        - Cleans up async generators and other resources
-        - Safe for asyncpg connection pools (each run gets fresh loop)
-        - No issues with "event loop already running" or "future attached to different loop"
+        The loop lives as long as the worker thread/process (``utils.worker_loop``),
+        so the pooled DB engine and HTTP clients bound to it are reused across
+        ``run_async`` calls and tasks instead of reconnecting each time.
 
         Args:
             coro: Async coroutine to run
@@ -56,7 +54,7 @@ class BaseTask(Task):
         Returns:
             Result of coroutine execution
         """
-        return asyncio.run(coro)
+        return run_in_worker_loop(coro)
 
     def update_progress(
         self,
@@ -69,6 +67,8 @@ class BaseTask(Task):
         """
         Update task progress with user_id for multi-tenancy validation.
 
+        Also pushed to the user's progress event stream (SSE, ``api.services.progress_events``).
+
         Args:
             user_id: ID of user who owns this task
             progress: Progress percentage (0-100)
@@ -86,7 +86,24 @@ class BaseTask(Task):
         if step:
             meta["step"] = step
 
+        # Called from a coroutine on the shared loop (AsyncIOPool), the sync
+        # Redis writes run on a background thread instead of stalling the loop
+        run_off_loop(self._store_progress, meta, user_id, progress, status, step)
+
+    def _store_progress(self, meta: dict, user_id: str, progress: int, status: str, step: str | None) -> None:
         self.update_state(state="PROCESSING", meta=meta)
+        publish_task_progress(self, user_id, progress, status, step)
+
+    def _get_request(self):
+        # Task.request is thread-local: coroutines on the shared loop run in the
+        # loop thread and get the request of the task awaiting them
+        if self.request_stack is None or self.request_stack.top is None:
+            request = current_task_request()
+            if request is not None:
+                return request
+        return super()._get_request()
+
+    request = property(_get_request)
 
     def build_result(self, user_id: str, status: str = "completed", **data) -> dict:
         """
@@ -129,6 +146,23 @@ class BaseTask(Task):
 class ProcessingTask(BaseTask):
     """Base class for processing tasks (download, trim, transcribe, etc.)."""
 
+    def before_start(self, task_id, args, kwargs):
+        """Renew the recording's pipeline slot lease: every step proves the pipeline is alive.
+
+        Download and trim also pin the recording to this node (node affinity).
+        """
+        recording_id = args[0] if len(args) > 0 else kwargs.get("recording_id")
+        user_id = args[1] if len(args) > 1 else kwargs.get("user_id")
+        if recording_id is None or user_id is None:
+            return
+        pin_recording(self.name, recording_id)
+        from api.services.pipeline_slots import get_pipeline_slots
+
+        try:
+            get_pipeline_slots().renew(user_id, recording_id)
+        except Exception as e:
+            logger.debug(f"Pipeline slot renew failed: {e!r}")
+
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         """Handle processing task failure with status rollback."""
         recording_id = args[0] if len(args) > 0 else kwargs.get("recording_id", "unknown")
@@ -152,6 +186,7 @@ class ProcessingTask(BaseTask):
                 "download_recording": ("download", None),
                 "trim_video": ("trim", ProcessingStageType.TRIM),
                 "transcribe_recording": ("transcribe", ProcessingStageType.TRANSCRIBE),
+                "complete_transcription": ("transcribe", ProcessingStageType.TRANSCRIBE),
                 "extract_topics": ("topics", ProcessingStageType.EXTRACT_TOPICS),
                 "generate_subtitles": ("subtitles", ProcessingStageType.GENERATE_SUBTITLES),
             }
@@ -159,11 +194,11 @@ class ProcessingTask(BaseTask):
             failed_at_stage, stage_type = stage_map.get(task_name, (None, None))
 
             if failed_at_stage:
-                asyncio.run(self._handle_failure_async(recording_id, user_id, failed_at_stage, stage_type, exc))
+                self.run_async(self._handle_failure_async(recording_id, user_id, failed_at_stage, stage_type, exc))
                 logger.error(f"Processing failed at {failed_at_stage}: {exc!r}")
             else:
                 # Orchestrator or unknown task: still clear on_air
-                asyncio.run(self._clear_on_air_async(recording_id, user_id))
+                self.run_async(self._clear_on_air_async(recording_id, user_id))
                 logger.error(f"Processing failed: {exc!r}")
 
     async def _handle_failure_async(
@@ -201,6 +236,8 @@ class ProcessingTask(BaseTask):
             recording.pipeline_task_id = None
             await repo.update(recording)
             await session.commit()
+        release_pipeline_slot(user_id, recording_id)
+        finish_recording_artifacts(recording_id)
 
     async def _clear_on_air_async(self, recording_id: int, user_id: str) -> None:
         """Clear on_air and pipeline_task_id without other status changes."""
@@ -215,11 +252,20 @@ class ProcessingTask(BaseTask):
                 recording.pipeline_task_id = None
                 await repo.update(recording)
                 await session.commit()
+        release_pipeline_slot(user_id, recording_id)
+        finish_recording_artifacts(recording_id)
 
 
 class UploadTask(BaseTask):
     """Base class for upload tasks."""
 
+    def after_return(self, status, retval, task_id, args, kwargs, einfo):
+        """A video upload that returned for good no longer holds the recording's node pin."""
+        if self.name == "api.tasks.upload.upload_recording_to_platform":
+            recording_id = args[0] if len(args) > 0 else kwargs.get("recording_id")
+            if recording_id is not None:
+                release_recording_artifacts(recording_id, status)
+
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         """Handle upload failure: mark output as FAILED, recalculate status."""
         recording_id = args[0] if len(args) > 0 else kwargs.get("recording_id", "unknown")
@@ -232,7 +278,7 @@ class UploadTask(BaseTask):
             user_id=short_user_id(user_id),
             platform=platform,
         ):
-            asyncio.run(self._handle_upload_failure_async(recording_id, user_id, platform, exc))
+            self.run_async(self._handle_upload_failure_async(recording_id, user_id, platform, exc))
             logger.error(f"Upload failed: {exc}")
 
     async def _handle_upload_failure_async(self, recording_id: int, user_id: str, platform: str, exc: Exception):
@@ -258,6 +304,7 @@ class UploadTask(BaseTask):
             recording.pipeline_task_id = None
             await repo.update(recording)
             await session.commit()
+        release_pipeline_slot(user_id, recording_id)
 
 
 class SyncTask(BaseTask):
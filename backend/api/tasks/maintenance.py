@@ -1,6 +1,5 @@
 """Celery tasks for system maintenance."""
 
-import asyncio
 from datetime import UTC, datetime
 
 from sqlalchemy import select
@@ -11,9 +10,11 @@ from api.dependencies import get_async_session_maker
 from api.repositories.auth_repos import RefreshTokenRepository
 from api.repositories.config_repos import UserConfigRepository
 from api.repositories.recording_repos import RecordingRepository
+from api.services.pipeline_slots import release_pipeline_slot
 from config.settings import get_settings
 from database.models import RecordingModel
 from logger import get_logger
+from utils.worker_loop import run_in_worker_loop
 
 logger = get_logger()
 settings = get_settings()
@@ -41,8 +42,7 @@ def cleanup_expired_tokens_task():
                 token_repo = RefreshTokenRepository(session)
                 return await token_repo.delete_expired()
 
-        # Use asyncio.run() for proper event loop isolation
-        deleted_count = asyncio.run(cleanup())
+        deleted_count = run_in_worker_loop(cleanup())
 
         logger.info(f"Cleanup completed: {deleted_count} expired tokens deleted")
 
@@ -121,8 +121,7 @@ def auto_expire_recordings_task():
             return expired_count, errors
 
         # Execute async function
-        # Use asyncio.run() for proper event loop isolation
-        expired_count, errors = asyncio.run(expire())
+        expired_count, errors = run_in_worker_loop(expire())
 
         if errors:
             logger.warning(f"Auto-expire completed with {len(errors)} errors")
@@ -151,7 +150,7 @@ def cleanup_recording_files_task():
     """
     Level 1: Clean up files for soft deleted recordings.
 
-    Deletes videos/audio, keeps master.json and extracted.json.
+    Deletes videos/audio, keeps master.json and the extracted/ topic versions.
     Runs daily at 4:00 UTC (configured in Celery Beat).
     """
     try:
@@ -228,8 +227,7 @@ def cleanup_recording_files_task():
             return cleaned_count, errors
 
         # Execute async function
-        # Use asyncio.run() for proper event loop isolation
-        cleaned_count, errors = asyncio.run(cleanup())
+        cleaned_count, errors = run_in_worker_loop(cleanup())
 
         if errors:
             logger.warning(f"Files cleanup completed with {len(errors)} errors")
@@ -312,8 +310,7 @@ def hard_delete_recordings_task():
             return deleted_count, errors
 
         # Execute async function
-        # Use asyncio.run() for proper event loop isolation
-        deleted_count, errors = asyncio.run(cleanup())
+        deleted_count, errors = run_in_worker_loop(cleanup())
 
         if errors:
             logger.warning(f"Hard delete completed with {len(errors)} errors")
@@ -345,14 +342,24 @@ def cleanup_temp_files_task(max_age_hours: int = 6):
     kill (OOM, SIGKILL, worker crash) can leave temps behind. This safety-net
     sweep runs hourly via Celery Beat and removes anything older than
     ``max_age_hours`` (default 6h).
+
+    Partial downloads (``temp/partials/``) are kept for task retries: only idle
+    ones older than ``STORAGE_DOWNLOAD_PARTIAL_TTL_HOURS`` are removed, never one
+    a download is writing to.
     """
     import time
     from pathlib import Path
 
     from file_storage.path_builder import StoragePathBuilder
+    from video_download_module.core.partial import sweep_stale_partials
 
     try:
-        temp_dir: Path = StoragePathBuilder().temp_dir()
+        builder = StoragePathBuilder()
+        partials = sweep_stale_partials(builder.partials_dir(), settings.storage.download_partial_ttl_hours * 3600)
+        if partials:
+            logger.info(f"cleanup_temp_files: deleted {partials} stale partial downloads")
+
+        temp_dir: Path = builder.temp_dir()
         if not temp_dir.exists():
             logger.debug(f"Temp dir does not exist: {temp_dir}")
             return {"status": "success", "deleted": 0, "message": "Temp dir absent"}
@@ -381,6 +388,42 @@ def cleanup_temp_files_task(max_age_hours: int = 6):
         return {"status": "error", "error": str(e)}
 
 
+@celery_app.task(
+    name="maintenance.evict_llm_cache",
+    max_retries=settings.celery.maintenance_max_retries,
+    default_retry_delay=settings.celery.maintenance_retry_delay,
+)
+def evict_llm_cache_task():
+    """
+    Periodic task: drop expired LLM cache entries and trim the table to
+    ``TOPIC_RESPONSE_CACHE_MAX_MB``, least recently used first.
+
+    Runs daily (configured in Celery Beat).
+    """
+    from api.repositories.llm_cache_repo import LLMCacheRepository
+
+    try:
+
+        async def evict():
+            session_maker = get_async_session_maker()
+
+            async with session_maker() as session:
+                result = await LLMCacheRepository(session).evict(
+                    settings.topic_extraction.response_cache_max_mb * 1024 * 1024
+                )
+                await session.commit()
+                return result
+
+        result = run_in_worker_loop(evict())
+
+        logger.info(f"LLM cache eviction: expired={result['expired']} evicted={result['evicted']}")
+        return {"status": "success", **result}
+
+    except Exception as e:
+        logger.error("Failed to evict LLM cache: {}", str(e), exc_info=True)
+        return {"status": "error", "error": str(e)}
+
+
 @celery_app.task(
     name="maintenance.reset_stale_active_recordings",
     max_retries=settings.celery.maintenance_max_retries,
@@ -450,10 +493,12 @@ def reset_stale_active_recordings_task(stale_hours: float = 2.0):
                 )
 
             await session.commit()
+            for rec in stale:
+                release_pipeline_slot(rec.user_id, rec.id)
             return len(stale)
 
     try:
-        reset_count = asyncio.run(_reset())
+        reset_count = run_in_worker_loop(_reset())
         logger.info(f"reset_stale_active_recordings: reset={reset_count} threshold_h={stale_hours}")
         return {"status": "success", "reset": reset_count}
     except Exception as e:
@@ -1,18 +1,29 @@
 """Celery tasks for processing recordings with multi-tenancy support."""
 
+import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
 
-from celery import chain, group
+from celery import chain, group, states
 from celery.exceptions import SoftTimeLimitExceeded
+from openai import AsyncOpenAI
 
 from api.celery_app import celery_app
 from api.dependencies import get_async_session_maker
 from api.helpers.status_manager import update_aggregate_status
-from api.observability import track_pipeline_stage
+from api.observability import track_pipeline_stage, transcription_cache_lookups_total
 from api.repositories.recording_repos import RecordingRepository
 from api.repositories.template_repos import OutputPresetRepository
+from api.services.asr_job_slots import get_asr_job_slots
 from api.services.config_utils import resolve_full_config
+from api.services.node_affinity import (
+    fetch_artifact,
+    finish_recording_artifacts,
+    hold_recording_artifacts,
+    keep_artifact,
+    release_recording_artifacts,
+)
+from api.services.pipeline_slots import get_pipeline_slots, promote_deferred_runs, release_pipeline_slot
 from api.services.quota_service import QuotaExceededError
 from api.services.timing_service import TimingService
 from api.tasks.base import BaseTask, ProcessingTask
@@ -23,8 +34,10 @@ from file_storage.path_builder import StoragePathBuilder
 from logger import format_details, format_status_change, get_logger, short_task_id, short_user_id
 from models import MeetingRecording, ProcessingStageStatus, ProcessingStageType, ProcessingStatus
 from transcription_module.manager import get_transcription_manager
+from utils.http_clients import get_http_client
 from video_download_module.downloader import ZoomDownloader
 from video_download_module.factory import create_downloader
+from video_processing_module.compact import OffsetMap, plan_keep_ranges
 from video_processing_module.config import ProcessingConfig
 from video_processing_module.video_processor import VideoProcessor, output_suffix_for_trim
 
@@ -564,6 +577,8 @@ def trim_video_task(
     - processing.min_silence_duration
     - processing.padding_before
     - processing.padding_after
+    - trimming.compact_mode: also cut internal silences of compact_min_gap_seconds or longer
+      from the transcription audio (and from the video with compact_video)
 
     Args:
         recording_id: ID of recording
@@ -602,6 +617,49 @@ def trim_video_task(
             raise self.retry(exc=exc)
 
 
+def _start_transcription_early(task_self) -> bool:
+    """Launch the rest of the pipeline chain now that the trimmed audio is committed.
+
+    Only chains built with an ``await_trim`` join (see ``run_recording_task``) are
+    released: the join holds uploads until the video trim completes. Like
+    ``_park_chain_until_transcript``, clearing ``request.chain`` keeps Celery from
+    launching the steps again; signatures keep their task ids for pause/revoke.
+    An early-upload launcher right after trim stays on trim's own chain, so the
+    private uploads start once the video is ready.
+    """
+    from celery import signature
+
+    remaining = list(task_self.request.chain or [])
+    # request.chain is stored in reverse order (Celery pops the next step from the end)
+    kept = [remaining.pop()] if remaining and remaining[-1].get("task") == _launch_uploads_task.name else []
+    if not remaining or remaining[-1].get("task") != transcribe_recording_task.name:
+        return False
+    if not any(step.get("task") == await_trim_task.name for step in remaining):
+        return False
+
+    chain(*(signature(step, app=celery_app) for step in reversed(remaining))).apply_async()
+    task_self.request.chain = kept or None
+    logger.info(f"Transcription started alongside video trim | {format_details(steps=len(remaining))}")
+    return True
+
+
+async def _plan_compact(
+    processor: VideoProcessor, audio_path: Path, start: float, end: float, trimming_config: dict
+) -> OffsetMap | None:
+    """Compact mode: kept ranges of the trim window, or None when no internal break is long enough."""
+    silence_periods = await processor.audio_detector.detect_silence_periods(str(audio_path))
+    ranges = plan_keep_ranges(
+        silence_periods,
+        start,
+        end,
+        min_gap_seconds=trimming_config.get("compact_min_gap_seconds", 480.0),
+        padding_seconds=trimming_config.get("compact_padding_seconds", 2.0),
+    )
+    if not ranges:
+        return None
+    return OffsetMap(tuple(ranges), video_offset=start, video_compacted=bool(trimming_config.get("compact_video")))
+
+
 async def _async_process_video(
     task_self,
     recording_id: int,
@@ -614,8 +672,9 @@ async def _async_process_video(
     Optimized workflow:
     1. Extract full audio from original video (MP3)
     2. Analyze audio file for silence (faster than video analysis)
-    3. Trim video based on detected boundaries
-    4. Trim audio to match video (stream copy - instant)
+    3. Trim audio (stream copy - instant) and commit it; in a pipeline chain the
+       transcription steps are launched right away (``_start_transcription_early``)
+    4. Trim video based on detected boundaries while transcription runs
     """
     from api.helpers.failure_reset import reset_recording_failure, should_reset_on_retry
     from api.services.config_utils import resolve_full_config
@@ -682,10 +741,13 @@ async def _async_process_video(
         )
         processor = VideoProcessor(config)
 
-        # Materialize the source video locally for FFmpeg (it needs a real path).
+        # Materialize the source video locally for FFmpeg (it needs a real path);
+        # with node affinity it is usually still in this node's scratch from download.
         source_suffix = Path(source_storage_key).suffix or ".mp4"
         local_source_video = storage_builder.create_temp_file(prefix=f"trim_src_{recording_id}_", suffix=source_suffix)
-        await storage_backend.download_to_file(source_storage_key, local_source_video)
+        await fetch_artifact(
+            storage_backend, source_storage_key, local_source_video, recording_id=recording_id, stage="trim"
+        )
 
         task_self.update_progress(user_id, 15, "Starting video trimming...", step="trim")
 
@@ -752,6 +814,9 @@ async def _async_process_video(
             )
             output_audio_key = _to_storage_key(storage_builder.recording_audio(user_slug, recording_id))
 
+            offset_map = None
+            released_early = False
+
             # Sound throughout entire video - skip trimming, reuse source video as processed.
             if last_sound is None and first_sound == 0.0:
                 logger.info("Skipped: sound throughout entire video")
@@ -824,56 +889,84 @@ async def _async_process_video(
                     f"Trim window vs video | {format_details(start=f'{start_trim:.1f}s', end=f'{end_trim:.1f}s', video=f'{video_duration:.1f}s')}"
                 )
 
-                # Step 3: Trim video into a local temp output.
-                task_self.update_progress(user_id, 60, "Trimming video...", step="trim_video")
+                if trimming_config.get("compact_mode"):
+                    offset_map = await _plan_compact(processor, temp_audio_path, start_trim, end_trim, trimming_config)
+                    if offset_map:
+                        logger.info(
+                            f"Compact plan | {format_details(ranges=len(offset_map.ranges), removed=f'{offset_map.removed_seconds:.1f}s', video=offset_map.video_compacted)}"
+                        )
 
-                sub_trim_v = await timing_service.start_substep(recording_id, user_id, "TRIM", "trim_video")
+                # Step 3: Trim audio (stream copy - instant) first: transcription only needs the audio.
+                task_self.update_progress(user_id, 50, "Trimming audio...", step="trim_audio")
+
+                sub_trim_a = await timing_service.start_substep(recording_id, user_id, "TRIM", "trim_audio")
                 await session.commit()
 
-                local_video_out = storage_builder.create_temp_file(
-                    prefix=f"trim_video_{recording_id}_", suffix=video_suffix
-                )
-                success = await processor.trim_video(
-                    str(local_source_video), str(local_video_out), start_trim, end_trim
-                )
+                local_audio_out = storage_builder.create_temp_file(prefix=f"trim_audio_{recording_id}_", suffix=".mp3")
+                if offset_map:
+                    success = await processor.keep_ranges(
+                        str(temp_audio_path), str(local_audio_out), list(offset_map.ranges), stream_copy=True
+                    )
+                else:
+                    success = await processor.trim_audio(
+                        str(temp_audio_path), str(local_audio_out), start_trim, end_trim
+                    )
+
+                if temp_audio_path.exists():
+                    temp_audio_path.unlink()
+                    logger.debug(f"Temp audio cleaned: {temp_audio_path}")
 
                 if not success:
-                    if temp_audio_path.exists():
-                        temp_audio_path.unlink()
-                    local_video_out.unlink(missing_ok=True)
-                    raise Exception("Failed to trim video")
+                    local_audio_out.unlink(missing_ok=True)
+                    raise Exception("Failed to trim audio")
 
-                await timing_service.complete_substep(sub_trim_v)
+                # Commit the audio before the video (save_file consumes the temp on LOCAL backend).
+                await storage_backend.save_file(output_audio_key, local_audio_out)
+                local_audio_out.unlink(missing_ok=True)
+
+                recording.processed_audio_path = output_audio_key
+                recording.update_stage_meta(
+                    ProcessingStageType.TRIM, {"compact": offset_map.to_meta() if offset_map else None}
+                )
+                await recording_repo.update(recording)
+                await timing_service.complete_substep(sub_trim_a)
                 await session.commit()
 
-                # Step 4: Trim audio (stream copy - instant) into a local temp output.
-                task_self.update_progress(user_id, 80, "Trimming audio...", step="trim_audio")
+                released_early = _start_transcription_early(task_self)
 
-                sub_trim_a = await timing_service.start_substep(recording_id, user_id, "TRIM", "trim_audio")
+                # Step 4: Trim video into a local temp output (runs alongside transcription when released).
+                task_self.update_progress(user_id, 60, "Trimming video...", step="trim_video")
+
+                sub_trim_v = await timing_service.start_substep(recording_id, user_id, "TRIM", "trim_video")
                 await session.commit()
 
-                local_audio_out = storage_builder.create_temp_file(prefix=f"trim_audio_{recording_id}_", suffix=".mp3")
-                success = await processor.trim_audio(str(temp_audio_path), str(local_audio_out), start_trim, end_trim)
+                local_video_out = storage_builder.create_temp_file(
+                    prefix=f"trim_video_{recording_id}_", suffix=video_suffix
+                )
+                if offset_map and offset_map.video_compacted:
+                    success = await processor.keep_ranges(
+                        str(local_source_video), str(local_video_out), list(offset_map.ranges)
+                    )
+                else:
+                    success = await processor.trim_video(
+                        str(local_source_video), str(local_video_out), start_trim, end_trim
+                    )
 
                 if not success:
-                    if temp_audio_path.exists():
-                        temp_audio_path.unlink()
                     local_video_out.unlink(missing_ok=True)
-                    local_audio_out.unlink(missing_ok=True)
-                    raise Exception("Failed to trim audio")
-
-                await timing_service.complete_substep(sub_trim_a)
-                await session.commit()
+                    raise Exception("Failed to trim video")
 
-                # Commit results to storage (save_file consumes the temp on LOCAL backend).
+                # Scratch copy first: save_file consumes the temp on LOCAL backend
+                keep_artifact(output_video_key, local_video_out)
                 await storage_backend.save_file(output_video_key, local_video_out)
-                await storage_backend.save_file(output_audio_key, local_audio_out)
                 local_video_out.unlink(missing_ok=True)
-                local_audio_out.unlink(missing_ok=True)
 
-                if temp_audio_path.exists():
-                    temp_audio_path.unlink()
-                    logger.debug(f"Temp audio cleaned: {temp_audio_path}")
+                await timing_service.complete_substep(sub_trim_v)
+                await session.commit()
+
+                if released_early:
+                    # Transcription may have finished meanwhile: compute the aggregate status from fresh stages
+                    await session.refresh(recording, ["processing_stages"])
 
             # Step 5: Update database
             task_self.update_progress(user_id, 90, "Updating database...", step="trim")
@@ -881,8 +974,10 @@ async def _async_process_video(
             recording.processed_video_path = output_video_key
             recording.processed_audio_path = output_audio_key
 
-            # Mark TRIM stage as COMPLETED
-            recording.mark_stage_completed(ProcessingStageType.TRIM)
+            # Mark TRIM stage as COMPLETED; the offset map lets transcription map compacted time back
+            recording.mark_stage_completed(
+                ProcessingStageType.TRIM, meta={"compact": offset_map.to_meta() if offset_map else None}
+            )
             update_aggregate_status(recording)
 
             await timing_service.complete_stage(timing)
@@ -957,6 +1052,9 @@ def transcribe_recording_task(
             with track_pipeline_stage("transcribe"):
                 result = self.run_async(_async_transcribe_recording(self, recording_id, user_id, manual_override))
 
+            if result.get("status") == "submitted":
+                _park_chain_until_transcript(self, recording_id, user_id, result)
+
             return self.build_result(
                 user_id=user_id,
                 status="completed",
@@ -997,7 +1095,6 @@ async def _async_transcribe_recording(
     from api.services.config_utils import resolve_full_config
     from assemblyai_module import AssemblyAIConfig, AssemblyAITranscriptionService
     from transcription_module.keyterms import compose_keyterms
-    from transcription_module.manager import get_transcription_manager
 
     session_maker = get_async_session_maker()
 
@@ -1063,7 +1160,7 @@ async def _async_transcribe_recording(
         task_self.update_progress(user_id, 20, "Loading transcription service...", step="transcribe")
 
         aai_config = AssemblyAIConfig.from_file("config/assemblyai_creds.json")
-        aai_service = AssemblyAITranscriptionService(aai_config)
+        aai_service = AssemblyAITranscriptionService(aai_config, job_slots=get_asr_job_slots())
         aai_model = (aai_config.settings.speech_models or ["universal-2"])[0]
 
         keyterms = compose_keyterms(vocabulary, recording.display_name)
@@ -1091,99 +1188,589 @@ async def _async_transcribe_recording(
         await recording_repo.update(recording)
         await session.commit()
 
+        job = {
+            "language": language,
+            "model": aai_model,
+            "speech_models": aai_config.settings.speech_models,
+            "language_detection": aai_config.settings.language_detection,
+            "keyterms_count": len(keyterms),
+            "audio_storage_key": audio_storage_key,
+            "timing_id": timing.id,
+        }
+        # Chunked recordings always take the blocking path, async_mode or not: the task waits
+        # for its chunks (about one chunk's turnaround) and stitches them. Chunk jobs of all
+        # workers share the per-account cap (ASSEMBLYAI_ACCOUNT_CONCURRENCY).
+        chunked = (
+            aai_config.settings.chunked_mode and (recording.duration or 0) >= aai_config.settings.chunk_min_duration
+        )
+
         try:
+            if aai_config.settings.result_cache:
+                cached = await _lookup_transcription_cache(session, storage_backend, recording, job, keyterms)
+                if cached is not None:
+                    task_self.update_progress(user_id, 60, "Transcription found in cache...", step="transcribe")
+                    return await _save_transcription_result(task_self, session, recording, cached, job, timing)
+
+            if aai_config.settings.async_mode and not chunked:
+                task_self.update_progress(user_id, 30, "Submitting audio for transcription...", step="transcribe")
+                transcript_id = await aai_service.submit_transcription(
+                    audio_storage_key=audio_storage_key,
+                    language=language,
+                    keyterms=keyterms,
+                )
+                return {"status": "submitted", "transcript_id": transcript_id, "job": job}
+
             task_self.update_progress(user_id, 30, "Transcribing audio...", step="transcribe")
 
-            transcription_result = await aai_service.transcribe_audio(
-                audio_storage_key=audio_storage_key,
-                language=language,
-                keyterms=keyterms,
-            )
+            if chunked:
+                if aai_config.settings.async_mode:
+                    logger.info(
+                        f"Chunked transcription runs in-task despite async_mode | {format_details(rec=recording_id)}"
+                    )
+                transcription_result = await aai_service.transcribe_audio_chunked(
+                    audio_storage_key=audio_storage_key,
+                    language=language,
+                    keyterms=keyterms,
+                    duration=recording.duration,
+                )
+            else:
+                transcription_result = await aai_service.transcribe_audio(
+                    audio_storage_key=audio_storage_key,
+                    language=language,
+                    keyterms=keyterms,
+                )
+            return await _save_transcription_result(task_self, session, recording, transcription_result, job, timing)
+
+        except Exception as e:
+            await timing_service.fail_stage(timing, str(e))
+            await session.commit()
+            raise
 
-            task_self.update_progress(user_id, 70, "Saving transcription...", step="transcribe")
 
-            transcription_manager = get_transcription_manager()
-            user_slug = recording.owner.user_slug
-            transcription_dir = transcription_manager.get_dir(recording_id, user_slug)
+async def _lookup_transcription_cache(session, storage_backend, recording, job: dict, keyterms: list[str]):
+    """Hash the audio and look up a cached result for the same parameters.
 
-            words = transcription_result.get("words", [])
-            segments = transcription_result.get("segments", [])
-            detected_language = transcription_result.get("language", language)
+    Fills ``job["cache"]`` so the result can be stored after a miss (also by the
+    non-blocking completion task). Hashing failures only disable the cache for this run.
+    """
+    from api.repositories.transcription_cache_repo import TranscriptionCacheRepository, transcription_cache_key
 
-            duration = 0.0
-            if segments:
-                duration = segments[-1].get("end", 0.0)
+    try:
+        audio_sha256 = await storage_backend.content_sha256(job["audio_storage_key"])
+    except Exception as exc:
+        transcription_cache_lookups_total.labels(result="error").inc()
+        logger.warning(f"Transcription cache skipped, audio hash failed: {exc!r}")
+        return None
+
+    cache_key = transcription_cache_key(
+        user_id=recording.user_id,
+        audio_sha256=audio_sha256,
+        language=job["language"],
+        language_detection=job["language_detection"],
+        speech_models=job["speech_models"],
+        keyterms=keyterms,
+    )
+    job["cache"] = {"key": cache_key, "audio_sha256": audio_sha256}
 
-            usage_metadata = {
-                "model": aai_model,
-                "speech_models": aai_config.settings.speech_models,
-                "keyterms_count": len(keyterms),
-                "config": {
-                    "language": language,
-                    "detected_language": detected_language,
-                    "language_detection": aai_config.settings.language_detection,
-                },
-                "audio_file": {
-                    "path": audio_storage_key,
-                    "duration_seconds": duration,
-                },
-            }
+    cached = await TranscriptionCacheRepository(session).get_result(cache_key)
+    transcription_cache_lookups_total.labels(result="hit" if cached is not None else "miss").inc()
+    if cached is not None:
+        job["cache_hit"] = True
+        logger.info(f"Transcription cache hit | {format_details(key=cache_key[:12], words=len(cached['words']))}")
+    return cached
 
-            await transcription_manager.save_master(
-                recording_id=recording_id,
-                words=words,
-                segments=segments,
-                language=language,
-                model=aai_model,
-                duration=duration,
-                usage_metadata=usage_metadata,
-                user_slug=user_slug,
-                raw_response=transcription_result,
+
+async def _store_transcription_cache(session, recording: RecordingModel, transcription_result: dict, job: dict) -> None:
+    """Remember a fresh ASR result under the key computed at lookup time (savepoint, failures logged)."""
+    from api.repositories.transcription_cache_repo import TranscriptionCacheRepository
+
+    cache = job.get("cache")
+    if not cache or job.get("cache_hit"):
+        return
+    try:
+        async with session.begin_nested():
+            await TranscriptionCacheRepository(session).put(
+                cache["key"],
+                user_id=recording.user_id,
+                audio_sha256=cache["audio_sha256"],
+                language=job["language"],
+                speech_model=job["model"],
+                keyterms_count=job["keyterms_count"],
+                source_recording_id=recording.id,
+                result=transcription_result,
             )
+    except Exception as exc:
+        logger.warning(f"Transcription cache store failed (ignored): {exc!r}")
 
-            await transcription_manager.generate_cache_files(recording_id, user_slug)
 
-            task_self.update_progress(user_id, 90, "Updating database...", step="transcribe")
+_DERIVED_SUBTITLE_FORMATS = ("srt", "vtt")
 
-            recording.transcription_dir = str(transcription_dir)
-            recording.transcription_info = transcription_result
-            recording.final_duration = duration or None
 
-            recording.mark_stage_completed(
-                ProcessingStageType.TRANSCRIBE,
-                meta={"transcription_dir": str(transcription_dir), "language": language, "model": aai_model},
+def _subtitles_pending(recording: RecordingModel) -> bool:
+    """Whether a GENERATE_SUBTITLES stage will run after this transcription."""
+    return any(
+        s.stage_type == ProcessingStageType.GENERATE_SUBTITLES and s.status != ProcessingStageStatus.SKIPPED
+        for s in recording.processing_stages
+    )
+
+
+def _derived_subtitles(recording: RecordingModel, formats: list[str]) -> dict[str, str] | None:
+    """Subtitle keys written with the transcription, if they cover ``formats``."""
+    transcribe_stage = next(
+        (s for s in recording.processing_stages if s.stage_type == ProcessingStageType.TRANSCRIBE), None
+    )
+    artifacts = ((transcribe_stage.stage_meta or {}).get("artifacts") or {}) if transcribe_stage else {}
+    if formats and all(fmt in artifacts for fmt in formats):
+        return {fmt: artifacts[fmt] for fmt in formats}
+    return None
+
+
+def _compact_offset_map(recording: RecordingModel) -> OffsetMap | None:
+    """Offset map left by a compact-mode trim, if the processed audio was compacted."""
+    trim_stage = next((s for s in recording.processing_stages if s.stage_type == ProcessingStageType.TRIM), None)
+    compact = (trim_stage.stage_meta or {}).get("compact") if trim_stage else None
+    return OffsetMap.from_meta(compact) if compact else None
+
+
+async def _save_transcription_result(
+    task_self,
+    session,
+    recording: RecordingModel,
+    transcription_result: dict,
+    job: dict,
+    timing,
+) -> dict:
+    """Persist an ASR result: master.json + cache files, search index, stage and usage bookkeeping.
+
+    Shared by the blocking transcribe path and the completion task of the
+    non-blocking path; ``job`` carries the submit-time parameters.
+    """
+    recording_id = recording.id
+    user_id = recording.user_id
+    language = job["language"]
+    aai_model = job["model"]
+    recording_repo = RecordingRepository(session)
+    timing_service = TimingService(session)
+
+    task_self.update_progress(user_id, 70, "Saving transcription...", step="transcribe")
+
+    transcription_manager = get_transcription_manager()
+    user_slug = recording.owner.user_slug
+    transcription_dir = transcription_manager.get_dir(recording_id, user_slug)
+
+    words = transcription_result.get("words", [])
+    segments = transcription_result.get("segments", [])
+    detected_language = transcription_result.get("language", language)
+
+    duration = 0.0
+    if segments:
+        duration = segments[-1].get("end", 0.0)
+    audio_duration = duration
+
+    # Compact mode: ASR ran on audio with long breaks cut out; move timestamps back onto the video
+    offset_map = _compact_offset_map(recording)
+    if offset_map and not offset_map.video_compacted:
+        words = offset_map.project(words)
+        segments = offset_map.project(segments)
+        duration = segments[-1]["end"] if segments else duration
+        transcription_info = {**transcription_result, "words": words, "segments": segments}
+    else:
+        transcription_info = transcription_result
+
+    usage_metadata = {
+        "model": aai_model,
+        "speech_models": job["speech_models"],
+        "keyterms_count": job["keyterms_count"],
+        "config": {
+            "language": language,
+            "detected_language": detected_language,
+            "language_detection": job["language_detection"],
+        },
+        "audio_file": {
+            "path": job["audio_storage_key"],
+            "duration_seconds": audio_duration,
+        },
+    }
+    if offset_map:
+        usage_metadata["compact"] = offset_map.to_meta()
+
+    await transcription_manager.save_master(
+        recording_id=recording_id,
+        words=words,
+        segments=segments,
+        language=language,
+        model=aai_model,
+        duration=duration,
+        usage_metadata=usage_metadata,
+        user_slug=user_slug,
+        raw_response=transcription_result,
+    )
+
+    # Cache files (and subtitles, when that stage will run) come straight from the
+    # in-memory result: no master.json / segments.txt read-back.
+    artifacts = await transcription_manager.derive_artifacts(
+        recording_id,
+        user_slug,
+        words,
+        segments,
+        subtitle_formats=_DERIVED_SUBTITLE_FORMATS if _subtitles_pending(recording) else (),
+    )
+
+    task_self.update_progress(user_id, 90, "Updating database...", step="transcribe")
+
+    # Search index is derived data: a failure here must not fail the
+    # transcription, so it runs in a savepoint and is only logged.
+    from api.repositories.transcript_search_repo import TranscriptSearchRepository
+
+    try:
+        async with session.begin_nested():
+            indexed = await TranscriptSearchRepository(session).replace_for_recording(
+                recording_id, user_id, segments, detected_language or language
             )
+        logger.debug(f"Transcript search index updated | {format_details(segments=indexed)}")
+    except Exception as exc:
+        logger.warning(f"Transcript search indexing failed (ignored): {exc!r}")
+
+    await _store_transcription_cache(session, recording, transcription_result, job)
+
+    recording.transcription_dir = str(transcription_dir)
+    recording.transcription_info = transcription_info
+    recording.final_duration = duration or None
+
+    recording.mark_stage_completed(
+        ProcessingStageType.TRANSCRIBE,
+        meta={
+            "transcription_dir": str(transcription_dir),
+            "language": language,
+            "model": aai_model,
+            "artifacts": artifacts,
+        },
+    )
 
-            update_aggregate_status(recording)
+    update_aggregate_status(recording)
 
-            await timing_service.complete_stage(timing, meta={"language": language, "words": len(words)})
-            _update_pipeline_completed(recording)
+    if timing:
+        await timing_service.complete_stage(
+            timing, meta={"language": language, "words": len(words), "cache_hit": bool(job.get("cache_hit"))}
+        )
+    _update_pipeline_completed(recording)
 
-            await recording_repo.update(recording)
-            await session.commit()
+    await recording_repo.update(recording)
+    await session.commit()
 
-            await _increment_usage_counter(user_id, "transcription")
-            await _track_event(user_id, "transcription_completed", recording_id=recording_id, duration_seconds=duration)
+    await _increment_usage_counter(user_id, "transcription")
+    await _track_event(user_id, "transcription_completed", recording_id=recording_id, duration_seconds=duration)
 
-            logger.success(
-                f"Transcription complete | "
-                f"{format_details(words=len(words), segments=len(segments), lang=language, elapsed=f'{timing.duration_seconds:.1f}s')}"
+    elapsed = f"{timing.duration_seconds:.1f}s" if timing and timing.duration_seconds is not None else "?"
+    logger.success(
+        f"Transcription complete | "
+        f"{format_details(words=len(words), segments=len(segments), lang=language, elapsed=elapsed)}"
+    )
+
+    return {
+        "success": True,
+        "transcription_dir": str(transcription_dir),
+        "language": language,
+        "words_count": len(words),
+        "segments_count": len(segments),
+    }
+
+
+def _park_chain_until_transcript(task_self, recording_id: int, user_id: str, submitted: dict) -> None:
+    """Detach the rest of the chain and register it with the submitted transcript.
+
+    Clearing ``request.chain`` stops Celery from launching the next step when this
+    task returns; the webhook or the poller re-launches it behind
+    ``complete_transcription`` once AssemblyAI is done. Signatures keep their task
+    ids, so a pause that revokes ``pipeline_task_id`` still applies to them.
+    """
+    from api.services.pending_transcripts import get_pending_transcript_store
+
+    remaining = list(task_self.request.chain or [])
+    get_pending_transcript_store().add(
+        submitted["transcript_id"],
+        {**submitted["job"], "recording_id": recording_id, "user_id": user_id, "chain": remaining},
+    )
+    task_self.request.chain = None
+    logger.info(
+        f"Transcription submitted, worker released | "
+        f"{format_details(transcript=submitted['transcript_id'], parked_steps=len(remaining))}"
+    )
+
+
+def resume_transcription_chain(transcript_id: str) -> str | None:
+    """Claim a pending transcript and launch ``complete_transcription`` + the parked chain.
+
+    Returns the id of the last launched task, or None if the transcript was unknown
+    or already claimed (webhook and poller may both see the same completion).
+    """
+    from celery import signature
+
+    from api.services.pending_transcripts import get_pending_transcript_store
+
+    store = get_pending_transcript_store()
+    job = store.claim(transcript_id)
+    if job is None:
+        return None
+
+    parked = job.pop("chain", None) or []
+    steps = [complete_transcription_task.si(job["recording_id"], job["user_id"], transcript_id, job)]
+    # request.chain is stored in reverse order (Celery pops the next step from the end)
+    steps.extend(signature(step, app=celery_app) for step in reversed(parked))
+    try:
+        result = chain(*steps).apply_async()
+    except Exception:
+        # Broker hiccup: put the job back so the next poll retries it
+        store.add(transcript_id, {**job, "chain": parked})
+        raise
+    logger.info(
+        f"Transcription resumed | {format_details(transcript=transcript_id, rec=job['recording_id'], steps=len(steps))}"
+    )
+    return result.id
+
+
+@celery_app.task(
+    bind=True,
+    base=ProcessingTask,
+    name="api.tasks.processing.complete_transcription",
+    max_retries=settings.celery.processing_max_retries,
+    default_retry_delay=settings.celery.processing_retry_delay,
+)
+def complete_transcription_task(self, recording_id: int, user_id: str, transcript_id: str, job: dict) -> dict:
+    """
+    Second half of non-blocking transcription: fetch the finished transcript and save it.
+
+    Launched by ``resume_transcription_chain`` (webhook or poller) as the head of the
+    chain that ``transcribe_recording`` parked. ASR-side failures (``error`` status,
+    timeout, empty result) are final; network errors are retried.
+    """
+    with logger.contextualize(
+        task_id=short_task_id(self.request.id),
+        recording_id=recording_id,
+        user_id=short_user_id(user_id),
+    ):
+        try:
+            with track_pipeline_stage("transcribe_complete"):
+                result = self.run_async(_async_complete_transcription(self, recording_id, user_id, transcript_id, job))
+
+            return self.build_result(
+                user_id=user_id,
+                status="completed",
+                recording_id=recording_id,
+                result=result,
             )
 
-            return {
-                "success": True,
-                "transcription_dir": str(transcription_dir),
-                "language": language,
-                "words_count": len(words),
-                "segments_count": len(segments),
-            }
+        except (RuntimeError, TimeoutError, ValueError) as exc:
+            logger.error(f"Transcription failed | {format_details(transcript=transcript_id, error=repr(exc))}")
+            raise
+
+        except Exception as exc:
+            logger.error(f"Error completing transcription: {exc!r}", exc_info=True)
+            raise self.retry(exc=exc)
+
+
+async def _async_complete_transcription(
+    task_self, recording_id: int, user_id: str, transcript_id: str, job: dict
+) -> dict:
+    from assemblyai_module import AssemblyAIConfig, AssemblyAITranscriptionService
+    from assemblyai_module.service import TERMINAL_STATUSES
+
+    session_maker = get_async_session_maker()
+
+    async with session_maker() as session:
+        recording = await RecordingRepository(session).get_by_id(recording_id, user_id)
+        if not recording:
+            raise ValueError(f"Recording {recording_id} not found")
+
+        timing_service = TimingService(session)
+        timing = await timing_service.get_by_id(job["timing_id"]) if job.get("timing_id") else None
+
+        try:
+            task_self.update_progress(user_id, 60, "Fetching transcript...", step="transcribe")
+
+            aai_service = AssemblyAITranscriptionService(AssemblyAIConfig.from_file("config/assemblyai_creds.json"))
+            data = await aai_service.get_transcript(transcript_id)
+            if data.get("status") not in TERMINAL_STATUSES:
+                waited = datetime.now(UTC).timestamp() - float(job.get("submitted_at") or 0)
+                raise TimeoutError(
+                    f"AssemblyAI transcription timed out after {waited:.0f}s (id={transcript_id}, status={data.get('status')})"
+                )
+
+            transcription_result = await aai_service.complete_transcription(data, job["language"])
+            return await _save_transcription_result(task_self, session, recording, transcription_result, job, timing)
 
         except Exception as e:
-            await timing_service.fail_stage(timing, str(e))
-            await session.commit()
+            if timing:
+                await timing_service.fail_stage(timing, str(e))
+                await session.commit()
             raise
 
 
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    name="api.tasks.processing.resume_transcription",
+    max_retries=3,
+    default_retry_delay=10,
+)
+def resume_transcription_task(self, transcript_id: str) -> dict:
+    """Resume a parked chain for one transcript (enqueued by the AssemblyAI webhook)."""
+    try:
+        chain_id = resume_transcription_chain(transcript_id)
+    except Exception as exc:
+        logger.warning(f"Resume failed | {format_details(transcript=transcript_id, error=repr(exc))}")
+        raise self.retry(exc=exc)
+    return {"transcript_id": transcript_id, "resumed": chain_id is not None, "chain_id": chain_id}
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    name="api.tasks.processing.poll_pending_transcripts",
+    max_retries=0,
+    ignore_result=True,
+)
+def poll_pending_transcripts_task(self) -> dict:
+    """
+    Batched poller for all outstanding transcripts (beat, every ``pending_poll_interval``).
+
+    One status request per pending transcript over one connection pool; terminal
+    or overdue ones are resumed. Covers deployments without a public webhook URL
+    and webhook deliveries that never arrived.
+    """
+    from api.services.pending_transcripts import get_pending_transcript_store
+    from assemblyai_module import AssemblyAIConfig, AssemblyAITranscriptionService
+    from assemblyai_module.service import TERMINAL_STATUSES
+
+    pending = get_pending_transcript_store().all()
+    if not pending:
+        return {"pending": 0, "resumed": 0}
+
+    aai_config = AssemblyAIConfig.from_file("config/assemblyai_creds.json")
+    statuses = self.run_async(AssemblyAITranscriptionService(aai_config).get_statuses(list(pending)))
+
+    now = datetime.now(UTC).timestamp()
+    resumed = 0
+    slots = get_pipeline_slots()
+    for transcript_id, job in pending.items():
+        # A parked pipeline runs no step until resumed: keep its slot lease alive meanwhile
+        if job.get("user_id") and job.get("recording_id") is not None:
+            try:
+                slots.renew(job["user_id"], job["recording_id"])
+            except Exception as e:
+                logger.debug(f"Pipeline slot renew failed: {e!r}")
+        overdue = now - float(job.get("submitted_at") or now) > aai_config.settings.max_wait_seconds
+        if statuses.get(transcript_id) in TERMINAL_STATUSES or overdue:
+            if resume_transcription_chain(transcript_id):
+                resumed += 1
+
+    if resumed:
+        logger.info(f"Pending transcripts polled | {format_details(pending=len(pending), resumed=resumed)}")
+    return {"pending": len(pending), "resumed": resumed}
+
+
+@celery_app.task(
+    name="api.tasks.processing.dispatch_fair_share",
+    max_retries=0,
+    ignore_result=True,
+)
+def dispatch_fair_share_task() -> dict:
+    """
+    Release queued bulk pipeline runs into Celery in tenant fair-share order (beat, every ``fair_share_interval``).
+
+    Only as many runs as keep the pipeline queues under ``fair_share_max_pending``
+    waiting tasks are published per tick, so one tenant's 500-video playlist is
+    interleaved with everyone else's work instead of sitting ahead of it.
+    """
+    from api.services.fair_share import get_fair_share_queue, pending_pipeline_tasks
+
+    queue = get_fair_share_queue()
+    lock_token = queue.lock(timeout=settings.celery.fair_share_interval * 12)
+    if not lock_token:
+        return {"dispatched": 0, "budget": 0}
+    try:
+        waiting = pending_pipeline_tasks(queue.redis, stale_after=settings.celery.task_time_limit)
+        budget = max(settings.celery.fair_share_max_pending - waiting, 0)
+        dispatched = queue.drain(
+            budget,
+            lambda payload: celery_app.send_task(payload["task"], kwargs=payload["kwargs"], task_id=payload["task_id"]),
+        )
+    finally:
+        queue.unlock(lock_token)
+
+    if dispatched:
+        logger.info(f"Fair-share dispatch | {format_details(dispatched=dispatched, waiting=waiting)}")
+    return {"dispatched": dispatched, "budget": budget}
+
+
+@celery_app.task(
+    name="api.tasks.processing.promote_deferred_pipelines",
+    max_retries=0,
+    ignore_result=True,
+)
+def promote_deferred_pipelines_task() -> dict:
+    """
+    Start deferred pipelines whose tenant has a free slot again (beat, every ``pipeline_slot_promote_interval``).
+
+    Releases promote the next deferred run right away; this sweep covers slots
+    freed by lease expiry (crashed workers) and releases whose promotion failed.
+    """
+    tenants = get_pipeline_slots().deferred_tenants()
+    promoted = 0
+    for user_id in tenants:
+        try:
+            promoted += promote_deferred_runs(user_id)
+        except Exception as e:
+            logger.warning(f"Deferred promotion failed | {format_details(user=short_user_id(user_id), error=repr(e))}")
+    return {"tenants": len(tenants), "promoted": promoted}
+
+
+@celery_app.task(
+    bind=True,
+    base=ProcessingTask,
+    name="api.tasks.processing.await_trim",
+    max_retries=settings.celery.trim_join_max_wait // settings.celery.trim_join_poll_interval,
+    default_retry_delay=settings.celery.trim_join_poll_interval,
+)
+def await_trim_task(self, recording_id: int, user_id: str) -> dict:
+    """
+    Join point before uploads when transcription was started off the trimmed audio.
+
+    ``trim_video`` launches the transcription steps as soon as the audio is
+    committed and keeps trimming the video. This step holds uploads (and
+    finalize) until the TRIM stage completes, re-checking with a countdown
+    instead of blocking a worker.
+    """
+    with logger.contextualize(
+        task_id=short_task_id(self.request.id),
+        recording_id=recording_id,
+        user_id=short_user_id(user_id),
+    ):
+        paused, status = self.run_async(_trim_stage_status(recording_id, user_id))
+
+        if paused:
+            logger.info("Skipped: recording paused")
+            return self.build_result(user_id=user_id, status="paused", recording_id=recording_id)
+        if status == ProcessingStageStatus.FAILED:
+            raise RuntimeError("Video trimming failed, pipeline stopped before uploads")
+        if status in (ProcessingStageStatus.PENDING, ProcessingStageStatus.IN_PROGRESS):
+            logger.debug(f"Waiting for video trim | {format_details(attempt=self.request.retries + 1)}")
+            raise self.retry(countdown=settings.celery.trim_join_poll_interval)
+
+        return self.build_result(user_id=user_id, status="completed", recording_id=recording_id)
+
+
+async def _trim_stage_status(recording_id: int, user_id: str) -> tuple[bool, ProcessingStageStatus | None]:
+    """(on_pause, TRIM stage status) of the recording."""
+    session_maker = get_async_session_maker()
+    async with session_maker() as session:
+        recording = await RecordingRepository(session).get_by_id(recording_id, user_id)
+        if not recording:
+            raise ValueError(f"Recording {recording_id} not found")
+        trim_stage = next((s for s in recording.processing_stages if s.stage_type == ProcessingStageType.TRIM), None)
+        return recording.on_pause, trim_stage.status if trim_stage else None
+
+
 @celery_app.task(
     bind=True,
     base=ProcessingTask,
@@ -1215,6 +1802,8 @@ def _finalize_pipeline_task(self, recording_id: int, user_id: str) -> dict:
                 rec.on_air = False
                 rec.pipeline_task_id = None
                 await session.commit()
+                release_pipeline_slot(user_id, recording_id)
+                finish_recording_artifacts(recording_id)
                 return
             rec.on_air = False
             rec.pipeline_task_id = None
@@ -1226,6 +1815,8 @@ def _finalize_pipeline_task(self, recording_id: int, user_id: str) -> dict:
                 rec.pipeline_duration_seconds = duration
             update_aggregate_status(rec)
             await session.commit()
+            release_pipeline_slot(user_id, recording_id)
+            finish_recording_artifacts(recording_id)
             await _track_event(user_id, "processing_completed", recording_id=recording_id, duration_seconds=duration)
 
     self.run_async(_finalize())
@@ -1245,12 +1836,17 @@ def _launch_uploads_task(
     platforms: list[str],
     preset_map: dict[str, int],
     metadata_override: dict | None = None,
+    deferred_publish: bool = False,
+    publish_platforms: list[str] | None = None,
+    upload_captions: bool = False,
 ) -> dict:
     """
     Launch upload tasks after processing chain completes.
 
     This task is added as final step in chain to ensure uploads start
-    only after all processing is complete.
+    only after all processing is complete. In early-upload mode it also runs
+    right after trim with ``deferred_publish`` (private uploads), and the final
+    step launches ``publish_recording_on_platform`` for those platforms.
 
     Args:
         recording_id: ID of recording
@@ -1258,11 +1854,19 @@ def _launch_uploads_task(
         platforms: List of platforms to upload to
         preset_map: Mapping of platform -> preset_id
         metadata_override: Optional metadata override
+        deferred_publish: Upload privately, metadata and visibility are applied at publish
+        publish_platforms: Platforms uploaded early that now need their publish step
+        upload_captions: Upload captions when publishing
 
     Returns:
         Dict with launched upload task IDs
     """
-    from api.tasks.upload import platform_to_target_type, upload_enqueue_skip_reason, upload_recording_to_platform
+    from api.tasks.upload import (
+        platform_to_target_type,
+        publish_recording_on_platform,
+        upload_enqueue_skip_reason,
+        upload_recording_to_platform,
+    )
 
     # Check pause flag before launching uploads
     session_maker = get_async_session_maker()
@@ -1304,7 +1908,9 @@ def _launch_uploads_task(
                 result={"message": "Pipeline paused by user"},
             )
 
-        logger.info(f"Launching uploads | {format_details(platforms=platforms)}")
+        logger.info(
+            f"Launching uploads | {format_details(platforms=platforms, deferred=deferred_publish, publish=publish_platforms)}"
+        )
 
         upload_task_ids = []
         for platform in platforms:
@@ -1324,9 +1930,15 @@ def _launch_uploads_task(
                     continue
 
                 preset_id = preset_map.get(platform)
-                upload_task = upload_recording_to_platform.delay(
-                    recording_id, user_id, platform, preset_id, None, metadata_override
-                )
+                # Hold the node pin (and its scratch copy of the video) until the upload returns
+                hold_recording_artifacts(recording_id)
+                try:
+                    upload_task = upload_recording_to_platform.delay(
+                        recording_id, user_id, platform, preset_id, None, metadata_override, deferred_publish
+                    )
+                except Exception:
+                    release_recording_artifacts(recording_id, states.FAILURE)
+                    raise
 
                 upload_task_ids.append(
                     {
@@ -1341,6 +1953,26 @@ def _launch_uploads_task(
             except Exception as e:
                 logger.error(f"Failed to launch upload | {format_details(platform=platform, error=e)}")
 
+        for platform in publish_platforms or []:
+            try:
+                preset_id = preset_map.get(platform)
+                publish_task = publish_recording_on_platform.delay(
+                    recording_id, user_id, platform, preset_id, metadata_override, upload_captions
+                )
+                upload_task_ids.append(
+                    {
+                        "platform": platform,
+                        "task_id": publish_task.id,
+                        "preset_id": preset_id,
+                        "status": "publishing",
+                    }
+                )
+                logger.info(
+                    f"Publish task launched | {format_details(platform=platform, publish_task=short_task_id(publish_task.id))}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to launch publish | {format_details(platform=platform, error=e)}")
+
         return self.build_result(
             user_id=user_id,
             status="completed",
@@ -1349,6 +1981,242 @@ def _launch_uploads_task(
         )
 
 
+def _build_pipeline_chain(
+    recording_id: int,
+    user_id: str,
+    manual_override: dict,
+    full_config: dict,
+    output_config: dict,
+    presets: list,
+) -> tuple[list, dict]:
+    """Chain steps for the enabled stages, plus the upload summary for the task result."""
+    trimming = full_config.get("trimming", {})
+    transcription = full_config.get("transcription", {})
+
+    download_enabled = True
+    trim_enabled = trimming.get("enable_trimming", True)
+    transcribe_enabled = transcription.get("enable_transcription", True)
+    extract_topics_enabled = transcription.get("enable_topics", True)
+    generate_subs_enabled = transcription.get("enable_subtitles", True)
+
+    upload_enabled = output_config.get("auto_upload", False)
+    platforms = output_config.get("default_platforms", [])
+
+    granularity = transcription.get("granularity", "long")
+    subtitle_formats = transcription.get("subtitle_formats", ["srt", "vtt"])
+
+    logger.info(
+        f"Pipeline config | {format_details(download=download_enabled, trim=trim_enabled, transcribe=transcribe_enabled, topics=extract_topics_enabled, subs=generate_subs_enabled, upload=upload_enabled)}"
+    )
+
+    # Build task chain based on enabled steps
+    task_chain = []
+
+    # Sequential tasks (must run in order)
+    if download_enabled:
+        task_chain.append(download_recording_task.si(recording_id, user_id, False, manual_override))
+
+    # Upload targets: with early_upload, editable platforms go up privately right after trim
+    upload_launch = None
+    if upload_enabled and (platforms or presets):
+        preset_map = {preset.platform: preset.id for preset in presets}
+        if not platforms and presets:
+            platforms = [preset.platform for preset in presets]
+        upload_launch = {
+            "recording_id": recording_id,
+            "user_id": user_id,
+            "preset_map": preset_map,
+            "metadata_override": full_config.get("metadata_config", {}),
+        }
+    summary = {"upload_enabled": upload_enabled, "platforms": list(platforms) if upload_launch else []}
+
+    early_platforms: list[str] = []
+    if upload_launch and trim_enabled and output_config.get("early_upload", False):
+        from api.tasks.upload import supports_deferred_publish
+
+        early_platforms = [p for p in platforms if supports_deferred_publish(p)]
+        platforms = [p for p in platforms if not supports_deferred_publish(p)]
+
+    if trim_enabled:
+        task_chain.append(trim_video_task.si(recording_id, user_id, manual_override))
+
+    if early_platforms:
+        task_chain.append(_launch_uploads_task.si(**upload_launch, platforms=early_platforms, deferred_publish=True))
+        logger.debug(f"Added early upload launcher | {format_details(platforms=early_platforms)}")
+
+    if transcribe_enabled:
+        task_chain.append(transcribe_recording_task.si(recording_id, user_id, manual_override))
+
+    # Parallel tasks after transcription (both depend on transcribe, but not on each other)
+    parallel_after_transcribe = []
+    if extract_topics_enabled:
+        parallel_after_transcribe.append(extract_topics_task.si(recording_id, user_id, granularity, None))
+
+    if generate_subs_enabled:
+        parallel_after_transcribe.append(generate_subtitles_task.si(recording_id, user_id, subtitle_formats))
+
+    # Add parallel group to chain if there are tasks
+    if parallel_after_transcribe:
+        if len(parallel_after_transcribe) > 1:
+            # Multiple tasks - run in parallel
+            task_chain.append(group(*parallel_after_transcribe))
+            logger.debug(f"Added parallel group | {format_details(tasks=len(parallel_after_transcribe))}")
+        else:
+            # Single task - just append normally
+            task_chain.append(parallel_after_transcribe[0])
+
+    # Trim starts transcription as soon as the audio is committed; join before uploads/finalize
+    if trim_enabled and transcribe_enabled:
+        task_chain.append(await_trim_task.si(recording_id, user_id))
+
+    if not task_chain:
+        return [], summary
+
+    # Build chain with optional upload callback (early uploads get their publish step here)
+    if upload_launch:
+        publish = (
+            {"publish_platforms": early_platforms, "upload_captions": output_config.get("upload_captions", True)}
+            if early_platforms
+            else {}
+        )
+        task_chain.append(_launch_uploads_task.si(**upload_launch, platforms=platforms, **publish))
+
+        logger.debug(f"Added upload launcher | {format_details(platforms=platforms, publish=early_platforms)}")
+
+    # Always append finalize step — clears on_air and records completion time
+    task_chain.append(_finalize_pipeline_task.si(recording_id, user_id))
+
+    return task_chain, summary
+
+
+async def _pipeline_preflight(recording_id: int, user_id: str, manual_override: dict) -> dict:
+    """
+    Everything ``run_recording_task`` needs before launch, in one session and one transaction.
+
+    The recording row is locked (SELECT ... FOR UPDATE) until commit, so concurrent
+    runs of the same recording serialize here. Pause check, quota gate, usage
+    counter/event, config resolution, pipeline start, blank-record skip and the
+    chain plan (with its pre-assigned chain id) are committed together. The
+    pipeline slot is acquired last and released again if the commit fails.
+
+    Returns:
+        ``{"chain": ..., "chain_tasks": ..., "upload_enabled": ..., "platforms": ...}``
+        when the pipeline should launch (the caller applies the chain after commit),
+        otherwise ``build_result`` kwargs (``status`` + ``result``/``reason``).
+    """
+    from api.repositories.subscription_repos import QuotaUsageRepository
+    from api.repositories.usage_event_repo import UsageEventRepository
+    from api.services.quota_service import QuotaService
+
+    session_maker = get_async_session_maker()
+
+    async with session_maker() as session:
+        repo = RecordingRepository(session)
+        rec = await repo.get_by_id(recording_id, user_id, for_update=True)
+        if not rec:
+            raise ValueError(f"Recording {recording_id} not found for user {user_id}")
+
+        # Check pause flag before building pipeline
+        if rec.on_pause:
+            logger.info("Skipped: recording paused")
+            return {"status": "paused", "result": {"message": "Pipeline paused by user"}}
+
+        # Hard limit: gate the whole pipeline. The manual /run endpoint returns a fast
+        # 429, but auto-run and bulk paths reach orchestration only here, so the
+        # authoritative processing gate lives in the task. Clear on_air on block.
+        quota_service = QuotaService(session)
+        proc_allowed, proc_err = await quota_service.check_processing_quota(user_id)
+        if not proc_allowed:
+            logger.warning(f"Processing blocked by quota | {format_details(rec=recording_id, reason=proc_err)}")
+            rec.on_air = False
+            rec.pipeline_task_id = None
+            await session.commit()
+            return {"status": "quota_exceeded", "result": {"message": proc_err}}
+
+        # Resolve config to determine which steps are enabled
+        full_config, output_config, rec = await resolve_full_config(
+            session, recording_id, user_id, manual_override, include_output_config=True
+        )
+        preset_ids_list = output_config.get("preset_ids", [])
+        presets = []
+        if preset_ids_list:
+            presets = await OutputPresetRepository(session).find_by_ids(preset_ids_list, user_id)
+
+        if rec.blank_record:
+            logger.info(
+                f"Skipped: blank record | {format_details(duration=f'{rec.duration}s', size=rec.video_file_size)}"
+            )
+            rec.status = ProcessingStatus.SKIPPED
+            rec.failed_reason = "Blank record (too short or too small)"
+            rec.on_air = False
+            rec.pipeline_task_id = None
+            await session.commit()
+            return {"status": "skipped", "reason": "blank_record"}
+
+        task_chain, summary = _build_pipeline_chain(
+            recording_id, user_id, manual_override, full_config, output_config, presets
+        )
+        if not task_chain:
+            logger.warning("No processing steps enabled")
+            # Clear on_air since no chain will run _finalize_pipeline_task.
+            rec.on_air = False
+            rec.pipeline_task_id = None
+            await session.commit()
+            return {"status": "completed", "result": {"message": "No processing steps enabled"}}
+
+        # Admission: one max_concurrent_tasks slot per running pipeline, taken last so
+        # nothing before it can leak the slot. Excess runs wait in the tenant's deferred
+        # queue (on_air stays set) and are re-published on release.
+        slots = get_pipeline_slots()
+        slot_limit = (await quota_service.get_effective_quotas(user_id))["max_concurrent_tasks"]
+        if not slots.acquire(user_id, recording_id, slot_limit):
+            run_kwargs = {"recording_id": recording_id, "user_id": user_id, "manual_override": manual_override}
+            deferred = slots.defer(user_id, run_kwargs, slot_limit)
+            logger.info(f"Deferred: no free pipeline slot | {format_details(limit=slot_limit, deferred=deferred)}")
+            rec.on_air = True
+            rec.pipeline_task_id = None
+            await session.commit()
+            return {
+                "status": "deferred",
+                "result": {
+                    "message": f"Waiting for a free pipeline slot ({slot_limit} concurrent)",
+                    "position": deferred,
+                },
+            }
+
+        try:
+            # Usage accounting is best-effort: a savepoint keeps its failure out of the preflight
+            try:
+                async with session.begin_nested():
+                    current_period = int(datetime.now().strftime("%Y%m"))
+                    await QuotaUsageRepository(session).increment_processing(user_id, current_period, commit=False)
+                    await UsageEventRepository(session).create(user_id, "processing_started", recording_id=recording_id)
+            except Exception as exc:
+                logger.warning(f"processing usage tracking failed (ignored): {exc!r}")
+
+            # Set pipeline_started_at and mark on_air. The manual /run endpoint already
+            # sets on_air before enqueue (for its 409 guard); auto-run and bulk-run reach
+            # the orchestrator without it, so set it here too — this keeps on_air the single
+            # source of truth for "pipeline active" across all entry paths (used by the
+            # concurrent-tasks quota gate). Every exit path clears it.
+            rec.pipeline_started_at = datetime.now(UTC)
+            rec.pipeline_completed_at = None
+            rec.pipeline_duration_seconds = None
+            rec.on_air = True
+
+            # Task ids are assigned up front, so the chain id is stored (for pause/revoke)
+            # in the same transaction and stays valid when the chain is applied
+            chain_signature = chain(*task_chain)
+            rec.pipeline_task_id = chain_signature.freeze().id
+            await session.commit()
+        except BaseException:
+            # No committed plan, no chain to reach finalize: free the slot now
+            release_pipeline_slot(user_id, recording_id)
+            raise
+
+        return {"chain": chain_signature, "chain_tasks": len(task_chain), **summary}
+
+
 @celery_app.task(
     bind=True,
     base=ProcessingTask,
@@ -1370,6 +2238,9 @@ def run_recording_task(
     - Better resource utilization during I/O operations
     - Natural task boundaries for monitoring and retries
 
+    All DB work happens in a single preflight transaction (``_pipeline_preflight``);
+    the chain is launched after it commits.
+
     Args:
         recording_id: ID of recording
         user_id: ID of user
@@ -1387,227 +2258,20 @@ def run_recording_task(
     try:
         logger.info("Orchestrating pipeline")
 
-        from api.dependencies import get_async_session_maker
-        from api.services.config_utils import resolve_full_config
-
-        manual_override = manual_override or {}
-        session_maker = get_async_session_maker()
+        plan = self.run_async(_pipeline_preflight(recording_id, user_id, manual_override or {}))
+        if "chain" not in plan:
+            return self.build_result(user_id=user_id, recording_id=recording_id, **plan)
 
-        # Check pause flag before building pipeline
-        async def _check_pause_before_pipeline():
-            async with session_maker() as session:
-                repo = RecordingRepository(session)
-                rec = await repo.get_by_id(recording_id, user_id)
-                return rec.on_pause if rec else False
-
-        if self.run_async(_check_pause_before_pipeline()):
-            logger.info("Skipped: recording paused")
-            return self.build_result(
-                user_id=user_id,
-                status="paused",
-                recording_id=recording_id,
-                result={"message": "Pipeline paused by user"},
-            )
-
-        # Hard limit: gate the whole pipeline. The manual /run endpoint returns a fast
-        # 429, but auto-run and bulk paths reach orchestration only here, so the
-        # authoritative processing gate lives in the task. Clear on_air on block.
-        async def _check_processing_quota():
-            from api.services.quota_service import QuotaService
-
-            async with session_maker() as session:
-                return await QuotaService(session).check_processing_quota(user_id)
-
-        proc_allowed, proc_err = self.run_async(_check_processing_quota())
-        if not proc_allowed:
-            logger.warning(f"Processing blocked by quota | {format_details(rec=recording_id, reason=proc_err)}")
+        try:
+            chain_result = plan["chain"].apply_async()
+        except Exception:
+            # The chain never started and on_failure skips the orchestrator:
+            # clear on_air and free the pipeline slot here
             self.run_async(self._clear_on_air_async(recording_id, user_id))
-            return self.build_result(
-                user_id=user_id,
-                status="quota_exceeded",
-                recording_id=recording_id,
-                result={"message": proc_err},
-            )
-
-        self.run_async(_increment_usage_counter(user_id, "processing"))
-        self.run_async(_track_event(user_id, "processing_started", recording_id=recording_id))
-
-        # Resolve config to determine which steps are enabled
-        async def _resolve_pipeline_config():
-            async with session_maker() as session:
-                full_config, output_config, recording = await resolve_full_config(
-                    session, recording_id, user_id, manual_override, include_output_config=True
-                )
-
-                preset_ids_list = output_config.get("preset_ids", [])
-                presets = []
-                if preset_ids_list:
-                    preset_repo = OutputPresetRepository(session)
-                    presets = await preset_repo.find_by_ids(preset_ids_list, user_id)
-
-                return full_config, output_config, recording, presets
-
-        full_config, output_config, recording, presets = self.run_async(_resolve_pipeline_config())
-
-        # Set pipeline_started_at and mark on_air. The manual /run endpoint already
-        # sets on_air before enqueue (for its 409 guard); auto-run and bulk-run reach
-        # the orchestrator without it, so set it here too — this keeps on_air the single
-        # source of truth for "pipeline active" across all entry paths (used by the
-        # concurrent-tasks quota gate). Every exit path clears it.
-        async def _set_pipeline_started():
-            async with session_maker() as session:
-                recording_repo = RecordingRepository(session)
-                rec = await recording_repo.get_by_id(recording_id, user_id)
-                if rec:
-                    rec.pipeline_started_at = datetime.now(UTC)
-                    rec.pipeline_completed_at = None
-                    rec.pipeline_duration_seconds = None
-                    rec.on_air = True
-                    await session.commit()
-
-        self.run_async(_set_pipeline_started())
-
-        # Check blank_record
-        if recording.blank_record:
-            logger.info(
-                f"Skipped: blank record | {format_details(duration=f'{recording.duration}s', size=recording.video_file_size)}"
-            )
-
-            async def _mark_skipped():
-                async with session_maker() as session:
-                    recording_repo = RecordingRepository(session)
-                    rec = await recording_repo.get_by_id(recording_id, user_id)
-                    if rec:
-                        rec.status = ProcessingStatus.SKIPPED
-                        rec.failed_reason = "Blank record (too short or too small)"
-                        rec.on_air = False
-                        rec.pipeline_task_id = None
-                        await session.commit()
-
-            self.run_async(_mark_skipped())
-
-            return self.build_result(
-                user_id=user_id,
-                status="skipped",
-                reason="blank_record",
-                recording_id=recording_id,
-            )
-
-        # Extract config flags
-        trimming = full_config.get("trimming", {})
-        transcription = full_config.get("transcription", {})
-
-        download_enabled = True
-        trim_enabled = trimming.get("enable_trimming", True)
-        transcribe_enabled = transcription.get("enable_transcription", True)
-        extract_topics_enabled = transcription.get("enable_topics", True)
-        generate_subs_enabled = transcription.get("enable_subtitles", True)
-
-        upload_enabled = output_config.get("auto_upload", False)
-        platforms = output_config.get("default_platforms", [])
-
-        granularity = transcription.get("granularity", "long")
-        subtitle_formats = transcription.get("subtitle_formats", ["srt", "vtt"])
-
-        logger.info(
-            f"Pipeline config | {format_details(download=download_enabled, trim=trim_enabled, transcribe=transcribe_enabled, topics=extract_topics_enabled, subs=generate_subs_enabled, upload=upload_enabled)}"
-        )
-
-        # Build task chain based on enabled steps
-        task_chain = []
-
-        # Sequential tasks (must run in order)
-        if download_enabled:
-            task_chain.append(download_recording_task.si(recording_id, user_id, False, manual_override))
-
-        if trim_enabled:
-            task_chain.append(trim_video_task.si(recording_id, user_id, manual_override))
-
-        if transcribe_enabled:
-            task_chain.append(transcribe_recording_task.si(recording_id, user_id, manual_override))
-
-        # Parallel tasks after transcription (both depend on transcribe, but not on each other)
-        parallel_after_transcribe = []
-        if extract_topics_enabled:
-            parallel_after_transcribe.append(extract_topics_task.si(recording_id, user_id, granularity, None))
-
-        if generate_subs_enabled:
-            parallel_after_transcribe.append(generate_subtitles_task.si(recording_id, user_id, subtitle_formats))
-
-        # Add parallel group to chain if there are tasks
-        if parallel_after_transcribe:
-            if len(parallel_after_transcribe) > 1:
-                # Multiple tasks - run in parallel
-                task_chain.append(group(*parallel_after_transcribe))
-                logger.debug(f"Added parallel group | {format_details(tasks=len(parallel_after_transcribe))}")
-            else:
-                # Single task - just append normally
-                task_chain.append(parallel_after_transcribe[0])
-
-        if not task_chain:
-            logger.warning("No processing steps enabled")
-
-            # Clear on_air since no chain will run _finalize_pipeline_task.
-            async def _clear_on_air_no_steps():
-                async with session_maker() as session:
-                    repo = RecordingRepository(session)
-                    rec = await repo.get_by_id(recording_id, user_id)
-                    if rec:
-                        rec.on_air = False
-                        rec.pipeline_task_id = None
-                        await session.commit()
-
-            self.run_async(_clear_on_air_no_steps())
-            return self.build_result(
-                user_id=user_id,
-                status="completed",
-                recording_id=recording_id,
-                result={"message": "No processing steps enabled"},
-            )
-
-        # Build chain with optional upload callback
-        if upload_enabled and (platforms or presets):
-            # Add upload launcher as final callback in chain
-            preset_map = {preset.platform: preset.id for preset in presets}
-
-            if not platforms and presets:
-                platforms = [preset.platform for preset in presets]
-
-            metadata_override = full_config.get("metadata_config", {})
-
-            # Create upload callback task
-            task_chain.append(
-                _launch_uploads_task.si(
-                    recording_id=recording_id,
-                    user_id=user_id,
-                    platforms=platforms,
-                    preset_map=preset_map,
-                    metadata_override=metadata_override,
-                )
-            )
-
-            logger.debug(f"Added upload launcher | {format_details(platforms=platforms)}")
-
-        # Always append finalize step — clears on_air and records completion time
-        task_chain.append(_finalize_pipeline_task.si(recording_id, user_id))
-
-        # Launch chain
-        chain_signature = chain(*task_chain)
-        chain_result = chain_signature.apply_async()
-
-        # Store the actual chain ID so pause can revoke it
-        async def _store_chain_id():
-            async with session_maker() as session:
-                repo = RecordingRepository(session)
-                rec = await repo.get_by_id(recording_id, user_id)
-                if rec:
-                    rec.pipeline_task_id = chain_result.id
-                    await session.commit()
-
-        self.run_async(_store_chain_id())
+            raise
 
         logger.info(
-            f"Pipeline launched | {format_details(tasks=len(task_chain), chain_id=short_task_id(chain_result.id))}"
+            f"Pipeline launched | {format_details(tasks=plan['chain_tasks'], chain_id=short_task_id(chain_result.id))}"
         )
 
         return self.build_result(
@@ -1616,9 +2280,9 @@ def run_recording_task(
             recording_id=recording_id,
             result={
                 "chain_id": chain_result.id,
-                "chain_tasks": len(task_chain),
-                "upload_enabled": upload_enabled,
-                "platforms": platforms if upload_enabled else [],
+                "chain_tasks": plan["chain_tasks"],
+                "upload_enabled": plan["upload_enabled"],
+                "platforms": plan["platforms"],
             },
         )
 
@@ -1642,6 +2306,7 @@ def extract_topics_task(
     user_id: str,
     granularity: str = "long",
     version_id: str | None = None,
+    bypass_cache: bool = False,
 ) -> dict:
     """
     Extract topics from existing transcription (only admin credentials).
@@ -1653,6 +2318,7 @@ def extract_topics_task(
         user_id: ID of user
         granularity: Extraction mode ("short" | "medium" | "long")
         version_id: ID of version (if None, generated automatically)
+        bypass_cache: Do not reuse cached LLM responses (forced regeneration)
 
     Returns:
         Results of topic extraction
@@ -1668,7 +2334,9 @@ def extract_topics_task(
             self.update_progress(user_id, 10, "Initializing topic extraction...", step="extract_topics")
 
             with track_pipeline_stage("extract_topics"):
-                result = self.run_async(_async_extract_topics(self, recording_id, user_id, granularity, version_id))
+                result = self.run_async(
+                    _async_extract_topics(self, recording_id, user_id, granularity, version_id, bypass_cache)
+                )
 
             return self.build_result(
                 user_id=user_id,
@@ -1686,11 +2354,65 @@ def extract_topics_task(
             raise self.retry(exc=exc)
 
 
+def _deepseek_client(config: DeepSeekConfig) -> AsyncOpenAI:
+    """DeepSeek client on the loop's pooled ``deepseek`` HTTP client (keep-alive shared by all calls)."""
+    return AsyncOpenAI(api_key=config.api_key, base_url=config.base_url, http_client=get_http_client("deepseek"))
+
+
+def _topic_stream_progress(task_self, user_id: str, max_tokens: int):
+    """Streamed extraction → task progress 40–75% (by generated tokens) with partial topics."""
+
+    def report(stream: dict) -> None:
+        share = min(stream["completion_tokens"] / max_tokens, 1.0) if max_tokens else 0.0
+        task_self.update_progress(
+            user_id,
+            40 + int(share * 35),
+            f"Extracting topics (deepseek): {len(stream['topics'])} found...",
+            step="extract_topics",
+            partial_topics=stream["topics"],
+            tokens_generated=stream["completion_tokens"],
+            tokens_per_second=stream["tokens_per_second"],
+        )
+
+    return report
+
+
 async def _async_extract_topics(
-    task_self, recording_id: int, user_id: str, granularity: str, version_id: str | None
+    task_self, recording_id: int, user_id: str, granularity: str, version_id: str | None, bypass_cache: bool = False
 ) -> dict:
     """Async function for extracting topics via DeepSeek. Failure raises — no fallback."""
-    session_maker = get_async_session_maker()
+    deepseek_config = DeepSeekConfig.from_file("config/deepseek_creds.json")
+    return await _extract_recording_topics(
+        get_async_session_maker(),
+        recording_id,
+        user_id,
+        granularity,
+        version_id,
+        bypass_cache,
+        deepseek_config=deepseek_config,
+        client=_deepseek_client(deepseek_config),
+        task_self=task_self,
+    )
+
+
+async def _extract_recording_topics(
+    session_maker,
+    recording_id: int,
+    user_id: str,
+    granularity: str,
+    version_id: str | None,
+    bypass_cache: bool,
+    *,
+    deepseek_config: DeepSeekConfig,
+    client: AsyncOpenAI,
+    task_self=None,
+    request_limiter: asyncio.Semaphore | None = None,
+) -> dict:
+    """Topic extraction of one recording (single and batch tasks); no progress updates without ``task_self``."""
+
+    def report(progress: int, status: str) -> None:
+        if task_self is not None:
+            task_self.update_progress(user_id, progress, status, step="extract_topics")
 
     async with session_maker() as session:
         recording_repo = RecordingRepository(session)
@@ -1720,7 +2442,7 @@ async def _async_extract_topics(
         if not await transcription_manager.has_master(recording_id, user_slug):
             raise ValueError(f"Transcription not found for recording {recording_id}. Please run transcription first.")
 
-        task_self.update_progress(user_id, 20, "Loading transcription...", step="extract_topics")
+        report(20, "Loading transcription...")
 
         # Ensure segments.txt exists in storage, then materialize it for DeepSeek (requires local path).
         from file_storage.factory import get_storage_backend
@@ -1744,7 +2466,7 @@ async def _async_extract_topics(
         transcription_config = full_config.get("transcription", {})
         questions_count = max(1, min(10, int(transcription_config.get("questions_count", 3))))
 
-        task_self.update_progress(user_id, 30, "Starting topic extraction...", step="extract_topics")
+        report(30, "Starting topic extraction...")
 
         # Mark EXTRACT_TOPICS stage as IN_PROGRESS BEFORE extraction
         from api.helpers.status_manager import update_aggregate_status
@@ -1764,29 +2486,50 @@ async def _async_extract_topics(
 
         try:
             logger.info("Topics: extracting via DeepSeek")
-            task_self.update_progress(user_id, 40, "Extracting topics (deepseek)...", step="extract_topics")
-
-            deepseek_config = DeepSeekConfig.from_file("config/deepseek_creds.json")
-            topic_extractor = TopicExtractor(deepseek_config)
+            report(40, "Extracting topics (deepseek)...")
+
+            # Cache entries go through their own session: they are kept even if this stage fails
+            async with session_maker() as cache_session:
+                response_cache = None
+                if settings.topic_extraction.response_cache:
+                    from api.repositories.llm_cache_repo import LLMCacheRepository
+
+                    response_cache = LLMCacheRepository(cache_session)
+                topic_extractor = TopicExtractor(
+                    deepseek_config,
+                    response_cache,
+                    bypass_cache=bypass_cache,
+                    stream=settings.topic_extraction.stream_completions,
+                    on_progress=(
+                        _topic_stream_progress(task_self, user_id, deepseek_config.max_tokens)
+                        if task_self is not None
+                        else None
+                    ),
+                    client=client,
+                    request_limiter=request_limiter,
+                )
 
-            topics_result = await topic_extractor.extract_topics_from_file(
-                segments_file_path=str(segments_path),
-                recording_topic=recording.display_name,
-                granularity=granularity,
-                language=transcript_language,
-                questions_count=questions_count,
-            )
+                try:
+                    topics_result = await topic_extractor.extract_topics_from_file(
+                        segments_file_path=str(segments_path),
+                        recording_topic=recording.display_name,
+                        granularity=granularity,
+                        language=transcript_language,
+                        questions_count=questions_count,
+                    )
+                finally:
+                    if response_cache is not None:
+                        try:
+                            await cache_session.commit()
+                        except Exception as exc:
+                            logger.warning(f"LLM cache commit failed (ignored): {exc!r}")
             model_used = "deepseek"
             logger.info("Topics extracted with deepseek")
 
             if not topics_result:
                 raise ValueError("Failed to extract topics: no result returned")
 
-            task_self.update_progress(user_id, 80, "Saving topics...", step="extract_topics")
-
-            # Generate version_id if not specified
-            if not version_id:
-                version_id = await transcription_manager.generate_version_id(recording_id, user_slug)
+            report(80, "Saving topics...")
 
             # Collect metadata for admin (includes token usage if API returned it)
             usage_metadata = {
@@ -1798,12 +2541,17 @@ async def _async_extract_topics(
             }
             if topics_result.get("usage"):
                 usage_metadata["tokens"] = topics_result["usage"]
+            if topics_result.get("cache"):
+                usage_metadata["cache"] = topics_result["cache"]
+            if topics_result.get("prompt"):
+                usage_metadata["prompt"] = topics_result["prompt"]
 
-            # Save in extracted.json (topics + summary + questions from single DeepSeek call)
+            # Save as a new extraction version (topics + summary + questions from single DeepSeek call);
+            # without an explicit version_id the manager allocates the next free vN atomically
             summary_value = topics_result.get("summary", "") or ""
-            await transcription_manager.add_extracted_version(
+            version_id = await transcription_manager.add_extracted_version(
                 recording_id=recording_id,
-                version_id=version_id,
+                version_id=version_id or None,
                 model=model_used,
                 granularity=granularity,
                 main_topics=topics_result.get("main_topics", []),
@@ -1855,6 +2603,113 @@ async def _async_extract_topics(
             raise
 
 
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    name="api.tasks.processing.extract_topics_batch",
+)
+def extract_topics_batch_task(
+    self,
+    recording_ids: list[int],
+    user_id: str,
+    granularity: str = "long",
+    version_id: str | None = None,
+    bypass_cache: bool = False,
+) -> dict:
+    """
+    Extract topics for several recordings in one worker (bulk topics).
+
+    Transcripts are loaded concurrently (at most ``TOPIC_BATCH_PREFETCH`` recordings
+    in flight), LLM calls share one pooled DeepSeek client and at most
+    ``TOPIC_BATCH_CONCURRENCY`` run at a time. Each recording is saved as soon as
+    its extraction finishes. Recordings that fail are re-queued as single
+    extract_topics tasks (regular retries and stage failure handling).
+
+    Args:
+        recording_ids: IDs of recordings
+        user_id: ID of user
+        granularity: Extraction mode ("short" | "medium" | "long")
+        version_id: ID of version (if None, generated automatically per recording)
+        bypass_cache: Do not reuse cached LLM responses (forced regeneration)
+
+    Returns:
+        Per-recording results and the re-queued recording IDs
+    """
+    with logger.contextualize(task_id=short_task_id(self.request.id), user_id=short_user_id(user_id)):
+        logger.info(f"Extracting topics (batch) | {format_details(recordings=len(recording_ids))}")
+        self.update_progress(user_id, 5, f"Extracting topics: 0/{len(recording_ids)}", step="extract_topics_batch")
+
+        with track_pipeline_stage("extract_topics_batch"):
+            result = self.run_async(
+                _async_extract_topics_batch(self, recording_ids, user_id, granularity, version_id, bypass_cache)
+            )
+
+        for recording_id in result["requeued"]:
+            extract_topics_task.delay(
+                recording_id=recording_id,
+                user_id=user_id,
+                granularity=granularity,
+                version_id=version_id,
+                bypass_cache=bypass_cache,
+            )
+
+        logger.info(
+            f"Batch topics done | {format_details(completed=len(result['completed']), requeued=len(result['requeued']))}"
+        )
+        return self.build_result(user_id=user_id, status="completed", result=result)
+
+
+async def _async_extract_topics_batch(
+    task_self,
+    recording_ids: list[int],
+    user_id: str,
+    granularity: str,
+    version_id: str | None,
+    bypass_cache: bool,
+) -> dict:
+    """Run _extract_recording_topics for all recordings on one loop, engine and DeepSeek client."""
+    session_maker = get_async_session_maker()
+    deepseek_config = DeepSeekConfig.from_file("config/deepseek_creds.json")
+    client = _deepseek_client(deepseek_config)
+    request_limiter = asyncio.Semaphore(settings.topic_extraction.batch_concurrency)
+    in_flight = asyncio.Semaphore(settings.topic_extraction.batch_prefetch)
+    completed: list[dict] = []
+    requeued: list[int] = []
+
+    async def extract(recording_id: int) -> None:
+        async with in_flight:
+            with logger.contextualize(recording_id=recording_id):
+                try:
+                    result = await _extract_recording_topics(
+                        session_maker,
+                        recording_id,
+                        user_id,
+                        granularity,
+                        version_id,
+                        bypass_cache,
+                        deepseek_config=deepseek_config,
+                        client=client,
+                        request_limiter=request_limiter,
+                    )
+                    completed.append({"recording_id": recording_id, **result})
+                except Exception as exc:
+                    logger.error(f"Batch topic extraction failed, re-queueing: {exc!r}")
+                    requeued.append(recording_id)
+
+        done = len(completed) + len(requeued)
+        task_self.update_progress(
+            user_id,
+            5 + int(90 * done / len(recording_ids)),
+            f"Extracting topics: {done}/{len(recording_ids)}",
+            step="extract_topics_batch",
+            completed=len(completed),
+            failed=len(requeued),
+        )
+
+    await asyncio.gather(*(extract(recording_id) for recording_id in recording_ids))
+    return {"completed": completed, "requeued": requeued}
+
+
 @celery_app.task(
     bind=True,
     base=ProcessingTask,
@@ -1933,9 +2788,12 @@ async def _async_generate_subtitles(task_self, recording_id: int, user_id: str,
         # Get user_slug for path generation
         user_slug = recording.owner.user_slug
 
+        # Subtitles derived together with the transcription need no storage I/O here
+        derived = _derived_subtitles(recording, formats)
+
         # Check presence of transcription
         transcription_manager = get_transcription_manager()
-        if not await transcription_manager.has_master(recording_id, user_slug):
+        if derived is None and not await transcription_manager.has_master(recording_id, user_slug):
             raise ValueError(f"Transcription not found for recording {recording_id}. Please run transcription first.")
 
         task_self.update_progress(user_id, 30, "Starting subtitle generation...", step="generate_subtitles")
@@ -1958,7 +2816,7 @@ async def _async_generate_subtitles(task_self, recording_id: int, user_id: str,
             task_self.update_progress(user_id, 40, "Generating subtitles...", step="generate_subtitles")
 
             # Generate subtitles (returns storage keys, not local paths)
-            subtitle_paths = await transcription_manager.generate_subtitles(
+            subtitle_paths = derived or await transcription_manager.generate_subtitles(
                 recording_id=recording_id,
                 formats=formats,
                 user_slug=user_slug,
@@ -2032,8 +2890,6 @@ def generate_poster(self, recording_id: int, user_id: str) -> dict:
 
 
 async def _async_generate_poster(recording_id: int, user_id: str) -> dict:
-    import asyncio
-
     from file_storage.factory import get_storage_backend
     from file_storage.path_builder import get_path_builder, to_storage_key
 
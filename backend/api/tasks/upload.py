@@ -16,6 +16,7 @@ from api.repositories.auth_repos import UserCredentialRepository
 from api.repositories.recording_repos import RecordingRepository
 from api.repositories.template_repos import OutputPresetRepository, RecordingTemplateRepository
 from api.services.config_resolver import ConfigResolver
+from api.services.node_affinity import fetch_artifact
 from api.services.timing_service import TimingService
 from api.shared.exceptions import CredentialError, ResourceNotFoundError
 from api.tasks.base import UploadTask
@@ -157,6 +158,32 @@ def _truncate_description_for_platform(description: str, platform: str) -> str:
     return _truncate_with_ellipsis(description, max_len)
 
 
+# Platforms whose uploads can be edited afterwards (metadata + visibility): early upload targets
+DEFERRED_PUBLISH_PLATFORMS = frozenset({"youtube", "vk"})
+
+# Legacy numeric VK privacy: 3 = only me
+_VK_PRIVACY_ONLY_ME = 3
+
+
+def supports_deferred_publish(platform: str) -> bool:
+    """Whether the platform can take a private upload and be patched/published later."""
+    return _platform_key(platform) in DEFERRED_PUBLISH_PLATFORMS
+
+
+def _hold_private(platform: str, upload_params: dict[str, Any], uploader) -> dict[str, Any]:
+    """Switch upload params to private in place; return the visibility to apply at publish."""
+    if _platform_key(platform) == "youtube":
+        final = {"privacy_status": upload_params.get("privacy_status") or uploader.config.default_privacy}
+        if upload_params.get("publish_at"):
+            final["publish_at"] = upload_params.pop("publish_at")
+        upload_params["privacy_status"] = "private"
+        return final
+
+    final = {"privacy_view": upload_params.get("privacy_view", uploader.config.privacy_view)}
+    upload_params["privacy_view"] = _VK_PRIVACY_ONLY_ME
+    return final
+
+
 def _yandex_extra_cfg_as_dict(cfg: object) -> dict:
     if cfg is None:
         return {}
@@ -267,6 +294,173 @@ async def _upload_extra_files_to_yadisk(
                 tmp_path.unlink(missing_ok=True)
 
 
+def _record_pipeline_completed(recording) -> None:
+    now = datetime.now(UTC)
+    recording.pipeline_completed_at = now
+    if recording.pipeline_started_at:
+        recording.pipeline_duration_seconds = (now - recording.pipeline_started_at).total_seconds()
+
+
+async def _resolve_uploader(
+    session,
+    recording,
+    user_id: str,
+    platform: str,
+    preset_id: int | None = None,
+    credential_id: int | None = None,
+    metadata_override: dict | None = None,
+) -> tuple[Any, int | None, dict[str, Any], int | None]:
+    """Pick preset/credential for the platform and build the uploader.
+
+    Returns (uploader, preset_id, preset_metadata, credential_id); the preset is
+    auto-selected from the recording template when not given.
+    """
+    preset_metadata: dict[str, Any] = {}
+    effective_credential_id: int | None = None
+
+    if not preset_id and recording.template_id:
+        template_repo = RecordingTemplateRepository(session)
+        template = await template_repo.find_by_id(recording.template_id, user_id)
+
+        if template and template.output_config:
+            preset_ids = template.output_config.get("preset_ids", [])
+            if preset_ids:
+                stmt = select(OutputPresetModel).where(
+                    OutputPresetModel.id.in_(preset_ids),
+                    OutputPresetModel.user_id == user_id,
+                )
+                result = await session.execute(stmt)
+                presets = result.scalars().all()
+
+                for candidate_preset in presets:
+                    if candidate_preset.platform.lower() == platform.lower():
+                        preset_id = candidate_preset.id
+                        logger.info(f"Auto-selected preset | {format_details(preset=preset_id)}")
+                        break
+
+    if preset_id:
+        preset_repo = OutputPresetRepository(session)
+        preset = await preset_repo.find_by_id(preset_id, user_id)
+
+        if not preset:
+            raise ValueError(f"Output preset {preset_id} not found for user {user_id}")
+
+        if not preset.credential_id:
+            raise ValueError(f"Output preset {preset_id} has no credential configured")
+
+        config_resolver = ConfigResolver(session)
+        preset_metadata = await config_resolver.resolve_upload_metadata(
+            recording=recording, user_id=user_id, preset_id=preset.id
+        )
+
+        if metadata_override:
+            preset_metadata = config_resolver._merge_configs(preset_metadata, metadata_override)
+
+        platform_map = {
+            "YOUTUBE": "youtube",
+            "VK": "vk_video",
+            "VK_VIDEO": "vk_video",
+            "YANDEX_DISK": "yandex_disk",
+        }
+        mapped_platform = platform_map.get(preset.platform.upper(), preset.platform.lower())
+
+        effective_credential_id = preset.credential_id
+        uploader = await create_uploader_from_db(
+            platform=mapped_platform,
+            credential_id=preset.credential_id,
+            session=session,
+        )
+    elif credential_id:
+        effective_credential_id = credential_id
+        uploader = await create_uploader_from_db(
+            platform=platform,
+            credential_id=credential_id,
+            session=session,
+        )
+    else:
+        cred_repo = UserCredentialRepository(session)
+        credentials = await cred_repo.list_by_platform(user_id, platform)
+
+        if not credentials:
+            raise ValueError(f"No credentials found for platform {platform}")
+
+        effective_credential_id = credentials[0].id
+        uploader = await create_uploader_from_db(
+            platform=platform,
+            credential_id=credentials[0].id,
+            session=session,
+        )
+
+    return uploader, preset_id, preset_metadata, effective_credential_id
+
+
+async def _render_upload_text(recording, platform: str, preset_metadata: dict[str, Any]) -> tuple[str, str, dict]:
+    """Render title and description (with fallbacks and platform limits) and the template context."""
+    topics_display = preset_metadata.get("topics_display") if preset_metadata else None
+    questions_display = preset_metadata.get("questions_display") if preset_metadata else None
+
+    # Pre-load active extraction (summary/questions) from storage; the sync
+    # prepare_recording_context can no longer touch the async TranscriptionManager.
+    owner = getattr(recording, "owner", None)
+    extracted_active: dict | None = None
+    if owner is not None and getattr(owner, "user_slug", None) is not None:
+        try:
+            from transcription_module.manager import get_transcription_manager
+
+            extracted_active = await get_transcription_manager().get_active_extracted(recording.id, owner.user_slug)
+        except Exception as exc:
+            logger.debug(f"Could not load extracted for template context: {exc}")
+
+    template_context = TemplateRenderer.prepare_recording_context(
+        recording,
+        topics_display=topics_display,
+        questions_display=questions_display,
+        extracted_data=extracted_active,
+    )
+
+    title_template = preset_metadata.get("title_template", "{{ display_name }}")
+    description_template = preset_metadata.get("description_template", "Uploaded on {{ record_date_iso }}")
+
+    title, description = render_upload_title_and_description(title_template, description_template, template_context)
+
+    if not title:
+        logger.warning("Title is empty, using fallback")
+        title = recording.display_name or "Recording"
+    if not description:
+        logger.warning("Description is empty, using fallback")
+        fallback_desc = render_jinja("Uploaded on {{ record_date_iso }}", template_context)
+        description = fallback_desc or "Uploaded"
+        topics_for_fallback: list[Any] = []
+        tts = getattr(recording, "topic_timestamps", None)
+        if tts and isinstance(tts, (list, tuple)):
+            topics_for_fallback = list(tts)
+        elif recording.main_topics:
+            mt = recording.main_topics
+            topics_for_fallback = list(mt) if isinstance(mt, (list, tuple)) else [mt]
+        if topics_for_fallback:
+            if topics_display and topics_display.get("enabled", True):
+                topics_str = TemplateRenderer._format_topics_list(topics_for_fallback, topics_display)
+            else:
+                topics_str = ", ".join(
+                    str(t.get("topic", t) if isinstance(t, dict) else t) for t in topics_for_fallback[:5]
+                )
+            description += f"\n\n{topics_str}"
+        if questions_display and questions_display.get("enabled") and template_context.get("questions"):
+            description += f"\n\n{template_context['questions']}"
+
+    original_title_len = len(title)
+    title = _truncate_title_for_platform(title, platform)
+    if len(title) < original_title_len:
+        logger.info(f"Title truncated from {original_title_len} to {len(title)} chars for {platform}")
+
+    original_desc_len = len(description)
+    description = _truncate_description_for_platform(description, platform)
+    if len(description) < original_desc_len:
+        logger.info(f"Description truncated from {original_desc_len} to {len(description)} chars for {platform}")
+
+    return title, description, template_context
+
+
 @celery_app.task(
     bind=True,
     base=UploadTask,
@@ -282,6 +476,7 @@ def upload_recording_to_platform(
     preset_id: int | None = None,
     credential_id: int | None = None,
     metadata_override: dict | None = None,
+    deferred_publish: bool = False,
 ) -> dict:
     """
     Upload one recording to platform with user credentials.
@@ -293,6 +488,7 @@ def upload_recording_to_platform(
         preset_id: ID of output preset (optional)
         credential_id: ID of credential (optional)
         metadata_override: Override for preset metadata (playlist_id, album_id, etc.)
+        deferred_publish: Upload privately; publish_recording_on_platform patches and publishes later
 
     Returns:
         Dictionary with upload results
@@ -304,7 +500,9 @@ def upload_recording_to_platform(
         platform=platform,
     ):
         try:
-            logger.info(f"Uploading | {format_details(metadata_override=bool(metadata_override))}")
+            logger.info(
+                f"Uploading | {format_details(metadata_override=bool(metadata_override), deferred=deferred_publish)}"
+            )
 
             with track_pipeline_stage("upload", platform=platform):
                 result = self.run_async(
@@ -316,6 +514,7 @@ def upload_recording_to_platform(
                         credential_id=credential_id,
                         metadata_override=metadata_override,
                         allow_active_upload=self.request.retries > 0,
+                        deferred_publish=deferred_publish,
                     )
                 )
 
@@ -378,6 +577,7 @@ async def _async_upload_recording(
     credential_id: int | None = None,
     metadata_override: dict | None = None,
     allow_active_upload: bool = False,
+    deferred_publish: bool = False,
 ) -> dict:
     """
     Async function for uploading recording.
@@ -389,6 +589,7 @@ async def _async_upload_recording(
         preset_id: ID of output preset (optional)
         credential_id: ID of credential (optional)
         metadata_override: Override for preset metadata (optional)
+        deferred_publish: Upload privately and keep the final visibility for the publish step
 
     Returns:
         Upload results (success, video_id, video_url, metadata)
@@ -440,8 +641,8 @@ async def _async_upload_recording(
         video_temp = storage_builder.create_temp_file(
             prefix=f"upload_{recording_id}_", suffix=Path(video_storage_key).suffix or ".mp4"
         )
-        await storage_backend.download_to_file(video_storage_key, video_temp)
         _local_temps.append(video_temp)
+        await fetch_artifact(storage_backend, video_storage_key, video_temp, recording_id=recording_id, stage="upload")
         video_path = str(video_temp)
 
         async def _resolve_thumbnail_to_temp(user_slug: int, filename: str) -> Path | None:
@@ -455,104 +656,10 @@ async def _async_upload_recording(
             _local_temps.append(tmp)
             return tmp
 
-        preset_metadata = {}
-        preset = None
-        effective_credential_id: int | None = None
-
-        if not preset_id and recording.template_id:
-            template_repo = RecordingTemplateRepository(ctx.session)
-            template = await template_repo.find_by_id(recording.template_id, user_id)
-
-            if template and template.output_config:
-                preset_ids = template.output_config.get("preset_ids", [])
-                if preset_ids:
-                    stmt = select(OutputPresetModel).where(
-                        OutputPresetModel.id.in_(preset_ids),
-                        OutputPresetModel.user_id == user_id,
-                    )
-                    result = await ctx.session.execute(stmt)
-                    presets = result.scalars().all()
-
-                    for candidate_preset in presets:
-                        if candidate_preset.platform.lower() == platform.lower():
-                            preset_id = candidate_preset.id
-                            logger.info(f"Auto-selected preset | {format_details(preset=preset_id)}")
-                            break
-
-        if preset_id:
-            preset_repo = OutputPresetRepository(ctx.session)
-            preset = await preset_repo.find_by_id(preset_id, user_id)
-
-            if not preset:
-                raise ValueError(f"Output preset {preset_id} not found for user {user_id}")
-
-            if not preset.credential_id:
-                raise ValueError(f"Output preset {preset_id} has no credential configured")
-
-            config_resolver = ConfigResolver(ctx.session)
-            preset_metadata = await config_resolver.resolve_upload_metadata(
-                recording=recording, user_id=user_id, preset_id=preset.id
-            )
-
-            if metadata_override:
-                preset_metadata = config_resolver._merge_configs(preset_metadata, metadata_override)
-
-            platform_map = {
-                "YOUTUBE": "youtube",
-                "VK": "vk_video",
-                "VK_VIDEO": "vk_video",
-                "YANDEX_DISK": "yandex_disk",
-            }
-            mapped_platform = platform_map.get(preset.platform.upper(), preset.platform.lower())
-
-            effective_credential_id = preset.credential_id
-            uploader = await create_uploader_from_db(
-                platform=mapped_platform,
-                credential_id=preset.credential_id,
-                session=ctx.session,
-            )
-        elif credential_id:
-            effective_credential_id = credential_id
-            uploader = await create_uploader_from_db(
-                platform=platform,
-                credential_id=credential_id,
-                session=ctx.session,
-            )
-        else:
-            cred_repo = UserCredentialRepository(ctx.session)
-            credentials = await cred_repo.list_by_platform(user_id, platform)
-
-            if not credentials:
-                raise ValueError(f"No credentials found for platform {platform}")
-
-            effective_credential_id = credentials[0].id
-            uploader = await create_uploader_from_db(
-                platform=platform,
-                credential_id=credentials[0].id,
-                session=ctx.session,
-            )
-
-        topics_display = preset_metadata.get("topics_display") if preset_metadata else None
-        questions_display = preset_metadata.get("questions_display") if preset_metadata else None
-
-        # Pre-load active extraction (summary/questions) from storage; the sync
-        # prepare_recording_context can no longer touch the async TranscriptionManager.
-        owner = getattr(recording, "owner", None)
-        extracted_active: dict | None = None
-        if owner is not None and getattr(owner, "user_slug", None) is not None:
-            try:
-                from transcription_module.manager import get_transcription_manager
-
-                extracted_active = await get_transcription_manager().get_active_extracted(recording.id, owner.user_slug)
-            except Exception as exc:
-                logger.debug(f"Could not load extracted for template context: {exc}")
-
-        template_context = TemplateRenderer.prepare_recording_context(
-            recording,
-            topics_display=topics_display,
-            questions_display=questions_display,
-            extracted_data=extracted_active,
+        uploader, preset_id, preset_metadata, effective_credential_id = await _resolve_uploader(
+            ctx.session, recording, user_id, platform, preset_id, credential_id, metadata_override
         )
+        title, description, template_context = await _render_upload_text(recording, platform, preset_metadata)
 
         cred_repo = UserCredentialRepository(ctx.session)
 
@@ -568,50 +675,6 @@ async def _async_upload_recording(
                 await cred_repo.update_last_used(effective_credential_id)
                 await cred_repo.set_needs_reauth(effective_credential_id, False)
 
-            title_template = preset_metadata.get("title_template", "{{ display_name }}")
-            description_template = preset_metadata.get("description_template", "Uploaded on {{ record_date_iso }}")
-
-            title, description = render_upload_title_and_description(
-                title_template, description_template, template_context
-            )
-
-            if not title:
-                logger.warning("Title is empty, using fallback")
-                title = recording.display_name or "Recording"
-            if not description:
-                logger.warning("Description is empty, using fallback")
-                fallback_desc = render_jinja("Uploaded on {{ record_date_iso }}", template_context)
-                description = fallback_desc or "Uploaded"
-                topics_for_fallback: list[Any] = []
-                tts = getattr(recording, "topic_timestamps", None)
-                if tts and isinstance(tts, (list, tuple)):
-                    topics_for_fallback = list(tts)
-                elif recording.main_topics:
-                    mt = recording.main_topics
-                    topics_for_fallback = list(mt) if isinstance(mt, (list, tuple)) else [mt]
-                if topics_for_fallback:
-                    if topics_display and topics_display.get("enabled", True):
-                        topics_str = TemplateRenderer._format_topics_list(topics_for_fallback, topics_display)
-                    else:
-                        topics_str = ", ".join(
-                            str(t.get("topic", t) if isinstance(t, dict) else t) for t in topics_for_fallback[:5]
-                        )
-                    description += f"\n\n{topics_str}"
-                if questions_display and questions_display.get("enabled") and template_context.get("questions"):
-                    description += f"\n\n{template_context['questions']}"
-
-            original_title_len = len(title)
-            title = _truncate_title_for_platform(title, platform)
-            if len(title) < original_title_len:
-                logger.info(f"Title truncated from {original_title_len} to {len(title)} chars for {platform}")
-
-            original_desc_len = len(description)
-            description = _truncate_description_for_platform(description, platform)
-            if len(description) < original_desc_len:
-                logger.info(
-                    f"Description truncated from {original_desc_len} to {len(description)} chars for {platform}"
-                )
-
             upload_params = {
                 "video_path": video_path,
                 "title": title,
@@ -696,6 +759,11 @@ async def _async_upload_recording(
                 elif preset_metadata.get("publish") is True:
                     upload_params["publish"] = True
 
+            # Early upload: video goes up private, title/description are re-rendered once topics exist
+            final_visibility = None
+            if deferred_publish and supports_deferred_publish(platform):
+                final_visibility = _hold_private(platform, upload_params, uploader)
+
             timing_service = TimingService(session)
             stage_name = f"UPLOAD:{target_type}"
             timing = await timing_service.start_stage(recording_id, user_id, stage_name)
@@ -740,6 +808,8 @@ async def _async_upload_recording(
                     "album_id": (upload_result.metadata or {}).get("album_id"),
                     "added_to_album": (upload_result.metadata or {}).get("added_to_album"),
                     "owner_id": (upload_result.metadata or {}).get("owner_id"),
+                    # Pending publish: visibility to apply once metadata is final
+                    "deferred_publish": final_visibility,
                 },
             )
 
@@ -776,11 +846,9 @@ async def _async_upload_recording(
                 except Exception as e:
                     logger.warning(f"Yandex Disk extra files batch failed (non-fatal): {e}")
 
-            # Update pipeline timing
-            now = datetime.now(UTC)
-            recording.pipeline_completed_at = now
-            if recording.pipeline_started_at:
-                recording.pipeline_duration_seconds = (now - recording.pipeline_started_at).total_seconds()
+            # Update pipeline timing (a deferred upload is not the end: publish records it)
+            if final_visibility is None:
+                _record_pipeline_completed(recording)
 
             await session.commit()
 
@@ -830,6 +898,229 @@ async def _async_upload_recording(
                     logger.debug(f"Failed to remove temp {tmp}: {exc}")
 
 
+@celery_app.task(
+    bind=True,
+    base=UploadTask,
+    name="api.tasks.upload.publish_recording_on_platform",
+    max_retries=settings.celery.publish_max_wait // settings.celery.publish_poll_interval,
+)
+def publish_recording_on_platform(
+    self,
+    recording_id: int,
+    user_id: str,
+    platform: str,
+    preset_id: int | None = None,
+    metadata_override: dict | None = None,
+    upload_captions: bool = False,
+) -> dict:
+    """
+    Finish an early upload: patch title/description with topics, add captions, then publish.
+
+    Polls while the private upload is still running. If it failed, the recording is
+    uploaded the regular way instead.
+
+    Args:
+        recording_id: ID of recording
+        user_id: ID of user
+        platform: Platform (youtube, vk)
+        preset_id: ID of output preset (optional)
+        metadata_override: Override for preset metadata
+        upload_captions: Upload SRT captions (platforms that support them)
+
+    Returns:
+        Dictionary with publish results
+    """
+    with logger.contextualize(
+        task_id=short_task_id(self.request.id),
+        recording_id=recording_id,
+        user_id=short_user_id(user_id),
+        platform=platform,
+    ):
+        try:
+            with track_pipeline_stage("publish", platform=platform):
+                result = self.run_async(
+                    _async_publish_recording(
+                        recording_id=recording_id,
+                        user_id=user_id,
+                        platform=platform,
+                        preset_id=preset_id,
+                        metadata_override=metadata_override,
+                        upload_captions=upload_captions,
+                    )
+                )
+
+        except (TokenRefreshError, CredentialError) as exc:
+            logger.error(f"Publish failed: {exc}")
+            return self.build_result(
+                user_id=user_id,
+                status="failed",
+                recording_id=recording_id,
+                platform=platform,
+                error="credential_error",
+                reason=str(exc),
+            )
+
+        except Exception as exc:
+            logger.error(f"Unexpected error: {type(exc).__name__}: {exc}", exc_info=True)
+            raise self.retry(countdown=settings.celery.upload_retry_delay, exc=exc)
+
+        if result.get("status") == "waiting":
+            if self.request.retries >= self.max_retries:
+                # Out of polls: leave the (private) upload alone instead of failing the output
+                reason = f"Private upload not finished after {settings.celery.publish_max_wait}s, not published"
+                logger.warning(f"Publish timed out | {format_details(reason=reason)}")
+                self.run_async(_record_publish_timeout(recording_id, user_id, platform, preset_id, reason))
+                return self.build_result(
+                    user_id=user_id,
+                    status="timeout",
+                    recording_id=recording_id,
+                    platform=platform,
+                    reason=reason,
+                )
+            logger.debug(f"Early upload not finished | {format_details(retry=self.request.retries)}")
+            raise self.retry(countdown=settings.celery.publish_poll_interval)
+
+        return self.build_result(
+            user_id=user_id,
+            status="completed",
+            recording_id=recording_id,
+            platform=platform,
+            result=result,
+        )
+
+
+async def _async_publish_recording(
+    recording_id: int,
+    user_id: str,
+    platform: str,
+    preset_id: int | None = None,
+    metadata_override: dict | None = None,
+    upload_captions: bool = False,
+) -> dict:
+    """Patch and publish a deferred upload; ``{"status": "waiting"}`` while it is still uploading."""
+    session_maker = get_async_session_maker()
+
+    async with session_maker() as session:
+        recording_repo = RecordingRepository(session)
+
+        recording = await recording_repo.get_by_id(recording_id, user_id)
+        if not recording:
+            raise ValueError(f"Recording {recording_id} not found for user {user_id}")
+
+        if recording.on_pause:
+            logger.info("Skipped: recording paused")
+            return {"status": "paused", "message": "Pipeline paused by user"}
+
+        output_target = await recording_repo.get_or_create_output_target(
+            recording=recording,
+            target_type=platform_to_target_type(platform),
+            preset_id=preset_id,
+        )
+        target_meta = output_target.target_meta or {}
+
+        if output_target.status == TargetStatus.FAILED:
+            logger.warning("Early upload failed, uploading with final metadata")
+            return await _async_upload_recording(
+                recording_id=recording_id,
+                user_id=user_id,
+                platform=platform,
+                preset_id=preset_id,
+                metadata_override=metadata_override,
+            )
+
+        video_id = target_meta.get("video_id")
+        if output_target.status != TargetStatus.UPLOADED or not video_id:
+            return {"status": "waiting"}
+
+        final_visibility = target_meta.get("deferred_publish")
+        if not final_visibility:
+            logger.info("Skipped: already published")
+            return _upload_skip_result(output_target, "Already uploaded")
+
+        uploader, preset_id, preset_metadata, effective_credential_id = await _resolve_uploader(
+            session, recording, user_id, platform, preset_id, None, metadata_override
+        )
+        title, description, _ = await _render_upload_text(recording, platform, preset_metadata)
+
+        if not await uploader.authenticate():
+            raise CredentialError(
+                platform=platform,
+                reason="Token validation failed or expired. Please re-authenticate via OAuth.",
+            )
+        if effective_credential_id:
+            await UserCredentialRepository(session).update_last_used(effective_credential_id)
+
+        captions_uploaded = None
+        if upload_captions:
+            captions_uploaded = await _upload_captions(uploader, recording, video_id)
+
+        updated = await uploader.update_video(
+            video_id,
+            title=title,
+            description=description,
+            owner_id=target_meta.get("owner_id"),
+            **final_visibility,
+        )
+        if not updated:
+            raise Exception(f"Failed to update video {video_id}")
+
+        output_target.target_meta = {
+            **target_meta,
+            "deferred_publish": None,
+            "published_at": datetime.now(UTC).isoformat(),
+            "captions_uploaded": captions_uploaded,
+        }
+        _record_pipeline_completed(recording)
+        await session.commit()
+
+        logger.success(f"Published | {format_details(video_id=video_id, **final_visibility)}")
+        return {
+            "success": True,
+            "video_id": video_id,
+            "video_url": target_meta.get("video_url"),
+            "published": True,
+            "captions_uploaded": captions_uploaded,
+        }
+
+
+async def _record_publish_timeout(
+    recording_id: int, user_id: str, platform: str, preset_id: int | None, reason: str
+) -> None:
+    """Note on the output why it stayed private; ``deferred_publish`` is kept for a later publish."""
+    async with get_async_session_maker()() as session:
+        recording_repo = RecordingRepository(session)
+        recording = await recording_repo.get_by_id(recording_id, user_id)
+        if not recording:
+            return
+        output_target = await recording_repo.get_or_create_output_target(
+            recording=recording,
+            target_type=platform_to_target_type(platform),
+            preset_id=preset_id,
+        )
+        output_target.target_meta = {**(output_target.target_meta or {}), "publish_error": reason}
+        await session.commit()
+
+
+async def _upload_captions(uploader, recording, video_id: str) -> bool:
+    """Upload SRT captions from the master transcription; non-fatal (False on any error)."""
+    from file_storage.factory import get_storage_backend
+    from file_storage.path_builder import StoragePathBuilder
+    from transcription_module.manager import get_transcription_manager
+
+    try:
+        keys = await get_transcription_manager().generate_subtitles(recording.id, ["srt"], recording.owner.user_slug)
+        caption_temp = StoragePathBuilder().create_temp_file(prefix=f"captions_{recording.id}_", suffix=".srt")
+        try:
+            await get_storage_backend().download_to_file(keys["srt"], caption_temp)
+            language = getattr(uploader.config, "default_language", "ru")
+            return await uploader.upload_caption(video_id, str(caption_temp), language=language)
+        finally:
+            caption_temp.unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning(f"Caption upload failed (non-fatal): {e}")
+        return False
+
+
 @celery_app.task(
     bind=True,
     base=UploadTask,
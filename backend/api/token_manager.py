@@ -12,6 +12,7 @@ import httpx
 
 from logger import get_logger
 from models.zoom_auth import ZoomServerToServerCredentials
+from utils.http_clients import api_endpoint, get_http_client
 
 logger = get_logger()
 
@@ -68,47 +69,47 @@ class TokenManager:
 
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(
-                        "https://zoom.us/oauth/token",
-                        headers={"Authorization": f"Basic {encoded_credentials}"},
-                        params={
-                            "grant_type": "account_credentials",
-                            "account_id": config.account_id,
-                        },
-                    )
-
-                    if response.status_code == 200:
-                        token_data = response.json()
-                        access_token = token_data.get("access_token")
-                        expires_in = token_data.get("expires_in", 3600)
+                response = await get_http_client("zoom").post(
+                    "https://zoom.us/oauth/token",
+                    headers={"Authorization": f"Basic {encoded_credentials}"},
+                    params={
+                        "grant_type": "account_credentials",
+                        "account_id": config.account_id,
+                    },
+                    extensions=api_endpoint("oauth.token"),
+                )
 
-                        if access_token:
-                            return (access_token, expires_in)
+                if response.status_code == 200:
+                    token_data = response.json()
+                    access_token = token_data.get("access_token")
+                    expires_in = token_data.get("expires_in", 3600)
 
-                        logger.error("Token missing in response", account=config.account)
-                        return (None, None)
+                    if access_token:
+                        return (access_token, expires_in)
 
-                    if response.status_code in (401, 403):
-                        logger.error(
-                            "Auth failed, invalid credentials",
-                            account=config.account,
-                            status=response.status_code,
-                        )
-                        return (None, None)
+                    logger.error("Token missing in response", account=config.account)
+                    return (None, None)
 
-                    logger.warning(
-                        "Token fetch failed",
+                if response.status_code in (401, 403):
+                    logger.error(
+                        "Auth failed, invalid credentials",
                         account=config.account,
                         status=response.status_code,
-                        attempt=attempt + 1,
                     )
+                    return (None, None)
 
-                    if attempt < max_retries - 1:
-                        delay = min(base_delay * (2**attempt), max_delay)
-                        await asyncio.sleep(delay)
-                    else:
-                        return (None, None)
+                logger.warning(
+                    "Token fetch failed",
+                    account=config.account,
+                    status=response.status_code,
+                    attempt=attempt + 1,
+                )
+
+                if attempt < max_retries - 1:
+                    delay = min(base_delay * (2**attempt), max_delay)
+                    await asyncio.sleep(delay)
+                else:
+                    return (None, None)
 
             except (httpx.NetworkError, httpx.TimeoutException, httpx.ConnectError) as e:
                 logger.warning(
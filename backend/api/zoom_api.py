@@ -8,6 +8,7 @@ import httpx
 
 from logger import get_logger
 from models.zoom_auth import ZoomOAuthCredentials, ZoomServerToServerCredentials
+from utils.http_clients import api_endpoint, get_http_client
 
 from .token_manager import TokenManager
 
@@ -105,31 +106,29 @@ class ZoomAPI:
                 from_date=from_date,
                 to_date=to_date,
             )
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"https://api.zoom.us/v2/users/{user_id}/recordings",
-                    headers={"Authorization": f"Bearer {access_token}"},
-                    params=params,
-                )
+            response = await get_http_client("zoom").get(
+                f"https://api.zoom.us/v2/users/{user_id}/recordings",
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=params,
+                extensions=api_endpoint("recordings.list"),
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.info(
-                        f"Fetched recordings: count={len(data.get('meetings', []))}",
-                        count=len(data.get("meetings", [])),
-                    )
-                    logger.debug(
-                        f"Raw Zoom API data (get_recordings):\n{json.dumps(data, indent=2, ensure_ascii=False)}"
-                    )
-                    return data
-                account = self.config.account if isinstance(self.config, ZoomServerToServerCredentials) else "oauth"
-                logger.error(
-                    f"API error: account={account} | status={response.status_code}",
-                    account=account,
-                    status_code=response.status_code,
-                    response_preview=response.text[:200],
+            if response.status_code == 200:
+                data = response.json()
+                logger.info(
+                    f"Fetched recordings: count={len(data.get('meetings', []))}",
+                    count=len(data.get("meetings", [])),
                 )
-                raise ZoomResponseError(f"API error: {response.status_code} - {response.text}")
+                logger.debug(f"Raw Zoom API data (get_recordings):\n{json.dumps(data, indent=2, ensure_ascii=False)}")
+                return data
+            account = self.config.account if isinstance(self.config, ZoomServerToServerCredentials) else "oauth"
+            logger.error(
+                f"API error: account={account} | status={response.status_code}",
+                account=account,
+                status_code=response.status_code,
+                response_preview=response.text[:200],
+            )
+            raise ZoomResponseError(f"API error: {response.status_code} - {response.text}")
 
         except httpx.RequestError as e:
             error_type = type(e).__name__
@@ -169,53 +168,53 @@ class ZoomAPI:
                 params = {"include_fields": "download_access_token", "ttl": "604800"}
 
             encoded_id = _encode_meeting_uuid(meeting_id)
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"https://api.zoom.us/v2/meetings/{encoded_id}/recordings",
-                    headers={"Authorization": f"Bearer {access_token}"},
-                    params=params,
+            response = await get_http_client("zoom").get(
+                f"https://api.zoom.us/v2/meetings/{encoded_id}/recordings",
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=params,
+                extensions=api_endpoint("recordings.get"),
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                logger.debug(
+                    f"Raw Zoom API data (get_recording_details meeting_id={meeting_id}):\n{json.dumps(data, indent=2, ensure_ascii=False)}"
                 )
+                return data
+
+            # Handle error response
+            account = self.config.account if isinstance(self.config, ZoomServerToServerCredentials) else "oauth"
 
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.debug(
-                        f"Raw Zoom API data (get_recording_details meeting_id={meeting_id}):\n{json.dumps(data, indent=2, ensure_ascii=False)}"
-                    )
-                    return data
-
-                # Handle error response
-                account = self.config.account if isinstance(self.config, ZoomServerToServerCredentials) else "oauth"
-
-                # Try to parse error details from response
-                error_code = None
-                error_message = None
-                try:
-                    error_data = response.json()
-                    error_code = error_data.get("code")
-                    error_message = error_data.get("message", response.text)
-                except Exception:
-                    error_message = response.text
-
-                # Special handling for code 3301 - recording still processing on Zoom side
-                if error_code == 3301:
-                    logger.info(
-                        f"Recording still processing on Zoom side: account={account} | meeting_id={meeting_id} | message={error_message}",
-                        account=account,
-                        meeting_id=meeting_id,
-                        zoom_code=error_code,
-                    )
-                    raise ZoomRecordingProcessingError(f"Recording still processing: {error_message}")
-
-                # Log other errors as ERROR
-                logger.error(
-                    f"API error getting recording: account={account} | meeting_id={meeting_id} | status={response.status_code} | zoom_code={error_code}",
+            # Try to parse error details from response
+            error_code = None
+            error_message = None
+            try:
+                error_data = response.json()
+                error_code = error_data.get("code")
+                error_message = error_data.get("message", response.text)
+            except Exception:
+                error_message = response.text
+
+            # Special handling for code 3301 - recording still processing on Zoom side
+            if error_code == 3301:
+                logger.info(
+                    f"Recording still processing on Zoom side: account={account} | meeting_id={meeting_id} | message={error_message}",
                     account=account,
                     meeting_id=meeting_id,
-                    status_code=response.status_code,
                     zoom_code=error_code,
-                    response_preview=error_message[:200] if error_message else response.text[:200],
                 )
-                raise ZoomResponseError(f"API error: {response.status_code} - {error_message}")
+                raise ZoomRecordingProcessingError(f"Recording still processing: {error_message}")
+
+            # Log other errors as ERROR
+            logger.error(
+                f"API error getting recording: account={account} | meeting_id={meeting_id} | status={response.status_code} | zoom_code={error_code}",
+                account=account,
+                meeting_id=meeting_id,
+                status_code=response.status_code,
+                zoom_code=error_code,
+                response_preview=error_message[:200] if error_message else response.text[:200],
+            )
+            raise ZoomResponseError(f"API error: {response.status_code} - {error_message}")
 
         except httpx.RequestError as e:
             error_type = type(e).__name__
@@ -0,0 +1,155 @@
+"""Chunked transcription helpers: cut planning at silences, ffmpeg split, result stitching."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from logger import get_logger
+
+logger = get_logger()
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """One chunk of a long recording.
+
+    ``start``/``end`` is the audio sent to ASR (cut ± overlap); ``own_start``/``own_end``
+    is the span this chunk is authoritative for when results are stitched.
+    """
+
+    index: int
+    start: float
+    end: float
+    own_start: float
+    own_end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def owns(self, t: float, is_last: bool) -> bool:
+        return self.own_start <= t < self.own_end or (is_last and t >= self.own_end)
+
+
+def plan_chunks(
+    duration: float,
+    silences: list[tuple[float, float]],
+    target_seconds: float,
+    search_window: float,
+    overlap: float,
+) -> list[AudioChunk]:
+    """Cut points near every ``target_seconds``, moved to the closest silence midpoint.
+
+    Without a silence inside ``search_window`` the cut stays at the target (the overlap
+    then keeps the split word intact in one of the chunks). The last chunk absorbs a
+    tail shorter than ``target_seconds + search_window``.
+    """
+    midpoints = sorted((start + end) / 2 for start, end in silences if end > start)
+    cuts: list[float] = []
+    position = 0.0
+
+    while duration - position > target_seconds + search_window:
+        ideal = position + target_seconds
+        candidates = [m for m in midpoints if abs(m - ideal) <= search_window and m > position]
+        cut = min(candidates, key=lambda m: abs(m - ideal)) if candidates else ideal
+        cuts.append(cut)
+        position = cut
+
+    bounds = [0.0, *cuts, duration]
+    return [
+        AudioChunk(
+            index=i,
+            start=max(0.0, bounds[i] - overlap),
+            end=min(duration, bounds[i + 1] + overlap),
+            own_start=bounds[i],
+            own_end=bounds[i + 1],
+        )
+        for i in range(len(bounds) - 1)
+    ]
+
+
+async def split_audio(source: Path, chunks: list[AudioChunk], output_dir: Path) -> list[Path]:
+    """Extract each chunk as 16 kHz mono MP3 (same format as the extracted recording audio)."""
+    paths: list[Path] = []
+    for chunk in chunks:
+        output = output_dir / f"chunk_{chunk.index:03d}.mp3"
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-ss",
+            f"{chunk.start:.3f}",
+            "-t",
+            f"{chunk.duration:.3f}",
+            "-i",
+            str(source),
+            "-vn",
+            "-acodec",
+            "libmp3lame",
+            "-ab",
+            "64k",
+            "-ar",
+            "16000",
+            "-ac",
+            "1",
+            "-y",
+            str(output),
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        _stdout, stderr = await process.communicate()
+        if process.returncode != 0 or not output.exists():
+            raise RuntimeError(f"Failed to extract audio chunk {chunk.index}: {stderr.decode().strip()[-500:]}")
+        paths.append(output)
+    return paths
+
+
+def stitch_chunks(chunks: list[AudioChunk], results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge per-chunk ``{words, segments, language}`` (chunk-relative seconds) into one result.
+
+    Times are shifted by the chunk start. A word belongs to the chunk that owns its
+    midpoint and a segment to the chunk that owns its start, so speech inside an
+    overlap is emitted exactly once.
+    """
+    words: list[dict[str, Any]] = []
+    segments: list[dict[str, Any]] = []
+    languages: Counter[str] = Counter()
+
+    for chunk, result in zip(chunks, results, strict=True):
+        is_last = chunk.index == len(chunks) - 1
+        offset = chunk.start
+        kept = 0
+
+        for w in result["words"]:
+            start, end = w["start"] + offset, w["end"] + offset
+            if chunk.owns((start + end) / 2, is_last):
+                words.append({"id": len(words), "start": start, "end": end, "word": w["word"]})
+                kept += 1
+
+        for seg in result["segments"]:
+            start, end = seg["start"] + offset, seg["end"] + offset
+            if not chunk.owns(start, is_last):
+                continue
+            if segments and segments[-1]["end"] > start:
+                # Seam: previous chunk's last sentence ran into the overlap
+                segments[-1]["end"] = max(start, segments[-1]["start"] + 0.1)
+            segments.append({"id": len(segments), "start": start, "end": end, "text": seg["text"]})
+
+        if result.get("language"):
+            languages[result["language"]] += kept or 1
+
+    if not words:
+        raise ValueError("No words in AssemblyAI response — check audio quality or language settings")
+
+    return {
+        "text": " ".join(seg["text"] for seg in segments),
+        "words": words,
+        "segments": segments,
+        "language": languages.most_common(1)[0][0] if languages else None,
+    }
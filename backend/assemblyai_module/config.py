@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from logger import get_logger
@@ -46,6 +46,78 @@ class AssemblyAISettings(BaseSettings):
         ge=60.0,
         description="Maximum wait time for transcription (seconds). 90-min lecture + queue buffer.",
     )
+    base_url: str = Field(
+        default=ASSEMBLYAI_BASE_URL,
+        description="API base URL (override for a regional endpoint or a local fake ASR server in tests)",
+    )
+    result_cache: bool = Field(
+        default=True,
+        description="Reuse normalized results for identical audio + language + keyterms + models (transcription_cache)",
+    )
+    async_mode: bool = Field(
+        default=True,
+        description="Submit and release the worker; the chain is resumed by the webhook or the pending-transcript poller",
+    )
+    webhook_url: str | None = Field(
+        default=None,
+        description="Public URL of POST /api/v1/webhooks/assemblyai. None = rely on the poller only.",
+    )
+    webhook_secret: str | None = Field(
+        default=None,
+        description="Shared secret AssemblyAI echoes back in the webhook auth header",
+    )
+    pending_poll_interval: float = Field(
+        default=15.0,
+        ge=5.0,
+        description="Beat interval (seconds) of the batched poller for outstanding transcripts",
+    )
+    chunked_mode: bool = Field(
+        default=False,
+        description=(
+            "Split long recordings at silences and transcribe the chunks in parallel. "
+            "Chunked recordings are transcribed inside the task (the worker waits) even with async_mode."
+        ),
+    )
+    chunk_min_duration: float = Field(
+        default=5400.0,
+        ge=600.0,
+        description="Recordings at least this long (seconds) are chunked when chunked_mode is on",
+    )
+    chunk_target_seconds: float = Field(
+        default=1800.0,
+        ge=300.0,
+        description="Target chunk length; the cut moves to the nearest silence within chunk_search_window",
+    )
+    chunk_search_window: float = Field(
+        default=90.0,
+        ge=0.0,
+        description="How far (seconds) from the target cut to look for a silence",
+    )
+    chunk_overlap_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=30.0,
+        description="Audio shared by neighbouring chunks; words in the overlap are kept once",
+    )
+    chunk_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Chunks in flight at once per recording",
+    )
+    account_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=200,
+        description="Chunk jobs in flight at once per API key across all workers (keep under the account's job limit)",
+    )
+
+    @model_validator(mode="after")
+    def validate_webhook(self) -> "AssemblyAISettings":
+        """An unauthenticated webhook would let anyone resume parked pipelines"""
+        if self.webhook_url and not self.webhook_secret:
+            raise ValueError("ASSEMBLYAI_WEBHOOK_SECRET is required when ASSEMBLYAI_WEBHOOK_URL is set")
+        return self
 
 
 class AssemblyAIConfig:
@@ -56,7 +128,7 @@ class AssemblyAIConfig:
             raise ValueError("api_key is required")
         self.api_key = api_key
         self.settings = settings
-        self.base_url = ASSEMBLYAI_BASE_URL
+        self.base_url = settings.base_url.rstrip("/")
 
     @classmethod
     def from_file(cls, config_file: str = "config/assemblyai_creds.json") -> AssemblyAIConfig:
@@ -3,25 +3,47 @@
 from __future__ import annotations
 
 import asyncio
+import shutil
 import time
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from logger import get_logger
-from transcription_module.normalize import build_segments_from_words, extract_words
+from transcription_module.normalize import build_segments, word_timeline
+from utils.http_clients import api_endpoint, get_http_client
+from utils.upload_streams import file_upload_headers, iter_file_chunks
 
+from .chunking import AudioChunk, plan_chunks, split_audio, stitch_chunks
 from .config import AssemblyAIConfig
 
+if TYPE_CHECKING:
+    from api.services.asr_job_slots import AsrJobSlots
+
 logger = get_logger()
 
+# AssemblyAI echoes this header (with ``webhook_secret``) on webhook delivery.
+WEBHOOK_AUTH_HEADER = "X-Leap-Webhook-Token"
+
+TERMINAL_STATUSES = frozenset({"completed", "error"})
+
 
 class AssemblyAITranscriptionService:
-    """Async transcription via AssemblyAI REST API (submit → poll → normalize)."""
+    """Async transcription via AssemblyAI REST API (submit → poll → normalize).
 
-    def __init__(self, config: AssemblyAIConfig) -> None:
+    Blocking callers use :meth:`transcribe_audio`. Non-blocking callers split it:
+    :meth:`submit_transcription` returns a transcript id right away, and once the
+    job is terminal (webhook or :meth:`get_statuses`) :meth:`complete_transcription`
+    turns it into the LEAP result. Long recordings can go through
+    :meth:`transcribe_audio_chunked` (parallel jobs over silence-aligned chunks);
+    pass ``job_slots`` to cap their jobs per API key across workers.
+    """
+
+    def __init__(self, config: AssemblyAIConfig, job_slots: AsrJobSlots | None = None) -> None:
         self.config = config
+        self.job_slots = job_slots
         self._headers = {
             "Authorization": config.api_key,
             "Content-Type": "application/json",
@@ -40,12 +62,179 @@ class AssemblyAITranscriptionService:
 
         Returns: {text, words, segments, language}
         """
+        transcript_id = await self.submit_transcription(audio_storage_key, language, keyterms)
+        result = await self._poll(transcript_id)
+        return await self.complete_transcription(result, language)
+
+    async def transcribe_audio_chunked(
+        self,
+        audio_storage_key: str,
+        language: str | None,
+        keyterms: list[str],
+        duration: float | None = None,
+    ) -> dict[str, Any]:
+        """Transcribe a long recording as parallel chunks cut at silences.
+
+        Chunks are uploaded and transcribed concurrently (``chunk_concurrency`` in flight per
+        recording; with ``job_slots`` also ``account_concurrency`` per API key across workers),
+        then shifted back to recording time and merged; overlaps are deduplicated.
+        Falls back to :meth:`transcribe_audio` when the recording fits in one chunk; with a
+        known ``duration`` that is decided before the audio is downloaded.
+
+        Returns: {text, words, segments, language}
+        """
+        from file_storage.path_builder import StoragePathBuilder
+
+        settings = self.config.settings
+        if duration and duration <= settings.chunk_target_seconds + settings.chunk_search_window:
+            logger.info("AssemblyAI | Chunked | single chunk, using regular transcription")
+            return await self.transcribe_audio(audio_storage_key, language, keyterms)
+
+        workdir = StoragePathBuilder().create_temp_file(prefix="aai_chunks_")
+        workdir.mkdir()
+        try:
+            chunks, paths = await self._prepare_chunks(audio_storage_key, workdir)
+            if len(chunks) == 1:
+                logger.info("AssemblyAI | Chunked | single chunk, using regular transcription")
+                return await self.transcribe_audio(audio_storage_key, language, keyterms)
+
+            logger.info(
+                f"AssemblyAI | Chunked | chunks={len(chunks)} | concurrency={settings.chunk_concurrency} | "
+                f"account_concurrency={settings.account_concurrency if self.job_slots else '-'} | "
+                f"cuts={[round(c.own_end, 1) for c in chunks[:-1]]}"
+            )
+            start = time.monotonic()
+            semaphore = asyncio.Semaphore(settings.chunk_concurrency)
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self._transcribe_chunk(chunk, path, language, keyterms, semaphore))
+                    for chunk, path in zip(chunks, paths, strict=True)
+                ]
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        result = stitch_chunks(chunks, [task.result() for task in tasks])
+        result["language"] = result["language"] or language or settings.language_code or "ru"
+        logger.info(
+            f"AssemblyAI | Chunked | Completed | chunks={len(chunks)} | words={len(result['words'])} | "
+            f"segments={len(result['segments'])} | elapsed={time.monotonic() - start:.1f}s"
+        )
+        return result
+
+    async def _prepare_chunks(self, audio_storage_key: str, workdir: Path) -> tuple[list[AudioChunk], list[Path]]:
+        """Download the audio, plan silence-aligned cuts and extract the chunk files."""
+        from file_storage.factory import get_storage_backend
+        from video_processing_module.audio_detector import AudioDetector
+
+        settings = self.config.settings
+        source = workdir / f"source{Path(audio_storage_key).suffix or '.mp3'}"
+        await get_storage_backend().download_to_file(audio_storage_key, source)
+
+        detector = AudioDetector(silence_threshold=-35.0, min_silence_duration=0.5)
+        duration = await detector.get_duration_seconds(str(source))
+        if not duration:
+            raise RuntimeError(f"Cannot determine audio duration for chunking: {audio_storage_key}")
+
+        chunks = plan_chunks(
+            duration,
+            await detector.detect_silence_periods(str(source)),
+            target_seconds=settings.chunk_target_seconds,
+            search_window=settings.chunk_search_window,
+            overlap=settings.chunk_overlap_seconds,
+        )
+        if len(chunks) == 1:
+            return chunks, [source]
+        return chunks, await split_audio(source, chunks, workdir)
+
+    async def _transcribe_chunk(
+        self,
+        chunk: AudioChunk,
+        path: Path,
+        language: str | None,
+        keyterms: list[str],
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any]:
+        """Upload → submit → poll → sentences for one chunk (chunk-relative LEAP format)."""
+        settings = self.config.settings
+        # Per-recording cap first, so a waiting chunk does not hold an account slot
+        account_slot = (
+            self.job_slots.hold(self.config.api_key, settings.account_concurrency, settings.poll_interval)
+            if self.job_slots is not None
+            else nullcontext()
+        )
+        async with semaphore, account_slot:
+            audio_url = await self._upload_file(path)
+            transcript_id = await self._submit(audio_url, language, keyterms)
+            data = await self._poll(transcript_id)
+            if not data.get("words"):
+                logger.warning(f"AssemblyAI | Chunked | chunk={chunk.index} has no speech | id={transcript_id}")
+                return {"words": [], "segments": [], "language": data.get("language_code")}
+            raw_sentences = await self._fetch_sentences(transcript_id)
+        return self._normalize(data, language, raw_sentences)
+
+    async def submit_transcription(
+        self,
+        audio_storage_key: str,
+        language: str | None,
+        keyterms: list[str],
+    ) -> str:
+        """Resolve audio URL and submit the job without waiting. Returns transcript_id."""
         audio_url = await self._resolve_audio_url(audio_storage_key)
+        return await self._submit(audio_url, language, keyterms)
+
+    async def get_transcript(self, transcript_id: str) -> dict[str, Any]:
+        """Fetch the current state of a transcript (single request, no waiting)."""
+        response = await get_http_client("assemblyai").get(
+            f"{self.config.base_url}/v2/transcript/{transcript_id}",
+            headers={"Authorization": self.config.api_key},
+            timeout=30.0,
+            extensions=api_endpoint("transcript.get"),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def get_statuses(self, transcript_ids: list[str], concurrency: int = 8) -> dict[str, str]:
+        """Status of many transcripts over the shared connection pool.
+
+        Lookups that fail are omitted from the result (retried on the next poll).
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        headers = {"Authorization": self.config.api_key}
+        client = get_http_client("assemblyai")
+
+        async def _status(transcript_id: str) -> tuple[str, str | None]:
+            async with semaphore:
+                try:
+                    response = await client.get(
+                        f"{self.config.base_url}/v2/transcript/{transcript_id}",
+                        headers=headers,
+                        timeout=30.0,
+                        extensions=api_endpoint("transcript.status"),
+                    )
+                    response.raise_for_status()
+                    return transcript_id, response.json().get("status")
+                except httpx.HTTPError as exc:
+                    logger.warning(f"AssemblyAI | Status lookup failed | id={transcript_id} | {exc!r}")
+                    return transcript_id, None
+
+        results = await asyncio.gather(*(_status(tid) for tid in transcript_ids))
+
+        return {tid: status for tid, status in results if status}
+
+    async def complete_transcription(self, data: dict[str, Any], language: str | None) -> dict[str, Any]:
+        """Turn a terminal transcript response into {text, words, segments, language}.
+
+        Raises RuntimeError for ``error`` transcripts and for jobs that are not done yet.
+        """
+        transcript_id = data.get("id")
+        status = data.get("status")
+        if status == "error":
+            raise RuntimeError(f"AssemblyAI transcription failed: {data.get('error')} (id={transcript_id})")
+        if status != "completed":
+            raise RuntimeError(f"AssemblyAI transcript is not completed: status={status} (id={transcript_id})")
 
-        transcript_id = await self._submit(audio_url, language, keyterms)
-        result = await self._poll(transcript_id)
         raw_sentences = await self._fetch_sentences(transcript_id)
-        return self._normalize(result, language, raw_sentences)
+        return self._normalize(data, language, raw_sentences)
 
     async def _resolve_audio_url(self, audio_storage_key: str) -> str:
         """Return a public URL for the audio key, uploading via AssemblyAI if needed."""
@@ -70,13 +259,17 @@ class AssemblyAITranscriptionService:
             tmp.unlink(missing_ok=True)
 
     async def _upload_file(self, local_path: Path) -> str:
-        """Upload local file to AssemblyAI and return the upload URL."""
+        """Stream a local file to AssemblyAI and return the upload URL."""
         upload_url = f"{self.config.base_url}/v2/upload"
-        headers = {"Authorization": self.config.api_key}
-
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            with local_path.open("rb") as f:
-                response = await client.post(upload_url, headers=headers, content=f.read())
+        headers = {"Authorization": self.config.api_key, **file_upload_headers(local_path)}
+
+        response = await get_http_client("assemblyai").post(
+            upload_url,
+            headers=headers,
+            content=iter_file_chunks(local_path),
+            timeout=300.0,
+            extensions=api_endpoint("upload"),
+        )
 
         response.raise_for_status()
         return response.json()["upload_url"]
@@ -103,17 +296,23 @@ class AssemblyAITranscriptionService:
         if keyterms:
             payload["keyterms_prompt"] = keyterms
 
+        if settings.webhook_url and settings.webhook_secret:
+            payload["webhook_url"] = settings.webhook_url
+            payload["webhook_auth_header_name"] = WEBHOOK_AUTH_HEADER
+            payload["webhook_auth_header_value"] = settings.webhook_secret
+
         logger.info(
             f"AssemblyAI | Submitting | models={settings.speech_models} | "
             f"lang={payload.get('language_code') or 'detect'} | keyterms={len(keyterms)}"
         )
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.config.base_url}/v2/transcript",
-                headers=self._headers,
-                json=payload,
-            )
+        response = await get_http_client("assemblyai").post(
+            f"{self.config.base_url}/v2/transcript",
+            headers=self._headers,
+            json=payload,
+            timeout=60.0,
+            extensions=api_endpoint("transcript.submit"),
+        )
 
         response.raise_for_status()
         data = response.json()
@@ -127,39 +326,45 @@ class AssemblyAITranscriptionService:
         poll_url = f"{self.config.base_url}/v2/transcript/{transcript_id}"
         start = time.monotonic()
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            attempt = 0
-            while True:
-                attempt += 1
-                elapsed = time.monotonic() - start
+        client = get_http_client("assemblyai")
+        attempt = 0
+        while True:
+            attempt += 1
+            elapsed = time.monotonic() - start
 
-                if elapsed > settings.max_wait_seconds:
-                    raise TimeoutError(f"AssemblyAI transcription timed out after {elapsed:.0f}s (id={transcript_id})")
+            if elapsed > settings.max_wait_seconds:
+                raise TimeoutError(f"AssemblyAI transcription timed out after {elapsed:.0f}s (id={transcript_id})")
 
-                response = await client.get(poll_url, headers={"Authorization": self.config.api_key})
-                response.raise_for_status()
-                data = response.json()
-                status = data.get("status")
+            response = await client.get(
+                poll_url,
+                headers={"Authorization": self.config.api_key},
+                timeout=30.0,
+                extensions=api_endpoint("transcript.poll"),
+            )
+            response.raise_for_status()
+            data = response.json()
+            status = data.get("status")
 
-                if status == "completed":
-                    logger.info(
-                        f"AssemblyAI | Completed | id={transcript_id} | elapsed={elapsed:.1f}s | attempts={attempt}"
-                    )
-                    return data
+            if status == "completed":
+                logger.info(
+                    f"AssemblyAI | Completed | id={transcript_id} | elapsed={elapsed:.1f}s | attempts={attempt}"
+                )
+                return data
 
-                if status == "error":
-                    raise RuntimeError(f"AssemblyAI transcription failed: {data.get('error')} (id={transcript_id})")
+            if status == "error":
+                raise RuntimeError(f"AssemblyAI transcription failed: {data.get('error')} (id={transcript_id})")
 
-                logger.debug(f"AssemblyAI | Polling | status={status} | elapsed={elapsed:.0f}s | attempt={attempt}")
-                await asyncio.sleep(settings.poll_interval)
+            logger.debug(f"AssemblyAI | Polling | status={status} | elapsed={elapsed:.0f}s | attempt={attempt}")
+            await asyncio.sleep(settings.poll_interval)
 
     async def _fetch_sentences(self, transcript_id: str) -> list[dict[str, Any]]:
         """Fetch sentence-level segments from AssemblyAI (free derived view of transcript)."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.config.base_url}/v2/transcript/{transcript_id}/sentences",
-                headers={"Authorization": self.config.api_key},
-            )
+        response = await get_http_client("assemblyai").get(
+            f"{self.config.base_url}/v2/transcript/{transcript_id}/sentences",
+            headers={"Authorization": self.config.api_key},
+            timeout=30.0,
+            extensions=api_endpoint("transcript.sentences"),
+        )
         response.raise_for_status()
         return response.json().get("sentences", [])
 
@@ -190,7 +395,9 @@ class AssemblyAITranscriptionService:
         if not raw_words:
             raise ValueError("No words in AssemblyAI response — check audio quality or language settings")
 
-        words = extract_words(raw_words)
+        # Columns once: master.json words and the heuristic segments share them
+        timeline = word_timeline(raw_words)
+        words = timeline.to_words()
 
         segments = self._normalize_sentences(raw_sentences) if raw_sentences else []
         if segments:
@@ -200,7 +407,7 @@ class AssemblyAITranscriptionService:
         else:
             if raw_sentences:
                 logger.warning("AssemblyAI | /sentences returned no usable text, falling back to heuristic")
-            segments = build_segments_from_words(words)
+            segments = build_segments(timeline)
             logger.info(
                 f"AssemblyAI | segments=heuristic(fallback) | count={len(segments)} | words={len(words)} | lang={language}"
             )
@@ -125,6 +125,16 @@ class DatabaseSettings(BaseSettings):
     max_overflow: int = Field(default=10, ge=0, description="Max overflow connections")
     pool_timeout: int = Field(default=30, ge=1, description="Pool timeout in seconds")
 
+    # Celery workers: one pool per worker thread/process loop (see utils/worker_loop.py)
+    worker_pool_size: int = Field(default=2, ge=1, description="Pooled connections per worker event loop")
+    worker_max_overflow: int = Field(default=8, ge=0, description="Extra connections per worker loop under bursts")
+    worker_pool_recycle: int = Field(
+        default=1800, ge=60, description="Reconnect pooled worker connections older than this (seconds)"
+    )
+    # AsyncIOPool workers run every task on one loop, so they share one bigger pool
+    async_pool_size: int = Field(default=20, ge=1, description="Pooled connections of a shared asyncio worker loop")
+    async_max_overflow: int = Field(default=20, ge=0, description="Extra connections of a shared asyncio worker loop")
+
     @property
     def url(self) -> str:
         """Async database URL"""
@@ -214,11 +224,85 @@ class CelerySettings(BaseSettings):
     maintenance_max_retries: int = Field(default=2, ge=0, description="Max retries for maintenance tasks")
     maintenance_retry_delay: int = Field(default=300, ge=0, description="Retry delay for maintenance tasks (seconds)")
 
+    # Pipeline join: transcription starts off the trimmed audio while the video is still trimming
+    trim_join_poll_interval: int = Field(
+        default=15, ge=1, description="How often the pipeline re-checks a running video trim before uploads (seconds)"
+    )
+    trim_join_max_wait: int = Field(
+        default=7200, ge=60, description="How long the pipeline waits for the video trim before failing (seconds)"
+    )
+
+    # Early upload: the publish step waits for the private upload before patching metadata
+    publish_poll_interval: int = Field(
+        default=60, ge=1, description="How often the publish step re-checks a running early upload (seconds)"
+    )
+    publish_max_wait: int = Field(
+        default=21600, ge=60, description="How long the publish step waits for the early upload (seconds)"
+    )
+
+    # AsyncIOPool (I/O queues): blocking SDK calls are offloaded to the shared loop's executor
+    asyncio_blocking_threads: int = Field(
+        default=32, ge=1, description="Executor threads for blocking calls on the shared asyncio worker loop"
+    )
+
+    # Fair share: bulk/playlist runs wait in per-tenant Redis queues and are released interleaved
+    fair_share_enabled: bool = Field(
+        default=True, description="Route bulk pipeline runs through tenant fair-share queues"
+    )
+    fair_share_interval: int = Field(default=5, ge=1, description="How often the fair-share dispatcher runs (seconds)")
+    fair_share_max_pending: int = Field(
+        default=16, ge=1, description="Release queued runs only while fewer pipeline tasks wait in Celery queues"
+    )
+    fair_share_max_weight: int = Field(
+        default=10, ge=1, description="Cap on a tenant's fair-share weight (plan max_concurrent_tasks)"
+    )
+
+    # Admission: max_concurrent_tasks slots per tenant, leased so crashed pipelines free theirs
+    pipeline_slot_lease: int = Field(
+        default=14400,
+        ge=300,
+        description="Pipeline slot lease, renewed by every pipeline step; > task_time_limit (seconds)",
+    )
+    pipeline_slot_promote_interval: int = Field(
+        default=60, ge=5, description="How often deferred pipelines are re-checked for free slots (seconds)"
+    )
+
+    # Node affinity: download/trim/upload of a recording run on one node and share its local scratch
+    affinity_enabled: bool = Field(
+        default=False, description="Route a recording's download/trim/upload to the node holding its artifacts"
+    )
+    affinity_node: str = Field(default="", description="This worker's node name (default: hostname)")
+    affinity_max_backlog: int = Field(
+        default=8, ge=1, description="Node queue depth at which stages fall back to the shared queue"
+    )
+    affinity_heartbeat_ttl: int = Field(
+        default=30, ge=5, description="Node queues without a heartbeat this long are treated as dead (seconds)"
+    )
+    affinity_scratch_ttl: int = Field(
+        default=86400, ge=600, description="Max age of a recording's pin and scratch artifacts (seconds)"
+    )
+    affinity_scratch_max_gb: int = Field(default=100, ge=1, description="Local scratch size cap per node (GB)")
+
+    # Progress events (SSE): per-user Redis stream for Last-Event-ID replay + pub/sub for live delivery
+    progress_events_enabled: bool = Field(default=True, description="Publish task progress and stage transitions")
+    progress_events_maxlen: int = Field(
+        default=500, ge=10, description="Events kept per user for Last-Event-ID replay (approximate)"
+    )
+    progress_events_ttl: int = Field(
+        default=3600, ge=60, description="Replay buffer of an idle user expires after (seconds)"
+    )
+    progress_events_keepalive: int = Field(
+        default=15, ge=1, description="Comment line sent on idle event streams (seconds)"
+    )
+
     @model_validator(mode="after")
     def validate_time_limits(self) -> "CelerySettings":
         """Validate that soft limit is less than hard limit"""
         if self.task_soft_time_limit >= self.task_time_limit:
             raise ValueError("task_soft_time_limit must be less than task_time_limit")
+        # Steps renew the slot lease when they start: one step must not outlive it
+        if self.pipeline_slot_lease <= self.task_time_limit:
+            raise ValueError("pipeline_slot_lease must be greater than task_time_limit")
         return self
 
 
@@ -366,6 +450,9 @@ class StorageSettings(BaseSettings):
     thumbnail_dir: str = Field(default="thumbnails", description="Thumbnail directory")
     template_thumbnail_dir: str = Field(default="storage/shared/thumbnails", description="Template thumbnail directory")
 
+    download_partial_ttl_hours: int = Field(
+        default=24, ge=1, description="Idle partial downloads are kept this long for task retries (hours)"
+    )
     max_upload_size_mb: int = Field(default=5000, ge=1, description="Max upload size (MB)")
     max_thumbnail_size_mb: int = Field(default=10, ge=1, description="Max thumbnail size (MB)")
 
@@ -662,6 +749,39 @@ class YtdlpSettings(BaseSettings):
     )
 
 
+# ============================================================================
+# OUTBOUND HTTP CLIENTS (shared pools, see utils/http_clients.py)
+# ============================================================================
+
+
+class HttpClientSettings(BaseSettings):
+    """Connection pooling and retry policy for outbound integration calls"""
+
+    model_config = SettingsConfigDict(
+        env_prefix="HTTP_CLIENT_",
+        case_sensitive=False,
+    )
+
+    http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 where the provider supports it (needs the optional `h2` package)",
+    )
+    keepalive_expiry: float = Field(default=30.0, ge=0.0, description="Idle pooled connection lifetime (seconds)")
+    max_retries: int = Field(default=2, ge=0, le=10, description="Retries of a failed idempotent request")
+    retry_backoff: float = Field(default=0.5, ge=0.0, description="Base delay before a retry (doubles per attempt)")
+    retry_budget_ratio: float = Field(
+        default=0.2,
+        ge=0.0,
+        le=1.0,
+        description="Retries allowed per request sent to a provider (retry budget)",
+    )
+    retry_budget_min: int = Field(
+        default=10,
+        ge=0,
+        description="Retries always available to a provider regardless of its traffic",
+    )
+
+
 class RetentionSettings(BaseSettings):
     """Default retention policy settings for recordings"""
 
@@ -726,6 +846,78 @@ class AssemblyAISettings(BaseSettings):
         ge=60.0,
         description="Maximum wait time for transcription (seconds). 90-min lecture + queue buffer.",
     )
+    base_url: str = Field(
+        default="https://api.assemblyai.com",
+        description="API base URL (override for a regional endpoint or a local fake ASR server in tests)",
+    )
+    result_cache: bool = Field(
+        default=True,
+        description="Reuse normalized results for identical audio + language + keyterms + models (transcription_cache)",
+    )
+    async_mode: bool = Field(
+        default=True,
+        description="Submit and release the worker; the chain is resumed by the webhook or the pending-transcript poller",
+    )
+    webhook_url: str | None = Field(
+        default=None,
+        description="Public URL of POST /api/v1/webhooks/assemblyai. None = rely on the poller only.",
+    )
+    webhook_secret: str | None = Field(
+        default=None,
+        description="Shared secret AssemblyAI echoes back in the webhook auth header",
+    )
+    pending_poll_interval: float = Field(
+        default=15.0,
+        ge=5.0,
+        description="Beat interval (seconds) of the batched poller for outstanding transcripts",
+    )
+    chunked_mode: bool = Field(
+        default=False,
+        description=(
+            "Split long recordings at silences and transcribe the chunks in parallel. "
+            "Chunked recordings are transcribed inside the task (the worker waits) even with async_mode."
+        ),
+    )
+    chunk_min_duration: float = Field(
+        default=5400.0,
+        ge=600.0,
+        description="Recordings at least this long (seconds) are chunked when chunked_mode is on",
+    )
+    chunk_target_seconds: float = Field(
+        default=1800.0,
+        ge=300.0,
+        description="Target chunk length; the cut moves to the nearest silence within chunk_search_window",
+    )
+    chunk_search_window: float = Field(
+        default=90.0,
+        ge=0.0,
+        description="How far (seconds) from the target cut to look for a silence",
+    )
+    chunk_overlap_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=30.0,
+        description="Audio shared by neighbouring chunks; words in the overlap are kept once",
+    )
+    chunk_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Chunks in flight at once per recording",
+    )
+    account_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=200,
+        description="Chunk jobs in flight at once per API key across all workers (keep under the account's job limit)",
+    )
+
+    @model_validator(mode="after")
+    def validate_webhook(self) -> "AssemblyAISettings":
+        """An unauthenticated webhook would let anyone resume parked pipelines"""
+        if self.webhook_url and not self.webhook_secret:
+            raise ValueError("ASSEMBLYAI_WEBHOOK_SECRET is required when ASSEMBLYAI_WEBHOOK_URL is set")
+        return self
 
 
 # ============================================================================
@@ -799,6 +991,45 @@ class TopicExtractionSettings(BaseSettings):
     topic_count_min_cap: int = Field(default=25, ge=1, description="Upper cap on the min-topics value sent to the LLM")
     topic_count_max_cap: int = Field(default=30, ge=1, description="Hard cap on the max-topics value sent to the LLM")
 
+    # Chunked (map-reduce) extraction: overlapping windows analysed concurrently, then one merge call
+    chunked_min_minutes: float = Field(
+        default=120.0, ge=0.0, description="Use chunked extraction for recordings longer than this (0 disables)"
+    )
+    chunk_window_minutes: float = Field(default=40.0, gt=0.0, description="Transcript window per map call (minutes)")
+    chunk_overlap_minutes: float = Field(default=4.0, ge=0.0, description="Overlap between adjacent windows (minutes)")
+    chunk_concurrency: int = Field(default=4, ge=1, description="Max concurrent map calls per recording")
+
+    # Prompt compaction: segments merged into blocks with one start timestamp, fillers and repeats dropped
+    compact_transcript: bool = Field(default=True, description="Send merged transcript blocks instead of raw segments")
+    compact_block_min_seconds: float = Field(default=30.0, ge=0.0, description="Close a block once it spans this long")
+    compact_block_max_seconds: float = Field(default=60.0, gt=0.0, description="Never stretch a block beyond this")
+
+    # Streaming completions: partial topics and token throughput published to task progress
+    stream_completions: bool = Field(default=True, description="Stream DeepSeek completions in extract_topics_task")
+    stream_progress_interval_seconds: float = Field(
+        default=2.0, gt=0.0, description="Min interval between progress updates without new topics"
+    )
+    stream_idle_timeout_seconds: float = Field(
+        default=60.0, gt=0.0, description="Abort a stream when no chunk arrives for this long (stuck generation)"
+    )
+    stream_malformed_line_limit: int = Field(
+        default=10, ge=1, description="Abort when this many consecutive topic-section lines are not topics"
+    )
+
+    # Batch extraction (POST /recordings/bulk/topics): one worker task per batch, shared DeepSeek client
+    batch_size: int = Field(default=50, ge=1, description="Recordings per extract_topics_batch task")
+    batch_concurrency: int = Field(default=8, ge=1, description="Max concurrent LLM requests per batch task")
+    batch_prefetch: int = Field(
+        default=16, ge=1, description="Recordings loaded/processed at once per batch task (>= batch_concurrency)"
+    )
+
+    # LLM response cache (llm_response_cache): identical requests reuse the stored completion
+    response_cache: bool = Field(default=True, description="Reuse completions for identical prompts + model + params")
+    response_cache_ttl_days: int = Field(default=30, ge=1, description="Cached completion lifetime in days")
+    response_cache_max_mb: int = Field(
+        default=512, ge=1, description="Size budget of the cache; least recently used entries are evicted above it"
+    )
+
 
 # ============================================================================
 # EMAIL / SMTP
@@ -856,6 +1087,7 @@ class Settings(BaseSettings):
     processing: ProcessingSettings = Field(default_factory=ProcessingSettings)
     ytdlp: YtdlpSettings = Field(default_factory=YtdlpSettings)
     retention: RetentionSettings = Field(default_factory=RetentionSettings)
+    http_client: HttpClientSettings = Field(default_factory=HttpClientSettings)
     assemblyai: AssemblyAISettings = Field(default_factory=AssemblyAISettings)
     deepseek: DeepSeekSettings = Field(default_factory=DeepSeekSettings)
     topic_extraction: TopicExtractionSettings = Field(default_factory=TopicExtractionSettings)
@@ -937,6 +1169,10 @@ DEFAULT_USER_CONFIG = {
         "min_silence_duration": 2.0,
         "padding_before": 5.0,
         "padding_after": 5.0,
+        "compact_mode": False,
+        "compact_min_gap_seconds": 480.0,
+        "compact_padding_seconds": 2.0,
+        "compact_video": False,
     },
     "transcription": {
         "enable_transcription": True,
@@ -960,6 +1196,7 @@ DEFAULT_USER_CONFIG = {
     "upload": {
         "auto_upload": False,
         "upload_captions": True,
+        "early_upload": False,
         "default_platforms": [],
         "default_preset_ids": {},
     },
@@ -12,11 +12,14 @@ from .config_models import UserConfigModel
 from .manager import DatabaseManager
 from .models import (
     Base,
+    LLMResponseCacheModel,
     OutputTargetModel,
     ProcessingStageModel,
     RecordingModel,
     SourceMetadataModel,
     StageTimingModel,
+    TranscriptionCacheModel,
+    TranscriptSegmentModel,
 )
 from .template_models import (
     BaseConfigModel,
@@ -33,6 +36,7 @@ __all__ = [
     "DatabaseConfig",
     "DatabaseManager",
     "InputSourceModel",
+    "LLMResponseCacheModel",
     "OutputPresetModel",
     "OutputTargetModel",
     "ProcessingStageModel",
@@ -43,6 +47,8 @@ __all__ = [
     "SourceMetadataModel",
     "StageTimingModel",
     "SubscriptionPlanModel",
+    "TranscriptSegmentModel",
+    "TranscriptionCacheModel",
     "UserConfigModel",
     "UserCredentialModel",
     "UserModel",
@@ -49,3 +49,4 @@ class AuditAction:
     PLAN_CREATED = "plan.created"
     PLAN_UPDATED = "plan.updated"
     PLAN_DELETED = "plan.deleted"
+    TRANSCRIPTION_CACHE_EVICTED = "transcription_cache.evicted"
@@ -13,9 +13,10 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from models.recording import (
@@ -183,7 +184,12 @@ class RecordingModel(Base):
         stage.completed_at = datetime.now(UTC)
         stage.failed = False
         if meta:
-            stage.stage_meta = {**(stage.stage_meta or {}), **meta}
+            self.update_stage_meta(stage_type, meta)
+
+    def update_stage_meta(self, stage_type: ProcessingStageType, meta: dict[str, Any]) -> None:
+        """Merge keys into stage meta without changing the stage status."""
+        stage = self._get_or_create_stage(stage_type)
+        stage.stage_meta = {**(stage.stage_meta or {}), **meta}
 
     def mark_stage_failed(self, stage_type: ProcessingStageType, reason: str) -> None:
         """Mark stage as failed."""
@@ -366,3 +372,110 @@ class StageTimingModel(Base):
             f"stage_type={self.stage_type}, substep={self.substep}, "
             f"duration={self.duration_seconds}s)>"
         )
+
+
+class TranscriptSegmentModel(Base):
+    """Full-text search index over transcript segments.
+
+    Rows are derived from ``master.json`` and replaced wholesale per recording
+    every time the master is saved. ``ts_config`` is the Postgres text search
+    configuration the vector was built with (``russian``, ``english``, ``simple``).
+    """
+
+    __tablename__ = "transcript_segments"
+
+    __table_args__ = (
+        Index("ix_transcript_segments_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_transcript_segments_recording_segment", "recording_id", "segment_index"),
+    )
+
+    # --- PK & FK ---
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    recording_id: Mapped[int] = mapped_column(Integer, ForeignKey("recordings.id", ondelete="CASCADE"))
+    user_id: Mapped[str] = mapped_column(String(26), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+
+    # --- Segment ---
+    segment_index: Mapped[int] = mapped_column(Integer)
+    start_time: Mapped[float] = mapped_column(Float)
+    end_time: Mapped[float] = mapped_column(Float)
+    text: Mapped[str] = mapped_column(Text)
+
+    # --- Search ---
+    ts_config: Mapped[str] = mapped_column(String(32), default="simple")
+    search_vector: Mapped[Any] = mapped_column(TSVECTOR)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TranscriptSegment(id={self.id}, recording_id={self.recording_id}, "
+            f"segment_index={self.segment_index}, start={self.start_time})>"
+        )
+
+
+class TranscriptionCacheModel(Base):
+    """Normalized ASR results keyed by audio content + transcription parameters.
+
+    ``cache_key`` is a SHA-256 over the audio object hash, language settings,
+    speech models and keyterms (see ``transcription_cache_key``), scoped per user.
+    ``result`` is deferred: listing entries never loads the transcript itself.
+    """
+
+    __tablename__ = "transcription_cache"
+
+    # --- PK & FK ---
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    user_id: Mapped[str] = mapped_column(String(26), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    source_recording_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("recordings.id", ondelete="SET NULL"), nullable=True
+    )
+
+    # --- Key components (for inspection) ---
+    audio_sha256: Mapped[str] = mapped_column(String(64), index=True)
+    language: Mapped[str | None] = mapped_column(String(16))
+    speech_model: Mapped[str] = mapped_column(String(64))
+    keyterms_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    # --- Payload ---
+    result: Mapped[Any] = mapped_column(JSONB, deferred=True)
+    words_count: Mapped[int] = mapped_column(Integer, default=0)
+    size_bytes: Mapped[int] = mapped_column(Integer, default=0)
+
+    # --- Usage ---
+    hit_count: Mapped[int] = mapped_column(Integer, default=0)
+    last_hit_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+
+    def __repr__(self) -> str:
+        return (
+            f"<TranscriptionCache(key={self.cache_key[:12]}, user_id={self.user_id}, "
+            f"words={self.words_count}, hits={self.hit_count})>"
+        )
+
+
+class LLMResponseCacheModel(Base):
+    """Raw LLM completions keyed by the exact request (topic extraction).
+
+    ``cache_key`` is a SHA-256 over system prompt, rendered user prompt, model and
+    request params (see ``llm_cache_key``): the prompt embeds the transcript, so
+    an entry only matches an identical request. Entries expire after a TTL and
+    the table is trimmed to a size budget, least recently used first.
+    """
+
+    __tablename__ = "llm_response_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(String(64))
+
+    # --- Payload ---
+    content: Mapped[str] = mapped_column(Text, deferred=True)
+    usage: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    total_tokens: Mapped[int] = mapped_column(Integer, default=0)
+    size_bytes: Mapped[int] = mapped_column(Integer, default=0)
+
+    # --- Usage ---
+    hit_count: Mapped[int] = mapped_column(Integer, default=0)
+    last_hit_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+    def __repr__(self) -> str:
+        return f"<LLMResponseCache(key={self.cache_key[:12]}, model={self.model}, hits={self.hit_count})>"
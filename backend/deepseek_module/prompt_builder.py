@@ -0,0 +1,86 @@
+"""Compact transcript rendering for topic-extraction prompts.
+
+Segments are merged into ~30–60 s blocks that keep only their start time,
+hesitation fillers are stripped and consecutive repeats (typical ASR
+hallucinations) are dropped. Token counts are estimated before and after so the
+saving can be reported next to the provider's ``usage``.
+
+The transcript goes first in every prompt (see ``prompts.py``): system prompt +
+transcript is a stable prefix across granularities and re-runs, which the
+provider's prompt cache can serve; per-call instructions follow it.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+
+# Hesitation sounds only: real words ("ну", "вот", "как бы") can carry meaning
+FILLER_PATTERN = re.compile(r"(?<!\w)(?:э+м*|м{2,}|хм+|uh+|um+|erm|hmm+)(?!\w)[,.…]*\s*", re.IGNORECASE)
+_TOKEN_PIECE = re.compile(r"\w+|[^\w\s]")
+_NORMALIZE = re.compile(r"[^\w]+")
+
+
+@dataclass
+class TranscriptBlock:
+    """Merged run of segments: start time and joined text."""
+
+    start: float
+    end: float
+    text: str
+
+
+def strip_fillers(text: str) -> str:
+    """Remove hesitation fillers and tidy the spacing left behind."""
+    cleaned = FILLER_PATTERN.sub("", text)
+    return re.sub(r"\s{2,}", " ", cleaned).strip()
+
+
+def compact_segments(
+    segments: list[tuple[float, float, str]],
+    *,
+    min_block_seconds: float,
+    max_block_seconds: float,
+) -> list[TranscriptBlock]:
+    """Merge (start, end, text) segments into blocks of about ``min``–``max`` seconds.
+
+    A block is closed once it spans ``min_block_seconds``; a segment that would
+    stretch it past ``max_block_seconds`` starts a new one. A segment repeating
+    the previous one word for word is dropped.
+    """
+    blocks: list[TranscriptBlock] = []
+    current: TranscriptBlock | None = None
+    previous = ""
+
+    for start, end, raw_text in segments:
+        text = strip_fillers(raw_text)
+        normalized = _NORMALIZE.sub(" ", text.lower()).strip()
+        if not normalized or normalized == previous:
+            continue
+        previous = normalized
+
+        if current is not None and end - current.start > max_block_seconds:
+            blocks.append(current)
+            current = None
+        if current is None:
+            current = TranscriptBlock(start=start, end=end, text=text)
+        else:
+            current.end = end
+            current.text = f"{current.text} {text}"
+        if current.end - current.start >= min_block_seconds:
+            blocks.append(current)
+            current = None
+
+    if current is not None:
+        blocks.append(current)
+    return blocks
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough BPE token count (~4 characters per token, every punctuation mark one token).
+
+    Only for comparing prompt variants; the provider-reported ``prompt_tokens``
+    stays authoritative.
+    """
+    return sum(math.ceil(len(piece) / 4) for piece in _TOKEN_PIECE.findall(text))
@@ -4,9 +4,8 @@ SYSTEM_PROMPT_EN = (
     "You are an expert analyst of educational content. Analyze transcripts and extract the video structure."
 )
 
-TOPIC_EXTRACTION_PROMPT = """Проанализируй транскрипцию видео и выдели структуру:{context_line}{pauses_instruction}
-
-## САММАРИ ВИДЕО
+# Output sections shared by the single-pass prompt and the reduce step of chunked extraction
+_OUTPUT_SPEC = """## САММАРИ ВИДЕО
 
 Краткое содержание в 2–4 предложения: что обсуждалось, основные идеи. Язык: {summary_language}.
 
@@ -57,14 +56,9 @@ TOPIC_EXTRACTION_PROMPT = """Проанализируй транскрипцию
 - Язык: {summary_language}
 
 Формат: по одному вопросу на строку с номером (1. 2. 3.)
-
-Транскрипция:
-{transcript}
 """
 
-TOPIC_EXTRACTION_PROMPT_EN = """Analyze the video transcript and extract its structure:{context_line}{pauses_instruction}
-
-## VIDEO SUMMARY
+_OUTPUT_SPEC_EN = """## VIDEO SUMMARY
 
 Brief summary in 2–4 sentences: what was discussed and the main ideas. Language: {summary_language}.
 
@@ -115,11 +109,80 @@ Write self-check questions. Count: {questions_count}. Criteria:
 - Language: {summary_language}
 
 Format: one question per line with a number (1. 2. 3.)
+"""
+
+# The transcript comes first in every prompt: system prompt + transcript is a prefix shared
+# by re-runs with other granularity/topic settings, so the provider's prompt cache can serve it.
+# Per-call instructions follow after the "---" separator.
+TOPIC_EXTRACTION_PROMPT = (
+    "Транскрипция:\n{transcript}\n\n---\n\n"
+    "Проанализируй транскрипцию видео выше и выдели структуру:{context_line}{pauses_instruction}\n\n" + _OUTPUT_SPEC
+)
+
+TOPIC_EXTRACTION_PROMPT_EN = (
+    "Transcript:\n{transcript}\n\n---\n\n"
+    "Analyze the video transcript above and extract its structure:{context_line}{pauses_instruction}\n\n"
+    + _OUTPUT_SPEC_EN
+)
+
+# Chunked (map-reduce) extraction for recordings longer than one prompt: each window
+# yields a summary and candidate topics, the reduce step builds the final structure.
+TOPIC_MAP_PROMPT = """Фрагмент:
+{transcript}
+
+---
+
+Выше — фрагмент {window_start}–{window_end} транскрипции длинного видео.{context_line}
+
+## САММАРИ ФРАГМЕНТА
 
-Transcript:
+2–3 предложения: что обсуждалось в этом фрагменте. Язык: {summary_language}.
+
+## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ
+
+Кандидаты тем этого фрагмента для оглавления всего видео:
+- Каждая тема — отдельная строка: [HH:MM:SS] - Название топика
+- Без markdown, нумерации и префиксов
+- Названия: 3–6 слов, только фактические темы, хронологический порядок
+- Не чаще одной темы в {min_spacing_minutes:.1f} минут
+- Используй РЕАЛЬНЫЕ временные метки из фрагмента
+"""
+
+TOPIC_MAP_PROMPT_EN = """Part:
 {transcript}
+
+---
+
+Above is part {window_start}–{window_end} of a long video transcript.{context_line}
+
+## PART SUMMARY
+
+2–3 sentences: what was discussed in this part. Language: {summary_language}.
+
+## DETAILED TOPICS
+
+Candidate topics of this part for the table of contents of the whole video:
+- One topic per line: [HH:MM:SS] - Topic title
+- No markdown, numbering or prefixes
+- Titles: 3–6 words, only factual topics, chronological order
+- At most one topic per {min_spacing_minutes:.1f} minutes
+- Use REAL timestamps from the part
 """
 
+TOPIC_REDUCE_PROMPT = (
+    "Фрагменты (временные метки — от начала видео):\n{transcript}\n\n---\n\n"
+    "Выше — краткие содержания и кандидаты тем последовательных фрагментов одного видео "
+    "(фрагменты перекрываются, кандидаты могут повторяться). Объедини их и выдели структуру "
+    "всего видео:{context_line}{pauses_instruction}\n\n" + _OUTPUT_SPEC
+)
+
+TOPIC_REDUCE_PROMPT_EN = (
+    "Parts (timestamps are from the start of the video):\n{transcript}\n\n---\n\n"
+    "Above are summaries and candidate topics of consecutive parts of one video "
+    "(parts overlap, candidates may repeat). Merge them and extract the structure "
+    "of the whole video:{context_line}{pauses_instruction}\n\n" + _OUTPUT_SPEC_EN
+)
+
 # Keys match Granularity enum. Prompt text derived in topic_extractor from duration_min/max.
 GRANULARITY_CONFIG = {
     "short": {
@@ -0,0 +1,78 @@
+"""Incremental parsing of streamed topic-extraction completions.
+
+The extractor feeds content deltas as they arrive; complete lines are checked
+with the same ``[HH:MM:SS] - topic`` rule as ``_parse_structured_response`` so
+partial topics can be published before generation ends. The final result is
+still parsed from the full text.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+# Receives {"topics", "completion_tokens", "tokens_per_second", "elapsed_seconds"}
+StreamProgressCallback = Callable[[dict[str, Any]], None]
+
+# Section headers after which every non-blank line must be a topic line
+TOPIC_SECTION_MARKERS = ("ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ", "ТОПИКИ С ТАЙМКОДАМИ", "DETAILED TOPICS")
+
+
+class MalformedStreamError(ValueError):
+    """Streamed output stopped following the requested topic format."""
+
+
+class TopicStreamParser:
+    """Line-by-line view of a streamed completion.
+
+    ``parse_line`` maps one line to ``{"topic", "start"}`` or None. Inside the
+    topics section, more than ``malformed_line_limit`` consecutive lines that are
+    not topics raise ``MalformedStreamError`` so the request can be cancelled
+    instead of generating up to ``max_tokens`` of garbage.
+    """
+
+    def __init__(self, parse_line: Callable[[str], dict | None], *, malformed_line_limit: int):
+        self._parse_line = parse_line
+        self.malformed_line_limit = malformed_line_limit
+        self.topics: list[dict] = []
+        self._buffer = ""
+        self._in_topics = False
+        self._unparsed = 0
+
+    def feed(self, delta: str) -> list[dict]:
+        """Consume a content delta; return topics completed by it."""
+        self._buffer += delta
+        *lines, self._buffer = self._buffer.split("\n")
+        return self._consume_lines(lines)
+
+    def close(self) -> list[dict]:
+        """Consume the last (unterminated) line."""
+        tail, self._buffer = self._buffer, ""
+        return self._consume_lines([tail])
+
+    def _consume_lines(self, lines: list[str]) -> list[dict]:
+        new = [topic for line in lines if (topic := self._consume(line.strip())) is not None]
+        self.topics.extend(new)
+        return new
+
+    def _consume(self, line: str) -> dict | None:
+        if not line:
+            return None
+        upper = line.upper()
+        if line.startswith("#") or any(marker in upper for marker in TOPIC_SECTION_MARKERS):
+            self._in_topics = any(marker in upper for marker in TOPIC_SECTION_MARKERS)
+            self._unparsed = 0
+            return None
+
+        topic = self._parse_line(line)
+        if topic is not None:
+            self._unparsed = 0
+            return topic
+        if self._in_topics:
+            self._unparsed += 1
+            if self._unparsed > self.malformed_line_limit:
+                raise MalformedStreamError(
+                    f"{self._unparsed} consecutive lines without [HH:MM:SS] - topic in the topics section "
+                    f"(last: {line[:80]!r})"
+                )
+        return None
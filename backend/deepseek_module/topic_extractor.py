@@ -1,24 +1,37 @@
 """Topic extraction from transcription using DeepSeek"""
 
+import asyncio
+import contextlib
 import math
 import re
+import time
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
 from openai import AsyncOpenAI
 
+from api.observability import llm_cache_lookups_total, llm_cache_saved_tokens_total, llm_stream_aborts_total
+from api.repositories.llm_cache_repo import LLMCacheRepository, llm_cache_key
 from api.shared.enums import Granularity
 from config.settings import settings
 from logger import get_logger
+from transcription_module.normalize import detect_long_pauses
 
 from .config import DeepSeekConfig
+from .prompt_builder import compact_segments, estimate_tokens
 from .prompts import (
     GRANULARITY_CONFIG,
     SYSTEM_PROMPT,
     SYSTEM_PROMPT_EN,
     TOPIC_EXTRACTION_PROMPT,
     TOPIC_EXTRACTION_PROMPT_EN,
+    TOPIC_MAP_PROMPT,
+    TOPIC_MAP_PROMPT_EN,
+    TOPIC_REDUCE_PROMPT,
+    TOPIC_REDUCE_PROMPT_EN,
 )
+from .streaming import MalformedStreamError, StreamProgressCallback, TopicStreamParser
 
 logger = get_logger(__name__)
 
@@ -28,6 +41,8 @@ TIMESTAMP_PATTERN_MS = r"\[(\d{2}):(\d{2}):(\d{2})\.(\d{3})\s*-\s*(\d{2}):(\d{2}
 NOISE_PATTERNS = [r"редактор субтитров", r"корректор", r"продолжение следует"]
 QUESTION_PATTERN = re.compile(r"^\d+\.\s*(.+)$")
 
+PROVIDER_CACHE_USAGE_KEYS = ("prompt_cache_hit_tokens", "prompt_cache_miss_tokens")
+
 _te = settings.topic_extraction
 
 
@@ -63,12 +78,44 @@ def _normalize_granularity(value: Granularity | str | None) -> Granularity:
 
 
 class TopicExtractor:
-    """Extract topics from transcription using DeepSeek API."""
+    """Extract topics from transcription using DeepSeek API.
 
-    def __init__(self, config: DeepSeekConfig):
-        self.config = config
+    With ``response_cache`` every chat request is first looked up by its exact
+    content (``llm_cache_key``); ``bypass_cache`` skips the lookup but still
+    stores the fresh completion.
+
+    With ``stream`` completions are consumed as a stream: topic lines are parsed
+    as they arrive and reported to ``on_progress`` with token throughput, and the
+    request is aborted on malformed output or when no chunk arrives for
+    ``TOPIC_STREAM_IDLE_TIMEOUT_SECONDS``.
 
-        self.client = AsyncOpenAI(
+    ``client`` and ``request_limiter`` let several extractors (batch extraction)
+    share one pooled client and one bound on concurrent LLM requests.
+    """
+
+    def __init__(
+        self,
+        config: DeepSeekConfig,
+        response_cache: LLMCacheRepository | None = None,
+        bypass_cache: bool = False,
+        stream: bool = False,
+        on_progress: StreamProgressCallback | None = None,
+        client: AsyncOpenAI | None = None,
+        request_limiter: asyncio.Semaphore | None = None,
+    ):
+        self.config = config
+        self.request_limiter = request_limiter
+        self.response_cache = response_cache
+        self.bypass_cache = bypass_cache
+        self.stream = stream
+        self.on_progress = on_progress
+        self._total_duration = 0.0
+        self.cache_stats = {"hits": 0, "misses": 0, "saved_tokens": 0}
+        # Chunked mode calls _complete concurrently; one AsyncSession must not be used by
+        # concurrent coroutines, so cache get/put are serialized
+        self._cache_lock = asyncio.Lock()
+
+        self.client = client or AsyncOpenAI(
             api_key=config.api_key,
             base_url=config.base_url,
         )
@@ -97,14 +144,19 @@ class TopicExtractor:
 
         Returns:
             Dict with topic_timestamps, main_topics, summary, questions, long_pauses.
-            Optionally "usage" (prompt_tokens, completion_tokens, total_tokens) if API returns it.
+            "prompt" holds estimated transcript tokens before/after compaction.
+            Optionally "usage" (prompt_tokens, completion_tokens, total_tokens, and the provider's
+            prompt_cache_hit_tokens/prompt_cache_miss_tokens when reported) if API returns it,
+            and "cache" (hits, misses, hit_rate, saved_tokens) when a response cache is set.
         """
         if not segments:
             raise ValueError("Segments are required for topic extraction")
 
         gran = _normalize_granularity(granularity)
+        self.cache_stats = {"hits": 0, "misses": 0, "saved_tokens": 0}
 
         total_duration = max(seg.get("end", seg.get("start", 0)) for seg in segments) if segments else 0.0
+        self._total_duration = total_duration
         duration_minutes = total_duration / 60
         min_topics, max_topics = self._calculate_topic_range(duration_minutes, granularity=gran)
 
@@ -114,20 +166,39 @@ class TopicExtractor:
             f"range={min_topics}-{max_topics}{context_info}"
         )
 
-        transcript_with_timestamps = self._format_transcript_with_timestamps(segments)
+        transcript_lines = self._transcript_lines(segments)
+        prompt_stats = self._prompt_stats(segments, transcript_lines)
+        logger.info(
+            f"Transcript compacted: segments={prompt_stats['segments']} -> blocks={prompt_stats['blocks']} | "
+            f"tokens≈{prompt_stats['transcript_tokens_before']} -> {prompt_stats['transcript_tokens_after']} "
+            f"(-{prompt_stats['reduction_pct']}%)"
+        )
 
         try:
-            result = await self._analyze_full_transcript(
-                transcript_with_timestamps,
-                total_duration,
-                recording_topic,
-                min_topics,
-                max_topics,
-                granularity=gran,
-                segments=segments,
-                language=language,
-                questions_count=questions_count,
-            )
+            if _te.chunked_min_minutes and duration_minutes > _te.chunked_min_minutes:
+                result = await self._analyze_chunked(
+                    segments,
+                    total_duration,
+                    recording_topic,
+                    min_topics,
+                    max_topics,
+                    granularity=gran,
+                    language=language,
+                    questions_count=questions_count,
+                    transcript_lines=transcript_lines,
+                )
+            else:
+                result = await self._analyze_full_transcript(
+                    "\n".join(line for _, line in transcript_lines),
+                    total_duration,
+                    recording_topic,
+                    min_topics,
+                    max_topics,
+                    granularity=gran,
+                    segments=segments,
+                    language=language,
+                    questions_count=questions_count,
+                )
 
             main_topics = result.get("main_topics", [])
             topic_timestamps = result.get("topic_timestamps", [])
@@ -146,9 +217,12 @@ class TopicExtractor:
                 "summary": result.get("summary", ""),
                 "questions": result.get("questions", []),
                 "long_pauses": result.get("long_pauses", []),
+                "prompt": prompt_stats,
             }
             if "usage" in result:
                 out["usage"] = result["usage"]
+            if self.response_cache is not None:
+                out["cache"] = self._cache_report()
             return out
         except Exception as error:
             logger.exception(f"Failed to extract topics: error={error}", error=str(error))
@@ -203,8 +277,17 @@ class TopicExtractor:
 
     def _format_transcript_with_timestamps(self, segments: list[dict]) -> str:
         """Format transcript with timestamps, filtering noise."""
+        return "\n".join(line for _, line in self._transcript_lines(segments))
+
+    def _transcript_lines(self, segments: list[dict], compact: bool | None = None) -> list[tuple[float, str]]:
+        """Timestamped transcript lines as (start, "HH:MM:SS text"), noise filtered.
+
+        With ``compact`` (default ``TOPIC_COMPACT_TRANSCRIPT``) segments are merged into
+        blocks and fillers/repeats dropped (``prompt_builder.compact_segments``).
+        """
+        compact = _te.compact_transcript if compact is None else compact
         exclude_from, exclude_to = self._detect_noise_window(segments)
-        segments_text = []
+        kept: list[tuple[float, float, str]] = []
 
         for seg in segments:
             start = seg.get("start", 0)
@@ -218,10 +301,30 @@ class TopicExtractor:
             if exclude_from is not None and exclude_from <= start <= exclude_to:
                 continue
 
-            time_str = self._format_time(start)
-            segments_text.append(f"{time_str} {text}")
+            kept.append((start, seg.get("end", start), text))
+
+        if compact:
+            blocks = compact_segments(
+                kept,
+                min_block_seconds=_te.compact_block_min_seconds,
+                max_block_seconds=_te.compact_block_max_seconds,
+            )
+            kept = [(block.start, block.end, block.text) for block in blocks]
 
-        return "\n".join(segments_text)
+        return [(start, f"{self._format_time(start)} {text}") for start, _, text in kept]
+
+    def _prompt_stats(self, segments: list[dict], lines: list[tuple[float, str]]) -> dict[str, Any]:
+        """Estimated transcript tokens per segment line vs. the compacted lines sent."""
+        raw = self._transcript_lines(segments, compact=False)
+        before = estimate_tokens("\n".join(line for _, line in raw))
+        after = estimate_tokens("\n".join(line for _, line in lines))
+        return {
+            "segments": len(raw),
+            "blocks": len(lines),
+            "transcript_tokens_before": before,
+            "transcript_tokens_after": after,
+            "reduction_pct": round(100 * (1 - after / before), 1) if before else 0.0,
+        }
 
     def _detect_noise_window(self, segments: list[dict]) -> tuple[float | None, float | None]:
         """Detect long noise window in segments."""
@@ -302,34 +405,24 @@ class TopicExtractor:
         max_topics = max(min_topics, min(_te.topic_count_max_cap, math.floor(duration_minutes / d_min)))
         return min_topics, max_topics
 
-    async def _analyze_full_transcript(
+    def _build_prompt_params(
         self,
-        transcript: str,
         total_duration: float,
-        recording_topic: str | None = None,
-        min_topics: int = 10,
-        max_topics: int = 30,
-        granularity: Granularity | str = Granularity.LONG,
-        segments: list[dict] | None = None,
-        language: str | None = None,
-        questions_count: int = 3,
-    ) -> dict[str, Any]:
-        """
-        Analyze transcript via DeepSeek/Fireworks.
-
-        Args:
-            transcript: Full transcript with timestamps.
-            total_duration: Video duration in seconds.
-            recording_topic: Course/subject name.
-            granularity: Topic density.
+        recording_topic: str | None,
+        min_topics: int,
+        max_topics: int,
+        granularity: Granularity | str,
+        segments: list[dict] | None,
+        language: str | None,
+        questions_count: int,
+    ) -> tuple[bool, dict[str, Any], list[dict]]:
+        """Template params shared by the single-pass and reduce prompts.
 
         Returns:
-            Dict with main_topics, topic_timestamps, summary, questions, long_pauses.
-            Optional "usage" if API returns it (OpenAI-compatible: prompt_tokens, completion_tokens, total_tokens).
+            (is_en, prompt params without "transcript", long pauses)
         """
         summary_language = (language or "").strip().lower() or "ru"
         is_en = summary_language.startswith("en")
-        system_prompt = SYSTEM_PROMPT_EN if is_en else SYSTEM_PROMPT
 
         context_line = ""
         if recording_topic:
@@ -407,57 +500,230 @@ class TopicExtractor:
             "max_topics": max_topics,
             "min_spacing_minutes": min_spacing_minutes,
             "questions_count": questions_count,
-            "transcript": transcript,
             "duration_rule": duration_rule,
             "duration_min": d_min,
             "duration_max": d_max,
             "duration_range": f"{d_min}–{d_max}",
             "split_instruction": split_instruction,
         }
-        template = TOPIC_EXTRACTION_PROMPT_EN if is_en else TOPIC_EXTRACTION_PROMPT
-        prompt = template.format(**prompt_params)
+        return is_en, prompt_params, long_pauses
 
-        try:
-            usage: dict[str, int] | None = None
-            response = await self.client.chat.completions.create(
-                model=self.config.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt},
-                ],
-                **self.config.to_request_params(),
+    async def _complete(self, system_prompt: str, prompt: str) -> tuple[str, dict[str, int] | None]:
+        """One chat completion, served from the response cache when possible.
+
+        Returns (content, usage or None); usage is None for a cache hit (no tokens spent).
+        """
+        params = self.config.to_request_params()
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = llm_cache_key(
+                system_prompt=system_prompt, prompt=prompt, model=self.config.model, params=params
             )
-            if not hasattr(response, "choices") or not response.choices:
-                error_msg = f"Unexpected DeepSeek API response format: type={type(response)}, value={response}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            content = response.choices[0].message.content.strip()
-            if hasattr(response, "usage") and response.usage is not None:
-                u = response.usage
-                usage = {
-                    "prompt_tokens": getattr(u, "prompt_tokens", 0) or 0,
-                    "completion_tokens": getattr(u, "completion_tokens", 0) or 0,
-                    "total_tokens": getattr(u, "total_tokens", 0) or 0,
-                }
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                return cached["content"], None
+
+        async with self.request_limiter or contextlib.nullcontext():
+            content, usage = await self._request_completion(system_prompt, prompt, params)
+        if cache_key is not None and content:
+            await self._cache_put(cache_key, content, usage)
+        return content, usage
+
+    async def _cache_get(self, cache_key: str) -> dict[str, Any] | None:
+        cache = self.response_cache
+        if cache is None:
+            return None
+        if self.bypass_cache:
+            llm_cache_lookups_total.labels(result="bypass").inc()
+            return None
+        try:
+            async with self._cache_lock:
+                cached = await cache.get(cache_key)
+        except Exception as exc:
+            logger.warning(f"LLM cache lookup failed (ignored): {exc!r}")
+            return None
+
+        if cached is None:
+            self.cache_stats["misses"] += 1
+            llm_cache_lookups_total.labels(result="miss").inc()
+            return None
+        saved = (cached.get("usage") or {}).get("total_tokens", 0)
+        self.cache_stats["hits"] += 1
+        self.cache_stats["saved_tokens"] += saved
+        llm_cache_lookups_total.labels(result="hit").inc()
+        llm_cache_saved_tokens_total.inc(saved)
+        return cached
+
+    async def _cache_put(self, cache_key: str, content: str, usage: dict[str, int] | None) -> None:
+        cache = self.response_cache
+        if cache is None:
+            return
+        try:
+            async with self._cache_lock:
+                await cache.put(
+                    cache_key,
+                    model=self.config.model,
+                    content=content,
+                    usage=usage,
+                    ttl=timedelta(days=_te.response_cache_ttl_days),
+                )
+        except Exception as exc:
+            logger.warning(f"LLM cache store failed (ignored): {exc!r}")
 
-            if not content:
-                return {"main_topics": [], "topic_timestamps": [], "summary": "", "questions": [], "usage": usage}
+    def _cache_report(self) -> dict[str, Any]:
+        """Hit rate and saved tokens of this extraction, reported next to ``usage``."""
+        lookups = self.cache_stats["hits"] + self.cache_stats["misses"]
+        return {
+            **self.cache_stats,
+            "hit_rate": round(self.cache_stats["hits"] / lookups, 3) if lookups else 0.0,
+            "bypassed": self.bypass_cache,
+        }
 
-            logger.debug(
-                f"Response: length={len(content)} | preview={content[:500]}..."
-                + (f" | tokens={usage}" if usage else "")
-            )
+    async def _request_completion(
+        self, system_prompt: str, prompt: str, params: dict[str, Any]
+    ) -> tuple[str, dict[str, int] | None]:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+        if self.stream:
+            return await self._stream_completion(messages, params)
+
+        response = await self.client.chat.completions.create(model=self.config.model, messages=messages, **params)
+        if not hasattr(response, "choices") or not response.choices:
+            error_msg = f"Unexpected DeepSeek API response format: type={type(response)}, value={response}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        content = (response.choices[0].message.content or "").strip()
+        return content, self._usage_dict(getattr(response, "usage", None))
+
+    async def _stream_completion(
+        self, messages: list[dict[str, str]], params: dict[str, Any]
+    ) -> tuple[str, dict[str, int] | None]:
+        """Streamed chat completion with incremental topic parsing and progress reports.
+
+        Raises MalformedStreamError or TimeoutError (stream closed, nothing cached).
+        """
+        stream = await self.client.chat.completions.create(
+            model=self.config.model,
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True},
+            **params,
+        )
+        parser = TopicStreamParser(
+            lambda line: self._parse_topic_line(line, self._total_duration),
+            malformed_line_limit=_te.stream_malformed_line_limit,
+        )
+        parts: list[str] = []
+        usage = None
+        chunks = 0
+        started = last_report = time.monotonic()
 
-            parsed = self._parse_structured_response(content, total_duration, questions_count)
-            parsed["long_pauses"] = long_pauses
-            if usage is not None:
-                parsed["usage"] = usage
-            logger.info(
-                f"Parsed result: main_topics={len(parsed.get('main_topics', []))} | "
-                f"topic_timestamps={len(parsed.get('topic_timestamps', []))} | total_duration={total_duration}s"
+        try:
+            iterator = aiter(stream)
+            while True:
+                try:
+                    async with asyncio.timeout(_te.stream_idle_timeout_seconds):
+                        chunk = await anext(iterator)
+                except StopAsyncIteration:
+                    break
+                if getattr(chunk, "usage", None) is not None:
+                    usage = chunk.usage
+                if not chunk.choices or not (delta := chunk.choices[0].delta.content):
+                    continue
+                chunks += 1
+                parts.append(delta)
+                new_topics = parser.feed(delta)
+                now = time.monotonic()
+                if new_topics or now - last_report >= _te.stream_progress_interval_seconds:
+                    last_report = now
+                    self._report_stream_progress(parser.topics, chunks, now - started)
+        except MalformedStreamError:
+            llm_stream_aborts_total.labels(reason="malformed").inc()
+            logger.warning(f"Stream aborted: malformed output after {chunks} chunks")
+            raise
+        except TimeoutError:
+            llm_stream_aborts_total.labels(reason="stalled").inc()
+            logger.warning(f"Stream aborted: no data for {_te.stream_idle_timeout_seconds}s after {chunks} chunks")
+            raise
+        finally:
+            await stream.close()
+
+        parser.close()
+        elapsed = time.monotonic() - started
+        usage_dict = self._usage_dict(usage)
+        self._report_stream_progress(parser.topics, usage_dict["completion_tokens"] if usage_dict else chunks, elapsed)
+        logger.info(f"Stream finished: chunks={chunks} | topics={len(parser.topics)} | elapsed={elapsed:.1f}s")
+        return "".join(parts).strip(), usage_dict
+
+    def _report_stream_progress(self, topics: list[dict], completion_tokens: int, elapsed: float) -> None:
+        """Partial topics and throughput of the running stream; callback errors are ignored."""
+        if self.on_progress is None:
+            return
+        try:
+            self.on_progress(
+                {
+                    "topics": [dict(topic) for topic in topics],
+                    "completion_tokens": completion_tokens,
+                    "tokens_per_second": round(completion_tokens / elapsed, 1) if elapsed > 0 else 0.0,
+                    "elapsed_seconds": round(elapsed, 1),
+                }
             )
+        except Exception as exc:
+            logger.warning(f"Stream progress callback failed (ignored): {exc!r}")
 
-            return parsed
+    @staticmethod
+    def _usage_dict(u: Any) -> dict[str, int] | None:
+        """OpenAI-compatible usage object → dict (None if the provider sent none)."""
+        if u is None:
+            return None
+        usage = {
+            "prompt_tokens": getattr(u, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(u, "completion_tokens", 0) or 0,
+            "total_tokens": getattr(u, "total_tokens", 0) or 0,
+        }
+        # DeepSeek context caching: prompt tokens served from the provider's prefix cache
+        for key in PROVIDER_CACHE_USAGE_KEYS:
+            if (value := getattr(u, key, None)) is not None:
+                usage[key] = value
+        return usage
+
+    async def _analyze_full_transcript(
+        self,
+        transcript: str,
+        total_duration: float,
+        recording_topic: str | None = None,
+        min_topics: int = 10,
+        max_topics: int = 30,
+        granularity: Granularity | str = Granularity.LONG,
+        segments: list[dict] | None = None,
+        language: str | None = None,
+        questions_count: int = 3,
+    ) -> dict[str, Any]:
+        """
+        Analyze transcript via DeepSeek/Fireworks.
+
+        Args:
+            transcript: Full transcript with timestamps.
+            total_duration: Video duration in seconds.
+            recording_topic: Course/subject name.
+            granularity: Topic density.
+
+        Returns:
+            Dict with main_topics, topic_timestamps, summary, questions, long_pauses.
+            Optional "usage" if API returns it (OpenAI-compatible: prompt_tokens, completion_tokens, total_tokens).
+        """
+        is_en, prompt_params, long_pauses = self._build_prompt_params(
+            total_duration, recording_topic, min_topics, max_topics, granularity, segments, language, questions_count
+        )
+        system_prompt = SYSTEM_PROMPT_EN if is_en else SYSTEM_PROMPT
+        template = TOPIC_EXTRACTION_PROMPT_EN if is_en else TOPIC_EXTRACTION_PROMPT
+        prompt = template.format(**prompt_params, transcript=transcript)
+
+        try:
+            content, usage = await self._complete(system_prompt, prompt)
+            return self._finish_analysis(content, usage, total_duration, questions_count, long_pauses)
 
         except Exception as error:
             logger.exception(f"Failed to analyze transcript: error={error}", error=str(error))
@@ -469,43 +735,170 @@ class TopicExtractor:
                 "long_pauses": [],
             }
 
-    def _detect_long_pauses(self, segments: list[dict], min_gap_minutes: float = 8.0) -> list[dict]:
+    async def _analyze_chunked(
+        self,
+        segments: list[dict],
+        total_duration: float,
+        recording_topic: str | None = None,
+        min_topics: int = 10,
+        max_topics: int = 30,
+        granularity: Granularity | str = Granularity.LONG,
+        language: str | None = None,
+        questions_count: int = 3,
+        transcript_lines: list[tuple[float, str]] | None = None,
+    ) -> dict[str, Any]:
         """
-        Find long pauses between segments.
+        Map-reduce analysis for transcripts too long for one prompt.
 
-        Args:
-            segments: List of segments (will be sorted by start).
-            min_gap_minutes: Minimum gap in minutes to report.
+        Map: each overlapping window yields a summary and candidate topics, at most
+        ``chunk_concurrency`` calls at a time. Reduce: one call merges the candidates
+        and partial summaries into the regular structured output (same parser,
+        same min_topics/max_topics and spacing rules as the single-pass prompt).
 
         Returns:
-            [{"start", "end", "duration_minutes"}, ...]
+            Same structure as _analyze_full_transcript; "usage" is summed over all calls.
         """
-        if not segments:
-            return []
+        is_en, prompt_params, long_pauses = self._build_prompt_params(
+            total_duration, recording_topic, min_topics, max_topics, granularity, segments, language, questions_count
+        )
+        system_prompt = SYSTEM_PROMPT_EN if is_en else SYSTEM_PROMPT
+        if transcript_lines is None:
+            transcript_lines = self._transcript_lines(segments)
+        windows = self._split_windows(transcript_lines, _te.chunk_window_minutes * 60, _te.chunk_overlap_minutes * 60)
+        logger.info(
+            f"Chunked topic extraction: windows={len(windows)} | concurrency={_te.chunk_concurrency} | "
+            f"window={_te.chunk_window_minutes}min | overlap={_te.chunk_overlap_minutes}min"
+        )
 
-        min_gap_seconds = min_gap_minutes * 60
-        pauses: list[dict] = []
+        semaphore = asyncio.Semaphore(_te.chunk_concurrency)
+        map_template = TOPIC_MAP_PROMPT_EN if is_en else TOPIC_MAP_PROMPT
+
+        async def analyze_window(window_start: float, window_end: float, transcript: str) -> dict[str, Any]:
+            prompt = map_template.format(
+                window_start=self._format_time(window_start),
+                window_end=self._format_time(window_end),
+                context_line=prompt_params["context_line"],
+                summary_language=prompt_params["summary_language"],
+                min_spacing_minutes=prompt_params["min_spacing_minutes"],
+                transcript=transcript,
+            )
+            async with semaphore:
+                content, usage = await self._complete(system_prompt, prompt)
+            parsed = self._parse_structured_response(content, total_duration, max_questions=0)
+            parsed["usage"] = usage
+            return parsed
 
-        sorted_segments = sorted(segments, key=lambda s: s.get("start", 0))
+        try:
+            results = await asyncio.gather(*(analyze_window(*window) for window in windows), return_exceptions=True)
+            parts: list[str] = []
+            usages: list[dict[str, int] | None] = []
+            for (window_start, window_end, _), result in zip(windows, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        f"Window analysis failed: window={self._format_time(window_start)}-"
+                        f"{self._format_time(window_end)} | error={result!r}"
+                    )
+                    continue
+                usages.append(result["usage"])
+                parts.append(self._format_window_outline(window_start, window_end, result))
 
-        for idx in range(len(sorted_segments) - 1):
-            current = sorted_segments[idx]
-            nxt = sorted_segments[idx + 1]
+            if not parts:
+                raise RuntimeError(f"All {len(windows)} transcript windows failed")
 
-            current_end = float(current.get("end", current.get("start", 0) or 0))
-            next_start = float(nxt.get("start", 0) or 0)
+            template = TOPIC_REDUCE_PROMPT_EN if is_en else TOPIC_REDUCE_PROMPT
+            prompt = template.format(**prompt_params, transcript="\n\n".join(parts))
+            content, usage = await self._complete(system_prompt, prompt)
+            usages.append(usage)
+            return self._finish_analysis(content, self._sum_usage(usages), total_duration, questions_count, long_pauses)
 
-            gap = next_start - current_end
-            if gap >= min_gap_seconds:
-                pauses.append(
-                    {
-                        "start": current_end,
-                        "end": next_start,
-                        "duration_minutes": gap / 60,
-                    }
-                )
+        except Exception as error:
+            logger.exception(f"Failed to analyze transcript (chunked): error={error}", error=str(error))
+            return {
+                "main_topics": [],
+                "topic_timestamps": [],
+                "summary": "",
+                "questions": [],
+                "long_pauses": [],
+            }
 
-        return pauses
+    def _finish_analysis(
+        self,
+        content: str,
+        usage: dict[str, int] | None,
+        total_duration: float,
+        questions_count: int,
+        long_pauses: list[dict],
+    ) -> dict[str, Any]:
+        """Parse the final response and attach pauses and usage."""
+        if not content:
+            return {"main_topics": [], "topic_timestamps": [], "summary": "", "questions": [], "usage": usage}
+
+        logger.debug(
+            f"Response: length={len(content)} | preview={content[:500]}..." + (f" | tokens={usage}" if usage else "")
+        )
+
+        parsed = self._parse_structured_response(content, total_duration, questions_count)
+        parsed["long_pauses"] = long_pauses
+        if usage is not None:
+            parsed["usage"] = usage
+        logger.info(
+            f"Parsed result: main_topics={len(parsed.get('main_topics', []))} | "
+            f"topic_timestamps={len(parsed.get('topic_timestamps', []))} | total_duration={total_duration}s"
+        )
+        return parsed
+
+    @staticmethod
+    def _split_windows(
+        lines: list[tuple[float, str]], window_seconds: float, overlap_seconds: float
+    ) -> list[tuple[float, float, str]]:
+        """Group timestamped lines into overlapping windows: [(start, end, text)].
+
+        Windows start every ``window - overlap`` seconds (overlap is capped at half
+        a window); empty windows (long pauses) are dropped.
+        """
+        if not lines:
+            return []
+        step = window_seconds - min(overlap_seconds, window_seconds / 2)
+        last_start = lines[-1][0]
+        windows: list[tuple[float, float, str]] = []
+        window_start = 0.0
+        while window_start <= last_start:
+            window_end = window_start + window_seconds
+            text = "\n".join(line for start, line in lines if window_start <= start < window_end)
+            if text:
+                windows.append((window_start, min(window_end, last_start), text))
+            window_start += step
+        return windows
+
+    def _format_window_outline(self, window_start: float, window_end: float, parsed: dict[str, Any]) -> str:
+        """Render one map result as an input block for the reduce prompt."""
+        lines = [f"### {self._format_time(window_start)}–{self._format_time(window_end)}"]
+        if parsed.get("summary"):
+            lines.append(parsed["summary"])
+        lines.extend(f"[{self._format_time(ts['start'])}] - {ts['topic']}" for ts in parsed.get("topic_timestamps", []))
+        return "\n".join(lines)
+
+    @staticmethod
+    def _sum_usage(usages: list[dict[str, int] | None]) -> dict[str, int] | None:
+        """Add up token usage of several calls (None if no call reported usage)."""
+        reported = [u for u in usages if u]
+        if not reported:
+            return None
+        keys = dict.fromkeys(key for u in reported for key in u)
+        return {key: sum(u.get(key, 0) for u in reported) for key in keys}
+
+    def _detect_long_pauses(self, segments: list[dict], min_gap_minutes: float = 8.0) -> list[dict]:
+        """
+        Find long pauses between segments.
+
+        Args:
+            segments: List of segments (will be sorted by start).
+            min_gap_minutes: Minimum gap in minutes to report.
+
+        Returns:
+            [{"start", "end", "duration_minutes"}, ...]
+        """
+        return detect_long_pauses(segments, min_gap_minutes * 60)
 
     @staticmethod
     def _format_time(seconds: float) -> str:
@@ -759,19 +1152,23 @@ class TopicExtractor:
             return h * 3600 + m * 60  # HH:MM
         return h * 60 + m  # MM:SS
 
+    def _parse_topic_line(self, line: str, total_duration: float) -> dict | None:
+        """One "[HH:MM:SS] - topic" line → {"topic", "start"}; None if no match or out of range."""
+        match = re.match(TIMESTAMP_PATTERN, _line_for_timestamp_match(line.strip()))
+        if not match:
+            return None
+        hours_str, minutes_str, seconds_str, topic = match.groups()
+        total_seconds = self._parse_timestamp_to_seconds(hours_str, minutes_str, seconds_str, total_duration)
+        if 0 <= total_seconds <= total_duration:
+            return {"topic": topic.strip(), "start": float(total_seconds)}
+        return None
+
     def _parse_all_timestamps(self, lines: list[str], total_duration: float) -> list[dict]:
         """Parse all lines with timestamps as fallback."""
         timestamps = []
         for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            match = re.match(TIMESTAMP_PATTERN, _line_for_timestamp_match(line))
-            if match:
-                hours_str, minutes_str, seconds_str, topic = match.groups()
-                total_seconds = self._parse_timestamp_to_seconds(hours_str, minutes_str, seconds_str, total_duration)
-                if 0 <= total_seconds <= total_duration:
-                    timestamps.append({"topic": topic.strip(), "start": float(total_seconds)})
+            if line.strip() and (parsed := self._parse_topic_line(line, total_duration)) is not None:
+                timestamps.append(parsed)
         return timestamps
 
     def _parse_simple_timestamps(self, text: str, total_duration: float) -> list[dict]:
@@ -1,6 +1,6 @@
 """File storage module for managing user media files"""
 
-from file_storage.backends.base import StorageBackend
+from file_storage.backends.base import PreconditionFailedError, StorageBackend
 from file_storage.backends.local import LocalStorageBackend
 from file_storage.backends.s3 import S3StorageBackend
 from file_storage.factory import create_storage_backend, get_storage_backend
@@ -8,6 +8,7 @@ from file_storage.path_builder import StoragePathBuilder, to_storage_key
 
 __all__ = [
     "LocalStorageBackend",
+    "PreconditionFailedError",
     "S3StorageBackend",
     "StorageBackend",
     "StoragePathBuilder",
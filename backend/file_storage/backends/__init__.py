@@ -1,11 +1,12 @@
 """Storage backend implementations"""
 
-from file_storage.backends.base import StorageBackend
+from file_storage.backends.base import PreconditionFailedError, StorageBackend
 from file_storage.backends.local import LocalStorageBackend
 from file_storage.backends.s3 import S3StorageBackend
 
 __all__ = [
     "LocalStorageBackend",
+    "PreconditionFailedError",
     "S3StorageBackend",
     "StorageBackend",
 ]
@@ -1,18 +1,23 @@
 """Abstract storage backend interface"""
 
+import hashlib
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
 from pathlib import Path
 
 import aiofiles
 
+from utils.upload_streams import iter_file_chunks
+
 
 class StorageBackend(ABC):
     """Abstract storage backend for file operations.
 
     Small artifacts (JSON, text, thumbnails) use ``save``/``load`` (bytes in memory).
     Large artifacts (video, audio) use ``save_file``/``download_to_file`` to stream
-    via local temp files — these have default impls but should be overridden by
-    storage backends that support native streaming (e.g. S3 multipart).
+    via local temp files. Every backend implements ``save_stream``; the other
+    streaming methods have default impls but should be overridden by storage
+    backends that support native streaming (e.g. S3 multipart).
     """
 
     @abstractmethod
@@ -35,13 +40,33 @@ class StorageBackend(ABC):
     async def get_size(self, path: str) -> int:
         """Get file size in bytes. Raises FileNotFoundError if not exists"""
 
+    @abstractmethod
+    async def load_versioned(self, path: str) -> tuple[bytes, str]:
+        """Load content plus an opaque version tag for ``save_if_match``.
+        Raises FileNotFoundError if not exists.
+        """
+
+    @abstractmethod
+    async def save_if_match(self, path: str, content: bytes, version: str | None) -> str:
+        """Compare-and-swap write: store ``content`` only if the object's current tag
+        equals ``version`` (``None``: only if the object does not exist yet).
+
+        Returns the new version tag. Raises PreconditionFailedError when the object
+        changed (or appeared) since it was read; the caller re-reads and retries.
+        """
+
+    @abstractmethod
+    async def save_stream(self, path: str, chunks: AsyncIterable[bytes]) -> str:
+        """Save an async stream of byte chunks, writing them incrementally (local
+        append, S3 multipart) so memory stays at one chunk regardless of size.
+        Raises StorageQuotaExceededError if quota exceeded.
+        """
+
     async def save_file(self, path: str, local_path: Path) -> str:
-        """Upload a local file to storage. Default impl reads bytes in memory;
-        override for streaming (S3 multipart, local move).
+        """Upload a local file to storage, read in fixed-size chunks into ``save_stream``.
+        Override when the backend has a cheaper native path (S3 upload_file, local move).
         """
-        async with aiofiles.open(local_path, "rb") as f:
-            content = await f.read()
-        return await self.save(path, content)
+        return await self.save_stream(path, iter_file_chunks(local_path))
 
     async def download_to_file(self, path: str, local_path: Path) -> None:
         """Download a stored object to a local file. Default impl loads bytes in memory;
@@ -52,6 +77,12 @@ class StorageBackend(ABC):
         async with aiofiles.open(local_path, "wb") as f:
             await f.write(content)
 
+    async def content_sha256(self, path: str) -> str:
+        """Hex SHA-256 of the stored object. Default impl loads bytes in memory;
+        override to hash while streaming. Raises FileNotFoundError if not exists.
+        """
+        return hashlib.sha256(await self.load(path)).hexdigest()
+
     async def presigned_url(self, path: str, expires_in: int = 3600, *, download_filename: str | None = None) -> str:
         """Generate a time-limited URL for direct client access.
 
@@ -101,3 +132,7 @@ class StorageBackend(ABC):
 
 class StorageQuotaExceededError(Exception):
     """Raised when storage quota is exceeded"""
+
+
+class PreconditionFailedError(Exception):
+    """Raised by ``save_if_match`` when the object changed since it was read"""
@@ -1,15 +1,22 @@
 """Local filesystem storage backend"""
 
+import asyncio
+import fcntl
+import hashlib
+import os
 import shutil
+from collections.abc import AsyncIterable
 from pathlib import Path
 
 import aiofiles
 
-from file_storage.backends.base import StorageBackend, StorageQuotaExceededError
+from file_storage.backends.base import PreconditionFailedError, StorageBackend, StorageQuotaExceededError
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+HASH_BLOCK_SIZE = 1024 * 1024
+
 
 class LocalStorageBackend(StorageBackend):
     """Local filesystem storage backend.
@@ -59,6 +66,33 @@ class LocalStorageBackend(StorageBackend):
 
         return str(full_path)
 
+    async def save_stream(self, path: str, chunks: AsyncIterable[bytes]) -> str:
+        """Write chunks to ``<name>.part`` as they arrive, then rename into place."""
+        max_bytes = self.max_size_gb * (1024**3) if self.max_size_gb else None
+        current_size = self._get_total_size() if max_bytes else 0
+
+        full_path = self._resolve(path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = full_path.with_name(full_path.name + ".part")
+
+        written = 0
+        try:
+            async with aiofiles.open(part_path, "wb") as f:
+                async for chunk in chunks:
+                    written += len(chunk)
+                    if max_bytes and current_size + written > max_bytes:
+                        raise StorageQuotaExceededError(
+                            f"Quota exceeded: {current_size / (1024**3):.2f}GB + "
+                            f"{written / (1024**3):.2f}GB+ > {self.max_size_gb}GB"
+                        )
+                    await f.write(chunk)
+            part_path.replace(full_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        return str(full_path)
+
     async def load(self, path: str) -> bytes:
         full_path = self._resolve(path)
         if not full_path.exists():
@@ -107,6 +141,48 @@ class LocalStorageBackend(StorageBackend):
         local_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(str(full_path), str(local_path))
 
+    async def load_versioned(self, path: str) -> tuple[bytes, str]:
+        """Content and its SHA-256 as the version tag (small JSON documents only)."""
+        content = await self.load(path)
+        return content, hashlib.sha256(content).hexdigest()
+
+    async def save_if_match(self, path: str, content: bytes, version: str | None) -> str:
+        """Check the tag and replace the file under an exclusive ``flock`` on its directory.
+
+        The lock is shared by all processes on the host (API and workers); the file
+        is written to ``<name>.tmp`` and renamed, so readers never see a partial file.
+        """
+        full_path = self._resolve(path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        return await asyncio.to_thread(self._swap_locked, full_path, content, version)
+
+    @staticmethod
+    def _swap_locked(full_path: Path, content: bytes, version: str | None) -> str:
+        dir_fd = os.open(full_path.parent, os.O_RDONLY)
+        try:
+            fcntl.flock(dir_fd, fcntl.LOCK_EX)
+            current = hashlib.sha256(full_path.read_bytes()).hexdigest() if full_path.exists() else None
+            if current != version:
+                raise PreconditionFailedError(f"Version mismatch for {full_path}: expected={version} current={current}")
+            tmp_path = full_path.with_name(full_path.name + ".tmp")
+            tmp_path.write_bytes(content)
+            tmp_path.replace(full_path)
+        finally:
+            os.close(dir_fd)  # releases the lock
+        return hashlib.sha256(content).hexdigest()
+
+    async def content_sha256(self, path: str) -> str:
+        """Hash the file in 1 MiB blocks."""
+        full_path = self._resolve(path)
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {full_path}")
+
+        digest = hashlib.sha256()
+        async with aiofiles.open(full_path, "rb") as f:
+            while block := await f.read(HASH_BLOCK_SIZE):
+                digest.update(block)
+        return digest.hexdigest()
+
     async def presigned_url(self, path: str, expires_in: int = 3600, *, download_filename: str | None = None) -> str:  # noqa: ARG002
         """For LOCAL backend, return a backend-served streaming endpoint URL.
 
@@ -1,15 +1,23 @@
 """S3-compatible object storage backend (AWS S3, Yandex Object Storage, MinIO)."""
 
+import hashlib
+from collections.abc import AsyncIterable
 from pathlib import Path
 
 import aioboto3
 from botocore.exceptions import ClientError
 
-from file_storage.backends.base import StorageBackend
+from file_storage.backends.base import PreconditionFailedError, StorageBackend
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+HASH_CHUNK_SIZE = 1024 * 1024
+# Conditional PutObject rejected: 412 when the ETag differs / key exists, 409 on a concurrent conditional write
+CONDITIONAL_WRITE_CONFLICTS = ("PreconditionFailed", "ConditionalRequestConflict", "412", "409")
+# S3 requires parts of at least 5 MiB (except the last one)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 class S3StorageBackend(StorageBackend):
     """S3-compatible storage backend.
@@ -67,6 +75,31 @@ class S3StorageBackend(StorageBackend):
                 raise
             return await response["Body"].read()
 
+    async def load_versioned(self, path: str) -> tuple[bytes, str]:
+        """Body and ETag of the object."""
+        key = self._key(path)
+        async with self._client() as s3:
+            try:
+                response = await s3.get_object(Bucket=self.bucket, Key=key)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                    raise FileNotFoundError(f"S3 key not found: {key}") from e
+                raise
+            return await response["Body"].read(), response["ETag"]
+
+    async def save_if_match(self, path: str, content: bytes, version: str | None) -> str:
+        """Conditional ``put_object``: ``If-Match: <etag>`` or ``If-None-Match: *`` for a new key."""
+        key = self._key(path)
+        condition = {"IfMatch": version} if version is not None else {"IfNoneMatch": "*"}
+        async with self._client() as s3:
+            try:
+                response = await s3.put_object(Bucket=self.bucket, Key=key, Body=content, **condition)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in CONDITIONAL_WRITE_CONFLICTS:
+                    raise PreconditionFailedError(f"S3 key changed since read: {key}") from e
+                raise
+            return response["ETag"]
+
     async def delete(self, path: str) -> bool:
         key = self._key(path)
         async with self._client() as s3:
@@ -102,6 +135,44 @@ class S3StorageBackend(StorageBackend):
                 raise
             return int(response["ContentLength"])
 
+    async def save_stream(self, path: str, chunks: AsyncIterable[bytes]) -> str:
+        """Multipart upload from a chunk stream; at most one part is buffered.
+
+        Bodies smaller than one part go out as a single ``put_object``.
+        """
+        key = self._key(path)
+        buffer = bytearray()
+        async with self._client() as s3:
+            upload_id: str | None = None
+            parts: list[dict] = []
+            try:
+                async for chunk in chunks:
+                    buffer += chunk
+                    if len(buffer) < MULTIPART_PART_SIZE:
+                        continue
+                    if upload_id is None:
+                        upload_id = (await s3.create_multipart_upload(Bucket=self.bucket, Key=key))["UploadId"]
+                    parts.append(await self._upload_part(s3, key, upload_id, len(parts) + 1, bytes(buffer)))
+                    buffer.clear()
+
+                if upload_id is None:
+                    await s3.put_object(Bucket=self.bucket, Key=key, Body=bytes(buffer))
+                    return path
+                if buffer:
+                    parts.append(await self._upload_part(s3, key, upload_id, len(parts) + 1, bytes(buffer)))
+                await s3.complete_multipart_upload(
+                    Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+                )
+            except BaseException:
+                if upload_id is not None:
+                    await s3.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+                raise
+        return path
+
+    async def _upload_part(self, s3, key: str, upload_id: str, number: int, body: bytes) -> dict:
+        response = await s3.upload_part(Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=body)
+        return {"ETag": response["ETag"], "PartNumber": number}
+
     async def save_file(self, path: str, local_path: Path) -> str:
         """Upload a local file using multipart (automatic for large files)."""
         key = self._key(path)
@@ -121,6 +192,21 @@ class S3StorageBackend(StorageBackend):
                     raise FileNotFoundError(f"S3 key not found: {key}") from e
                 raise
 
+    async def content_sha256(self, path: str) -> str:
+        """Hash the object body while streaming it (never held in memory)."""
+        key = self._key(path)
+        digest = hashlib.sha256()
+        async with self._client() as s3:
+            try:
+                response = await s3.get_object(Bucket=self.bucket, Key=key)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                    raise FileNotFoundError(f"S3 key not found: {key}") from e
+                raise
+            async for chunk in response["Body"].iter_chunks(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     async def presigned_url(self, path: str, expires_in: int = 3600, *, download_filename: str | None = None) -> str:
         """Generate a time-limited GET URL for direct browser access."""
         key = self._key(path)
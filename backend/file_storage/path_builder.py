@@ -23,6 +23,14 @@ class StoragePathBuilder:
     def temp_dir(self) -> Path:
         return self.base / "temp"
 
+    def partials_dir(self) -> Path:
+        """Partial downloads kept across task retries (``video_download_module.core.partial``)."""
+        return self.temp_dir() / "partials"
+
+    def scratch_dir(self) -> Path:
+        """Node-local copies of pipeline artifacts (node affinity), mirrored by storage key."""
+        return self.base / "scratch"
+
     def create_temp_file(self, prefix: str = "proc_", suffix: str = "") -> Path:
         """Create unique temp file path (creates directory if needed)"""
         temp_dir = self.temp_dir()
@@ -65,9 +73,17 @@ class StoragePathBuilder:
         return self.transcription_dir(user_slug, recording_id) / "master.json"
 
     def transcription_extracted(self, user_slug: int, recording_id: int) -> Path:
-        """Extraction results: topics, summary (from DeepSeek)."""
+        """Legacy extraction results file (all versions in one JSON); read-only fallback."""
         return self.transcription_dir(user_slug, recording_id) / "extracted.json"
 
+    def transcription_extracted_manifest(self, user_slug: int, recording_id: int) -> Path:
+        """Extraction versions index: active version and version list."""
+        return self.transcription_dir(user_slug, recording_id) / "extracted" / "manifest.json"
+
+    def transcription_extracted_version(self, user_slug: int, recording_id: int, version_id: str) -> Path:
+        """One extraction version: topics, summary, questions (from DeepSeek)."""
+        return self.transcription_dir(user_slug, recording_id) / "extracted" / "versions" / f"{version_id}.json"
+
     def calc_user_storage_bytes(self, user_slug: int) -> int:
         """Calculate total disk usage for a user's storage folder."""
         user_root = self.user_root(user_slug)
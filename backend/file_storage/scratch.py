@@ -0,0 +1,123 @@
+"""Node-local scratch copies of pipeline artifacts (node affinity).
+
+With affinity routing (``api.services.node_affinity``) a recording's download,
+trim and upload run on the same node. The stage that writes an artifact to
+storage also keeps a hard link of it here, and the next stage materializes
+its temp file from the scratch copy instead of downloading it back from S3.
+Storage stays the source of truth: a missing or stale copy falls back to the
+storage backend.
+
+Copies mirror storage keys (``<scratch>/users/user_000001/recordings/74/...``),
+so a recording's artifacts share one directory that is evicted as a whole.
+"""
+
+import os
+import shutil
+import time
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
+from config.settings import get_settings
+from file_storage.path_builder import StoragePathBuilder
+from logger import format_details, get_logger
+
+logger = get_logger(__name__)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link ``src`` to ``dst`` (copy across filesystems), replacing ``dst`` atomically."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    tmp.replace(dst)
+
+
+class ArtifactScratch:
+    """Local artifact copies under ``root``, keyed by storage key."""
+
+    def __init__(self, root: Path, max_bytes: int, ttl: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+    def path(self, key: str) -> Path:
+        return self.root / str(key).lstrip("/")
+
+    def keep(self, key: str, local_path: Path) -> None:
+        """Keep a copy of a file just written to storage. Best-effort: failures are logged."""
+        try:
+            _link_or_copy(local_path, self.path(key))
+        except OSError as e:
+            logger.warning(f"Scratch keep failed | {format_details(key=key, error=repr(e))}")
+
+    def materialize(self, key: str, local_path: Path, expected_size: int) -> bool:
+        """Link the scratch copy of ``key`` to ``local_path``. False on a miss or size mismatch."""
+        src = self.path(key)
+        try:
+            if src.stat().st_size != expected_size:
+                return False
+            local_path.unlink(missing_ok=True)
+            _link_or_copy(src, local_path)
+            os.utime(src.parent)  # recently used: evicted last
+        except OSError:
+            return False
+        return True
+
+    def recording_dirs(self) -> Iterator[tuple[int, Path]]:
+        """``(recording_id, directory)`` of every recording with scratch copies."""
+        for directory in self.root.glob("users/*/recordings/*"):
+            if directory.is_dir() and directory.name.isdigit():
+                yield int(directory.name), directory
+
+    def evict(self, directory: Path) -> int:
+        """Delete a recording's scratch directory. Returns the bytes freed."""
+        size = _dir_size(directory)
+        shutil.rmtree(directory, ignore_errors=True)
+        return size
+
+    def enforce_limits(self) -> int:
+        """Evict directories older than ``ttl``, then least recently used ones above ``max_bytes``."""
+        cutoff = time.time() - self.ttl
+        entries = []
+        freed = 0
+        for _, directory in self.recording_dirs():
+            mtime = directory.stat().st_mtime
+            if mtime < cutoff:
+                freed += self.evict(directory)
+            else:
+                entries.append((mtime, _dir_size(directory), directory))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, directory in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            freed += self.evict(directory)
+            total -= size
+        return freed
+
+
+def _dir_size(directory: Path) -> int:
+    return sum(f.stat().st_size for f in directory.rglob("*") if f.is_file())
+
+
+_scratch: ArtifactScratch | None = None
+
+
+def get_artifact_scratch() -> ArtifactScratch | None:
+    """Process-wide scratch, or None when node affinity is disabled."""
+    global _scratch
+    celery = get_settings().celery
+    if not celery.affinity_enabled:
+        return None
+    if _scratch is None:
+        _scratch = ArtifactScratch(
+            StoragePathBuilder().scratch_dir(),
+            max_bytes=celery.affinity_scratch_max_gb * 1024**3,
+            ttl=celery.affinity_scratch_ttl,
+        )
+    return _scratch
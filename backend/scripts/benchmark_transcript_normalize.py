@@ -0,0 +1,138 @@
+#!/usr/bin/env -S uv run python
+"""
+Benchmark transcript normalization: per-word loop vs NumPy columns.
+
+Generates synthetic AssemblyAI word lists (``--words``, default 50k/100k/150k
+words ≈ 5–15 h of speech) and times, for each size:
+  - words:    ``_extract_words_loop``          vs ``word_timeline(...).to_words()``
+  - segments: ``_build_segments_loop``         vs ``build_segments(timeline)``
+  - pauses:   ``_detect_long_pauses_loop``     vs ``detect_long_pauses``
+Outputs of both paths are compared before timing; the median of ``--repeats``
+runs is printed.
+
+Usage:
+  uv run python scripts/benchmark_transcript_normalize.py
+  uv run python scripts/benchmark_transcript_normalize.py --words 150000 --repeats 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transcription_module import normalize
+from transcription_module.normalize import build_segments, detect_long_pauses, word_timeline
+
+VOCABULARY = [
+    "лекция",
+    "градиент",
+    "функция",
+    "матрица",
+    "вектор",
+    "модель",
+    "обучение",
+    "данные",
+    "выборка",
+    "ошибка",
+    "gradient",
+    "model",
+    "и",
+    "в",
+    "что",
+    "это",
+    "вот",
+]
+PAUSE_GAP_SECONDS = 60.0
+
+
+def _synthetic_words(rng: random.Random, count: int) -> list[dict[str, Any]]:
+    """AssemblyAI-shaped words (ms): ~7% sentence ends, ~5% commas, rare long breaks."""
+    words = []
+    t = 0
+    for _ in range(count):
+        t += rng.randint(150, 450)
+        roll = rng.random()
+        if roll < 0.03:
+            t += rng.randint(500, 1500)
+        elif roll < 0.0302:
+            t += rng.randint(90_000, 600_000)
+        text = rng.choice(VOCABULARY)
+        punct = rng.random()
+        if punct < 0.07:
+            text += "."
+        elif punct < 0.12:
+            text += ","
+        words.append({"text": text, "start": t, "end": t + rng.randint(120, 400), "confidence": 0.9})
+    return words
+
+
+def _median_ms(fn: Callable[[], Any], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings)
+
+
+def run(word_counts: list[int], repeats: int, seed: int) -> None:
+    if normalize.np is None:
+        sys.exit("numpy is not installed: uv sync")
+
+    print(f"{'words':>8} {'stage':<9} {'loop ms':>9} {'numpy ms':>9} {'speedup':>8}")
+    for count in word_counts:
+        bench_size(count, repeats, seed)
+
+
+def bench_size(count: int, repeats: int, seed: int) -> None:
+    raw = _synthetic_words(random.Random(seed), count)
+    timeline = word_timeline(raw)
+    words = normalize._extract_words_loop(raw)
+    segments = normalize._build_segments_loop(words, 8.0, 0.4)
+
+    # Same output is a precondition for comparing timings
+    assert timeline.to_words() == words
+    assert build_segments(timeline) == segments
+    assert detect_long_pauses(segments, PAUSE_GAP_SECONDS) == normalize._detect_long_pauses_loop(
+        segments, PAUSE_GAP_SECONDS
+    )
+
+    stages = [
+        ("words", lambda: normalize._extract_words_loop(raw), lambda: word_timeline(raw).to_words()),
+        ("segments", lambda: normalize._build_segments_loop(words, 8.0, 0.4), lambda: build_segments(timeline)),
+        (
+            "pauses",
+            lambda: normalize._detect_long_pauses_loop(segments, PAUSE_GAP_SECONDS),
+            lambda: detect_long_pauses(segments, PAUSE_GAP_SECONDS),
+        ),
+    ]
+    loop_total = numpy_total = 0.0
+    for name, loop_fn, numpy_fn in stages:
+        loop_ms = _median_ms(loop_fn, repeats)
+        numpy_ms = _median_ms(numpy_fn, repeats)
+        loop_total += loop_ms
+        numpy_total += numpy_ms
+        print(f"{count:>8} {name:<9} {loop_ms:>9.1f} {numpy_ms:>9.1f} {loop_ms / numpy_ms:>7.2f}x")
+    print(f"{count:>8} {'total':<9} {loop_total:>9.1f} {numpy_total:>9.1f} {loop_total / numpy_total:>7.2f}x")
+    print(f"{'':>8} segments={len(segments)} pauses={len(detect_long_pauses(segments, PAUSE_GAP_SECONDS))}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, nargs="+", default=[50_000, 100_000, 150_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    run(args.words, args.repeats, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env -S uv run python
+"""
+Benchmark transcript full-text search over synthetic transcripts.
+
+Creates ``--recordings`` synthetic recordings (``--hours`` each) for an existing
+user, indexes them through TranscriptSearchRepository (same path as the
+transcription task), then times a query mix and prints p50/p95/max latency plus
+the EXPLAIN plan of the first query. Synthetic recordings are deleted at the end
+(CASCADE removes their segments) unless ``--keep``.
+
+Usage:
+  uv run python scripts/benchmark_transcript_search.py --user-id 01J... --recordings 2000 --hours 1.5
+  uv run python scripts/benchmark_transcript_search.py --user-id 01J... --recordings 200 --keep
+
+Requires .env with DATABASE_* and migration 040 applied.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import delete, text
+
+from api.dependencies import get_async_session_maker
+from api.repositories.transcript_search_repo import TranscriptSearchRepository
+from database.automation_models import AutomationJobModel  # noqa: F401 - UserModel.relationship
+from database.models import RecordingModel
+
+BENCH_PREFIX = "[search-bench]"
+SEGMENT_SECONDS = 7.5
+WORDS_PER_SEGMENT = 18
+
+VOCABULARY_RU = [
+    "лекция",
+    "градиент",
+    "функция",
+    "матрица",
+    "вектор",
+    "производная",
+    "интеграл",
+    "модель",
+    "обучение",
+    "данные",
+    "выборка",
+    "нейрон",
+    "слой",
+    "ошибка",
+    "оптимизация",
+    "регрессия",
+    "классификация",
+    "кластер",
+    "признак",
+    "вероятность",
+    "распределение",
+    "гипотеза",
+    "тест",
+    "среднее",
+    "дисперсия",
+    "алгоритм",
+    "сложность",
+    "граф",
+    "дерево",
+    "сортировка",
+    "память",
+    "процессор",
+]
+VOCABULARY_EN = [
+    "lecture",
+    "gradient",
+    "function",
+    "matrix",
+    "vector",
+    "derivative",
+    "integral",
+    "model",
+    "training",
+    "data",
+    "sample",
+    "neuron",
+    "layer",
+    "error",
+    "optimization",
+    "regression",
+    "classification",
+    "cluster",
+    "feature",
+    "probability",
+    "distribution",
+    "hypothesis",
+    "test",
+    "mean",
+    "variance",
+    "algorithm",
+    "complexity",
+    "graph",
+    "tree",
+    "sorting",
+    "memory",
+    "processor",
+]
+FILLER = ["и", "в", "на", "что", "это", "как", "мы", "вот", "то", "есть", "так", "the", "a", "of", "and", "to", "is"]
+
+QUERIES = (
+    "градиент",
+    "матрица вектор",
+    '"нейрон слой"',
+    "регрессия -классификация",
+    "gradient descent",
+    "probability distribution",
+    "алгоритм or algorithm",
+    "несуществующеслово",
+)
+
+
+def _synthetic_segments(rng: random.Random, hours: float, vocabulary: list[str]) -> list[dict]:
+    segments = []
+    for idx in range(int(hours * 3600 / SEGMENT_SECONDS)):
+        words = [rng.choice(vocabulary) if rng.random() < 0.4 else rng.choice(FILLER) for _ in range(WORDS_PER_SEGMENT)]
+        start = idx * SEGMENT_SECONDS
+        segments.append({"start": start, "end": start + SEGMENT_SECONDS, "text": " ".join(words)})
+    return segments
+
+
+async def populate(user_id: str, recordings: int, hours: float, seed: int) -> list[int]:
+    rng = random.Random(seed)
+    session_maker = get_async_session_maker()
+    recording_ids: list[int] = []
+    started = time.perf_counter()
+    total_segments = 0
+
+    for n in range(recordings):
+        language = "ru" if n % 4 else "en"
+        vocabulary = VOCABULARY_RU if language == "ru" else VOCABULARY_EN
+        async with session_maker() as session:
+            recording = RecordingModel(
+                user_id=user_id,
+                display_name=f"{BENCH_PREFIX} {n}",
+                start_time=datetime.now(UTC),
+                duration=hours * 3600,
+            )
+            session.add(recording)
+            await session.flush()
+            segments = _synthetic_segments(rng, hours, vocabulary)
+            total_segments += await TranscriptSearchRepository(session).replace_for_recording(
+                recording.id, user_id, segments, language
+            )
+            await session.commit()
+            recording_ids.append(recording.id)
+
+        if (n + 1) % 100 == 0:
+            print(f"  indexed {n + 1}/{recordings} recordings ({total_segments} segments)", flush=True)
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"Indexed {recordings} recordings / {recordings * hours:.0f} h / {total_segments} segments "
+        f"in {elapsed:.1f}s ({elapsed / max(recordings, 1) * 1000:.0f} ms per recording)"
+    )
+    return recording_ids
+
+
+async def run_queries(user_id: str, repeats: int, per_page: int) -> None:
+    session_maker = get_async_session_maker()
+    async with session_maker() as session:
+        await session.execute(text("ANALYZE transcript_segments"))
+        await session.commit()
+
+        repo = TranscriptSearchRepository(session)
+        print(f"\n{'query':<30} {'hits':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+        for query in QUERIES:
+            timings = []
+            hits = []
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                hits = await repo.search(user_id, query, limit=per_page)
+                timings.append((time.perf_counter() - t0) * 1000)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"{query:<30} {len(hits):>5} {statistics.median(timings):>8.1f} {p95:>8.1f} {timings[-1]:>8.1f}")
+
+        plan = await session.execute(
+            text(
+                "EXPLAIN (ANALYZE, BUFFERS) SELECT recording_id, start_time FROM transcript_segments "
+                "WHERE user_id = :user_id AND search_vector @@ "
+                "(websearch_to_tsquery('russian', :q) || websearch_to_tsquery('english', :q) "
+                "|| websearch_to_tsquery('simple', :q)) LIMIT :limit"
+            ),
+            {"user_id": user_id, "q": QUERIES[0], "limit": per_page},
+        )
+        print("\nEXPLAIN (first query, match only):")
+        for (line,) in plan.all():
+            print(f"  {line}")
+
+
+async def cleanup(recording_ids: list[int]) -> None:
+    session_maker = get_async_session_maker()
+    async with session_maker() as session:
+        await session.execute(delete(RecordingModel).where(RecordingModel.id.in_(recording_ids)))
+        await session.commit()
+    print(f"\nRemoved {len(recording_ids)} synthetic recordings")
+
+
+async def main(args: argparse.Namespace) -> None:
+    recording_ids = await populate(args.user_id, args.recordings, args.hours, args.seed)
+    try:
+        await run_queries(args.user_id, args.repeats, args.per_page)
+    finally:
+        if not args.keep:
+            await cleanup(recording_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark transcript full-text search on synthetic data")
+    parser.add_argument("--user-id", required=True, help="Existing users.id to own the synthetic recordings")
+    parser.add_argument("--recordings", type=int, default=1000, help="Number of synthetic recordings")
+    parser.add_argument("--hours", type=float, default=1.5, help="Transcript length per recording, hours")
+    parser.add_argument("--repeats", type=int, default=20, help="Runs per query")
+    parser.add_argument("--per-page", type=int, default=20, help="Hits per query")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Keep synthetic recordings after the run")
+    asyncio.run(main(parser.parse_args()))
@@ -1,8 +1,9 @@
 """Subtitle generator from transcriptions (SRT and VTT formats).
 
-Reads ``segments.txt`` and writes ``subtitles.srt``/``subtitles.vtt`` through the
-storage backend. All entries live entirely in-memory (subtitle files are small)
-so no temp files are required.
+Cues are built straight from word timings (``entries_from_words``) and rendered
+in memory; ``TranscriptionManager.derive_artifacts`` writes them next to the
+other transcript cache files. ``generate_from_transcription`` still reads a
+``segments.txt`` from storage for callers that only have that file.
 """
 
 import io
@@ -89,6 +90,60 @@ class SubtitleGenerator:
                 logger.warning(f"Error parsing line {line_num}: {line[:50]} - {e}")
         return entries
 
+    # -------------------------------------------------------------- from words
+    def entries_from_words(self, words: list[dict], segments: list[dict]) -> list[SubtitleEntry]:
+        """Build cues from word timings; segments (sentences) only force breaks.
+
+        A cue ends at a sentence end, before a pause longer than ``PAUSE_THRESHOLD``,
+        when it would last over ``MAX_SUBTITLE_DURATION`` or when the next word would
+        not fit in ``max_lines`` lines. Without words, one cue per segment.
+        """
+        if not words:
+            return [
+                SubtitleEntry(timedelta(seconds=seg["start"]), timedelta(seconds=seg["end"]), seg["text"])
+                for seg in segments
+                if seg.get("text", "").strip()
+            ]
+
+        entries: list[SubtitleEntry] = []
+        sentence_ends = [seg["end"] for seg in segments]
+        boundary = 0
+        cue: list[dict] = []
+
+        def flush() -> None:
+            if cue:
+                start, end = cue[0]["start"], max(cue[-1]["end"], cue[0]["start"] + 0.1)
+                text = " ".join(w["word"] for w in cue)
+                entries.append(SubtitleEntry(timedelta(seconds=start), timedelta(seconds=end), text))
+                cue.clear()
+
+        for word in words:
+            midpoint = (word["start"] + word["end"]) / 2
+            crossed = False
+            while boundary < len(sentence_ends) and midpoint >= sentence_ends[boundary]:
+                boundary += 1
+                crossed = True
+            if cue and (
+                crossed
+                or word["start"] - cue[-1]["end"] > self.PAUSE_THRESHOLD
+                or word["end"] - cue[0]["start"] > self.MAX_SUBTITLE_DURATION
+                or not self._fits([*(w["word"] for w in cue), word["word"]])
+            ):
+                flush()
+            cue.append(word)
+        flush()
+        return entries
+
+    def _fits(self, tokens: list[str]) -> bool:
+        """Whether ``tokens`` wrap into at most ``max_lines`` lines (same wrapping as ``_split_text``)."""
+        lines, length = 1, -1
+        for token in tokens:
+            if length >= 0 and length + 1 + len(token) > self.max_chars_per_line:
+                lines, length = lines + 1, len(token)
+            else:
+                length += 1 + len(token)
+        return lines <= self.max_lines
+
     # ----------------------------------------------------------------- format
     def _format_timedelta(self, td: timedelta, separator: str = ",") -> str:
         """Format timedelta as HH:MM:SS{separator}mmm"""
@@ -158,6 +213,14 @@ class SubtitleGenerator:
             buf.write("\n")
         return buf.getvalue()
 
+    def render(self, entries: list[SubtitleEntry], fmt: str) -> str:
+        """Render entries as ``srt`` or ``vtt``."""
+        if fmt == "srt":
+            return self._render_srt(entries)
+        if fmt == "vtt":
+            return self._render_vtt(entries)
+        raise ValueError(f"Unsupported subtitle format: {fmt}")
+
     # ------------------------------------------------------------------- main
     async def generate_from_transcription(
         self,
@@ -0,0 +1,174 @@
+"""Local fake of the AssemblyAI REST API for tests.
+
+Serves the subset LEAP uses (``/v2/upload``, ``/v2/transcript``, ``/v2/transcript/{id}``,
+``/v2/transcript/{id}/sentences``) from a real uvicorn server on 127.0.0.1, so the
+service code runs unmodified with ``base_url`` pointed at it.
+
+Each submitted audio URL is transcribed into a deterministic script: ``words_for``
+(audio_url -> list of words) decides the words, spaced ``WORD_MS`` apart; sentences
+end at words with terminal punctuation. Uploaded bodies are kept in ``uploads``
+(upload_url -> bytes), so a script can depend on what was uploaded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+
+WORD_MS = 500
+
+
+def _default_words(audio_url: str) -> list[str]:
+    return ["Hello", "world.", "This", "is", "a", "lecture."]
+
+
+class FakeASRServer:
+    """AssemblyAI stand-in. Use as a context manager; ``base_url`` is set once started."""
+
+    def __init__(
+        self,
+        *,
+        polls_until_done: int = 1,
+        words_for: Callable[[str], list[str]] = _default_words,
+        failing_audio_urls: set[str] | None = None,
+        processing_delay: float = 0.0,
+    ) -> None:
+        self.polls_until_done = polls_until_done
+        self.words_for = words_for
+        self.failing_audio_urls = failing_audio_urls or set()
+        self.processing_delay = processing_delay
+
+        self.transcripts: dict[str, dict[str, Any]] = {}
+        self.uploads: dict[str, bytes] = {}
+        self.active_jobs = 0
+        self.max_active_jobs = 0
+        self.base_url = ""
+
+        self._lock = threading.Lock()
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+        self.app = self._build_app()
+
+    # ------------------------------------------------------------------ app
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.post("/v2/upload")
+        async def upload(request: Request) -> dict:
+            body = await request.body()
+            with self._lock:
+                upload_url = f"{self.base_url}/uploads/{len(self.uploads) + 1}"
+                self.uploads[upload_url] = body
+            return {"upload_url": upload_url}
+
+        @app.post("/v2/transcript")
+        async def submit(request: Request) -> dict:
+            payload = await request.json()
+            transcript_id = uuid.uuid4().hex
+            with self._lock:
+                self.transcripts[transcript_id] = {"payload": payload, "polls": 0, "submitted_at": time.monotonic()}
+                self.active_jobs += 1
+                self.max_active_jobs = max(self.max_active_jobs, self.active_jobs)
+            return {"id": transcript_id, "status": "queued"}
+
+        @app.get("/v2/transcript/{transcript_id}")
+        async def get_transcript(transcript_id: str) -> dict:
+            job = self._job(transcript_id)
+            job["polls"] += 1
+            if self.processing_delay:
+                await asyncio.sleep(self.processing_delay)
+            return self._render(transcript_id, job)
+
+        @app.get("/v2/transcript/{transcript_id}/sentences")
+        async def sentences(transcript_id: str) -> dict:
+            job = self._job(transcript_id)
+            words = self._words(job)
+            result: list[dict[str, Any]] = []
+            current: list[dict[str, Any]] = []
+            for w in words:
+                current.append(w)
+                if w["text"].endswith((".", "?", "!")):
+                    result.append(self._sentence(current))
+                    current = []
+            if current:
+                result.append(self._sentence(current))
+            return {"sentences": result}
+
+        return app
+
+    def _job(self, transcript_id: str) -> dict[str, Any]:
+        job = self.transcripts.get(transcript_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Transcript not found")
+        return job
+
+    def _words(self, job: dict[str, Any]) -> list[dict[str, Any]]:
+        words = self.words_for(job["payload"]["audio_url"])
+        return [
+            {"text": w, "start": i * WORD_MS, "end": i * WORD_MS + WORD_MS - 50, "confidence": 0.99}
+            for i, w in enumerate(words)
+        ]
+
+    @staticmethod
+    def _sentence(words: list[dict[str, Any]]) -> dict[str, Any]:
+        return {"text": " ".join(w["text"] for w in words), "start": words[0]["start"], "end": words[-1]["end"]}
+
+    def _render(self, transcript_id: str, job: dict[str, Any]) -> dict[str, Any]:
+        payload = job["payload"]
+        if job["polls"] < self.polls_until_done:
+            return {"id": transcript_id, "status": "processing"}
+
+        with self._lock:
+            if not job.get("done"):
+                job["done"] = True
+                self.active_jobs -= 1
+
+        if payload["audio_url"] in self.failing_audio_urls:
+            return {"id": transcript_id, "status": "error", "error": "Audio file could not be decoded"}
+
+        words = self._words(job)
+        return {
+            "id": transcript_id,
+            "status": "completed",
+            "text": " ".join(w["text"] for w in words),
+            "words": words,
+            "language_code": payload.get("language_code") or "en",
+        }
+
+    # ------------------------------------------------------------ lifecycle
+
+    def start(self) -> FakeASRServer:
+        config = uvicorn.Config(self.app, host="127.0.0.1", port=0, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Fake ASR server did not start")
+            time.sleep(0.01)
+
+        port = self._server.servers[0].sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.should_exit = True
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> FakeASRServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
@@ -0,0 +1,179 @@
+"""In-memory stand-in for the sync ``redis.Redis`` client (``decode_responses=True``).
+
+Covers the commands of the Redis-backed services (node affinity, fair-share
+queues, pipeline slots, pending transcripts, queue age metrics). Values live in
+plain dicts per type (``strings``, ``hashes``, ``lists``, ``zsets``, ``sets``)
+that tests may inspect or edit directly. TTLs are accepted and ignored;
+``transaction`` runs the callable once against the client itself (under a
+lock, so it stays atomic for callers on threads), and ``pipeline`` queues
+calls until ``execute``.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _stores(self) -> tuple[dict, ...]:
+        return self.strings, self.hashes, self.lists, self.zsets, self.sets
+
+    # --- keys -------------------------------------------------------------------
+
+    def exists(self, key):
+        return int(any(key in store for store in self._stores()))
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if any(store.pop(key, None) is not None for store in self._stores()))
+
+    def expire(self, key, seconds):  # noqa: ARG002
+        return self.exists(key)
+
+    def scan_iter(self, match, count=None):  # noqa: ARG002
+        return [key for store in self._stores() for key in list(store) if fnmatch.fnmatch(key, match)]
+
+    # --- strings ----------------------------------------------------------------
+
+    def get(self, key):
+        return self.strings.get(key)
+
+    def set(self, key, value, nx=False, ex=None):  # noqa: ARG002
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = str(value)
+        return True
+
+    # --- hashes -----------------------------------------------------------------
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value)
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hdel(self, key, field):
+        return 1 if self.hashes.get(key, {}).pop(field, None) is not None else 0
+
+    def hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+    # --- lists ------------------------------------------------------------------
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+        return len(self.lists[key])
+
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+        return len(self.lists[key])
+
+    def lpop(self, key):
+        items = self.lists.get(key)
+        return items.pop(0) if items else None
+
+    def lindex(self, key, index):
+        items = self.lists.get(key, [])
+        return items[index] if -len(items) <= index < len(items) else None
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    # --- sorted sets ------------------------------------------------------------
+
+    def zadd(self, key, mapping, nx=False, xx=False, ch=False):  # noqa: ARG002
+        zset = self.zsets.setdefault(key, {})
+        changed = 0
+        for member, score in mapping.items():
+            if (nx and member in zset) or (xx and member not in zset):
+                continue
+            zset[member] = float(score)
+            changed += 1
+        if not zset:
+            del self.zsets[key]
+        return changed
+
+    def zrem(self, key, member):
+        zset = self.zsets.get(key, {})
+        removed = 1 if zset.pop(member, None) is not None else 0
+        if key in self.zsets and not zset:
+            del self.zsets[key]
+        return removed
+
+    def zscore(self, key, member):
+        return self.zsets.get(key, {}).get(member)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zcount(self, key, low, high):
+        return sum(1 for score in self.zsets.get(key, {}).values() if float(low) <= score <= float(high))
+
+    def zrange(self, key, start, end, withscores=False):
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+        ordered = ordered[start:] if end == -1 else ordered[start : end + 1]
+        return ordered if withscores else [member for member, _ in ordered]
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        doomed = [member for member, score in zset.items() if float(low) <= score <= float(high)]
+        for member in doomed:
+            del zset[member]
+        return len(doomed)
+
+    # --- sets -------------------------------------------------------------------
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    # --- transactions -----------------------------------------------------------
+
+    def transaction(self, func: Callable[[FakeRedis], Any], *keys, value_from_callable=False):  # noqa: ARG002
+        with self._lock:
+            return func(self)
+
+    def multi(self) -> None:
+        pass
+
+    def pipeline(self, transaction=True):  # noqa: ARG002
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    """Queues commands and runs them in order on ``execute``."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[Callable[[], Any]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        command = getattr(self._redis, name)
+
+        def queue(*args, **kwargs) -> None:
+            self._ops.append(lambda: command(*args, **kwargs))
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        return [op() for op in self._ops]
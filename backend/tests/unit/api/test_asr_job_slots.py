@@ -0,0 +1,80 @@
+"""Per-account AssemblyAI job slots: leased account_concurrency semaphore shared by workers."""
+
+import asyncio
+import time
+
+import pytest
+
+from api.services.asr_job_slots import AsrJobSlots, account_id
+from tests.fixtures.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def slots():
+    return AsrJobSlots(FakeRedis(), lease_seconds=120)
+
+
+def _key(api_key: str) -> str:
+    return f"leap:asr:jobs:{account_id(api_key)}"
+
+
+@pytest.mark.unit
+class TestAsrJobSlots:
+    def test_account_id_hides_key(self):
+        """The Redis key is derived from the API key without containing it."""
+        assert account_id("aai_secret") == account_id("aai_secret")
+        assert account_id("aai_secret") != account_id("aai_other")
+        assert "aai_secret" not in account_id("aai_secret")
+
+    def test_limit_enforced_per_account(self, slots):
+        """Each account is capped separately."""
+        assert slots.acquire("a1", "t1", limit=2)
+        assert slots.acquire("a1", "t2", limit=2)
+        assert not slots.acquire("a1", "t3", limit=2)
+        assert slots.acquire("a2", "t3", limit=2)
+        assert slots.usage("a1") == 2
+
+    def test_expired_lease_frees_slot(self, slots):
+        """A chunk whose worker died stops counting once its lease runs out."""
+        slots.acquire("a1", "t1", limit=1)
+        slots.redis.zsets["leap:asr:jobs:a1"]["t1"] = time.time() - 1
+
+        assert slots.acquire("a1", "t2", limit=1)
+        assert "t1" not in slots.redis.zsets["leap:asr:jobs:a1"]
+
+    def test_renew_only_extends_held_lease(self, slots):
+        """renew extends only a lease that is still held."""
+        slots.acquire("a1", "t1", limit=1)
+        slots.redis.zsets["leap:asr:jobs:a1"]["t1"] = time.time() + 5
+
+        slots.renew("a1", "t1")
+        slots.renew("a1", "t2")
+
+        assert slots.redis.zsets["leap:asr:jobs:a1"]["t1"] > time.time() + 100
+        assert "t2" not in slots.redis.zsets["leap:asr:jobs:a1"]
+
+    async def test_hold_waits_for_free_slot_and_releases(self, slots):
+        """Holders beyond the limit wait until a slot is released."""
+        active = 0
+        peak = 0
+
+        async def job() -> None:
+            nonlocal active, peak
+            async with slots.hold("aai_test", limit=2, wait_interval=0.01):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.05)
+                active -= 1
+
+        await asyncio.gather(*(job() for _ in range(5)))
+
+        assert peak == 2
+        assert slots.redis.zsets.get(_key("aai_test"), {}) == {}
+
+    async def test_hold_releases_on_error(self, slots):
+        """A failing job still frees its slot."""
+        with pytest.raises(RuntimeError):
+            async with slots.hold("aai_test", limit=1, wait_interval=0.01):
+                raise RuntimeError("boom")
+
+        assert slots.usage(account_id("aai_test")) == 0
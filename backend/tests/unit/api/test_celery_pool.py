@@ -0,0 +1,93 @@
+"""AsyncIOPool: tasks of the I/O queues share one event loop."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from celery import Celery
+from celery.exceptions import Terminated
+
+from api.celery_pool import AsyncIOPool
+from api.services import progress_events
+from api.tasks.base import BaseTask
+from utils.worker_loop import run_in_worker_loop, shared_loop_active
+
+
+@pytest.fixture
+def pool():
+    pool = AsyncIOPool(limit=4)
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+@pytest.mark.unit
+class TestAsyncIOPool:
+    def test_start_and_stop_manage_shared_loop(self, pool):
+        """Pool start brings up the shared loop and stop tears it down."""
+        assert shared_loop_active()
+
+        pool.stop()
+
+        assert not shared_loop_active()
+
+    def test_task_runs_on_shared_loop(self, pool):
+        """A task's coroutine runs on the shared loop and its result reaches the callback."""
+        callback = MagicMock()
+
+        def target():
+            return run_in_worker_loop(asyncio.sleep(0, result="done"))
+
+        result = pool.apply_async(target, callback=callback, soft_timeout=5, timeout=10)
+        result.wait(timeout=2)
+
+        callback.assert_called_once_with("done")
+        assert result.job.soft_timeout == 5
+        assert result.job.timeout == 10
+
+    def test_terminate_cancels_task_coroutine(self, pool):
+        """Terminating a job cancels its coroutine with Terminated."""
+        errors: list[BaseException] = []
+
+        def target():
+            try:
+                run_in_worker_loop(asyncio.sleep(5))
+            except Terminated as exc:
+                errors.append(exc)
+
+        result = pool.apply_async(target, callback=MagicMock())
+        while not result.job._futures:
+            asyncio.run(asyncio.sleep(0.01))
+        pool.terminate_job(pid=None)
+        result.terminate(15)
+        result.wait(timeout=2)
+
+        assert len(errors) == 1
+
+    def test_progress_from_coroutine_keeps_task_request(self, pool, mocker):
+        """update_progress inside a coroutine still sees the task's request."""
+        publish = mocker.patch.object(progress_events, "publish_event")
+        app = Celery("test", set_as_current=False)
+
+        @app.task(bind=True, base=BaseTask, name="api.tasks.processing.trim_video")
+        def trim_video(self, recording_id, user_id):
+            async def body():
+                self.update_progress(user_id, 40, "Trimming...", step="trim")
+                return self.request.id
+
+            return self.run_async(body())
+
+        trim_video.backend = MagicMock()
+        callback = MagicMock()
+        result = pool.apply_async(lambda: trim_video.apply((7, "u1"), task_id="abc").get(), callback=callback)
+        result.wait(timeout=2)
+        pool.stop()  # drains the offloaded progress writes
+
+        callback.assert_called_once_with("abc")
+        assert trim_video.backend.store_result.call_args.args[:3] == (
+            "abc",
+            {"user_id": "u1", "progress": 40, "status": "Trimming...", "step": "trim"},
+            "PROCESSING",
+        )
+        assert publish.call_args.args[2]["task_id"] == "abc"
+        assert publish.call_args.args[2]["recording_id"] == 7
@@ -0,0 +1,214 @@
+"""Early upload: private upload right after trim, metadata patch and publish after topics."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from celery.exceptions import Retry
+
+from models.recording import TargetStatus
+from video_upload_module.config_factory import VKConfig, YouTubeConfig
+
+LAUNCH_UPLOADS = "api.tasks.processing.launch_uploads"
+TRANSCRIBE = "api.tasks.processing.transcribe_recording"
+AWAIT_TRIM = "api.tasks.processing.await_trim"
+FINALIZE = "api.tasks.processing.finalize_pipeline"
+
+
+@pytest.mark.unit
+class TestHoldPrivate:
+    def test_youtube_keeps_privacy_and_schedule_for_publish(self):
+        """YouTube uploads private and keeps the final privacy and schedule for publish."""
+        from api.tasks.upload import _hold_private
+
+        params = {"privacy_status": "public", "publish_at": "2026-10-20T10:00:00Z"}
+        uploader = SimpleNamespace(config=YouTubeConfig())
+
+        final = _hold_private("youtube", params, uploader)
+
+        assert final == {"privacy_status": "public", "publish_at": "2026-10-20T10:00:00Z"}
+        assert params == {"privacy_status": "private"}
+
+    def test_vk_hidden_until_publish(self):
+        """VK uploads hidden and keeps the final privacy_view for publish."""
+        from api.tasks.upload import _hold_private
+
+        params: dict = {}
+        final = _hold_private("vk_video", params, SimpleNamespace(config=VKConfig(privacy_view=0)))
+
+        assert final == {"privacy_view": 0}
+        assert params == {"privacy_view": 3}
+
+    def test_only_editable_platforms_supported(self):
+        """Only platforms whose videos can be edited after upload support it."""
+        from api.tasks.upload import supports_deferred_publish
+
+        assert supports_deferred_publish("youtube")
+        assert supports_deferred_publish("vk_video")
+        assert not supports_deferred_publish("yandex_disk")
+
+
+@pytest.mark.unit
+class TestPublishRecording:
+    @pytest.fixture
+    def env(self, mocker):
+        from api.tasks import upload
+
+        session = MagicMock(commit=AsyncMock())
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__.return_value = session
+        mocker.patch.object(upload, "get_async_session_maker", return_value=session_maker)
+
+        recording = SimpleNamespace(id=7, on_pause=False, pipeline_started_at=None, pipeline_completed_at=None)
+        target = SimpleNamespace(
+            status=TargetStatus.UPLOADED,
+            target_meta={
+                "video_id": "vid1",
+                "video_url": "https://youtu.be/vid1",
+                "deferred_publish": {"privacy_status": "public"},
+            },
+        )
+        repo = MagicMock(
+            get_by_id=AsyncMock(return_value=recording), get_or_create_output_target=AsyncMock(return_value=target)
+        )
+        mocker.patch.object(upload, "RecordingRepository", return_value=repo)
+
+        uploader = MagicMock(authenticate=AsyncMock(return_value=True), update_video=AsyncMock(return_value=True))
+        mocker.patch.object(upload, "_resolve_uploader", AsyncMock(return_value=(uploader, None, {}, None)))
+        mocker.patch.object(upload, "_render_upload_text", AsyncMock(return_value=("Title: topics", "Desc", {})))
+        return SimpleNamespace(upload=upload, target=target, uploader=uploader, recording=recording)
+
+    async def test_patches_metadata_then_publishes(self, env):
+        """Publishing fills in title and description, then applies the final privacy."""
+        result = await env.upload._async_publish_recording(7, "user-1", "youtube")
+
+        assert result["published"] is True
+        env.uploader.update_video.assert_awaited_once_with(
+            "vid1", title="Title: topics", description="Desc", owner_id=None, privacy_status="public"
+        )
+        assert env.target.target_meta["deferred_publish"] is None
+        assert env.target.target_meta["published_at"]
+        assert env.recording.pipeline_completed_at is not None
+
+    async def test_waits_while_uploading(self, env):
+        """Publishing waits while the private upload is still running."""
+        env.target.status = TargetStatus.UPLOADING
+
+        assert await env.upload._async_publish_recording(7, "user-1", "youtube") == {"status": "waiting"}
+        env.uploader.update_video.assert_not_called()
+
+    async def test_already_published_skipped(self, env):
+        """An already published target is skipped."""
+        env.target.target_meta["deferred_publish"] = None
+
+        result = await env.upload._async_publish_recording(7, "user-1", "youtube")
+
+        assert result["skipped"] is True
+        env.uploader.update_video.assert_not_called()
+
+    async def test_failed_early_upload_falls_back_to_regular_upload(self, env, mocker):
+        """A failed early upload falls back to a regular upload."""
+        env.target.status = TargetStatus.FAILED
+        regular = mocker.patch.object(env.upload, "_async_upload_recording", AsyncMock(return_value={"success": True}))
+
+        assert await env.upload._async_publish_recording(7, "user-1", "youtube") == {"success": True}
+        assert "deferred_publish" not in regular.call_args.kwargs
+
+    async def test_captions_uploaded_before_publish(self, env, mocker):
+        """Captions go up before the video is made public."""
+        captions = mocker.patch.object(env.upload, "_upload_captions", AsyncMock(return_value=True))
+
+        result = await env.upload._async_publish_recording(7, "user-1", "youtube", upload_captions=True)
+
+        captions.assert_awaited_once_with(env.uploader, env.recording, "vid1")
+        assert result["captions_uploaded"] is True
+
+    def test_task_polls_until_upload_done(self, mocker):
+        """The publish task retries while the upload is running."""
+        from api.tasks import upload
+
+        mocker.patch.object(upload, "_async_publish_recording", AsyncMock(return_value={"status": "waiting"}))
+
+        with pytest.raises(Retry):
+            upload.publish_recording_on_platform(7, "user-1", "youtube")
+
+    def test_task_gives_up_without_failing_the_upload(self, env, mocker):
+        """Out of retries, the publish stops and the private upload stays intact."""
+        env.target.status = TargetStatus.UPLOADING
+        mocker.patch.object(env.upload.publish_recording_on_platform, "max_retries", 0)
+
+        result = env.upload.publish_recording_on_platform(7, "user-1", "youtube")
+
+        assert result["status"] == "timeout"
+        assert env.target.status == TargetStatus.UPLOADING
+        assert "not published" in env.target.target_meta["publish_error"]
+        assert env.target.target_meta["deferred_publish"] == {"privacy_status": "public"}
+
+
+@pytest.mark.unit
+class TestEarlyUploadPipeline:
+    def test_trim_keeps_early_launcher_and_releases_the_rest(self, mocker):
+        """Trim keeps the early upload launcher and releases the other steps."""
+        from api.tasks.processing import _start_transcription_early
+
+        mock_chain = mocker.patch("api.tasks.processing.chain")
+        mocker.patch("celery.signature", side_effect=lambda step, app=None: step["task"])  # noqa: ARG005
+        early_launch = {"task": LAUNCH_UPLOADS}
+        task_self = SimpleNamespace(
+            request=SimpleNamespace(
+                chain=[
+                    {"task": FINALIZE},
+                    {"task": LAUNCH_UPLOADS},
+                    {"task": AWAIT_TRIM},
+                    {"task": TRANSCRIBE},
+                    early_launch,
+                ]
+            )
+        )
+
+        assert _start_transcription_early(task_self) is True
+        assert task_self.request.chain == [early_launch]
+        assert mock_chain.call_args.args == (TRANSCRIBE, AWAIT_TRIM, LAUNCH_UPLOADS, FINALIZE)
+
+    def test_editable_platforms_launched_after_trim(self, mocker):
+        """Editable platforms upload right after trim; the others wait for the end."""
+        from api.tasks import processing
+
+        config = {"trimming": {"enable_trimming": True}, "transcription": {"enable_subtitles": False}}
+        output_config = {
+            "auto_upload": True,
+            "early_upload": True,
+            "upload_captions": True,
+            "default_platforms": ["youtube", "yandex_disk"],
+            "preset_ids": [],
+        }
+        for task in (
+            processing.download_recording_task,
+            processing.trim_video_task,
+            processing.transcribe_recording_task,
+            processing.extract_topics_task,
+            processing.await_trim_task,
+            processing._finalize_pipeline_task,
+        ):
+            mocker.patch.object(task, "si", return_value=task.name.rsplit(".", 1)[-1])
+        launch_si = mocker.patch.object(processing._launch_uploads_task, "si", return_value="launch_uploads")
+
+        task_chain, summary = processing._build_pipeline_chain(7, "user-1", {}, config, output_config, [])
+
+        assert task_chain == [
+            "download_recording",
+            "trim_video",
+            "launch_uploads",
+            "transcribe_recording",
+            "extract_topics",
+            "await_trim",
+            "launch_uploads",
+            "finalize_pipeline",
+        ]
+        assert summary["platforms"] == ["youtube", "yandex_disk"]
+        early, final = (call.kwargs for call in launch_si.call_args_list)
+        assert early["platforms"] == ["youtube"]
+        assert early["deferred_publish"] is True
+        assert final["platforms"] == ["yandex_disk"]
+        assert final["publish_platforms"] == ["youtube"]
+        assert final["upload_captions"] is True
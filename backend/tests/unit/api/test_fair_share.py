@@ -0,0 +1,165 @@
+"""Tenant fair-share queues: weighted interleaving of bulk pipeline runs."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.services.fair_share import FairShareQueue, fair_share_weight, pending_pipeline_tasks
+from tests.fixtures.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def queue():
+    return FairShareQueue(FakeRedis())
+
+
+def _submit(queue, user_id, count, weight=1):
+    return [
+        queue.submit(user_id, "api.tasks.processing.run_recording", {"recording_id": i}, weight) for i in range(count)
+    ]
+
+
+def _drain_order(queue, count):
+    return [queue.pop()[0] for _ in range(count)]
+
+
+@pytest.mark.unit
+class TestFairShareQueue:
+    def test_tenants_interleaved_instead_of_fifo(self, queue):
+        """Tenants take turns instead of draining in submission order."""
+        _submit(queue, "a", 5)
+        _submit(queue, "b", 2)
+
+        assert _drain_order(queue, 7) == ["a", "b", "a", "b", "a", "a", "a"]
+        assert queue.pop() is None
+        assert queue.depth() == {}
+
+    def test_weight_sets_share(self, queue):
+        """A tenant's weight sets its share of dispatches."""
+        _submit(queue, "pro", 6, weight=2)
+        _submit(queue, "free", 6, weight=1)
+
+        order = _drain_order(queue, 6)
+
+        assert order.count("pro") == 4
+        assert order.count("free") == 2
+
+    def test_late_tenant_gets_no_banked_credit(self, queue):
+        """A tenant joining late does not get credit for the time it was idle."""
+        _submit(queue, "a", 6)
+        _drain_order(queue, 3)
+
+        _submit(queue, "b", 4)
+
+        assert _drain_order(queue, 4) == ["a", "b", "a", "b"]
+
+    def test_payload_keeps_task_id_and_clears_wait_entry(self, queue):
+        """Popping keeps the task id and clears the queue-age entry."""
+        (task_id,) = _submit(queue, "a", 1)
+        wait_key = "leap:enq:fair:async_operations:a"
+        assert task_id in queue.redis.zsets[wait_key]
+
+        user_id, payload = queue.pop()
+
+        assert (user_id, payload["task_id"]) == ("a", task_id)
+        assert payload["kwargs"] == {"recording_id": 0}
+        assert wait_key not in queue.redis.zsets
+
+    def test_drain_stops_at_budget(self, queue):
+        """drain publishes no more than its budget."""
+        _submit(queue, "a", 5)
+        publish = MagicMock()
+
+        assert queue.drain(3, publish) == 3
+        assert publish.call_count == 3
+        assert queue.depth() == {"a": 2}
+
+    def test_failed_publish_requeued_at_head(self, queue):
+        """A task that fails to publish goes back to the head of its queue."""
+        first, _ = _submit(queue, "a", 2)
+        publish = MagicMock(side_effect=ConnectionError("broker down"))
+
+        assert queue.drain(5, publish) == 0
+        assert queue.pop()[1]["task_id"] == first
+
+    def test_dispatcher_lock_is_exclusive(self, queue):
+        """Only one dispatcher holds the lock at a time."""
+        token = queue.lock(timeout=60)
+        assert token
+        assert not queue.lock(timeout=60)
+        queue.unlock(token)
+        assert queue.lock(timeout=60)
+
+    def test_unlock_leaves_a_lock_taken_after_expiry(self, queue):
+        """An expired lock taken over by another dispatcher is not released."""
+        stale = queue.lock(timeout=60)
+        queue.redis.strings.clear()  # expired while the tick ran
+        current = queue.lock(timeout=60)
+
+        queue.unlock(stale)
+
+        assert queue.redis.strings[f"{queue.prefix}lock"] == current
+
+
+@pytest.mark.unit
+def test_pending_pipeline_tasks_ignores_stale_entries():
+    """Only recent queue-age entries count as pending."""
+    import time
+
+    redis = FakeRedis()
+    now = time.time()
+    redis.zadd("leap:enq:downloads", {"t1": now, "old": now - 7200})
+    redis.zadd("leap:enq:async_operations", {"t2": now})
+    redis.zadd("leap:enq:uploads", {"t3": now})
+
+    assert pending_pipeline_tasks(redis, stale_after=3600) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("max_concurrent_tasks", "weight"),
+    [(1, 1), (3, 3), (50, 10), (None, 10), (0, 1)],
+)
+def test_weight_from_plan_concurrency(max_concurrent_tasks, weight):
+    """The fair-share weight follows the plan's concurrency."""
+    assert fair_share_weight({"max_concurrent_tasks": max_concurrent_tasks}) == weight
+
+
+@pytest.mark.unit
+def test_dispatch_task_publishes_within_budget(mocker):
+    """The dispatch tick publishes only what fits under the pending cap."""
+    from api.tasks import processing
+
+    queue = FairShareQueue(FakeRedis())
+    _submit(queue, "a", 3)
+    _submit(queue, "b", 3)
+    mocker.patch("api.services.fair_share.get_fair_share_queue", return_value=queue)
+    mocker.patch(
+        "api.services.fair_share.pending_pipeline_tasks",
+        return_value=processing.settings.celery.fair_share_max_pending - 4,
+    )
+    send_task = mocker.patch.object(processing.celery_app, "send_task")
+
+    result = processing.dispatch_fair_share_task()
+
+    assert result == {"dispatched": 4, "budget": 4}
+    assert [c.kwargs["kwargs"]["recording_id"] for c in send_task.call_args_list] == [0, 0, 1, 1]
+    assert queue.lock(timeout=60)  # released after the tick
+
+
+@pytest.mark.unit
+def test_collector_exports_tenant_wait():
+    """The queue age collector exports each tenant's wait."""
+    from api.observability.metrics import _QueueAgeCollector
+
+    queue = FairShareQueue(FakeRedis())
+    _submit(queue, "tenant-1", 2)
+    collector = _QueueAgeCollector()
+    collector._client = queue.redis
+
+    families = {family.name: family for family in collector.collect()}
+
+    depth = families["leap_tenant_queue_depth"].samples
+    assert [(s.labels, s.value) for s in depth] == [({"queue": "async_operations", "tenant": "tenant-1"}, 2)]
+    age = families["leap_tenant_queue_oldest_task_age_seconds"].samples
+    assert age[0].labels == {"queue": "async_operations", "tenant": "tenant-1"}
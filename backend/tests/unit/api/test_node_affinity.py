@@ -0,0 +1,180 @@
+"""Node affinity: pin a recording's download/trim/upload to one node and reuse its artifacts."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from api.services import node_affinity
+from api.services.node_affinity import NodeAffinity
+from file_storage.scratch import ArtifactScratch
+from tests.fixtures.fake_redis import FakeRedis
+
+TRIM = "api.tasks.processing.trim_video"
+UPLOAD = "api.tasks.upload.upload_recording_to_platform"
+
+
+@pytest.fixture
+def affinity():
+    return NodeAffinity(FakeRedis(), pin_ttl=3600, heartbeat_ttl=30, max_backlog=2)
+
+
+@pytest.mark.unit
+class TestNodeAffinity:
+    def test_unpinned_recording_uses_shared_queue(self, affinity):
+        """A recording with no pinned node stays on the shared queue."""
+        assert affinity.route(7, "processing_cpu") is None
+
+    def test_pinned_live_node_gets_stage(self, affinity):
+        """A stage goes to the live node the recording is pinned to."""
+        affinity.pin(7, "node-a")
+        affinity.heartbeat(["processing_cpu.node-a"])
+
+        assert affinity.route(7, "processing_cpu") == "processing_cpu.node-a"
+
+    def test_dead_node_falls_back(self, affinity):
+        """Without a heartbeat from the pinned node the stage uses the shared queue."""
+        affinity.pin(7, "node-a")
+
+        assert affinity.route(7, "processing_cpu") is None
+
+    def test_backlogged_node_falls_back(self, affinity):
+        """A pinned node with a backlog gives the stage to the shared queue."""
+        affinity.pin(7, "node-a")
+        affinity.heartbeat(["processing_cpu.node-a"])
+        affinity.redis.lists["processing_cpu.node-a"] = ["m1", "m2"]
+
+        assert affinity.route(7, "processing_cpu") is None
+
+    def test_unpinned_after_pipeline_and_last_upload(self, affinity):
+        """The pin lasts until the pipeline ends and the last upload releases it."""
+        affinity.pin(7, "node-a")
+        affinity.count(7, "storage", 100)
+        affinity.count(7, "scratch", 300)
+        affinity.hold(7)
+        affinity.hold(7)
+
+        assert affinity.release(7) is None
+        assert affinity.finish(7) is None
+        assert affinity.release(7) == {"storage": 100, "scratch": 300}
+        assert affinity.pinned_node(7) is None
+
+    def test_pipeline_without_uploads_unpins_on_finish(self, affinity):
+        """With no uploads, finishing the pipeline releases the pin."""
+        affinity.pin(7, "node-a")
+
+        assert affinity.finish(7) == {"storage": 0, "scratch": 0}
+
+
+@pytest.mark.unit
+class TestRouter:
+    @pytest.fixture(autouse=True)
+    def _enabled(self, mocker, affinity):
+        mocker.patch.object(node_affinity, "_enabled", return_value=True)
+        mocker.patch.object(node_affinity, "get_node_affinity", return_value=affinity)
+
+    def test_routes_stage_to_pinned_node(self, affinity):
+        """The router sends a pinned stage to the node's queue."""
+        affinity.pin(7, "node-a")
+        affinity.heartbeat(["uploads.node-a"])
+
+        route = node_affinity.route_stage_to_node(UPLOAD, (7, "user-1", "youtube"), {}, {})
+
+        assert route == {"queue": "uploads.node-a"}
+
+    def test_other_tasks_not_routed(self, affinity):
+        """Tasks outside the pinned stages are not routed."""
+        affinity.pin(7, "node-a")
+        affinity.heartbeat(["async_operations.node-a"])
+
+        assert node_affinity.route_stage_to_node("api.tasks.processing.transcribe_recording", (7,), {}, {}) is None
+
+    def test_redis_errors_fall_back(self, affinity):
+        """Redis errors fall back to the default route."""
+        affinity.redis = MagicMock(hget=MagicMock(side_effect=ConnectionError("redis down")))
+
+        assert node_affinity.route_stage_to_node(TRIM, (7, "user-1"), {}, {}) is None
+
+    def test_upload_retry_keeps_hold(self, affinity):
+        """An upload retry keeps its hold; success releases it."""
+        affinity.pin(7, "node-a")
+        affinity.hold(7)
+        affinity.finish(7)
+
+        node_affinity.release_recording_artifacts(7, "RETRY")
+        assert affinity.pinned_node(7) == "node-a"
+
+        node_affinity.release_recording_artifacts(7, "SUCCESS")
+        assert affinity.pinned_node(7) is None
+
+
+@pytest.mark.unit
+class TestFetchArtifact:
+    KEY = "users/user_000001/recordings/7/video.mp4"
+
+    @pytest.fixture
+    def storage(self):
+        async def _download(key, local_path):
+            local_path.write_bytes(b"from-storage")
+
+        return SimpleNamespace(get_size=AsyncMock(return_value=12), download_to_file=AsyncMock(side_effect=_download))
+
+    async def test_scratch_hit_skips_storage(self, mocker, tmp_path, storage, affinity):
+        """A scratch copy on this node is used instead of storage."""
+        scratch = ArtifactScratch(tmp_path / "scratch", max_bytes=10**9, ttl=3600)
+        produced = tmp_path / "trim_out.mp4"
+        produced.write_bytes(b"from-scratch")
+        scratch.keep(self.KEY, produced)
+        mocker.patch.object(node_affinity, "get_artifact_scratch", return_value=scratch)
+        mocker.patch.object(node_affinity, "get_node_affinity", return_value=affinity)
+        affinity.pin(7, "node-a")
+
+        local = tmp_path / "upload.mp4"
+        await node_affinity.fetch_artifact(storage, self.KEY, local, recording_id=7, stage="upload")
+
+        assert local.read_bytes() == b"from-scratch"
+        storage.download_to_file.assert_not_awaited()
+        assert affinity.redis.hashes["leap:affinity:rec:7"]["scratch_bytes"] == "12"
+
+    async def test_without_affinity_reads_storage(self, mocker, tmp_path, storage):
+        """With affinity off, artifacts are read from storage."""
+        mocker.patch.object(node_affinity, "get_artifact_scratch", return_value=None)
+        counter = mocker.patch.object(node_affinity, "artifact_fetch_bytes_total")
+
+        local = tmp_path / "upload.mp4"
+        await node_affinity.fetch_artifact(storage, self.KEY, local, recording_id=7, stage="upload")
+
+        assert local.read_bytes() == b"from-storage"
+        counter.labels.assert_called_once_with(stage="upload", source="storage")
+        counter.labels.return_value.inc.assert_called_once_with(12)
+
+
+@pytest.mark.unit
+def test_sweep_evicts_recordings_pinned_elsewhere(tmp_path, affinity):
+    """The sweep drops scratch copies of recordings pinned to other nodes."""
+    scratch = ArtifactScratch(tmp_path / "scratch", max_bytes=10**9, ttl=3600)
+    temp = tmp_path / "t.mp4"
+    temp.write_bytes(b"x" * 10)
+    scratch.keep("users/user_000001/recordings/1/source.mp4", temp)
+    scratch.keep("users/user_000001/recordings/2/source.mp4", temp)
+    affinity.pin(1, "node-a")
+    affinity.pin(2, "node-b")
+
+    assert node_affinity.sweep_scratch(affinity, "node-a", scratch) == 10
+    assert [rec_id for rec_id, _ in scratch.recording_dirs()] == [1]
+
+
+@pytest.mark.unit
+def test_worker_consumes_node_queues_for_its_shared_queues(mocker):
+    """A worker also consumes the node queues of its shared queues."""
+    mocker.patch.object(node_affinity, "_enabled", return_value=True)
+    mocker.patch.object(node_affinity, "current_node", return_value="node-a")
+    heartbeat = mocker.patch.object(node_affinity, "_NodeHeartbeat")
+    queues = MagicMock(consume_from={"downloads": object(), "maintenance": object()})
+
+    added = node_affinity.start_node_queues(queues)
+
+    assert added == ["downloads.node-a"]
+    queues.select_add.assert_called_once_with("downloads.node-a")
+    heartbeat.return_value.start.assert_called_once()
+    node_affinity.stop_node_queues()
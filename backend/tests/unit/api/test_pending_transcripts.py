@@ -0,0 +1,157 @@
+"""Unit tests for parking/resuming the pipeline chain around async transcription."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.services.pending_transcripts import PendingTranscriptStore
+from tests.fixtures.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def store():
+    return PendingTranscriptStore(FakeRedis())
+
+
+@pytest.mark.unit
+class TestPendingTranscriptStore:
+    def test_claim_is_one_time(self, store):
+        """A pending transcript can be claimed only once."""
+        store.add("t1", {"recording_id": 5, "chain": []})
+
+        job = store.claim("t1")
+
+        assert job["recording_id"] == 5
+        assert "submitted_at" in job
+        assert store.claim("t1") is None
+        assert store.all() == {}
+
+    def test_claim_unknown_returns_none(self, store):
+        """Claiming an unknown transcript returns None."""
+        assert store.claim("nope") is None
+
+
+@pytest.mark.unit
+class TestParkAndResumeChain:
+    def test_park_moves_remaining_chain_into_store(self, store, mocker):
+        """Parking moves the rest of the chain into the store."""
+        from api.tasks.processing import _park_chain_until_transcript
+
+        mocker.patch("api.services.pending_transcripts.get_pending_transcript_store", return_value=store)
+        task_self = SimpleNamespace(request=SimpleNamespace(chain=[{"task": "b"}, {"task": "a"}]))
+
+        _park_chain_until_transcript(task_self, 7, "user-1", {"transcript_id": "t1", "job": {"language": "en"}})
+
+        assert task_self.request.chain is None
+        job = store.all()["t1"]
+        assert job["recording_id"] == 7
+        assert job["user_id"] == "user-1"
+        assert job["chain"] == [{"task": "b"}, {"task": "a"}]
+
+    def test_resume_launches_complete_then_parked_steps_in_order(self, store, mocker):
+        """Resume runs the completion step, then the parked steps in order."""
+        from api.tasks import processing
+
+        mocker.patch("api.services.pending_transcripts.get_pending_transcript_store", return_value=store)
+        mock_chain = mocker.patch("api.tasks.processing.chain")
+        mock_chain.return_value.apply_async.return_value = MagicMock(id="last-task")
+        mocker.patch("celery.signature", side_effect=lambda step, app=None: step["task"])  # noqa: ARG005
+        mocker.patch.object(processing.complete_transcription_task, "si", return_value="complete")
+        store.add("t1", {"recording_id": 7, "user_id": "user-1", "chain": [{"task": "b"}, {"task": "a"}]})
+
+        assert processing.resume_transcription_chain("t1") == "last-task"
+        assert mock_chain.call_args.args == ("complete", "a", "b")
+        assert processing.resume_transcription_chain("t1") is None
+        assert mock_chain.call_count == 1
+
+    def test_resume_restores_job_when_broker_fails(self, store, mocker):
+        """The parked job goes back to the store when the broker is down."""
+        from api.tasks import processing
+
+        mocker.patch("api.services.pending_transcripts.get_pending_transcript_store", return_value=store)
+        mock_chain = mocker.patch("api.tasks.processing.chain")
+        mock_chain.return_value.apply_async.side_effect = ConnectionError("broker down")
+        mocker.patch.object(processing.complete_transcription_task, "si", return_value="complete")
+        store.add("t1", {"recording_id": 7, "user_id": "user-1", "chain": []})
+
+        with pytest.raises(ConnectionError):
+            processing.resume_transcription_chain("t1")
+
+        assert "t1" in store.all()
+
+
+def _aai_settings(**overrides):
+    aai = SimpleNamespace(webhook_url="https://leap.example/hook", webhook_secret="s3cret")
+    for key, value in overrides.items():
+        setattr(aai, key, value)
+    return SimpleNamespace(assemblyai=aai)
+
+
+@pytest.mark.unit
+class TestAssemblyAIWebhook:
+    """Tests for POST /api/v1/webhooks/assemblyai."""
+
+    URL = "/api/v1/webhooks/assemblyai"
+
+    def test_completed_enqueues_resume(self, client, mocker):
+        """A completed transcript webhook queues the resume task."""
+        mocker.patch("api.routers.webhooks.get_settings", return_value=_aai_settings())
+        resume = mocker.patch("api.tasks.processing.resume_transcription_task")
+
+        response = client.post(
+            self.URL,
+            json={"transcript_id": "t1", "status": "completed"},
+            headers={"X-Leap-Webhook-Token": "s3cret"},
+        )
+
+        assert response.status_code == 202
+        assert response.json() == {"accepted": True, "transcript_id": "t1"}
+        resume.delay.assert_called_once_with("t1")
+
+    def test_bad_token_rejected(self, client, mocker):
+        """A wrong webhook token is rejected."""
+        mocker.patch("api.routers.webhooks.get_settings", return_value=_aai_settings())
+        resume = mocker.patch("api.tasks.processing.resume_transcription_task")
+
+        response = client.post(
+            self.URL,
+            json={"transcript_id": "t1", "status": "completed"},
+            headers={"X-Leap-Webhook-Token": "wrong"},
+        )
+
+        assert response.status_code == 401
+        resume.delay.assert_not_called()
+
+    def test_disabled_returns_404(self, client, mocker):
+        """The webhook is 404 when no webhook URL is configured."""
+        mocker.patch("api.routers.webhooks.get_settings", return_value=_aai_settings(webhook_url=None))
+
+        response = client.post(self.URL, json={"transcript_id": "t1", "status": "completed"})
+
+        assert response.status_code == 404
+
+    def test_missing_secret_refused(self, client, mocker):
+        """The webhook is refused while no shared secret is configured."""
+        mocker.patch("api.routers.webhooks.get_settings", return_value=_aai_settings(webhook_secret=None))
+        resume = mocker.patch("api.tasks.processing.resume_transcription_task")
+
+        response = client.post(self.URL, json={"transcript_id": "t1", "status": "completed"})
+
+        assert response.status_code == 503
+        resume.delay.assert_not_called()
+
+    def test_non_terminal_status_not_accepted(self, client, mocker):
+        """Non-terminal statuses do not resume anything."""
+        mocker.patch("api.routers.webhooks.get_settings", return_value=_aai_settings())
+        resume = mocker.patch("api.tasks.processing.resume_transcription_task")
+
+        response = client.post(
+            self.URL,
+            json={"transcript_id": "t1", "status": "processing"},
+            headers={"X-Leap-Webhook-Token": "s3cret"},
+        )
+
+        assert response.status_code == 202
+        assert response.json()["accepted"] is False
+        resume.delay.assert_not_called()
@@ -0,0 +1,185 @@
+"""run_recording preflight: one locked session/transaction before the chain is launched."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models import ProcessingStatus
+
+
+@pytest.fixture
+def preflight(mocker):
+    from api.tasks import processing
+
+    session = MagicMock(commit=AsyncMock())
+    session.begin_nested.return_value.__aenter__ = AsyncMock()
+    session.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+    session_maker = MagicMock()
+    session_maker.return_value.__aenter__.return_value = session
+    mocker.patch.object(processing, "get_async_session_maker", return_value=session_maker)
+
+    recording = SimpleNamespace(
+        on_pause=False,
+        on_air=False,
+        blank_record=False,
+        pipeline_task_id=None,
+        duration=3600,
+        video_file_size=1,
+        status=ProcessingStatus.DOWNLOADED,
+    )
+    repo = MagicMock(get_by_id=AsyncMock(return_value=recording))
+    mocker.patch.object(processing, "RecordingRepository", return_value=repo)
+
+    quota = mocker.patch("api.services.quota_service.QuotaService")
+    quota.return_value.check_processing_quota = AsyncMock(return_value=(True, None))
+    quota.return_value.get_effective_quotas = AsyncMock(return_value={"max_concurrent_tasks": 2})
+    slots = MagicMock()
+    slots.acquire.return_value = True
+    slots.defer.return_value = 3
+    mocker.patch.object(processing, "get_pipeline_slots", return_value=slots)
+    release = mocker.patch.object(processing, "release_pipeline_slot")
+    usage = mocker.patch("api.repositories.subscription_repos.QuotaUsageRepository")
+    usage.return_value.increment_processing = AsyncMock()
+    events = mocker.patch("api.repositories.usage_event_repo.UsageEventRepository")
+    events.return_value.create = AsyncMock()
+
+    output_config = {"auto_upload": False, "preset_ids": []}
+    mocker.patch.object(processing, "resolve_full_config", AsyncMock(return_value=({}, output_config, recording)))
+    mocker.patch.object(
+        processing,
+        "_build_pipeline_chain",
+        return_value=(["download", "finalize"], {"upload_enabled": False, "platforms": []}),
+    )
+    mock_chain = mocker.patch.object(processing, "chain")
+    mock_chain.return_value.freeze.return_value = SimpleNamespace(id="chain-1")
+
+    return SimpleNamespace(
+        run=lambda: processing._pipeline_preflight(7, "user-1", {}),
+        session=session,
+        recording=recording,
+        repo=repo,
+        quota=quota,
+        slots=slots,
+        release=release,
+        usage=usage,
+        chain=mock_chain,
+    )
+
+
+@pytest.mark.unit
+class TestPipelinePreflight:
+    async def test_plan_committed_once_with_chain_id(self, preflight):
+        """The locked preflight commits once and records the chain id."""
+        plan = await preflight.run()
+
+        assert plan["chain"] is preflight.chain.return_value
+        assert plan["chain_tasks"] == 2
+        preflight.repo.get_by_id.assert_awaited_once_with(7, "user-1", for_update=True)
+        preflight.usage.return_value.increment_processing.assert_awaited_once()
+        assert preflight.usage.return_value.increment_processing.call_args.kwargs == {"commit": False}
+        assert preflight.recording.pipeline_task_id == "chain-1"
+        assert preflight.recording.on_air is True
+        preflight.session.commit.assert_awaited_once()
+        preflight.chain.return_value.apply_async.assert_not_called()
+        preflight.slots.acquire.assert_called_once_with("user-1", 7, 2)
+        preflight.release.assert_not_called()
+
+    async def test_paused_recording_not_touched(self, preflight):
+        """A paused recording is left as it is."""
+        preflight.recording.on_pause = True
+
+        assert (await preflight.run())["status"] == "paused"
+        preflight.session.commit.assert_not_called()
+        preflight.usage.return_value.increment_processing.assert_not_called()
+
+    async def test_quota_block_clears_on_air(self, preflight):
+        """A quota block takes the recording off air without counting usage."""
+        preflight.recording.on_air = True
+        preflight.quota.return_value.check_processing_quota.return_value = (False, "Monthly processing quota exceeded")
+
+        plan = await preflight.run()
+
+        assert plan == {"status": "quota_exceeded", "result": {"message": "Monthly processing quota exceeded"}}
+        assert preflight.recording.on_air is False
+        preflight.session.commit.assert_awaited_once()
+        preflight.usage.return_value.increment_processing.assert_not_called()
+
+    async def test_blank_record_skipped(self, preflight):
+        """A blank recording is skipped before a slot is taken."""
+        preflight.recording.blank_record = True
+
+        assert await preflight.run() == {"status": "skipped", "reason": "blank_record"}
+        assert preflight.recording.status == ProcessingStatus.SKIPPED
+        assert preflight.recording.on_air is False
+        preflight.chain.assert_not_called()
+        preflight.slots.acquire.assert_not_called()
+
+    async def test_no_free_slot_defers_run(self, preflight):
+        """With no free slot the run is queued behind the tenant's other runs."""
+        preflight.slots.acquire.return_value = False
+
+        plan = await preflight.run()
+
+        assert plan["status"] == "deferred"
+        assert plan["result"]["position"] == 3
+        preflight.slots.defer.assert_called_once_with(
+            "user-1", {"recording_id": 7, "user_id": "user-1", "manual_override": {}}, 2
+        )
+        assert preflight.recording.on_air is True
+        assert preflight.recording.pipeline_task_id is None
+        preflight.session.commit.assert_awaited_once()
+        preflight.usage.return_value.increment_processing.assert_not_called()
+        preflight.chain.assert_not_called()
+
+    async def test_failed_commit_releases_slot(self, preflight):
+        """A failed commit gives the slot back."""
+        preflight.session.commit.side_effect = RuntimeError("db gone")
+
+        with pytest.raises(RuntimeError):
+            await preflight.run()
+
+        preflight.slots.acquire.assert_called_once()
+        preflight.release.assert_called_once_with("user-1", 7)
+
+    async def test_usage_tracking_failure_ignored(self, preflight):
+        """Usage tracking errors do not stop the run."""
+        preflight.usage.return_value.increment_processing.side_effect = RuntimeError("db hiccup")
+
+        assert "chain" in await preflight.run()
+
+
+@pytest.mark.unit
+def test_run_recording_launches_chain_after_preflight(mocker):
+    """The chain is published only after the preflight commit."""
+    from api.tasks import processing
+
+    chain_signature = MagicMock()
+    chain_signature.apply_async.return_value = SimpleNamespace(id="chain-1")
+    plan = {"chain": chain_signature, "chain_tasks": 3, "upload_enabled": False, "platforms": []}
+    run_async = mocker.patch.object(
+        processing.run_recording_task, "run_async", side_effect=lambda coro: (coro.close(), plan)[1]
+    )
+
+    result = processing.run_recording_task(7, "user-1")
+
+    assert run_async.call_count == 1
+    assert result["status"] == "launched"
+    assert result["result"]["chain_id"] == "chain-1"
+
+
+@pytest.mark.unit
+def test_run_recording_frees_slot_when_chain_not_published(mocker):
+    """A chain the broker did not accept frees the slot and the on-air flag."""
+    from api.tasks import processing
+
+    chain_signature = MagicMock()
+    chain_signature.apply_async.side_effect = ConnectionError("broker down")
+    plan = {"chain": chain_signature, "chain_tasks": 3, "upload_enabled": False, "platforms": []}
+    mocker.patch.object(processing.run_recording_task, "run_async", side_effect=lambda coro: (coro.close(), plan)[1])
+    clear = mocker.patch.object(processing.run_recording_task, "_clear_on_air_async")
+
+    with pytest.raises(ConnectionError):
+        processing.run_recording_task(7, "user-1")
+
+    clear.assert_called_once_with(7, "user-1")
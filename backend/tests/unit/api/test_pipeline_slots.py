@@ -0,0 +1,124 @@
+"""Per-tenant pipeline slots: leased max_concurrent_tasks semaphore with deferred runs."""
+
+import time
+
+import pytest
+
+from api.services import pipeline_slots
+from api.services.pipeline_slots import PipelineSlots
+from tests.fixtures.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def slots():
+    return PipelineSlots(FakeRedis(), lease_seconds=600)
+
+
+def _run(recording_id):
+    return {"recording_id": recording_id, "user_id": "u1", "manual_override": {}}
+
+
+@pytest.mark.unit
+class TestPipelineSlots:
+    def test_limit_enforced_per_tenant(self, slots):
+        """Each tenant is capped separately."""
+        assert slots.acquire("u1", 1, limit=2)
+        assert slots.acquire("u1", 2, limit=2)
+        assert not slots.acquire("u1", 3, limit=2)
+        assert slots.acquire("u2", 3, limit=2)
+        assert slots.usage("u1") == (2, 0)
+
+    def test_reacquire_by_holder_renews(self, slots):
+        """A recording that already holds a slot gets it again."""
+        assert slots.acquire("u1", 1, limit=1)
+        assert slots.acquire("u1", 1, limit=1)
+
+    def test_unlimited_plan(self, slots):
+        """Without a limit every run gets a slot."""
+        assert all(slots.acquire("u1", i, limit=None) for i in range(20))
+
+    def test_expired_lease_frees_slot(self, slots):
+        """An expired lease frees its slot."""
+        slots.acquire("u1", 1, limit=1)
+        slots.redis.zsets["leap:slots:u1"]["1"] = time.time() - 1  # worker died, lease ran out
+
+        assert slots.acquire("u1", 2, limit=1)
+        assert "1" not in slots.redis.zsets["leap:slots:u1"]
+
+    def test_renew_only_extends_held_lease(self, slots):
+        """renew extends only a lease that is still held."""
+        slots.acquire("u1", 1, limit=1)
+        slots.redis.zsets["leap:slots:u1"]["1"] = time.time() + 5
+
+        slots.renew("u1", 1)
+        slots.renew("u1", 2)
+
+        assert slots.redis.zsets["leap:slots:u1"]["1"] > time.time() + 500
+        assert "2" not in slots.redis.zsets["leap:slots:u1"]
+
+    def test_release(self, slots):
+        """A released slot can be taken again; releasing twice is a no-op."""
+        slots.acquire("u1", 1, limit=1)
+
+        assert slots.release("u1", 1)
+        assert not slots.release("u1", 1)
+        assert slots.acquire("u1", 2, limit=1)
+
+    def test_take_deferred_fills_free_slots_in_order(self, slots):
+        """Deferred runs take free slots in the order they were queued."""
+        slots.acquire("u1", 1, limit=2)
+        for recording_id in (2, 3, 4):
+            slots.defer("u1", _run(recording_id), limit=2)
+
+        taken = slots.take_deferred("u1")
+
+        assert [payload["kwargs"]["recording_id"] for payload in taken] == [2]
+        assert slots.usage("u1") == (1, 2)
+        assert slots.deferred_tenants() == ["u1"]
+
+    def test_take_deferred_retires_empty_tenant(self, slots):
+        """A tenant with nothing left deferred is dropped from the index."""
+        slots.defer("u1", _run(2), limit=1)
+
+        assert len(slots.take_deferred("u1")) == 1
+        assert slots.deferred_tenants() == []
+
+
+@pytest.mark.unit
+def test_release_promotes_next_deferred_run(mocker):
+    """Releasing a slot starts the tenant's next deferred run."""
+    from api.celery_app import celery_app
+
+    slots = PipelineSlots(FakeRedis(), lease_seconds=600)
+    mocker.patch.object(pipeline_slots, "get_pipeline_slots", return_value=slots)
+    send_task = mocker.patch.object(celery_app, "send_task")
+    slots.acquire("u1", 1, limit=1)
+    slots.defer("u1", _run(2), limit=1)
+
+    pipeline_slots.release_pipeline_slot("u1", 1)
+
+    send_task.assert_called_once_with(pipeline_slots.RUN_RECORDING_TASK, kwargs=_run(2))
+    assert slots.usage("u1") == (0, 0)
+
+
+@pytest.mark.unit
+def test_release_without_slot_does_not_promote(mocker):
+    """Releasing a slot that was not held promotes nothing."""
+    from api.celery_app import celery_app
+
+    slots = PipelineSlots(FakeRedis(), lease_seconds=600)
+    mocker.patch.object(pipeline_slots, "get_pipeline_slots", return_value=slots)
+    send_task = mocker.patch.object(celery_app, "send_task")
+    slots.defer("u1", _run(2), limit=1)
+
+    pipeline_slots.release_pipeline_slot("u1", 1)
+
+    send_task.assert_not_called()
+
+
+@pytest.mark.unit
+def test_release_swallows_redis_errors(mocker):
+    """Redis errors on release are logged, not raised."""
+    mocker.patch.object(pipeline_slots, "get_pipeline_slots", side_effect=ConnectionError("redis down"))
+
+    pipeline_slots.release_pipeline_slot("u1", 1)
@@ -0,0 +1,221 @@
+"""Progress events: per-user replay stream + live pub/sub behind the SSE endpoint."""
+
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+import database.automation_models  # noqa: F401  (resolves UserModel relationships for mapper configuration)
+from api.services import progress_events
+from api.services.progress_events import ProgressEvents, _ClientQueue, replay, stream_events
+from database.models import ProcessingStageModel, RecordingModel
+from models.recording import ProcessingStageStatus, ProcessingStageType, ProcessingStatus
+
+
+class _StreamRedis:
+    """Just enough of redis.Redis / redis.asyncio.Redis (streams, pub/sub publish) for progress events."""
+
+    def __init__(self):
+        self.streams: dict[str, list[tuple[str, dict[str, str]]]] = {}
+        self.published: list[tuple[str, dict]] = []
+        self._seq = 0
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):  # noqa: ARG002
+        self._seq += 1
+        event_id = f"1000-{self._seq}"
+        entries = self.streams.setdefault(key, [])
+        entries.append((event_id, dict(fields)))
+        if maxlen is not None:
+            del entries[:-maxlen]
+        return event_id
+
+    def register_script(self, _script):
+        def run(keys, args):
+            stream, channel = keys
+            maxlen, event_name, payload, _ttl = args
+            event_id = self.xadd(stream, {"event": event_name, "data": payload}, maxlen=maxlen)
+            self.publish(channel, json.dumps({"id": event_id, "event": event_name, "data": payload}))
+            return event_id
+
+        return run
+
+    def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+        return 1
+
+    async def xrange(self, key, min="-", max="+", count=None):  # noqa: A002, ARG002
+        entries = self.streams.get(key, [])
+        if min.startswith("("):
+            floor = progress_events._event_id_key(min[1:])
+            entries = [e for e in entries if progress_events._event_id_key(e[0]) > floor]
+        return entries[:count] if count else list(entries)
+
+
+@pytest.fixture
+def events():
+    return ProgressEvents(_StreamRedis(), maxlen=3, ttl=3600)
+
+
+@pytest.mark.unit
+class TestPublish:
+    def test_publish_buffers_and_announces(self, events):
+        """publish appends to the replay stream and announces on the live channel."""
+        event_id = events.publish("u1", "progress", {"task_id": "t1", "progress": 40})
+
+        fields = events.redis.streams["leap:events:u1"][0][1]
+        channel, message = events.redis.published[0]
+        assert fields["event"] == "progress"
+        assert channel == "leap:events:u1:live"
+        assert message["id"] == event_id
+        assert json.loads(message["data"]) == {"task_id": "t1", "progress": 40}
+
+    def test_publish_event_never_blocks_caller(self, mocker):
+        """publish_event hands the work to the publisher thread."""
+        publisher = mocker.patch.object(progress_events, "_get_publisher")
+        redis_access = mocker.patch.object(progress_events, "get_progress_events")
+
+        progress_events.publish_event("u1", "progress", {"progress": 40})
+
+        publisher.return_value.submit.assert_called_once_with(
+            progress_events._publish, "u1", "progress", {"progress": 40}
+        )
+        redis_access.assert_not_called()
+        progress_events._backlog.release()
+
+    def test_publish_swallows_redis_errors(self, mocker):
+        """Redis errors while publishing are logged, not raised."""
+        mocker.patch.object(progress_events, "get_progress_events", side_effect=ConnectionError("redis down"))
+        progress_events._backlog.acquire()
+
+        progress_events._publish("u1", "progress", {})
+
+    def test_task_state_uses_call_convention(self, mocker):
+        """Task state events take the recording and user from the task args."""
+        publish = mocker.patch.object(progress_events, "publish_event")
+        task = SimpleNamespace(name="api.tasks.processing.trim_video")
+
+        progress_events.publish_task_state(task, "t1", "SUCCESS", (7, "u1"), {})
+        progress_events.publish_task_state(task, "t2", "SUCCESS", (), {})
+
+        publish.assert_any_call(
+            "u1", "task", {"task_id": "t1", "task": "trim_video", "recording_id": 7, "state": "SUCCESS"}
+        )
+        assert publish.call_args_list[1].args[0] is None
+
+
+@pytest.mark.unit
+class TestStageTransitions:
+    def test_published_after_commit_only(self, mocker):
+        """Stage and status changes are published after commit, not before."""
+        publish = mocker.patch.object(progress_events, "publish_event")
+        stage = ProcessingStageModel(
+            recording_id=7, user_id="u1", stage_type=ProcessingStageType.TRIM, status=ProcessingStageStatus.IN_PROGRESS
+        )
+        recording = RecordingModel(id=7, user_id="u1", status=ProcessingStatus.PROCESSING)
+        session = SimpleNamespace(new=[stage], dirty=[recording], info={})
+
+        progress_events._collect_transitions(session, None)
+        publish.assert_not_called()
+        progress_events._publish_committed(session)
+
+        publish.assert_any_call("u1", "stage", {"recording_id": 7, "stage": "TRIM", "status": "IN_PROGRESS"})
+        publish.assert_any_call("u1", "recording", {"recording_id": 7, "status": "PROCESSING"})
+
+    def test_rollback_discards(self, mocker):
+        """A rollback discards the collected transitions."""
+        publish = mocker.patch.object(progress_events, "publish_event")
+        recording = RecordingModel(id=7, user_id="u1", status=ProcessingStatus.PROCESSING)
+        session = SimpleNamespace(new=[], dirty=[recording], info={})
+
+        progress_events._collect_transitions(session, None)
+        progress_events._discard_pending(session)
+        progress_events._publish_committed(session)
+
+        publish.assert_not_called()
+
+
+@pytest.mark.unit
+class TestReplay:
+    async def test_replays_after_last_event_id(self, events):
+        """Replay returns only the events after Last-Event-ID."""
+        first = events.publish("u1", "progress", {"progress": 10})
+        events.publish("u1", "progress", {"progress": 20})
+
+        missed, complete = await replay(events.redis, "u1", first)
+
+        assert complete
+        assert [json.loads(fields["data"]) for _, fields in missed] == [{"progress": 20}]
+
+    async def test_trimmed_buffer_needs_resync(self, events):
+        """Events trimmed from the buffer make the client resync."""
+        first = events.publish("u1", "progress", {"progress": 10})
+        for progress in (20, 30, 40):
+            events.publish("u1", "progress", {"progress": progress})
+
+        missed, complete = await replay(events.redis, "u1", first)
+
+        assert not complete
+        assert len(missed) == 3
+
+    @pytest.mark.parametrize("last_event_id", ["garbage", "1000-1"])
+    async def test_malformed_or_expired_needs_resync(self, events, last_event_id):
+        """A malformed or expired Last-Event-ID makes the client resync."""
+        assert await replay(events.redis, "u1", last_event_id) == ([], False)
+
+
+class _Hub:
+    def __init__(self):
+        self.queue = _ClientQueue()
+
+    @asynccontextmanager
+    async def subscribe(self, _user_id):
+        yield self.queue
+
+
+def _live(events, event_name, data):
+    event_id = events.publish("u1", event_name, data)
+    return json.dumps({"id": event_id, "event": event_name, "data": json.dumps(data)})
+
+
+@pytest.mark.unit
+class TestStreamEvents:
+    async def test_replay_then_live_without_duplicates(self, events):
+        """Live events already sent by the replay are skipped."""
+        hub = _Hub()
+        first = events.publish("u1", "progress", {"progress": 10})
+        duplicate = _live(events, "progress", {"progress": 20})  # replayed and also delivered live
+        hub.queue.offer(duplicate)
+        hub.queue.offer(_live(events, "stage", {"recording_id": 7}))
+
+        stream = stream_events(hub, events.redis, "u1", first, keepalive=5)
+        chunks = [await anext(stream) for _ in range(3)]
+        await stream.aclose()
+
+        assert chunks[0].startswith("retry:")
+        assert chunks[1] == 'id: 1000-2\nevent: progress\ndata: {"progress": 20}\n\n'
+        assert chunks[2] == 'id: 1000-3\nevent: stage\ndata: {"recording_id": 7}\n\n'
+
+    async def test_keepalive_when_idle(self, events):
+        """An idle stream sends keepalive comments."""
+        stream = stream_events(_Hub(), events.redis, "u1", None, keepalive=0.01)
+        await anext(stream)
+
+        assert await anext(stream) == ": keepalive\n\n"
+        await stream.aclose()
+
+    async def test_lagged_client_catches_up_from_stream(self, events):
+        """A client that fell behind catches up from the replay stream."""
+        hub = _Hub()
+        hub.queue.offer(_live(events, "progress", {"progress": 10}))
+        stream = stream_events(hub, events.redis, "u1", None, keepalive=5)
+        await anext(stream)
+        await anext(stream)
+
+        events.publish("u1", "progress", {"progress": 20})  # dropped from the full client queue
+        hub.queue.lagged = True
+        hub.queue.offer(_live(events, "progress", {"progress": 30}))
+
+        assert await anext(stream) == 'id: 1000-2\nevent: progress\ndata: {"progress": 20}\n\n'
+        assert await anext(stream) == 'id: 1000-3\nevent: progress\ndata: {"progress": 30}\n\n'
+        await stream.aclose()
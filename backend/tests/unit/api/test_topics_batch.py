@@ -0,0 +1,118 @@
+"""Batch topic extraction: shared client and request limit, per-recording results, bulk grouping."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from deepseek_module import DeepSeekConfig, TopicExtractor
+
+RESPONSE = "## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ\n[00:00:00] - Введение\n"
+SEGMENTS = [{"start": m * 60.0, "end": m * 60.0 + 60, "text": f"Минута {m}"} for m in range(20)]
+
+
+class SlowCompletions:
+    """Counts concurrent requests."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, **_params) -> SimpleNamespace:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=RESPONSE))], usage=None)
+
+
+@pytest.mark.unit
+class TestSharedRequestLimiter:
+    async def test_extractors_share_client_and_limit(self):
+        """Extractors sharing a client never exceed the shared request limiter."""
+        completions = SlowCompletions()
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        limiter = asyncio.Semaphore(2)
+        extractors = [
+            TopicExtractor(DeepSeekConfig(api_key="test"), client=client, request_limiter=limiter) for _ in range(6)
+        ]
+
+        results = await asyncio.gather(*(e.extract_topics(SEGMENTS) for e in extractors))
+
+        assert all(e.client is client for e in extractors)
+        assert completions.peak == 2
+        assert all(r["topic_timestamps"][0]["topic"] == "Введение" for r in results)
+
+
+@pytest.mark.unit
+class TestAsyncExtractTopicsBatch:
+    async def test_runs_concurrently_and_requeues_failures(self, monkeypatch):
+        """The batch runs recordings concurrently and requeues the failed ones."""
+        from api.tasks import processing
+
+        monkeypatch.setattr(processing.settings.topic_extraction, "batch_concurrency", 3)
+        monkeypatch.setattr(processing.settings.topic_extraction, "batch_prefetch", 4)
+        active = peak = 0
+        limiters = set()
+
+        async def extract(_session_maker, recording_id, *_args, client, request_limiter, **_kwargs):
+            nonlocal active, peak
+            limiters.add(id(request_limiter))
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if recording_id == 3:
+                raise RuntimeError("storage unavailable")
+            return {"success": True, "topics_count": recording_id, "client": client}
+
+        task = MagicMock()
+        with (
+            patch.object(processing, "_extract_recording_topics", side_effect=extract),
+            patch.object(processing, "get_async_session_maker"),
+            patch.object(processing.DeepSeekConfig, "from_file", return_value=DeepSeekConfig(api_key="test")),
+            patch.object(processing, "_deepseek_client", return_value="shared-client"),
+        ):
+            result = await processing._async_extract_topics_batch(
+                task, list(range(1, 11)), "user-1", "long", None, False
+            )
+
+        assert result["requeued"] == [3]
+        assert sorted(r["recording_id"] for r in result["completed"]) == [1, 2, 4, 5, 6, 7, 8, 9, 10]
+        assert {r["client"] for r in result["completed"]} == {"shared-client"}
+        assert len(limiters) == 1
+        assert peak == 4
+        last_call = task.update_progress.call_args_list[-1]
+        assert last_call.args[2] == "Extracting topics: 10/10"
+        assert last_call.kwargs["failed"] == 1
+
+
+@pytest.mark.unit
+class TestBulkTopicsBatching:
+    async def test_recordings_grouped_into_batch_tasks(self, monkeypatch):
+        """Bulk topics groups non-blank recordings into batch_size tasks."""
+        from api.routers import recordings
+        from api.schemas.recording.request import BulkTopicsRequest
+        from config.settings import get_settings
+
+        monkeypatch.setattr(get_settings().topic_extraction, "batch_size", 2)
+        recordings_map = {i: SimpleNamespace(blank_record=i == 4) for i in range(1, 7)}
+        repo = MagicMock(get_by_ids=AsyncMock(return_value=recordings_map))
+        batch_task = MagicMock()
+        batch_task.delay.side_effect = [SimpleNamespace(id=f"batch-{n}") for n in range(3)]
+
+        with (
+            patch.object(recordings, "_resolve_recording_ids", AsyncMock(return_value=list(range(1, 7)))),
+            patch.object(recordings, "RecordingRepository", return_value=repo),
+            patch("api.tasks.processing.extract_topics_batch_task", batch_task),
+        ):
+            response = await recordings.bulk_extract_topics(
+                BulkTopicsRequest(recording_ids=list(range(1, 7))), MagicMock(user_id="user-1"), MagicMock()
+            )
+
+        assert [call.kwargs["recording_ids"] for call in batch_task.delay.call_args_list] == [[1, 2], [3, 5], [6]]
+        assert response["queued_count"] == 5
+        assert [t["task_id"] for t in response["tasks"]] == ["batch-0", "batch-0", "batch-1", "batch-1", "batch-2"]
@@ -0,0 +1,97 @@
+"""Unit tests for transcript full-text search (GET /recordings/search/transcripts)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api.repositories.transcript_search_repo import TranscriptSearchRepository, ts_config_for_language
+
+
+def _hit(recording_id: int, segment_index: int, start: float) -> dict:
+    return {
+        "recording_id": recording_id,
+        "display_name": f"Lecture {recording_id}",
+        "segment_index": segment_index,
+        "start": start,
+        "end": start + 5.0,
+        "snippet": "about <mark>gradient</mark> descent",
+        "rank": 0.5,
+    }
+
+
+@pytest.mark.unit
+class TestSearchTranscriptsEndpoint:
+    """Tests for GET /api/v1/recordings/search/transcripts."""
+
+    def test_returns_timestamped_hits(self, client, mocker, mock_user):
+        """Search returns hits with recording, segment and start time."""
+        mock_repo = mocker.patch("api.routers.recordings.TranscriptSearchRepository")
+        mock_repo_instance = MagicMock()
+        mock_repo_instance.search = AsyncMock(return_value=[_hit(1, 3, 12.5), _hit(2, 0, 0.0)])
+        mock_repo.return_value = mock_repo_instance
+
+        response = client.get("/api/v1/recordings/search/transcripts?q=gradient")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["has_more"] is False
+        assert [(i["recording_id"], i["start"]) for i in data["items"]] == [(1, 12.5), (2, 0.0)]
+        assert "<mark>gradient</mark>" in data["items"][0]["snippet"]
+        mock_repo_instance.search.assert_awaited_once_with(
+            mock_user.id, "gradient", recording_ids=None, limit=21, offset=0
+        )
+
+    def test_has_more_trims_extra_row(self, client, mocker):
+        """One extra row beyond per_page sets has_more and is not returned."""
+        mock_repo = mocker.patch("api.routers.recordings.TranscriptSearchRepository")
+        mock_repo_instance = MagicMock()
+        mock_repo_instance.search = AsyncMock(return_value=[_hit(1, i, i * 5.0) for i in range(3)])
+        mock_repo.return_value = mock_repo_instance
+
+        response = client.get("/api/v1/recordings/search/transcripts?q=gradient&per_page=2&page=2&recording_id=1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["has_more"] is True
+        assert len(data["items"]) == 2
+        kwargs = mock_repo_instance.search.await_args.kwargs
+        assert kwargs == {"recording_ids": [1], "limit": 3, "offset": 2}
+
+    def test_short_query_rejected(self, client):
+        """A one-character query is rejected."""
+        response = client.get("/api/v1/recordings/search/transcripts?q=a")
+
+        assert response.status_code == 422
+
+
+@pytest.mark.unit
+class TestTranscriptSearchRepository:
+    """Tests for indexing helpers."""
+
+    @pytest.mark.parametrize(
+        ("language", "expected"),
+        [("ru", "russian"), ("en-US", "english"), ("EN", "english"), ("auto", "simple"), (None, "simple")],
+    )
+    def test_ts_config_for_language(self, language, expected):
+        """Transcript language maps to the Postgres text search config."""
+        assert ts_config_for_language(language) == expected
+
+    async def test_replace_for_recording_skips_empty_segments(self):
+        """Indexing a recording skips whitespace-only segments."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+        repo = TranscriptSearchRepository(session)
+
+        segments = [
+            {"start": 0.0, "end": 4.0, "text": "Hello"},
+            {"start": 4.0, "end": 5.0, "text": "   "},
+            {"start": 5.0, "end": 9.0, "text": "world"},
+        ]
+        written = await repo.replace_for_recording(7, "user-1", segments, "en")
+
+        assert written == 2
+        # DELETE of previous rows + one INSERT batch
+        assert session.execute.await_count == 2
+        insert_sql = str(session.execute.await_args_list[1].args[0].compile(dialect=postgresql.asyncpg.dialect()))
+        assert "to_tsvector" in insert_sql
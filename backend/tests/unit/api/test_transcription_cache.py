@@ -0,0 +1,243 @@
+"""Unit tests for the content-hash keyed transcription result cache."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api.observability import transcription_cache_lookups_total
+from api.repositories.transcription_cache_repo import TranscriptionCacheRepository, transcription_cache_key
+
+AUDIO_SHA = "a" * 64
+
+
+def _key(**overrides) -> str:
+    params = {
+        "user_id": "user-1",
+        "audio_sha256": AUDIO_SHA,
+        "language": "ru",
+        "language_detection": False,
+        "speech_models": ["universal-3-pro", "universal-2"],
+        "keyterms": ["градиент", "LEAP"],
+    }
+    params.update(overrides)
+    return transcription_cache_key(**params)
+
+
+def _lookups(result: str) -> float:
+    return transcription_cache_lookups_total.labels(result=result)._value.get()
+
+
+@pytest.mark.unit
+class TestTranscriptionCacheKey:
+    def test_deterministic(self):
+        """The key is a stable SHA-256 hex digest."""
+        assert _key() == _key()
+        assert len(_key()) == 64
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"user_id": "user-2"},
+            {"audio_sha256": "b" * 64},
+            {"language": "en"},
+            {"speech_models": ["universal-2"]},
+            {"keyterms": ["градиент"]},
+            {"language_detection": True},
+        ],
+    )
+    def test_any_parameter_changes_key(self, override):
+        """Changing any transcription parameter changes the key."""
+        assert _key(**override) != _key()
+
+    def test_language_ignored_with_detection(self):
+        """With language detection on, the requested language is not part of the key."""
+        assert _key(language_detection=True, language="ru") == _key(language_detection=True, language="en")
+
+
+@pytest.mark.unit
+class TestTranscriptionCacheRepository:
+    async def test_put_upserts_normalized_payload(self):
+        """put upserts the normalized result with its metadata."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+        repo = TranscriptionCacheRepository(session)
+
+        await repo.put(
+            _key(),
+            user_id="user-1",
+            audio_sha256=AUDIO_SHA,
+            language="ru",
+            speech_model="universal-3-pro",
+            keyterms_count=2,
+            source_recording_id=7,
+            result={"text": "hi", "words": [{"word": "hi"}], "segments": [], "language": "ru", "extra": 1},
+        )
+
+        stmt = session.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+        assert "ON CONFLICT (cache_key) DO UPDATE" in sql
+        params = stmt.compile().params
+        assert params["result"] == {"text": "hi", "words": [{"word": "hi"}], "segments": [], "language": "ru"}
+        assert params["words_count"] == 1
+
+
+@pytest.mark.unit
+class TestLookupTranscriptionCache:
+    def _job(self) -> dict:
+        return {
+            "language": "ru",
+            "language_detection": False,
+            "speech_models": ["universal-2"],
+            "audio_storage_key": "users/user_000001/recordings/7/audio.mp3",
+        }
+
+    async def test_hit_marks_job_and_counts(self, mocker):
+        """A hit marks the job as served from cache and counts the hit."""
+        from api.tasks.processing import _lookup_transcription_cache
+
+        cached = {"text": "hi", "words": [{"word": "hi"}], "segments": [], "language": "ru"}
+        repo = mocker.patch("api.repositories.transcription_cache_repo.TranscriptionCacheRepository")
+        repo.return_value.get_result = AsyncMock(return_value=cached)
+        storage = MagicMock(content_sha256=AsyncMock(return_value=AUDIO_SHA))
+        recording = SimpleNamespace(user_id="user-1", id=7)
+        job = self._job()
+        before = _lookups("hit")
+
+        result = await _lookup_transcription_cache(MagicMock(), storage, recording, job, ["LEAP"])
+
+        assert result is cached
+        assert job["cache_hit"] is True
+        assert job["cache"]["audio_sha256"] == AUDIO_SHA
+        assert _lookups("hit") == before + 1
+
+    async def test_miss_keeps_key_for_store(self, mocker):
+        """A miss keeps the key so the result can be stored later."""
+        from api.tasks.processing import _lookup_transcription_cache
+
+        repo = mocker.patch("api.repositories.transcription_cache_repo.TranscriptionCacheRepository")
+        repo.return_value.get_result = AsyncMock(return_value=None)
+        storage = MagicMock(content_sha256=AsyncMock(return_value=AUDIO_SHA))
+        job = self._job()
+        before = _lookups("miss")
+
+        result = await _lookup_transcription_cache(MagicMock(), storage, SimpleNamespace(user_id="user-1"), job, [])
+
+        assert result is None
+        assert "cache_hit" not in job
+        assert job["cache"]["key"] == transcription_cache_key(
+            user_id="user-1",
+            audio_sha256=AUDIO_SHA,
+            language="ru",
+            language_detection=False,
+            speech_models=["universal-2"],
+            keyterms=[],
+        )
+        assert _lookups("miss") == before + 1
+
+    async def test_hash_failure_disables_cache(self):
+        """If the audio can't be hashed the cache is skipped for the job."""
+        from api.tasks.processing import _lookup_transcription_cache
+
+        storage = MagicMock(content_sha256=AsyncMock(side_effect=FileNotFoundError("gone")))
+        job = self._job()
+        before = _lookups("error")
+
+        result = await _lookup_transcription_cache(MagicMock(), storage, SimpleNamespace(user_id="user-1"), job, [])
+
+        assert result is None
+        assert "cache" not in job
+        assert _lookups("error") == before + 1
+
+    async def test_store_skipped_after_hit(self, mocker):
+        """A result that came from the cache is not stored again."""
+        from api.tasks.processing import _store_transcription_cache
+
+        repo = mocker.patch("api.repositories.transcription_cache_repo.TranscriptionCacheRepository")
+        job = {**self._job(), "cache": {"key": _key(), "audio_sha256": AUDIO_SHA}, "cache_hit": True}
+
+        await _store_transcription_cache(MagicMock(), SimpleNamespace(user_id="user-1", id=7), {}, job)
+
+        repo.assert_not_called()
+
+
+def _entry(**overrides) -> SimpleNamespace:
+    data = {
+        "cache_key": _key(),
+        "user_id": "user-1",
+        "source_recording_id": 7,
+        "audio_sha256": AUDIO_SHA,
+        "language": "ru",
+        "speech_model": "universal-3-pro",
+        "keyterms_count": 2,
+        "words_count": 1200,
+        "size_bytes": 64000,
+        "hit_count": 3,
+        "last_hit_at": datetime.now(UTC),
+        "created_at": datetime.now(UTC),
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+@pytest.mark.unit
+class TestAdminTranscriptionCacheEndpoints:
+    """Tests for /api/v1/admin/transcription-cache."""
+
+    def test_list_entries(self, admin_client, mocker):
+        """Admins can page through cache entries filtered by user."""
+        repo = mocker.patch("api.routers.admin.TranscriptionCacheRepository")
+        repo.return_value.list_entries = AsyncMock(return_value=([_entry()], 21))
+
+        response = admin_client.get("/api/v1/admin/transcription-cache?user_id=user-1&per_page=20&page=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 21
+        assert data["total_pages"] == 2
+        assert data["items"][0]["hit_count"] == 3
+        assert "result" not in data["items"][0]
+        repo.return_value.list_entries.assert_awaited_once_with(
+            user_id="user-1", audio_sha256=None, limit=20, offset=20
+        )
+
+    def test_get_missing_entry(self, admin_client, mocker):
+        """A missing cache entry is 404."""
+        repo = mocker.patch("api.routers.admin.TranscriptionCacheRepository")
+        repo.return_value.get = AsyncMock(return_value=None)
+
+        response = admin_client.get(f"/api/v1/admin/transcription-cache/{_key()}")
+
+        assert response.status_code == 404
+
+    def test_evict_entry_is_audited(self, admin_client, mocker, mock_db_session):
+        """Evicting an entry writes an audit record."""
+        repo = mocker.patch("api.routers.admin.TranscriptionCacheRepository")
+        repo.return_value.delete = AsyncMock(return_value=True)
+        audit = mocker.patch("api.routers.admin._audit", new_callable=AsyncMock)
+
+        response = admin_client.delete(f"/api/v1/admin/transcription-cache/{_key()}")
+
+        assert response.status_code == 204
+        repo.return_value.delete.assert_awaited_once_with(_key())
+        assert audit.await_args.args[3] == "transcription_cache.evicted"
+        mock_db_session.commit.assert_awaited()
+
+    def test_evict_user_entries(self, admin_client, mocker):
+        """All cache entries of a user can be evicted at once."""
+        repo = mocker.patch("api.routers.admin.TranscriptionCacheRepository")
+        repo.return_value.delete_for_user = AsyncMock(return_value=4)
+        mocker.patch("api.routers.admin._audit", new_callable=AsyncMock)
+
+        response = admin_client.delete("/api/v1/admin/users/user-1/transcription-cache")
+
+        assert response.status_code == 200
+        assert response.json() == {"evicted": 4}
+
+    def test_requires_admin(self, client):
+        """The cache endpoints are admin-only."""
+        response = client.get("/api/v1/admin/transcription-cache")
+
+        assert response.status_code == 403
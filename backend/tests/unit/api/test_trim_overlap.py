@@ -0,0 +1,110 @@
+"""Transcription overlapping the video trim: early chain release and the join before uploads."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from celery.exceptions import Retry
+
+from models import ProcessingStageStatus
+
+TRANSCRIBE = "api.tasks.processing.transcribe_recording"
+AWAIT_TRIM = "api.tasks.processing.await_trim"
+FINALIZE = "api.tasks.processing.finalize_pipeline"
+
+
+@pytest.mark.unit
+class TestStartTranscriptionEarly:
+    def test_releases_rest_of_chain_in_order(self, mocker):
+        """Early transcription queues the remaining steps in their original order."""
+        from api.tasks.processing import _start_transcription_early
+
+        mock_chain = mocker.patch("api.tasks.processing.chain")
+        mocker.patch("celery.signature", side_effect=lambda step, app=None: step["task"])  # noqa: ARG005
+        # request.chain is reversed: the next step is last
+        task_self = SimpleNamespace(
+            request=SimpleNamespace(chain=[{"task": FINALIZE}, {"task": AWAIT_TRIM}, {"task": TRANSCRIBE}])
+        )
+
+        assert _start_transcription_early(task_self) is True
+        assert task_self.request.chain is None
+        assert mock_chain.call_args.args == (TRANSCRIBE, AWAIT_TRIM, FINALIZE)
+        mock_chain.return_value.apply_async.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "remaining",
+        [
+            None,
+            [{"task": FINALIZE}, {"task": TRANSCRIBE}],
+            [{"task": FINALIZE}, {"task": AWAIT_TRIM}, {"task": "api.tasks.processing.extract_topics"}],
+        ],
+    )
+    def test_chain_kept_without_join_or_transcribe(self, mocker, remaining):
+        """Without a join step or a transcription step the chain is left untouched."""
+        from api.tasks.processing import _start_transcription_early
+
+        mock_chain = mocker.patch("api.tasks.processing.chain")
+        task_self = SimpleNamespace(request=SimpleNamespace(chain=remaining))
+
+        assert _start_transcription_early(task_self) is False
+        assert task_self.request.chain == remaining
+        mock_chain.assert_not_called()
+
+
+@pytest.mark.unit
+class TestAwaitTrim:
+    def _run(self, mocker, paused: bool, status: ProcessingStageStatus):
+        from api.tasks import processing
+
+        mocker.patch.object(processing, "_trim_stage_status", AsyncMock(return_value=(paused, status)))
+        return processing.await_trim_task(7, "user-1")
+
+    def test_passes_when_trim_completed(self, mocker):
+        """The join passes once trimming has completed."""
+        assert self._run(mocker, False, ProcessingStageStatus.COMPLETED)["status"] == "completed"
+
+    def test_retries_while_trim_running(self, mocker):
+        """The join retries while trimming is still running."""
+        with pytest.raises(Retry):
+            self._run(mocker, False, ProcessingStageStatus.IN_PROGRESS)
+
+    def test_fails_when_trim_failed(self, mocker):
+        """The join fails when trimming failed."""
+        with pytest.raises(RuntimeError, match="trimming failed"):
+            self._run(mocker, False, ProcessingStageStatus.FAILED)
+
+    def test_paused_recording_not_polled(self, mocker):
+        """A paused recording is reported as paused, not polled."""
+        assert self._run(mocker, True, ProcessingStageStatus.IN_PROGRESS)["status"] == "paused"
+
+
+@pytest.mark.unit
+class TestPipelineJoin:
+    def test_join_inserted_before_uploads(self, mocker):
+        """The trim join goes after transcription and topics, before the uploads."""
+        from api.tasks import processing
+
+        config = {"trimming": {"enable_trimming": True}, "transcription": {"enable_subtitles": False}}
+        output_config = {"auto_upload": True, "default_platforms": ["youtube"], "preset_ids": []}
+        for task in (
+            processing.download_recording_task,
+            processing.trim_video_task,
+            processing.transcribe_recording_task,
+            processing.extract_topics_task,
+            processing.await_trim_task,
+            processing._launch_uploads_task,
+            processing._finalize_pipeline_task,
+        ):
+            mocker.patch.object(task, "si", return_value=task.name.rsplit(".", 1)[-1])
+
+        task_chain, _ = processing._build_pipeline_chain(7, "user-1", {}, config, output_config, [])
+
+        assert task_chain == [
+            "download_recording",
+            "trim_video",
+            "transcribe_recording",
+            "extract_topics",
+            "await_trim",
+            "launch_uploads",
+            "finalize_pipeline",
+        ]
@@ -0,0 +1,245 @@
+"""Chunked transcription: cut planning, stitching and an end-to-end run against the fake ASR server."""
+
+import asyncio
+from functools import partial
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.services.asr_job_slots import AsrJobSlots
+from assemblyai_module.chunking import AudioChunk, plan_chunks, stitch_chunks
+from assemblyai_module.config import AssemblyAIConfig, AssemblyAISettings
+from assemblyai_module.service import AssemblyAITranscriptionService
+from file_storage import path_builder
+from file_storage.path_builder import StoragePathBuilder
+from tests.fixtures.fake_asr import FakeASRServer
+from tests.fixtures.fake_redis import FakeRedis
+
+
+def _words(*spans: tuple[str, float, float]) -> list[dict]:
+    return [{"id": i, "word": w, "start": s, "end": e} for i, (w, s, e) in enumerate(spans)]
+
+
+@pytest.mark.unit
+class TestPlanChunks:
+    def test_short_recording_is_one_chunk(self):
+        """A recording within target plus window stays one chunk."""
+        chunks = plan_chunks(600.0, [], target_seconds=1800, search_window=90, overlap=2)
+
+        assert chunks == [AudioChunk(index=0, start=0.0, end=600.0, own_start=0.0, own_end=600.0)]
+
+    def test_cuts_snap_to_nearest_silence_within_window(self):
+        """Cuts move to the closest silence midpoint inside the search window."""
+        silences = [(1700.0, 1702.0), (1790.0, 1796.0), (3650.0, 3651.0)]
+
+        chunks = plan_chunks(5000.0, silences, target_seconds=1800, search_window=90, overlap=2)
+
+        assert [c.own_end for c in chunks] == [1793.0, 3650.5, 5000.0]
+        assert chunks[1].start == pytest.approx(1791.0)
+        assert chunks[1].end == pytest.approx(3652.5)
+
+    def test_hard_cut_without_silence_and_tail_absorbed(self):
+        """Without a nearby silence the cut stays at the target; a short tail joins the last chunk."""
+        chunks = plan_chunks(3800.0, [(100.0, 101.0)], target_seconds=1800, search_window=90, overlap=2)
+
+        # No silence near 1800/3600 → cuts stay at the targets; the 200 s tail joins the last chunk
+        assert [c.own_end for c in chunks] == [1800.0, 3600.0, 3800.0]
+        assert chunks[0].start == 0.0
+        assert chunks[-1].end == 3800.0
+
+
+@pytest.mark.unit
+class TestStitchChunks:
+    def test_overlap_words_and_segments_kept_once(self):
+        """Words and segments in the overlap are kept once, by the chunk that owns them."""
+        chunks = [
+            AudioChunk(index=0, start=0.0, end=12.0, own_start=0.0, own_end=10.0),
+            AudioChunk(index=1, start=8.0, end=20.0, own_start=10.0, own_end=20.0),
+        ]
+        first = {
+            "words": _words(("a", 1.0, 1.5), ("b", 9.0, 9.5), ("c", 10.5, 11.0)),
+            "segments": [
+                {"id": 0, "start": 1.0, "end": 9.5, "text": "a b"},
+                {"id": 1, "start": 10.5, "end": 11.0, "text": "c"},
+            ],
+            "language": "en",
+        }
+        # Same speech seen from chunk 2 (times relative to 8.0)
+        second = {
+            "words": _words(("b", 1.0, 1.5), ("c", 2.5, 3.0), ("d", 5.0, 5.5)),
+            "segments": [
+                {"id": 0, "start": 1.0, "end": 1.5, "text": "b"},
+                {"id": 1, "start": 2.5, "end": 5.5, "text": "c d"},
+            ],
+            "language": "en",
+        }
+
+        result = stitch_chunks(chunks, [first, second])
+
+        assert [(w["word"], w["start"]) for w in result["words"]] == [("a", 1.0), ("b", 9.0), ("c", 10.5), ("d", 13.0)]
+        assert [w["id"] for w in result["words"]] == [0, 1, 2, 3]
+        assert [(s["text"], s["start"]) for s in result["segments"]] == [("a b", 1.0), ("c d", 10.5)]
+        assert result["text"] == "a b c d"
+        assert result["language"] == "en"
+
+    def test_seam_segment_end_clamped_to_next_start(self):
+        """A segment crossing the seam ends where the next one starts."""
+        chunks = [
+            AudioChunk(index=0, start=0.0, end=12.0, own_start=0.0, own_end=10.0),
+            AudioChunk(index=1, start=8.0, end=20.0, own_start=10.0, own_end=20.0),
+        ]
+        first = {
+            "words": _words(("a", 9.0, 9.4)),
+            "segments": [{"id": 0, "start": 9.0, "end": 11.5, "text": "a"}],
+            "language": "en",
+        }
+        second = {
+            "words": _words(("b", 2.2, 2.8)),
+            "segments": [{"id": 0, "start": 2.2, "end": 2.8, "text": "b"}],
+            "language": "en",
+        }
+
+        segments = stitch_chunks(chunks, [first, second])["segments"]
+
+        assert segments[0]["end"] == pytest.approx(10.2)
+        assert segments[1]["start"] == pytest.approx(10.2)
+
+    def test_all_silent_chunks_raise(self):
+        """Stitching chunks with no words at all raises."""
+        chunks = [AudioChunk(index=0, start=0.0, end=5.0, own_start=0.0, own_end=5.0)]
+
+        with pytest.raises(ValueError, match="No words"):
+            stitch_chunks(chunks, [{"words": [], "segments": [], "language": None}])
+
+
+# --- end to end against the fake ASR server -------------------------------------------------
+#
+# The "recording" is one long script: word k is spoken at k * 0.5 s, sentences are four words.
+# Each uploaded chunk file holds "start:end"; the fake transcribes it to the words inside that
+# window with chunk-relative timings, exactly like a real ASR would.
+
+DURATION = 50.0
+SILENCES = [(9.6, 10.4), (30.5, 31.5)]
+
+
+def _script_word(k: int) -> str:
+    return f"w{k}." if k % 4 == 3 else f"w{k}"
+
+
+@pytest.fixture
+def fake_asr():
+    server = FakeASRServer(polls_until_done=1, processing_delay=0.1)
+
+    def words_for(audio_url: str) -> list[str]:
+        start, end = (float(x) for x in server.uploads[audio_url].decode().split(":"))
+        return [_script_word(k) for k in range(int(start * 2), int(end * 2))]
+
+    server.words_for = words_for
+    with server:
+        yield server
+
+
+def _make_service(base_url: str, job_slots: AsrJobSlots | None = None) -> AssemblyAITranscriptionService:
+    settings = AssemblyAISettings(
+        base_url=base_url,
+        speech_models=["universal-2"],
+        language_code="en",
+        poll_interval=1.0,
+        chunked_mode=True,
+        chunk_target_seconds=300.0,
+        chunk_concurrency=2,
+        account_concurrency=3,
+    )
+    return AssemblyAITranscriptionService(AssemblyAIConfig(api_key="aai_test", settings=settings), job_slots)
+
+
+def _prepare(chunks: list[AudioChunk]):
+    async def prepare(audio_storage_key, workdir):
+        paths = []
+        for chunk in chunks:
+            path = workdir / f"chunk_{chunk.index:03d}.mp3"
+            path.write_bytes(f"{chunk.start}:{chunk.end}".encode())
+            paths.append(path)
+        return chunks, paths
+
+    return prepare
+
+
+@pytest.fixture(autouse=True)
+def storage_temp(tmp_path, monkeypatch):
+    """Chunk work dirs go under the storage temp dir; point it at ``tmp_path``."""
+    monkeypatch.setattr(path_builder, "StoragePathBuilder", partial(StoragePathBuilder, tmp_path))
+    return tmp_path / "temp"
+
+
+@pytest.mark.unit
+class TestChunkedTranscriptionEndToEnd:
+    async def test_chunks_transcribed_in_parallel_and_stitched(self, fake_asr, storage_temp):
+        """Chunks are transcribed in parallel and stitched back in recording time."""
+        svc = _make_service(fake_asr.base_url)
+        chunks = plan_chunks(DURATION, SILENCES, target_seconds=10.0, search_window=2.0, overlap=2.0)
+        assert [c.own_end for c in chunks] == [10.0, 20.0, 31.0, 41.0, 50.0]
+
+        with patch.object(svc, "_prepare_chunks", side_effect=_prepare(chunks)):
+            result = await svc.transcribe_audio_chunked("storage/long.mp3", "en", [])
+
+        expected_words = [_script_word(k) for k in range(int(DURATION * 2))]
+        assert [w["word"] for w in result["words"]] == expected_words
+        assert [w["start"] for w in result["words"]] == pytest.approx([k * 0.5 for k in range(len(expected_words))])
+        assert [s["start"] for s in result["segments"]] == pytest.approx([j * 2.0 for j in range(25)])
+        assert result["segments"][15]["text"] == "w60 w61 w62 w63."
+        assert result["text"].split() == expected_words
+        assert result["language"] == "en"
+
+        assert len(fake_asr.uploads) == len(chunks)
+        assert 1 < fake_asr.max_active_jobs <= 2
+        assert list(storage_temp.iterdir()) == []
+
+    async def test_account_cap_shared_across_recordings(self, fake_asr, storage_temp):
+        """Two recordings on one API key stay within account_concurrency together."""
+        job_slots = AsrJobSlots(FakeRedis())
+        services = [_make_service(fake_asr.base_url, job_slots) for _ in range(2)]
+        chunks = plan_chunks(DURATION, SILENCES, target_seconds=10.0, search_window=2.0, overlap=2.0)
+
+        async def transcribe(svc: AssemblyAITranscriptionService) -> dict:
+            with patch.object(svc, "_prepare_chunks", side_effect=_prepare(chunks)):
+                return await svc.transcribe_audio_chunked("storage/long.mp3", "en", [])
+
+        results = await asyncio.gather(*(transcribe(svc) for svc in services))
+
+        assert results[0]["words"] == results[1]["words"]
+        assert len(fake_asr.uploads) == 2 * len(chunks)
+        assert 2 < fake_asr.max_active_jobs <= 3
+        assert job_slots.redis.zsets == {}
+        assert list(storage_temp.iterdir()) == []
+
+    async def test_single_chunk_falls_back_to_regular_transcription(self, fake_asr):
+        """A single planned chunk falls back to the regular transcription."""
+        svc = _make_service(fake_asr.base_url)
+        chunks = plan_chunks(20.0, [], target_seconds=300.0, search_window=90.0, overlap=2.0)
+        regular = {"text": "x", "words": [], "segments": [], "language": "en"}
+
+        with (
+            patch.object(svc, "_prepare_chunks", side_effect=_prepare(chunks)),
+            patch.object(svc, "transcribe_audio", AsyncMock(return_value=regular)) as transcribe,
+        ):
+            result = await svc.transcribe_audio_chunked("storage/short.mp3", "en", [])
+
+        assert result is regular
+        transcribe.assert_awaited_once_with("storage/short.mp3", "en", [])
+        assert fake_asr.uploads == {}
+
+    async def test_short_duration_skips_download(self, fake_asr):
+        """A known short duration skips the download and silence detection."""
+        svc = _make_service(fake_asr.base_url)
+        regular = {"text": "x", "words": [], "segments": [], "language": "en"}
+
+        with (
+            patch.object(svc, "_prepare_chunks") as prepare,
+            patch.object(svc, "transcribe_audio", AsyncMock(return_value=regular)) as transcribe,
+        ):
+            result = await svc.transcribe_audio_chunked("storage/short.mp3", "en", [], duration=320.0)
+
+        assert result is regular
+        prepare.assert_not_called()
+        transcribe.assert_awaited_once_with("storage/short.mp3", "en", [])
@@ -0,0 +1,113 @@
+"""Non-blocking AssemblyAI flow (submit → status → complete) against a local fake ASR server."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from assemblyai_module.config import AssemblyAIConfig, AssemblyAISettings
+from assemblyai_module.service import WEBHOOK_AUTH_HEADER, AssemblyAITranscriptionService
+from tests.fixtures.fake_asr import FakeASRServer
+
+AUDIO_URL = "https://storage.example/audio.mp3"
+BROKEN_URL = "https://storage.example/broken.mp3"
+
+
+@pytest.fixture(scope="module")
+def fake_asr():
+    with FakeASRServer(polls_until_done=2, failing_audio_urls={BROKEN_URL}) as server:
+        yield server
+
+
+def _make_service(base_url: str, **overrides) -> AssemblyAITranscriptionService:
+    settings = AssemblyAISettings(
+        base_url=base_url,
+        speech_models=["universal-2"],
+        language_code="en",
+        poll_interval=1.0,
+        max_wait_seconds=60.0,
+        **overrides,
+    )
+    return AssemblyAITranscriptionService(AssemblyAIConfig(api_key="aai_test", settings=settings))
+
+
+def _storage(url: str) -> MagicMock:
+    storage = MagicMock()
+    storage.presigned_url = AsyncMock(return_value=url)
+    return storage
+
+
+@pytest.mark.unit
+class TestNonBlockingTranscription:
+    async def test_submit_returns_immediately_then_completes(self, fake_asr):
+        """submit_transcription returns before any poll; the transcript completes later."""
+        svc = _make_service(fake_asr.base_url)
+
+        with patch("file_storage.factory.get_storage_backend", return_value=_storage(AUDIO_URL)):
+            transcript_id = await svc.submit_transcription("storage/audio.mp3", "en", [])
+
+        assert fake_asr.transcripts[transcript_id]["polls"] == 0
+        assert await svc.get_statuses([transcript_id]) == {transcript_id: "processing"}
+
+        data = await svc.get_transcript(transcript_id)
+        assert data["status"] == "completed"
+
+        result = await svc.complete_transcription(data, "en")
+        assert result["text"] == "Hello world. This is a lecture."
+        assert [s["text"] for s in result["segments"]] == ["Hello world.", "This is a lecture."]
+        assert len(result["words"]) == 6
+
+    async def test_get_statuses_omits_failed_lookups(self, fake_asr):
+        """Transcripts whose status lookup fails are left out."""
+        svc = _make_service(fake_asr.base_url)
+
+        with patch("file_storage.factory.get_storage_backend", return_value=_storage(AUDIO_URL)):
+            transcript_id = await svc.submit_transcription("storage/audio.mp3", "en", [])
+
+        statuses = await svc.get_statuses([transcript_id, "missing"])
+
+        assert statuses == {transcript_id: "processing"}
+
+    async def test_error_transcript_raises(self, fake_asr):
+        """An errored transcript raises with AssemblyAI's error message."""
+        svc = _make_service(fake_asr.base_url)
+
+        with patch("file_storage.factory.get_storage_backend", return_value=_storage(BROKEN_URL)):
+            transcript_id = await svc.submit_transcription("storage/broken.mp3", "en", [])
+        await svc.get_transcript(transcript_id)
+        data = await svc.get_transcript(transcript_id)
+
+        with pytest.raises(RuntimeError, match="could not be decoded"):
+            await svc.complete_transcription(data, "en")
+
+    async def test_not_completed_raises(self):
+        """Completing a transcript that is still processing raises."""
+        svc = _make_service("http://unused")
+
+        with pytest.raises(RuntimeError, match="not completed"):
+            await svc.complete_transcription({"id": "t1", "status": "processing"}, "en")
+
+    async def test_blocking_transcribe_still_polls_to_completion(self, fake_asr):
+        """The blocking transcribe_audio still polls until the result is ready."""
+        svc = _make_service(fake_asr.base_url)
+
+        with patch("file_storage.factory.get_storage_backend", return_value=_storage(AUDIO_URL)):
+            result = await svc.transcribe_audio("storage/audio.mp3", "en", [])
+
+        assert result["language"] == "en"
+        assert len(result["segments"]) == 2
+
+    async def test_webhook_fields_sent_when_configured(self, fake_asr):
+        """webhook_url and the auth header are sent when a secret is configured."""
+        svc = _make_service(
+            fake_asr.base_url,
+            webhook_url="https://leap.example/api/v1/webhooks/assemblyai",
+            webhook_secret="s3cret",
+        )
+
+        with patch("file_storage.factory.get_storage_backend", return_value=_storage(AUDIO_URL)):
+            transcript_id = await svc.submit_transcription("storage/audio.mp3", "en", [])
+
+        payload = fake_asr.transcripts[transcript_id]["payload"]
+        assert payload["webhook_url"] == "https://leap.example/api/v1/webhooks/assemblyai"
+        assert payload["webhook_auth_header_name"] == WEBHOOK_AUTH_HEADER
+        assert payload["webhook_auth_header_value"] == "s3cret"
@@ -75,11 +75,9 @@ class TestAssemblyAIServiceFetchSentences:
         mock_response.raise_for_status = MagicMock()
 
         mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.get = AsyncMock(return_value=mock_response)
 
-        with patch("assemblyai_module.service.httpx.AsyncClient", return_value=mock_client):
+        with patch("assemblyai_module.service.get_http_client", return_value=mock_client):
             result = await svc._fetch_sentences("tid_abc")
 
         assert result == [{"text": "Hi.", "start": 0, "end": 500}]
@@ -92,11 +90,9 @@ class TestAssemblyAIServiceFetchSentences:
         mock_response.raise_for_status = MagicMock()
 
         mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.get = AsyncMock(return_value=mock_response)
 
-        with patch("assemblyai_module.service.httpx.AsyncClient", return_value=mock_client):
+        with patch("assemblyai_module.service.get_http_client", return_value=mock_client):
             result = await svc._fetch_sentences("tid_abc")
 
         assert result == []
@@ -182,11 +178,9 @@ class TestAssemblyAIServiceSubmit:
         mock_response.raise_for_status = MagicMock()
 
         mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.post = AsyncMock(return_value=mock_response)
 
-        with patch("assemblyai_module.service.httpx.AsyncClient", return_value=mock_client):
+        with patch("assemblyai_module.service.get_http_client", return_value=mock_client):
             transcript_id = await svc._submit("https://example.com/audio.mp3", "ru", ["Python"])
 
         assert transcript_id == "test_id_123"
@@ -209,11 +203,9 @@ class TestAssemblyAIServicePoll:
         completed_response.raise_for_status = MagicMock()
 
         mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.get = AsyncMock(return_value=completed_response)
 
-        with patch("assemblyai_module.service.httpx.AsyncClient", return_value=mock_client):
+        with patch("assemblyai_module.service.get_http_client", return_value=mock_client):
             result = await svc._poll("test_id")
 
         assert result["status"] == "completed"
@@ -227,10 +219,8 @@ class TestAssemblyAIServicePoll:
         error_response.raise_for_status = MagicMock()
 
         mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.get = AsyncMock(return_value=error_response)
 
-        with patch("assemblyai_module.service.httpx.AsyncClient", return_value=mock_client):
+        with patch("assemblyai_module.service.get_http_client", return_value=mock_client):
             with pytest.raises(RuntimeError, match="Bad audio"):
                 await svc._poll("test_id")
@@ -0,0 +1,148 @@
+"""Map-reduce topic extraction for long transcripts (mocked chat completions)."""
+
+import asyncio
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from deepseek_module import DeepSeekConfig, TopicExtractor
+from deepseek_module.topic_extractor import _te
+
+REDUCE_RESPONSE = """## САММАРИ ВИДЕО
+Лекция о градиентном спуске и регуляризации.
+
+## ОСНОВНАЯ ТЕМА ВИДЕО
+Методы оптимизации моделей
+
+## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ
+[00:00:00] - Постановка задачи оптимизации
+[01:30:00] - Градиентный спуск
+[02:40:00] - Регуляризация моделей
+
+## ВОПРОСЫ ДЛЯ САМОПРОВЕРКИ
+1. Что такое градиент?
+"""
+
+
+def _segments(minutes: int) -> list[dict]:
+    return [{"start": m * 60.0, "end": m * 60.0 + 50, "text": f"Минута {m} лекции"} for m in range(minutes)]
+
+
+def _response(content: str) -> SimpleNamespace:
+    usage = SimpleNamespace(prompt_tokens=100, completion_tokens=10, total_tokens=110)
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+
+class FakeCompletions:
+    """Answers map prompts with one topic per window and the reduce prompt with REDUCE_RESPONSE."""
+
+    def __init__(self, fail_windows: int = 0):
+        self.prompts: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self.fail_windows = fail_windows
+
+    async def create(self, *, messages, **_params) -> SimpleNamespace:
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        if "Фрагмент:" not in prompt:
+            return _response(REDUCE_RESPONSE)
+
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        if self.fail_windows:
+            self.fail_windows -= 1
+            raise RuntimeError("upstream 500")
+        start = re.search(r"фрагмент (\d{2}:\d{2}:\d{2})", prompt).group(1)
+        return _response(
+            f"## САММАРИ ФРАГМЕНТА\nЧасть с {start}.\n\n## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ\n[{start}] - Тема {start}\n"
+        )
+
+
+def _extractor(completions: FakeCompletions) -> TopicExtractor:
+    extractor = TopicExtractor(DeepSeekConfig(api_key="test"))
+    extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return extractor
+
+
+@pytest.mark.unit
+class TestChunkedExtraction:
+    async def test_long_recording_uses_map_reduce(self):
+        """A long transcript is mapped window by window, then reduced in one call."""
+        completions = FakeCompletions()
+
+        result = await _extractor(completions).extract_topics(_segments(180), recording_topic="ML")
+
+        windows = TopicExtractor._split_windows(
+            [(m * 60.0, "") for m in range(180)], _te.chunk_window_minutes * 60, _te.chunk_overlap_minutes * 60
+        )
+        assert len(completions.prompts) == len(windows) + 1
+        assert 1 < completions.peak <= _te.chunk_concurrency
+
+        reduce_prompt = completions.prompts[-1]
+        assert "[00:36:00] - Тема 00:36:00" in reduce_prompt
+        assert "Часть с 00:36:00." in reduce_prompt
+
+        assert result["summary"] == "Лекция о градиентном спуске и регуляризации."
+        assert result["main_topics"] == ["Методы оптимизации моделей"]
+        assert [t["start"] for t in result["topic_timestamps"]] == [0.0, 5400.0, 9600.0]
+        assert result["topic_timestamps"][-1]["end"] == 179 * 60 + 50
+        assert result["questions"] == ["Что такое градиент?"]
+        assert result["usage"]["total_tokens"] == 110 * len(completions.prompts)
+
+    async def test_short_recording_single_call(self):
+        """A short transcript still takes one completion."""
+        completions = FakeCompletions()
+
+        result = await _extractor(completions).extract_topics(_segments(30))
+
+        assert len(completions.prompts) == 1
+        assert "Транскрипция:" in completions.prompts[0]
+        assert result["summary"] == "Лекция о градиентном спуске и регуляризации."
+
+    async def test_failed_window_skipped(self):
+        """A window that fails is skipped and the rest is reduced."""
+        completions = FakeCompletions(fail_windows=1)
+
+        result = await _extractor(completions).extract_topics(_segments(180))
+
+        assert result["main_topics"] == ["Методы оптимизации моделей"]
+
+    async def test_all_windows_failed_returns_empty(self):
+        """With every window failed the result is empty and no reduce call is made."""
+        completions = FakeCompletions(fail_windows=100)
+        extractor = _extractor(completions)
+        extractor._complete = AsyncMock(wraps=extractor._complete)
+
+        result = await extractor.extract_topics(_segments(180))
+
+        assert result["topic_timestamps"] == []
+        assert all("Фрагмент:" in call.args[1] for call in extractor._complete.await_args_list)
+
+
+@pytest.mark.unit
+class TestSplitWindows:
+    def test_windows_overlap_and_cover_all_lines(self):
+        """Windows overlap and together cover every transcript line."""
+        lines = [(m * 60.0, f"line {m}") for m in range(100)]
+
+        windows = TopicExtractor._split_windows(lines, window_seconds=40 * 60, overlap_seconds=5 * 60)
+
+        assert [w[0] for w in windows] == [0.0, 2100.0, 4200.0]
+        assert "line 39" in windows[0][2]
+        assert "line 35" in windows[1][2]
+        assert set(range(100)) == {int(line.split()[1]) for *_, text in windows for line in text.split("\n")}
+
+    def test_empty_windows_dropped(self):
+        """Windows with no lines are dropped."""
+        lines = [(0.0, "a"), (7200.0, "b")]
+
+        windows = TopicExtractor._split_windows(lines, window_seconds=1800, overlap_seconds=0)
+
+        assert [w[2] for w in windows] == ["a", "b"]
@@ -0,0 +1,136 @@
+"""Transcript compaction for topic-extraction prompts: blocks, fillers, token estimate, prompt layout."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from deepseek_module import DeepSeekConfig, TopicExtractor
+from deepseek_module.prompt_builder import compact_segments, estimate_tokens, strip_fillers
+from deepseek_module.topic_extractor import PROVIDER_CACHE_USAGE_KEYS
+
+
+def _segments(count: int, step: float = 5.0) -> list[tuple[float, float, str]]:
+    return [(i * step, i * step + step, f"Предложение номер {i}.") for i in range(count)]
+
+
+@pytest.mark.unit
+class TestStripFillers:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Эм, сегодня мы, ммм, поговорим", "сегодня мы, поговорим"),
+            ("So, uh, the gradient… um is zero", "So, the gradient… is zero"),
+            ("Ну вот, как бы это работает", "Ну вот, как бы это работает"),
+            ("Эмиссия и память", "Эмиссия и память"),
+        ],
+    )
+    def test_only_hesitations_removed(self, text, expected):
+        """Only hesitation fillers are stripped; real words stay."""
+        assert strip_fillers(text) == expected
+
+
+@pytest.mark.unit
+class TestCompactSegments:
+    def test_blocks_span_min_to_max(self):
+        """Segments merge into blocks between the minimum and maximum length."""
+        blocks = compact_segments(_segments(36), min_block_seconds=30, max_block_seconds=60)
+
+        assert [b.start for b in blocks] == [0.0, 30.0, 60.0, 90.0, 120.0, 150.0]
+        assert blocks[0].text.startswith("Предложение номер 0. Предложение номер 1.")
+        assert all(b.end - b.start <= 60 for b in blocks)
+
+    def test_long_segment_starts_new_block(self):
+        """A segment that would overflow the block starts a new one."""
+        segments = [(0.0, 10.0, "Короткий."), (10.0, 80.0, "Очень длинный монолог.")]
+
+        blocks = compact_segments(segments, min_block_seconds=30, max_block_seconds=60)
+
+        assert [(b.start, b.text) for b in blocks] == [(0.0, "Короткий."), (10.0, "Очень длинный монолог.")]
+
+    def test_repeats_and_filler_only_segments_dropped(self):
+        """Repeated and filler-only segments are dropped."""
+        segments = [
+            (0.0, 2.0, "Продолжение следует."),
+            (2.0, 4.0, "продолжение следует"),
+            (4.0, 5.0, "Ммм..."),
+            (5.0, 7.0, "Итак, начнём."),
+        ]
+
+        blocks = compact_segments(segments, min_block_seconds=30, max_block_seconds=60)
+
+        assert [b.text for b in blocks] == ["Продолжение следует. Итак, начнём."]
+
+    def test_compaction_saves_tokens(self):
+        """The compact transcript costs fewer tokens than the raw one."""
+        raw = "\n".join(f"00:00:{i:02d} {text}" for i, (*_, text) in enumerate(_segments(60)))
+        blocks = compact_segments(_segments(60), min_block_seconds=30, max_block_seconds=60)
+        compact = "\n".join(f"00:00:00 {b.text}" for b in blocks)
+
+        assert estimate_tokens(compact) < estimate_tokens(raw)
+
+
+@pytest.mark.unit
+class TestEstimateTokens:
+    def test_counts_words_and_punctuation(self):
+        """The estimate counts words and punctuation marks."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("[00:05:10]") == 7
+        assert estimate_tokens("градиентный спуск") == 5
+
+
+def _extractor(usage: SimpleNamespace) -> tuple[TopicExtractor, AsyncMock]:
+    response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="## САММАРИ ВИДЕО\nОк."))])
+    response.usage = usage
+    create = AsyncMock(return_value=response)
+    extractor = TopicExtractor(DeepSeekConfig(api_key="test"))
+    extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return extractor, create
+
+
+@pytest.mark.unit
+class TestCompactPrompt:
+    SEGMENTS = [{"start": i * 5.0, "end": i * 5.0 + 5.0, "text": f"Эм, фраза {i}."} for i in range(360)]
+
+    async def test_transcript_prefix_shared_across_granularities(self):
+        """Prompts for different granularities share the transcript prefix."""
+        extractor, create = _extractor(SimpleNamespace(prompt_tokens=10, completion_tokens=1, total_tokens=11))
+
+        await extractor.extract_topics(self.SEGMENTS, granularity="short")
+        await extractor.extract_topics(self.SEGMENTS, granularity="long", recording_topic="ML")
+
+        short, long = (call.kwargs["messages"][-1]["content"] for call in create.await_args_list)
+        transcript, _, _ = short.partition("\n\n---\n\n")
+        assert long.startswith(transcript + "\n\n---\n\n")
+        assert transcript.count("\n") == 60
+        assert "Эм" not in transcript
+
+    async def test_prompt_stats_and_provider_cache_usage_reported(self):
+        """Prompt size and the provider's cache hit tokens end up in the usage."""
+        usage = SimpleNamespace(
+            prompt_tokens=1000,
+            completion_tokens=50,
+            total_tokens=1050,
+            prompt_cache_hit_tokens=800,
+            prompt_cache_miss_tokens=200,
+        )
+        extractor, _ = _extractor(usage)
+
+        result = await extractor.extract_topics(self.SEGMENTS)
+
+        stats = result["prompt"]
+        assert (stats["segments"], stats["blocks"]) == (360, 60)
+        assert stats["transcript_tokens_after"] < stats["transcript_tokens_before"]
+        assert stats["reduction_pct"] > 0
+        assert {key: result["usage"][key] for key in PROVIDER_CACHE_USAGE_KEYS} == {
+            "prompt_cache_hit_tokens": 800,
+            "prompt_cache_miss_tokens": 200,
+        }
+
+    def test_sum_usage_keeps_provider_keys(self):
+        """Summed usage keeps provider-specific keys and skips missing entries."""
+        total = TopicExtractor._sum_usage(
+            [{"prompt_tokens": 10, "prompt_cache_hit_tokens": 4}, None, {"prompt_tokens": 5, "total_tokens": 6}]
+        )
+
+        assert total == {"prompt_tokens": 15, "prompt_cache_hit_tokens": 4, "total_tokens": 6}
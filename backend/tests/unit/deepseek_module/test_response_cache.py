@@ -0,0 +1,149 @@
+"""LLM response cache for topic extraction: key, hit/miss/bypass accounting, eviction SQL."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api.observability import llm_cache_lookups_total, llm_cache_saved_tokens_total
+from api.repositories.llm_cache_repo import LLMCacheRepository, llm_cache_key
+from database import automation_models  # noqa: F401  (registers mappers referenced by UserModel)
+from deepseek_module import DeepSeekConfig, TopicExtractor
+
+RESPONSE = """## САММАРИ ВИДЕО
+Лекция о базах данных.
+
+## ОСНОВНАЯ ТЕМА ВИДЕО
+Реляционные базы данных
+
+## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ
+[00:00:00] - Введение в SQL
+[00:20:00] - Индексы и планы запросов
+"""
+
+SEGMENTS = [{"start": m * 60.0, "end": m * 60.0 + 50, "text": f"Минута {m}"} for m in range(40)]
+
+
+class MemoryCache:
+    """Stands in for LLMCacheRepository (same get/put signatures)."""
+
+    def __init__(self):
+        self.entries: dict[str, dict] = {}
+
+    async def get(self, cache_key: str) -> dict | None:
+        return self.entries.get(cache_key)
+
+    async def put(self, cache_key: str, *, model: str, content: str, usage: dict | None, ttl: timedelta) -> None:
+        self.entries[cache_key] = {"content": content, "usage": usage, "model": model, "ttl": ttl}
+
+
+def _extractor(cache: MemoryCache, **kwargs) -> tuple[TopicExtractor, AsyncMock]:
+    usage = SimpleNamespace(prompt_tokens=900, completion_tokens=100, total_tokens=1000)
+    response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=RESPONSE))], usage=usage)
+    create = AsyncMock(return_value=response)
+    extractor = TopicExtractor(DeepSeekConfig(api_key="test"), cache, **kwargs)
+    extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return extractor, create
+
+
+def _lookups(result: str) -> float:
+    return llm_cache_lookups_total.labels(result=result)._value.get()
+
+
+@pytest.mark.unit
+class TestLLMCacheKey:
+    def _key(self, **overrides) -> str:
+        params = {"system_prompt": "sys", "prompt": "transcript", "model": "deepseek-chat", "params": {"t": 0.0}}
+        params.update(overrides)
+        return llm_cache_key(**params)
+
+    def test_deterministic(self):
+        """The key is a stable SHA-256 hex digest."""
+        assert self._key() == self._key()
+        assert len(self._key()) == 64
+
+    @pytest.mark.parametrize(
+        "override",
+        [{"system_prompt": "other"}, {"prompt": "transcript!"}, {"model": "deepseek-reasoner"}, {"params": {"t": 0.2}}],
+    )
+    def test_any_part_changes_key(self, override):
+        """Changing any input to the request changes the key."""
+        assert self._key(**override) != self._key()
+
+
+@pytest.mark.unit
+class TestTopicExtractorResponseCache:
+    async def test_second_run_served_from_cache(self):
+        """A repeated extraction is served from the cache and counts the saved tokens."""
+        cache = MemoryCache()
+        hits_before, saved_before = _lookups("hit"), llm_cache_saved_tokens_total._value.get()
+
+        first, first_api = _extractor(cache)
+        cold = await first.extract_topics(SEGMENTS, granularity="medium")
+        second, second_api = _extractor(cache)
+        warm = await second.extract_topics(SEGMENTS, granularity="medium")
+
+        assert first_api.await_count == 1
+        second_api.assert_not_awaited()
+        assert warm["topic_timestamps"] == cold["topic_timestamps"]
+        assert cold["cache"] == {"hits": 0, "misses": 1, "saved_tokens": 0, "hit_rate": 0.0, "bypassed": False}
+        assert warm["cache"] == {"hits": 1, "misses": 0, "saved_tokens": 1000, "hit_rate": 1.0, "bypassed": False}
+        assert "usage" not in warm
+        assert _lookups("hit") == hits_before + 1
+        assert llm_cache_saved_tokens_total._value.get() == saved_before + 1000
+
+    async def test_other_granularity_misses(self):
+        """Another granularity builds another prompt and misses the cache."""
+        cache = MemoryCache()
+        await _extractor(cache)[0].extract_topics(SEGMENTS, granularity="medium")
+
+        extractor, api = _extractor(cache)
+        await extractor.extract_topics(SEGMENTS, granularity="short")
+
+        assert api.await_count == 1
+        assert len(cache.entries) == 2
+
+    async def test_bypass_regenerates_and_refreshes_entry(self):
+        """bypass_cache calls the API again and overwrites the cached entry."""
+        cache = MemoryCache()
+        await _extractor(cache)[0].extract_topics(SEGMENTS)
+        bypass_before = _lookups("bypass")
+
+        extractor, api = _extractor(cache, bypass_cache=True)
+        result = await extractor.extract_topics(SEGMENTS)
+
+        assert api.await_count == 1
+        assert result["usage"]["total_tokens"] == 1000
+        assert result["cache"]["bypassed"] is True
+        assert len(cache.entries) == 1
+        assert _lookups("bypass") == bypass_before + 1
+
+    async def test_cache_failure_does_not_fail_extraction(self):
+        """Cache errors are logged and the extraction still runs."""
+        cache = MagicMock(get=AsyncMock(side_effect=RuntimeError("db down")), put=AsyncMock(side_effect=RuntimeError))
+        extractor, api = _extractor(cache)
+
+        result = await extractor.extract_topics(SEGMENTS)
+
+        assert api.await_count == 1
+        assert result["summary"] == "Лекция о базах данных."
+
+
+@pytest.mark.unit
+class TestLLMCacheRepository:
+    async def test_evict_trims_least_recently_used_over_budget(self):
+        """Eviction deletes expired rows, then the least recently used over the budget."""
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+
+        result = await LLMCacheRepository(session).evict(max_bytes=1024)
+
+        assert result == {"expired": 2, "evicted": 2}
+        expired_sql, trim_sql = (
+            str(call.args[0].compile(dialect=postgresql.asyncpg.dialect())) for call in session.execute.await_args_list
+        )
+        assert "expires_at <=" in expired_sql
+        assert "sum(llm_response_cache.size_bytes) OVER (ORDER BY coalesce" in trim_sql
+        assert "DESC" in trim_sql
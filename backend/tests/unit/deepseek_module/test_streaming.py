@@ -0,0 +1,190 @@
+"""Streamed topic extraction: incremental parsing, progress, early abort."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from api.observability import llm_stream_aborts_total
+from deepseek_module import DeepSeekConfig, TopicExtractor
+from deepseek_module.streaming import MalformedStreamError, TopicStreamParser
+from deepseek_module.topic_extractor import _te
+
+RESPONSE = """## САММАРИ ВИДЕО
+Лекция о базах данных.
+
+## ОСНОВНАЯ ТЕМА ВИДЕО
+Реляционные базы данных
+
+## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ
+[00:00:00] - Введение в SQL
+[00:12:00] - Индексы и планы запросов
+[00:25:00] - Транзакции и блокировки
+
+## ВОПРОСЫ ДЛЯ САМОПРОВЕРКИ
+1. Зачем нужны индексы?
+"""
+
+SEGMENTS = [{"start": m * 60.0, "end": m * 60.0 + 60, "text": f"Минута {m}"} for m in range(40)]
+
+
+def _deltas(text: str, size: int = 7) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class FakeStream:
+    """Async iterator over chat.completion.chunk-like objects; ``delay`` stalls before each chunk."""
+
+    def __init__(self, deltas: list[str], usage: SimpleNamespace | None = None, delay: float = 0.0):
+        chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=d))], usage=None) for d in deltas
+        ]
+        if usage is not None:
+            chunks.append(SimpleNamespace(choices=[], usage=usage))
+        self.chunks = chunks
+        self.delay = delay
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.consumed == len(self.chunks):
+            raise StopAsyncIteration
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.consumed += 1
+        return self.chunks[self.consumed - 1]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _extractor(stream: FakeStream, progress: list[dict] | None = None) -> tuple[TopicExtractor, AsyncMock]:
+    create = AsyncMock(return_value=stream)
+    extractor = TopicExtractor(
+        DeepSeekConfig(api_key="test"), stream=True, on_progress=progress.append if progress is not None else None
+    )
+    extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return extractor, create
+
+
+def _parser(limit: int = 3) -> TopicStreamParser:
+    extractor = TopicExtractor(DeepSeekConfig(api_key="test"))
+    return TopicStreamParser(lambda line: extractor._parse_topic_line(line, 3600.0), malformed_line_limit=limit)
+
+
+@pytest.mark.unit
+class TestTopicStreamParser:
+    def test_topics_emitted_when_line_completes(self):
+        """A topic is emitted once its line is complete."""
+        parser = _parser()
+
+        assert parser.feed("## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ\n[00:0") == []
+        assert parser.feed("1:00] - Введ") == []
+        assert parser.feed("ение\n* [00:10:00] - Индексы") == [{"topic": "Введение", "start": 60.0}]
+        assert parser.close() == [{"topic": "Индексы", "start": 600.0}]
+        assert [t["start"] for t in parser.topics] == [60.0, 600.0]
+
+    def test_prose_outside_topics_section_allowed(self):
+        """Prose outside the topics section does not count as malformed."""
+        parser = _parser(limit=1)
+
+        parser.feed("## САММАРИ ВИДЕО\nПервое.\nВторое.\nТретье.\n## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ\n[00:01:00] - Тема\n")
+
+        assert len(parser.topics) == 1
+
+    def test_malformed_topics_section_raises(self):
+        """Too many unparsable lines in the topics section raise."""
+        parser = _parser(limit=2)
+        parser.feed("## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ\nтекст\nтекст\n")
+
+        with pytest.raises(MalformedStreamError):
+            parser.feed("ещё текст\n")
+
+    def test_out_of_range_timestamps_count_as_malformed(self):
+        """Timestamps past the recording count as malformed lines."""
+        parser = _parser(limit=1)
+
+        with pytest.raises(MalformedStreamError):
+            parser.feed("## DETAILED TOPICS\n[05:00:00] - A\n[06:00:00] - B\n")
+
+
+@pytest.mark.unit
+class TestStreamedExtraction:
+    async def test_same_result_as_full_response_with_progress(self):
+        """Streaming gives the same result as a full response and reports progress."""
+        progress: list[dict] = []
+        usage = SimpleNamespace(prompt_tokens=900, completion_tokens=120, total_tokens=1020)
+        extractor, create = _extractor(FakeStream(_deltas(RESPONSE), usage), progress)
+
+        result = await extractor.extract_topics(SEGMENTS)
+
+        assert create.await_args.kwargs["stream"] is True
+        assert create.await_args.kwargs["stream_options"] == {"include_usage": True}
+        assert [t["topic"] for t in result["topic_timestamps"]] == [
+            "Введение в SQL",
+            "Индексы и планы запросов",
+            "Транзакции и блокировки",
+        ]
+        assert result["summary"] == "Лекция о базах данных."
+        assert result["questions"] == ["Зачем нужны индексы?"]
+        assert result["usage"]["total_tokens"] == 1020
+        assert [len(p["topics"]) for p in progress][:3] == [1, 2, 3]
+        assert progress[-1]["completion_tokens"] == 120
+        assert progress[-1]["tokens_per_second"] > 0
+
+    async def test_malformed_output_aborts_stream(self):
+        """Malformed output closes the stream early."""
+        garbage = "## ДЕТАЛИЗИРОВАННЫЕ ТОПИКИ\n" + "бессвязный текст\n" * 500
+        stream = FakeStream(_deltas(garbage, size=20))
+        extractor, _ = _extractor(stream)
+        aborts_before = llm_stream_aborts_total.labels(reason="malformed")._value.get()
+
+        result = await extractor.extract_topics(SEGMENTS)
+
+        assert result["topic_timestamps"] == []
+        assert stream.closed
+        assert stream.consumed < len(stream.chunks) // 10
+        assert llm_stream_aborts_total.labels(reason="malformed")._value.get() == aborts_before + 1
+
+    async def test_stalled_stream_aborts(self, monkeypatch):
+        """A stream that goes idle is aborted."""
+        monkeypatch.setattr(_te, "stream_idle_timeout_seconds", 0.01)
+        stream = FakeStream(_deltas(RESPONSE), delay=0.1)
+        extractor, _ = _extractor(stream)
+        stalled_before = llm_stream_aborts_total.labels(reason="stalled")._value.get()
+
+        result = await extractor.extract_topics(SEGMENTS)
+
+        assert result["topic_timestamps"] == []
+        assert stream.closed
+        assert llm_stream_aborts_total.labels(reason="stalled")._value.get() == stalled_before + 1
+
+    async def test_progress_callback_failure_ignored(self):
+        """A failing progress callback does not break the extraction."""
+        extractor, _ = _extractor(FakeStream(_deltas(RESPONSE)))
+        extractor.on_progress = MagicMock(side_effect=RuntimeError("backend down"))
+
+        result = await extractor.extract_topics(SEGMENTS)
+
+        assert len(result["topic_timestamps"]) == 3
+
+
+@pytest.mark.unit
+class TestTopicStreamTaskProgress:
+    def test_progress_scaled_by_generated_tokens(self):
+        """Topic progress scales with the tokens generated so far."""
+        from api.tasks.processing import _topic_stream_progress
+
+        task = MagicMock()
+        report = _topic_stream_progress(task, "user-1", max_tokens=8000)
+
+        report({"topics": [{"topic": "A", "start": 0.0}], "completion_tokens": 4000, "tokens_per_second": 50.0})
+
+        args, kwargs = task.update_progress.call_args
+        assert args[:2] == ("user-1", 57)
+        assert kwargs["partial_topics"] == [{"topic": "A", "start": 0.0}]
+        assert kwargs["tokens_per_second"] == 50.0
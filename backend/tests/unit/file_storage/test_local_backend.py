@@ -2,7 +2,7 @@
 
 import pytest
 
-from file_storage.backends.base import StorageQuotaExceededError
+from file_storage.backends.base import PreconditionFailedError, StorageQuotaExceededError
 from file_storage.backends.local import LocalStorageBackend
 
 
@@ -95,3 +95,99 @@ class TestLocalStorageBackend:
         url = await backend.presigned_url("users/000001/video.mp4")
         assert "users/000001/video.mp4" in url
         assert url.startswith("/api/")
+
+    async def test_content_sha256_streams_whole_file(self, tmp_path):
+        """content_sha256 hashes the whole file in blocks."""
+        import hashlib
+
+        backend = LocalStorageBackend(base_path=tmp_path)
+        content = b"a" * (3 * 1024 * 1024 + 17)
+        await backend.save("audio.mp3", content)
+
+        assert await backend.content_sha256("audio.mp3") == hashlib.sha256(content).hexdigest()
+
+    async def test_content_sha256_missing(self, tmp_path):
+        """content_sha256 of a missing key raises FileNotFoundError."""
+        backend = LocalStorageBackend(base_path=tmp_path)
+        with pytest.raises(FileNotFoundError):
+            await backend.content_sha256("nope.mp3")
+
+    async def test_save_stream_writes_chunks(self, tmp_path):
+        """save_stream writes every chunk to the target path."""
+        backend = LocalStorageBackend(base_path=tmp_path / "storage")
+
+        async def chunks():
+            for part in (b"one ", b"two ", b"three"):
+                yield part
+
+        full_path = await backend.save_stream("users/000001/a.txt", chunks())
+
+        assert await backend.load("users/000001/a.txt") == b"one two three"
+        assert not any(p.name.endswith(".part") for p in (tmp_path / "storage").rglob("*"))
+        assert full_path.endswith("users/000001/a.txt")
+
+    async def test_save_stream_quota_removes_partial(self, tmp_path, monkeypatch):
+        """Going over quota mid-stream raises and leaves no partial file."""
+        backend = LocalStorageBackend(base_path=tmp_path, max_size_gb=1)
+        monkeypatch.setattr(backend, "_get_total_size", lambda: 1024**3 - 10)
+
+        async def chunks():
+            yield b"x" * 8
+            yield b"x" * 8
+
+        with pytest.raises(StorageQuotaExceededError):
+            await backend.save_stream("big.bin", chunks())
+
+        assert not await backend.exists("big.bin")
+        assert not (tmp_path / "big.bin.part").exists()
+
+    async def test_default_save_file_streams_into_save_stream(self, tmp_path, monkeypatch):
+        """The base save_file streams the source into save_stream in blocks."""
+        from file_storage.backends.base import StorageBackend
+
+        backend = LocalStorageBackend(base_path=tmp_path / "storage")
+        src = tmp_path / "source.bin"
+        src.write_bytes(b"z" * (2 * 1024 * 1024 + 5))
+        sizes: list[int] = []
+        original = backend.save_stream
+
+        async def spy(path, chunks):
+            async def counted():
+                async for chunk in chunks:
+                    sizes.append(len(chunk))
+                    yield chunk
+
+            return await original(path, counted())
+
+        monkeypatch.setattr(backend, "save_stream", spy)
+
+        await StorageBackend.save_file(backend, "copy.bin", src)
+
+        assert sizes == [1024 * 1024, 1024 * 1024, 5]
+        assert await backend.get_size("copy.bin") == src.stat().st_size
+
+
+@pytest.mark.unit
+class TestLocalConditionalWrite:
+    async def test_create_only_and_compare_and_swap(self, tmp_path):
+        """save_if_match creates only when absent and swaps only on a matching tag."""
+        backend = LocalStorageBackend(base_path=tmp_path)
+
+        tag = await backend.save_if_match("doc.json", b"v1", None)
+        with pytest.raises(PreconditionFailedError):
+            await backend.save_if_match("doc.json", b"other", None)
+
+        content, loaded_tag = await backend.load_versioned("doc.json")
+        assert (content, loaded_tag) == (b"v1", tag)
+
+        await backend.save_if_match("doc.json", b"v2", tag)
+        with pytest.raises(PreconditionFailedError):
+            await backend.save_if_match("doc.json", b"v3", tag)
+        assert await backend.load("doc.json") == b"v2"
+
+    async def test_load_versioned_missing(self, tmp_path):
+        """load_versioned of a missing key raises FileNotFoundError."""
+        backend = LocalStorageBackend(base_path=tmp_path)
+
+        with pytest.raises(FileNotFoundError):
+            await backend.load_versioned("missing.json")
@@ -53,3 +53,7 @@ class TestStoragePathBuilder:
             to_storage_key(b.transcription_extracted(1, 42))
             == "users/user_000001/recordings/42/transcriptions/extracted.json"
         )
+        assert (
+            to_storage_key(b.transcription_extracted_version(1, 42, "v3"))
+            == "users/user_000001/recordings/42/transcriptions/extracted/versions/v3.json"
+        )
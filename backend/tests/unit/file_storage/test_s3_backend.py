@@ -12,6 +12,7 @@ import boto3
 import pytest
 from moto.server import ThreadedMotoServer
 
+from file_storage.backends.base import PreconditionFailedError
 from file_storage.backends.s3 import S3StorageBackend
 
 BUCKET = "leap-test-bucket"
@@ -135,6 +136,79 @@ class TestS3StorageBackend:
         with pytest.raises(FileNotFoundError):
             await backend.download_to_file("missing.bin", tmp_path / "out.bin")
 
+    async def test_conditional_write(self, backend):
+        """save_if_match uses If-None-Match / If-Match against the ETag."""
+        etag = await backend.save_if_match("doc.json", b"v1", None)
+        with pytest.raises(PreconditionFailedError):
+            await backend.save_if_match("doc.json", b"other", None)
+
+        content, loaded_etag = await backend.load_versioned("doc.json")
+        assert (content, loaded_etag) == (b"v1", etag)
+
+        await backend.save_if_match("doc.json", b"v2", etag)
+        with pytest.raises(PreconditionFailedError):
+            await backend.save_if_match("doc.json", b"v3", etag)
+        assert await backend.load("doc.json") == b"v2"
+
+    async def test_content_sha256(self, backend):
+        """content_sha256 hashes the object body."""
+        import hashlib
+
+        content = b"audio" * 500_000
+        await backend.save("users/000001/audio.mp3", content)
+        assert await backend.content_sha256("users/000001/audio.mp3") == hashlib.sha256(content).hexdigest()
+
+    async def test_content_sha256_missing(self, backend):
+        """content_sha256 of a missing object raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await backend.content_sha256("missing.mp3")
+
+    async def test_save_stream_small_body(self, backend):
+        """A body smaller than one part is sent with a single PUT."""
+
+        async def chunks():
+            yield b"small "
+            yield b"body"
+
+        await backend.save_stream("users/000001/small.txt", chunks())
+        assert await backend.load("users/000001/small.txt") == b"small body"
+
+    async def test_save_stream_multipart(self, backend):
+        """A larger body goes up as a multipart upload."""
+        from file_storage.backends.s3 import MULTIPART_PART_SIZE
+
+        blocks = [bytes([i]) * (3 * 1024 * 1024) for i in range(4)]
+
+        async def chunks():
+            for block in blocks:
+                yield block
+
+        await backend.save_stream("users/000001/big.bin", chunks())
+
+        assert sum(map(len, blocks)) > MULTIPART_PART_SIZE
+        assert await backend.load("users/000001/big.bin") == b"".join(blocks)
+
+    async def test_save_stream_failure_aborts_upload(self, backend, moto_endpoint):
+        """A failing source aborts the multipart upload."""
+        from file_storage.backends.s3 import MULTIPART_PART_SIZE
+
+        async def chunks():
+            yield b"x" * MULTIPART_PART_SIZE
+            raise OSError("source vanished")
+
+        with pytest.raises(OSError, match="vanished"):
+            await backend.save_stream("users/000001/broken.bin", chunks())
+
+        client = boto3.client(
+            "s3",
+            region_name=REGION,
+            endpoint_url=moto_endpoint,
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        assert not client.list_multipart_uploads(Bucket=BUCKET).get("Uploads")
+        assert not await backend.exists("users/000001/broken.bin")
+
     async def test_presigned_url(self, backend):
         await backend.save("public.txt", b"hello")
         url = await backend.presigned_url("public.txt", expires_in=600)
@@ -0,0 +1,65 @@
+"""Unit tests for ArtifactScratch (node-local artifact copies)."""
+
+import os
+import time
+
+import pytest
+
+from file_storage.scratch import ArtifactScratch
+
+SOURCE_KEY = "users/user_000001/recordings/74/source.mp4"
+
+
+@pytest.fixture
+def scratch(tmp_path):
+    return ArtifactScratch(tmp_path / "scratch", max_bytes=1024, ttl=3600)
+
+
+@pytest.mark.unit
+class TestArtifactScratch:
+    def test_keep_then_materialize(self, scratch, tmp_path):
+        """A kept artifact outlives the stage temp file and is copied back on demand."""
+        temp = tmp_path / "dl_temp.mp4"
+        temp.write_bytes(b"video" * 10)
+
+        scratch.keep(SOURCE_KEY, temp)
+        temp.unlink()  # the stage purges its temp; the scratch copy survives
+
+        local = tmp_path / "trim_src.mp4"
+        assert scratch.materialize(SOURCE_KEY, local, expected_size=50)
+        assert local.read_bytes() == b"video" * 10
+
+    def test_materialize_miss_or_stale(self, scratch, tmp_path):
+        """Missing or wrong-sized scratch copies are not materialized."""
+        local = tmp_path / "trim_src.mp4"
+        assert not scratch.materialize(SOURCE_KEY, local, expected_size=50)
+
+        temp = tmp_path / "dl_temp.mp4"
+        temp.write_bytes(b"old")
+        scratch.keep(SOURCE_KEY, temp)
+
+        assert not scratch.materialize(SOURCE_KEY, local, expected_size=50)
+        assert not local.exists()
+
+    def test_recording_dirs(self, scratch, tmp_path):
+        """recording_dirs lists every recording that has scratch copies."""
+        temp = tmp_path / "t.mp4"
+        temp.write_bytes(b"x")
+        scratch.keep(SOURCE_KEY, temp)
+        scratch.keep("users/user_000002/recordings/9/video.mp4", temp)
+
+        assert sorted(rec_id for rec_id, _ in scratch.recording_dirs()) == [9, 74]
+
+    def test_enforce_limits_evicts_expired_then_lru(self, scratch, tmp_path):
+        """Limits drop expired recordings first, then the least recently used."""
+        temp = tmp_path / "t.mp4"
+        temp.write_bytes(b"x" * 600)
+        for rec_id in (1, 2, 3):
+            scratch.keep(f"users/user_000001/recordings/{rec_id}/video.mp4", temp)
+        dirs = dict(scratch.recording_dirs())
+        now = time.time()
+        os.utime(dirs[1], (now - 7200, now - 7200))  # past ttl
+        os.utime(dirs[2], (now - 60, now - 60))  # least recently used
+
+        assert scratch.enforce_limits() == 1200
+        assert [rec_id for rec_id, _ in scratch.recording_dirs()] == [3]
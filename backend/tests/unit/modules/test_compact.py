@@ -0,0 +1,89 @@
+"""Compact mode: keep-range planning and compacted → video time mapping."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from models import ProcessingStageType
+from video_processing_module.compact import OffsetMap, plan_keep_ranges
+
+
+@pytest.mark.unit
+class TestPlanKeepRanges:
+    def test_long_silences_cut_with_padding(self):
+        """Long silences are cut out, keeping some padding around speech."""
+        silences = [(0.0, 30.0), (600.0, 1500.0), (2000.0, 2010.0), (3000.0, 3700.0)]
+
+        ranges = plan_keep_ranges(silences, 25.0, 4000.0, min_gap_seconds=480.0, padding_seconds=2.0)
+
+        assert ranges == [(25.0, 602.0), (1498.0, 3002.0), (3698.0, 4000.0)]
+
+    def test_no_long_silence_returns_empty(self):
+        """Without a long enough silence nothing is cut."""
+        assert plan_keep_ranges([(100.0, 200.0)], 0.0, 1000.0, min_gap_seconds=480.0, padding_seconds=2.0) == []
+
+    def test_silence_outside_window_ignored(self):
+        """Silences outside the trimmed window are ignored."""
+        silences = [(0.0, 900.0), (5000.0, 6000.0)]
+
+        assert plan_keep_ranges(silences, 895.0, 4000.0, min_gap_seconds=480.0, padding_seconds=2.0) == []
+
+
+@pytest.mark.unit
+class TestOffsetMap:
+    def test_to_source_across_cuts(self):
+        """Compacted times map back to source times across the cuts."""
+        offset_map = OffsetMap(((25.0, 602.0), (1498.0, 3002.0)))
+
+        assert offset_map.to_source(0.0) == 25.0
+        assert offset_map.to_source(100.0) == 125.0
+        assert offset_map.to_source(577.0) == 1498.0
+        assert offset_map.to_source(577.0, is_end=True) == 602.0
+        assert offset_map.to_source(600.0) == 1521.0
+        assert offset_map.removed_seconds == 896.0
+
+    def test_project_to_trimmed_video(self):
+        """Words are projected onto the trimmed video's timeline."""
+        offset_map = OffsetMap(((25.0, 602.0), (1498.0, 3002.0)), video_offset=25.0)
+        words = [{"text": "a", "start": 576.0, "end": 577.0}, {"text": "b", "start": 577.0, "end": 578.5}]
+
+        projected = offset_map.project(words)
+
+        assert projected == [{"text": "a", "start": 576.0, "end": 577.0}, {"text": "b", "start": 1473.0, "end": 1474.5}]
+        assert words[1]["start"] == 577.0
+
+    def test_compacted_video_keeps_timestamps(self):
+        """A compacted video keeps the compacted timestamps."""
+        offset_map = OffsetMap(((25.0, 602.0), (1498.0, 3002.0)), video_offset=25.0, video_compacted=True)
+
+        assert offset_map.project([{"start": 600.0, "end": 601.0}]) == [{"start": 600.0, "end": 601.0}]
+
+    def test_meta_roundtrip(self):
+        """The map survives a round trip through stage meta."""
+        offset_map = OffsetMap(((25.0, 602.0), (1498.0, 3002.0)), video_offset=25.0)
+
+        assert OffsetMap.from_meta(offset_map.to_meta()) == offset_map
+
+
+@pytest.mark.unit
+class TestCompactOffsetMapFromStage:
+    def test_read_from_trim_stage_meta(self):
+        """The offset map is read from the trim stage's meta."""
+        from api.tasks.processing import _compact_offset_map
+
+        meta = OffsetMap(((10.0, 20.0), (700.0, 800.0)), video_offset=10.0).to_meta()
+        recording = SimpleNamespace(
+            processing_stages=[SimpleNamespace(stage_type=ProcessingStageType.TRIM, stage_meta={"compact": meta})]
+        )
+
+        assert _compact_offset_map(recording).to_video(15.0) == 695.0
+
+    def test_plain_trim_has_no_map(self):
+        """A plain trim has no offset map."""
+        from api.tasks.processing import _compact_offset_map
+
+        recording = SimpleNamespace(
+            processing_stages=[SimpleNamespace(stage_type=ProcessingStageType.TRIM, stage_meta={"compact": None})]
+        )
+
+        assert _compact_offset_map(recording) is None
@@ -0,0 +1,303 @@
+"""Transcript artifacts (cache files, word-timed subtitles) and the versioned extraction store."""
+
+import asyncio
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from file_storage.backends.base import PreconditionFailedError
+from file_storage.backends.local import LocalStorageBackend
+from models import ProcessingStageStatus, ProcessingStageType
+from subtitle_module import SubtitleGenerator
+from transcription_module.manager import TranscriptionManager
+
+CACHE_DIR = "users/user_000001/recordings/7/transcriptions/cache"
+EXTRACTED_DIR = "users/user_000001/recordings/7/transcriptions/extracted"
+LEGACY_EXTRACTED = "users/user_000001/recordings/7/transcriptions/extracted.json"
+
+
+def _words(text: str, start: float = 0.0, step: float = 0.3) -> list[dict]:
+    return [
+        {"word": word, "start": round(start + i * step, 3), "end": round(start + i * step + 0.25, 3)}
+        for i, word in enumerate(text.split())
+    ]
+
+
+@pytest.mark.unit
+class TestEntriesFromWords:
+    def test_sentence_end_breaks_cue(self):
+        """A sentence end starts a new cue."""
+        words = _words("Привет всем.") + _words("Начнём лекцию.", start=0.7)
+        segments = [
+            {"start": 0.0, "end": 0.55, "text": "Привет всем."},
+            {"start": 0.7, "end": 1.25, "text": "Начнём лекцию."},
+        ]
+
+        entries = SubtitleGenerator().entries_from_words(words, segments)
+
+        assert [e.text for e in entries] == ["Привет всем.", "Начнём лекцию."]
+        assert entries[1].start_time == timedelta(seconds=0.7)
+        assert entries[1].end_time == timedelta(seconds=1.25)
+
+    def test_pause_breaks_cue(self):
+        """A pause between words starts a new cue."""
+        words = _words("один два") + _words("три", start=2.0)
+        segments = [{"start": 0.0, "end": 2.25, "text": "один два три"}]
+
+        entries = SubtitleGenerator().entries_from_words(words, segments)
+
+        assert [e.text for e in entries] == ["один два", "три"]
+
+    def test_long_sentence_split_by_duration(self):
+        """A long sentence is split so no cue runs past the maximum duration."""
+        words = _words(" ".join(["да"] * 30), step=0.4)
+        segments = [{"start": 0.0, "end": words[-1]["end"], "text": " ".join(["да"] * 30)}]
+
+        entries = SubtitleGenerator().entries_from_words(words, segments)
+
+        assert len(entries) > 1
+        assert sum(len(e.text.split()) for e in entries) == 30
+        assert all(
+            (e.end_time - e.start_time).total_seconds() <= SubtitleGenerator.MAX_SUBTITLE_DURATION for e in entries
+        )
+
+    def test_cue_fits_line_limits(self):
+        """Cues fit the line length and line count limits."""
+        generator = SubtitleGenerator(max_chars_per_line=20, max_lines=2)
+        text = "градиентный спуск минимизирует функцию потерь на обучающей выборке"
+        words = _words(text, step=0.1)
+        segments = [{"start": 0.0, "end": words[-1]["end"], "text": text}]
+
+        entries = generator.entries_from_words(words, segments)
+
+        assert " ".join(e.text for e in entries) == text
+        assert all(" ".join(generator._split_text(e.text)) == e.text for e in entries)
+
+    def test_without_words_uses_segments(self):
+        """Without words, cues come from the non-empty segments."""
+        segments = [{"start": 1.0, "end": 2.0, "text": "Только сегменты"}, {"start": 2.0, "end": 3.0, "text": " "}]
+
+        entries = SubtitleGenerator().entries_from_words([], segments)
+
+        assert [e.text for e in entries] == ["Только сегменты"]
+
+    def test_render_rejects_unknown_format(self):
+        """An unknown subtitle format is rejected."""
+        with pytest.raises(ValueError, match="Unsupported subtitle format"):
+            SubtitleGenerator().render([], "ass")
+
+
+@pytest.mark.unit
+class TestDeriveArtifacts:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        backend = LocalStorageBackend(base_path=tmp_path)
+        with patch("transcription_module.manager.get_storage_backend", return_value=backend):
+            yield backend
+
+    async def test_writes_cache_files_and_subtitles(self, storage):
+        """One pass writes the cache text files and every subtitle format."""
+        words = _words("Привет всем.")
+        segments = [{"start": 0.0, "end": 0.55, "text": "Привет всем."}]
+
+        files = await TranscriptionManager().derive_artifacts(7, 1, words, segments)
+
+        assert files == {
+            "segments_txt": f"{CACHE_DIR}/segments.txt",
+            "words_txt": f"{CACHE_DIR}/words.txt",
+            "srt": f"{CACHE_DIR}/subtitles.srt",
+            "vtt": f"{CACHE_DIR}/subtitles.vtt",
+        }
+        assert (await storage.load(files["segments_txt"])).decode() == "[00:00:00.000 - 00:00:00.550] Привет всем.\n"
+        assert (await storage.load(files["srt"])).decode() == "1\n00:00:00,000 --> 00:00:00,550\nПривет всем.\n\n"
+        assert (await storage.load(files["vtt"])).decode().startswith("WEBVTT\n\n00:00:00.000 --> 00:00:00.550\n")
+
+    async def test_generate_subtitles_reads_master_only(self, storage):
+        """Subtitles are generated from master.json alone."""
+        manager = TranscriptionManager()
+        await manager.save_master(
+            recording_id=7,
+            words=_words("Привет всем."),
+            segments=[{"start": 0.0, "end": 0.55, "text": "Привет всем."}],
+            language="ru",
+            model="universal-2",
+            duration=0.55,
+            user_slug=1,
+        )
+
+        with patch.object(storage, "load", wraps=storage.load) as load:
+            files = await manager.generate_subtitles(7, ["srt"], user_slug=1)
+
+        assert files == {"srt": f"{CACHE_DIR}/subtitles.srt"}
+        assert [call.args[0] for call in load.call_args_list] == [manager._master_key(7, 1)]
+        assert not await storage.exists(f"{CACHE_DIR}/segments.txt")
+
+
+async def _add(manager: TranscriptionManager, version_id: str | None = None, **fields) -> str:
+    return await manager.add_extracted_version(
+        recording_id=7,
+        version_id=version_id,
+        model="deepseek",
+        granularity="long",
+        main_topics=fields.pop("main_topics", ["ML"]),
+        topic_timestamps=[{"topic": "Intro", "start": 0.0}],
+        user_slug=1,
+        **fields,
+    )
+
+
+@pytest.mark.unit
+class TestExtractedVersions:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        backend = LocalStorageBackend(base_path=tmp_path)
+        with patch("transcription_module.manager.get_storage_backend", return_value=backend):
+            yield backend
+
+    async def test_versions_stored_separately_with_manifest(self, storage):
+        """Each version is its own object, listed in the manifest."""
+        manager = TranscriptionManager()
+
+        assert await _add(manager) == "v1"
+        assert await _add(manager, summary="second") == "v2"
+
+        manifest = json.loads(await storage.load(f"{EXTRACTED_DIR}/manifest.json"))
+        assert manifest["active_version"] == "v2"
+        assert [v["id"] for v in manifest["versions"]] == ["v1", "v2"]
+        assert await storage.exists(f"{EXTRACTED_DIR}/versions/v1.json")
+
+        data = await manager.load_extracted(7, 1)
+        assert [(v["id"], v["is_active"]) for v in data["versions"]] == [("v1", False), ("v2", True)]
+        assert (await manager.get_active_extracted(7, 1))["summary"] == "second"
+        assert await manager.generate_version_id(7, 1) == "v3"
+
+    @pytest.mark.usefixtures("storage")
+    async def test_concurrent_adds_keep_every_version(self):
+        """Concurrent adds keep every version."""
+        manager = TranscriptionManager()
+
+        ids = await asyncio.gather(*(_add(manager) for _ in range(6)))
+
+        assert sorted(ids) == [f"v{n}" for n in range(1, 7)]
+        data = await manager.load_extracted(7, 1)
+        assert sorted(v["id"] for v in data["versions"]) == sorted(ids)
+
+    @pytest.mark.usefixtures("storage")
+    async def test_explicit_id_replaces_version(self):
+        """Adding with an existing id replaces that version."""
+        manager = TranscriptionManager()
+        await _add(manager, "draft", summary="old")
+
+        await _add(manager, "draft", summary="new")
+
+        data = await manager.load_extracted(7, 1)
+        assert [(v["id"], v["summary"]) for v in data["versions"]] == [("draft", "new")]
+
+    @pytest.mark.usefixtures("storage")
+    async def test_invalid_version_id_rejected(self):
+        """Version ids that could escape the directory are rejected."""
+        with pytest.raises(ValueError, match="Invalid extracted version id"):
+            await _add(TranscriptionManager(), "../../escape")
+
+    async def test_legacy_file_read_then_migrated_on_write(self, storage):
+        """A legacy extracted.json is readable and is migrated on the next write."""
+        legacy = {
+            "recording_id": 7,
+            "active_version": "v1",
+            "versions": [
+                {"id": "v1", "model": "deepseek", "summary": "legacy", "is_active": True},
+                {"id": "v1", "model": "deepseek", "summary": "duplicate", "is_active": False},
+            ],
+        }
+        await storage.save(LEGACY_EXTRACTED, json.dumps(legacy).encode())
+        manager = TranscriptionManager()
+
+        assert await manager.has_extracted(7, 1)
+        assert (await manager.get_active_extracted(7, 1))["summary"] == "legacy"
+
+        assert await _add(manager) == "v2"
+
+        assert not await storage.exists(LEGACY_EXTRACTED)
+        data = await manager.load_extracted(7, 1)
+        assert [(v["id"], v["summary"]) for v in data["versions"]] == [("v1", "legacy"), ("v2", "")]
+        assert data["active_version"] == "v2"
+
+    async def test_legacy_migration_keeps_existing_version_objects(self, storage):
+        """Migration creates version objects only if absent; a newer write is not overwritten."""
+        legacy = {"recording_id": 7, "active_version": "v1", "versions": [{"id": "v1", "summary": "legacy"}]}
+        await storage.save(LEGACY_EXTRACTED, json.dumps(legacy).encode())
+        await storage.save(f"{EXTRACTED_DIR}/versions/v1.json", json.dumps({"id": "v1", "summary": "newer"}).encode())
+
+        await _add(TranscriptionManager())
+
+        stored = json.loads(await storage.load(f"{EXTRACTED_DIR}/versions/v1.json"))
+        assert stored["summary"] == "newer"
+        assert not await storage.exists(LEGACY_EXTRACTED)
+
+    async def test_update_active_version_is_compare_and_swap(self, storage):
+        """Editing the active version retries after a concurrent change."""
+        manager = TranscriptionManager()
+        await _add(manager)
+        original = storage.save_if_match
+        conflicts = 0
+
+        async def racing_save(path, content, version):
+            # Another editor changes the version between our read and write, once
+            nonlocal conflicts
+            if path.endswith("versions/v1.json") and not conflicts:
+                conflicts += 1
+                current, tag = await storage.load_versioned(path)
+                edited = json.loads(current) | {"questions": ["Concurrent?"]}
+                await original(path, json.dumps(edited).encode(), tag)
+            return await original(path, content, version)
+
+        with patch.object(storage, "save_if_match", side_effect=racing_save):
+            updated = await manager.update_active_version(7, 1, {"summary": "edited"})
+
+        assert conflicts == 1
+        assert updated["summary"] == "edited"
+        assert updated["questions"] == ["Concurrent?"]
+        assert updated["manually_edited"] is True
+
+    async def test_update_gives_up_after_repeated_conflicts(self, storage):
+        """Editing gives up after repeated conflicts."""
+        manager = TranscriptionManager()
+        await _add(manager)
+
+        with (
+            patch.object(storage, "save_if_match", side_effect=PreconditionFailedError("busy")),
+            pytest.raises(PreconditionFailedError),
+        ):
+            await manager.update_active_version(7, 1, {"summary": "edited"})
+
+
+def _recording(*stages) -> SimpleNamespace:
+    return SimpleNamespace(processing_stages=[SimpleNamespace(stage_meta=None, **stage) for stage in stages])
+
+
+@pytest.mark.unit
+class TestDerivedSubtitlesReuse:
+    def test_subtitles_pending_unless_skipped(self):
+        """Subtitles count as pending unless their stage was skipped."""
+        from api.tasks.processing import _subtitles_pending
+
+        subs = {"stage_type": ProcessingStageType.GENERATE_SUBTITLES}
+
+        assert _subtitles_pending(_recording({**subs, "status": ProcessingStageStatus.PENDING}))
+        assert not _subtitles_pending(_recording({**subs, "status": ProcessingStageStatus.SKIPPED}))
+        assert not _subtitles_pending(_recording())
+
+    def test_keys_reused_only_when_all_formats_derived(self):
+        """Derived subtitle keys are reused only when every requested format exists."""
+        from api.tasks.processing import _derived_subtitles
+
+        recording = _recording(
+            {"stage_type": ProcessingStageType.TRANSCRIBE, "status": ProcessingStageStatus.COMPLETED}
+        )
+        recording.processing_stages[0].stage_meta = {"artifacts": {"srt": "k.srt", "words_txt": "k.txt"}}
+
+        assert _derived_subtitles(recording, ["srt"]) == {"srt": "k.srt"}
+        assert _derived_subtitles(recording, ["srt", "vtt"]) is None
@@ -307,3 +307,61 @@ class TestVideoProcessorHelpers:
 
             # Assert
             assert result["bitrate"] == 0  # Default value
+
+
+@pytest.mark.unit
+class TestKeepRanges:
+    """Tests for compact-mode concatenation of kept ranges."""
+
+    def test_concat_list_escapes_path(self):
+        """The ffconcat list quotes paths and lists each kept range."""
+        from video_processing_module.video_processor import concat_list
+
+        text = concat_list("/tmp/it's.mp3", [(1.0, 2.5), (10.0, 12.0)])
+
+        assert text.splitlines() == [
+            "ffconcat version 1.0",
+            "file '/tmp/it'\\''s.mp3'",
+            "inpoint 1.000",
+            "outpoint 2.500",
+            "file '/tmp/it'\\''s.mp3'",
+            "inpoint 10.000",
+            "outpoint 12.000",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_keep_ranges_stream_copy(self, tmp_path):
+        """keep_ranges stream-copies through the concat demuxer."""
+        from video_processing_module.config import ProcessingConfig
+        from video_processing_module.video_processor import VideoProcessor
+
+        processor = VideoProcessor(ProcessingConfig(output_dir=str(tmp_path), temp_dir=str(tmp_path)))
+        output = tmp_path / "out.mp3"
+        mock_process = AsyncMock()
+        mock_process.communicate = AsyncMock(return_value=(b"", b""))
+        mock_process.returncode = 0
+
+        def fake_ffmpeg(*cmd, **_kwargs):
+            list_path = Path(cmd[cmd.index("-i") + 1])
+            assert "outpoint 20.000" in list_path.read_text()
+            output.write_bytes(b"mp3")
+            return mock_process
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_ffmpeg) as mock_exec:
+            result = await processor.keep_ranges("/in.mp3", str(output), [(0.0, 10.0), (15.0, 20.0)], stream_copy=True)
+
+        cmd = mock_exec.call_args.args
+        assert result is True
+        assert cmd[cmd.index("-f") + 1] == "concat"
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        assert not list(tmp_path.glob("*.ffconcat"))
+
+    @pytest.mark.asyncio
+    async def test_keep_ranges_rejects_empty_range(self):
+        """keep_ranges refuses a zero-length range."""
+        from video_processing_module.config import ProcessingConfig
+        from video_processing_module.video_processor import VideoProcessor
+
+        processor = VideoProcessor(ProcessingConfig(output_dir="/tmp/test"))
+
+        assert await processor.keep_ranges("/in.mp4", "/out.mp4", [(5.0, 5.0)]) is False
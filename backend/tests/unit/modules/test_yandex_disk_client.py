@@ -73,3 +73,36 @@ class TestYandexDiskClientUploadFile:
         missing = tmp_path / "nope.bin"
         with pytest.raises(FileNotFoundError):
             await client.upload_file(missing, disk_path="/disk/x.bin")
+
+    @pytest.mark.asyncio
+    async def test_upload_file_streams_sized_body(self, tmp_path: Path) -> None:
+        """Uploads stream the file with a Content-Length, not chunked encoding."""
+        import httpx
+
+        src = tmp_path / "video.mp4"
+        src.write_bytes(b"v" * (2 * 1024 * 1024 + 3))
+        seen: dict = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen["length"] = request.headers.get("content-length")
+            seen["chunked"] = "transfer-encoding" in request.headers
+            seen["body"] = b"".join([chunk async for chunk in request.stream])
+            return httpx.Response(201)
+
+        client = YandexDiskClient(oauth_token="t")
+        progress: list[int] = []
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            with (
+                patch.object(client, "_client", return_value=http),
+                patch.object(client, "_ensure_folder_exists", new_callable=AsyncMock),
+                patch.object(client, "get_upload_url", new_callable=AsyncMock, return_value="https://up.test/x"),
+            ):
+                ok = await client.upload_file(
+                    src, disk_path="/Video/video.mp4", on_progress=lambda sent, _total: progress.append(sent)
+                )
+
+        assert ok is True
+        assert seen["body"] == src.read_bytes()
+        assert seen["length"] == str(src.stat().st_size)
+        assert not seen["chunked"]
+        assert progress[-1] == src.stat().st_size
@@ -1,8 +1,30 @@
 """Unit tests for transcription_module.normalize."""
 
+import random
+
 import pytest
 
-from transcription_module.normalize import build_segments_from_words, extract_words
+from transcription_module import normalize
+from transcription_module.normalize import (
+    build_segments,
+    build_segments_from_words,
+    detect_long_pauses,
+    extract_words,
+    word_timeline,
+)
+
+
+def _random_raw_words(seed: int, count: int) -> list[dict]:
+    """AssemblyAI-shaped words with punctuation, pauses, zero/negative durations and out-of-order starts."""
+    rng = random.Random(seed)
+    words, t = [], 0
+    for _ in range(count):
+        t += rng.choice([0, 50, 120, 300, 500, 900, 3000]) + rng.randint(0, 200)
+        if rng.random() < 0.01:
+            t -= rng.randint(0, 2000)
+        text = rng.choice(["слово", "word", "да,", "конец.", "вопрос?", "ну!", "мысль…", "", " x ", "a b"])
+        words.append({"text": text, "start": t, "end": t + rng.choice([0, -10, 80, 200, 400, 2500])})
+    return words
 
 
 @pytest.mark.unit
@@ -83,3 +105,112 @@ class TestBuildSegmentsFromWords:
         assert "start" in segs[0]
         assert "end" in segs[0]
         assert "text" in segs[0]
+
+
+@pytest.mark.unit
+class TestWordTimeline:
+    def test_ids_keep_provider_order(self):
+        """Ids follow the provider's order even after sorting by start."""
+        raw = [{"text": "b", "start": 2000, "end": 2100}, {"text": "a", "start": 1000, "end": 1100}]
+
+        timeline = word_timeline(raw)
+
+        assert timeline.text == ["a", "b"]
+        assert timeline.ids == [1, 0]
+        assert timeline.to_words() == extract_words(raw)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_words_as_loop(self, seed):
+        """The vectorized word timeline matches the loop implementation."""
+        pytest.importorskip("numpy")
+        raw = _random_raw_words(seed, 300)
+
+        assert word_timeline(raw).to_words() == normalize._extract_words_loop(raw)
+
+
+@pytest.mark.unit
+class TestBuildSegments:
+    def _timeline(self, texts_with_times):
+        return normalize.WordTimeline.from_words(
+            [
+                {"id": i, "word": text, "start": start, "end": end}
+                for i, (text, start, end) in enumerate(texts_with_times)
+            ]
+        )
+
+    def test_pause_breaks_segment(self):
+        """A long pause ends the segment."""
+        timeline = self._timeline(
+            [
+                ("one", 0.0, 0.3),
+                ("two", 0.3, 0.6),
+                ("three", 0.6, 0.9),
+                ("four", 2.0, 2.3),
+                ("five", 2.3, 2.6),
+                ("six.", 2.6, 2.9),
+            ]
+        )
+
+        segments = build_segments(timeline)
+
+        assert [s["text"] for s in segments] == ["one two three", "four five six."]
+
+    def test_duration_limit_splits_long_sentence(self):
+        """A sentence longer than the duration limit is split."""
+        timeline = self._timeline([(f"w{i}", i * 0.5, i * 0.5 + 0.5) for i in range(40)])
+
+        segments = build_segments(timeline, max_duration_seconds=8.0)
+
+        assert [s["start"] for s in segments] == [0.0, 8.0, 16.0]
+        assert all(s["end"] - s["start"] <= 8.0 for s in segments)
+
+    def test_short_segments_merged_into_previous(self):
+        """Very short segments are merged into the previous one."""
+        timeline = self._timeline([("Hello there friend.", 0.0, 2.0), ("Ok.", 2.1, 2.4), ("Yes.", 2.5, 2.8)])
+
+        segments = build_segments(timeline)
+
+        assert segments == [{"id": 0, "start": 0.0, "end": 2.8, "text": "Hello there friend. Ok. Yes."}]
+
+    @pytest.mark.parametrize("seed", range(10))
+    @pytest.mark.parametrize(("max_duration", "pause"), [(8.0, 0.4), (2.0, 0.1)])
+    def test_same_segments_as_loop(self, seed, max_duration, pause):
+        """Vectorized segmentation matches the loop implementation."""
+        pytest.importorskip("numpy")
+        words = extract_words(_random_raw_words(seed, 400))
+
+        expected = normalize._build_segments_loop(words, max_duration, pause)
+
+        assert build_segments(word_timeline(_random_raw_words(seed, 400)), max_duration, pause) == expected
+        assert build_segments_from_words(words, max_duration, pause) == expected
+
+    def test_without_numpy_uses_loop(self, monkeypatch):
+        """Without NumPy the loop implementation gives the same result."""
+        pytest.importorskip("numpy")
+        raw = _random_raw_words(7, 200)
+        expected = build_segments(word_timeline(raw))
+
+        monkeypatch.setattr(normalize, "np", None)
+
+        assert build_segments(word_timeline(raw)) == expected
+        assert extract_words(raw) == normalize._extract_words_loop(raw)
+
+
+@pytest.mark.unit
+class TestDetectLongPauses:
+    def test_gaps_over_threshold_sorted_by_start(self):
+        """Gaps over the threshold are reported in start order."""
+        segments = [
+            {"start": 700.0, "end": 710.0},
+            {"start": 0.0, "end": 100.0},
+            {"start": 100.0, "end": 200.0},
+        ]
+
+        assert detect_long_pauses(segments, 480) == [{"start": 200.0, "end": 700.0, "duration_minutes": 500 / 60}]
+
+    def test_same_as_loop(self):
+        """Vectorized pause detection matches the loop implementation."""
+        pytest.importorskip("numpy")
+        segments = normalize._build_segments_loop(extract_words(_random_raw_words(3, 400)), 8.0, 0.4)
+
+        assert detect_long_pauses(segments, 1.0) == normalize._detect_long_pauses_loop(segments, 1.0)
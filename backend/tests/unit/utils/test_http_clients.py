@@ -0,0 +1,223 @@
+"""Shared pooled HTTP clients: per-loop registry, connection reuse metrics, budgeted retries."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from api.observability import external_api_connections_total, external_api_retries_total
+from api.tasks.base import BaseTask
+from tests.fixtures.fake_asr import FakeASRServer
+from utils.http_clients import (
+    PooledTransport,
+    RetryBudget,
+    api_endpoint,
+    close_http_clients,
+    get_http_client,
+)
+from utils.worker_loop import shutdown_worker_loops
+
+
+def _connections(provider: str, connection: str) -> float:
+    return external_api_connections_total.labels(provider=provider, connection=connection)._value.get()
+
+
+def _retries(provider: str, outcome: str) -> float:
+    return external_api_retries_total.labels(provider=provider, outcome=outcome)._value.get()
+
+
+async def _grab(provider: str) -> httpx.AsyncClient:
+    return get_http_client(provider)
+
+
+def _flaky_client(statuses: list[int], budget: RetryBudget, max_retries: int = 2) -> tuple[httpx.AsyncClient, list]:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return httpx.Response(statuses[min(len(seen), len(statuses)) - 1])
+
+    transport = PooledTransport("test", httpx.MockTransport(handler), budget, max_retries=max_retries, backoff=0)
+    return httpx.AsyncClient(transport=transport), seen
+
+
+@pytest.mark.unit
+class TestHttpClientRegistry:
+    async def test_same_loop_shares_client_per_provider(self):
+        """Code on one loop shares one client per provider."""
+        try:
+            client = get_http_client("zoom")
+
+            assert get_http_client("zoom") is client
+            assert get_http_client("vk") is not client
+        finally:
+            await close_http_clients()
+
+        assert client.is_closed
+        assert get_http_client("zoom") is not client
+        await close_http_clients()
+
+    async def test_unknown_provider(self):
+        """An unknown provider is rejected."""
+        with pytest.raises(ValueError, match="Unknown HTTP client provider"):
+            get_http_client("nope")
+
+    def test_run_async_reuses_worker_loop_client(self):
+        """run_async reuses the worker loop's client across tasks."""
+
+        async def grab() -> httpx.AsyncClient:
+            return get_http_client("assemblyai")
+
+        task = BaseTask()
+        try:
+            first = task.run_async(grab())
+            second = task.run_async(grab())
+
+            assert first is second
+            assert not first.is_closed
+        finally:
+            shutdown_worker_loops()
+
+        assert first.is_closed
+
+    def test_client_survives_failed_task(self):
+        """A failing task does not close the shared client."""
+        clients = []
+
+        async def fail() -> None:
+            clients.append(get_http_client("vk"))
+            raise RuntimeError("boom")
+
+        async def grab() -> httpx.AsyncClient:
+            return get_http_client("vk")
+
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                BaseTask().run_async(fail())
+
+            assert BaseTask().run_async(grab()) is clients[0]
+        finally:
+            shutdown_worker_loops()
+
+    def test_finished_loops_dropped_from_registry(self):
+        """Clients of closed loops are dropped from the registry."""
+        from utils import http_clients
+
+        stale = asyncio.new_event_loop()
+        stale.run_until_complete(_grab("zoom"))
+        stale.close()
+
+        async def live_loops() -> list[asyncio.AbstractEventLoop]:
+            get_http_client("zoom")
+            return [loop for loop, _ in http_clients._clients.values()]
+
+        assert stale not in asyncio.run(live_loops())
+
+
+@pytest.mark.unit
+class TestConnectionReuse:
+    async def test_keepalive_connection_reused(self):
+        """Keep-alive connections are reused and counted."""
+        with FakeASRServer() as server:
+            new_before = _connections("assemblyai", "new")
+            reused_before = _connections("assemblyai", "reused")
+            client = get_http_client("assemblyai")
+            try:
+                for _ in range(3):
+                    response = await client.get(
+                        f"{server.base_url}/v2/transcript/missing", extensions=api_endpoint("transcript.get")
+                    )
+                    assert response.status_code == 404
+            finally:
+                await close_http_clients()
+
+        assert _connections("assemblyai", "new") == new_before + 1
+        assert _connections("assemblyai", "reused") == reused_before + 2
+
+
+@pytest.mark.unit
+class TestRetries:
+    async def test_idempotent_request_retried_on_503(self):
+        """Idempotent requests are retried on 503."""
+        client, seen = _flaky_client([503, 503, 200], RetryBudget(ratio=0.2, minimum=10))
+        before = _retries("test", "retried")
+
+        response = await client.get("https://example.test/status")
+
+        assert response.status_code == 200
+        assert seen == ["GET", "GET", "GET"]
+        assert _retries("test", "retried") == before + 2
+
+    async def test_post_not_retried(self):
+        """POST is not retried."""
+        client, seen = _flaky_client([503, 200], RetryBudget(ratio=0.2, minimum=10))
+
+        response = await client.post("https://example.test/submit", json={})
+
+        assert response.status_code == 503
+        assert seen == ["POST"]
+
+    async def test_retries_stop_after_max(self):
+        """Retries stop after max_retries."""
+        client, seen = _flaky_client([502], RetryBudget(ratio=0.2, minimum=10), max_retries=1)
+
+        response = await client.get("https://example.test/status")
+
+        assert response.status_code == 502
+        assert len(seen) == 2
+
+    async def test_exhausted_budget_refuses_retry(self):
+        """No retry is made once the budget is spent."""
+        budget = RetryBudget(ratio=0.2, minimum=1)
+        client, seen = _flaky_client([503], budget, max_retries=5)
+        before = _retries("test", "budget_exhausted")
+
+        await client.get("https://example.test/a")
+        assert len(seen) == 2  # one retry from the initial token
+
+        await client.get("https://example.test/b")
+        assert len(seen) == 3  # 0.2 tokens left: no retry
+        assert _retries("test", "budget_exhausted") == before + 2
+
+    async def test_network_error_retried_for_get(self):
+        """A connect error is retried for GET."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200)
+
+        transport = PooledTransport(
+            "test", httpx.MockTransport(handler), RetryBudget(ratio=0.2, minimum=10), max_retries=2, backoff=0
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("https://example.test/status")
+
+        assert response.status_code == 200
+        assert calls == 2
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    def test_deposits_are_capped(self):
+        """Deposits stop at the budget's cap."""
+        budget = RetryBudget(ratio=0.5, minimum=2)
+        for _ in range(10):
+            budget.deposit()
+
+        assert budget.try_spend()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+    def test_outage_bounded_by_ratio(self):
+        """During an outage retries are bounded by the ratio."""
+        budget = RetryBudget(ratio=0.25, minimum=0)
+        retries = 0
+        for _ in range(100):
+            budget.deposit()
+            retries += budget.try_spend()
+
+        assert retries == 25
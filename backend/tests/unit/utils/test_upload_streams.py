@@ -0,0 +1,112 @@
+"""Streaming upload bodies: chunked file reads, multipart framing, progress."""
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, UploadFile
+
+from utils.upload_streams import file_upload_headers, iter_file_chunks, multipart_file_body
+from video_upload_module.config_factory import VKConfig
+from video_upload_module.platforms.vk.uploader import VKUploader
+
+
+def _receiver() -> tuple[FastAPI, dict]:
+    received: dict = {}
+    app = FastAPI()
+
+    @app.post("/multipart")
+    async def multipart(video_file: UploadFile) -> dict:
+        received["filename"] = video_file.filename
+        received["content"] = await video_file.read()
+        return {"video_id": 1}
+
+    @app.put("/raw")
+    async def raw(request: Request) -> dict:
+        received["headers"] = dict(request.headers)
+        received["content"] = await request.body()
+        return {}
+
+    return app, received
+
+
+def _asgi_client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://upload.test")
+
+
+@pytest.mark.unit
+class TestIterFileChunks:
+    async def test_fixed_chunks_and_progress(self, tmp_path):
+        """Files are read in fixed-size chunks with progress after each one."""
+        path = tmp_path / "audio.mp3"
+        path.write_bytes(b"a" * 25)
+        progress: list[tuple[int, int]] = []
+
+        chunks = [
+            c async for c in iter_file_chunks(path, chunk_size=10, on_progress=lambda s, t: progress.append((s, t)))
+        ]
+
+        assert [len(c) for c in chunks] == [10, 10, 5]
+        assert progress == [(10, 25), (20, 25), (25, 25)]
+
+    async def test_raw_body_sent_with_content_length(self, tmp_path):
+        """A raw streamed body arrives intact with its Content-Length."""
+        path = tmp_path / "audio.mp3"
+        path.write_bytes(b"b" * 3000)
+        app, received = _receiver()
+
+        async with _asgi_client(app) as client:
+            await client.put("/raw", content=iter_file_chunks(path, chunk_size=1024), headers=file_upload_headers(path))
+
+        assert received["content"] == path.read_bytes()
+        assert received["headers"]["content-length"] == "3000"
+        assert "transfer-encoding" not in received["headers"]
+
+
+@pytest.mark.unit
+class TestMultipartFileBody:
+    async def test_parsed_as_form_upload(self, tmp_path):
+        """The streamed multipart body parses as a regular form upload."""
+        path = tmp_path / "лекция 1.mp4"
+        path.write_bytes(bytes(range(256)) * 100)
+        app, received = _receiver()
+
+        headers, body = multipart_file_body("video_file", path, chunk_size=4096)
+        async with _asgi_client(app) as client:
+            response = await client.post("/multipart", content=body, headers=headers)
+
+        assert response.status_code == 200
+        assert received["filename"] == "лекция 1.mp4"
+        assert received["content"] == path.read_bytes()
+
+    async def test_content_length_matches_body(self, tmp_path):
+        """The declared Content-Length equals the streamed multipart size."""
+        path = tmp_path / "v.mp4"
+        path.write_bytes(b"v" * 5000)
+
+        headers, body = multipart_file_body("video_file", path)
+        sent = b"".join([chunk async for chunk in body])
+
+        assert int(headers["Content-Length"]) == len(sent)
+
+
+@pytest.mark.unit
+class TestVKStreamingUpload:
+    async def test_video_streamed_with_progress(self, tmp_path):
+        """VK video upload streams from disk and reports progress."""
+        path = tmp_path / "lecture.mp4"
+        path.write_bytes(b"v" * (3 * 1024 * 1024))
+        app, received = _receiver()
+        progress = MagicMock(task_ids=[7])
+        uploader = VKUploader(VKConfig(access_token="test"))
+
+        async with _asgi_client(app) as client:
+            with patch("video_upload_module.platforms.vk.uploader.get_http_client", return_value=client):
+                result = await uploader._upload_video_file(
+                    "http://upload.test/multipart", str(path), progress=progress, task_id=7
+                )
+
+        assert result == {"video_id": 1}
+        assert received["content"] == path.read_bytes()
+        completed = [call.kwargs["completed"] for call in progress.update.call_args_list]
+        assert completed == [33, 66, 100]
@@ -0,0 +1,196 @@
+"""Worker-lifetime event loops and the pooled engine bound to them."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded, Terminated, TimeLimitExceeded
+
+from utils.worker_loop import (
+    AsyncJob,
+    bind_job,
+    run_in_worker_loop,
+    shared_loop_active,
+    shutdown_worker_loops,
+    start_shared_loop,
+    start_worker_loop,
+    stop_shared_loop,
+    worker_engine,
+)
+
+
+async def _running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+@pytest.fixture
+def worker_loops():
+    yield
+    shutdown_worker_loops()
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("worker_loops")
+class TestWorkerLoop:
+    def test_loop_reused_across_calls(self):
+        """The same loop serves every call in a thread."""
+        first = run_in_worker_loop(_running_loop())
+
+        assert run_in_worker_loop(_running_loop()) is first
+        assert not first.is_closed()
+
+    def test_each_thread_has_own_loop(self):
+        """Each worker thread gets its own loop."""
+        main_loop = run_in_worker_loop(_running_loop())
+        other: list[asyncio.AbstractEventLoop] = []
+        thread = threading.Thread(target=lambda: other.append(run_in_worker_loop(_running_loop())))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_loop
+
+    def test_engine_shared_by_sync_setup_and_loop(self):
+        """Sync setup code and coroutines on the loop share one engine."""
+        factory = MagicMock(side_effect=lambda: MagicMock(dispose=AsyncMock()))
+
+        async def inside():
+            return worker_engine(factory)
+
+        engine = worker_engine(factory)
+
+        assert run_in_worker_loop(inside()) is engine
+        factory.assert_called_once()
+
+    def test_foreign_loop_gets_no_pooled_engine(self):
+        """A coroutine on some other loop gets no pooled engine."""
+        factory = MagicMock()
+
+        async def inside():
+            return worker_engine(factory)
+
+        run_in_worker_loop(_running_loop())
+
+        assert asyncio.run(inside()) is None
+        factory.assert_not_called()
+
+    def test_shutdown_disposes_engine_and_closes_loop(self):
+        """Shutdown disposes the engine and closes the loop."""
+        engine = MagicMock(dispose=AsyncMock())
+        worker_engine(lambda: engine)
+        loop = run_in_worker_loop(_running_loop())
+
+        shutdown_worker_loops()
+
+        engine.dispose.assert_awaited_once()
+        assert loop.is_closed()
+        assert run_in_worker_loop(_running_loop()) is not loop
+
+    def test_forked_worker_drops_inherited_loop(self):
+        """A forked child does not reuse the parent's loop."""
+        inherited = run_in_worker_loop(_running_loop())
+
+        start_worker_loop()
+
+        assert run_in_worker_loop(_running_loop()) is not inherited
+        inherited.close()
+
+
+@pytest.fixture
+def shared_loop():
+    start_shared_loop(blocking_threads=2)
+    yield
+    stop_shared_loop()
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("shared_loop")
+class TestSharedWorkerLoop:
+    def test_threads_share_one_loop_and_engine(self):
+        """Pool threads share one loop and one engine."""
+        factory = MagicMock(side_effect=lambda: MagicMock(dispose=AsyncMock()))
+        loops: list[asyncio.AbstractEventLoop] = []
+        engines = []
+
+        def task():
+            engines.append(worker_engine(factory))
+            loops.append(run_in_worker_loop(_running_loop()))
+
+        threads = [threading.Thread(target=task) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert shared_loop_active()
+        assert len(set(loops)) == 1
+        assert len(set(map(id, engines))) == 1
+        factory.assert_called_once()
+
+    def test_tasks_await_concurrently(self):
+        """Tasks from different threads await at the same time."""
+        started = threading.Barrier(2, timeout=5)
+
+        async def wait_for_peer():
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            return True
+
+        results: list[bool] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(run_in_worker_loop(wait_for_peer()))) for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True, True]
+
+    def test_soft_limit_raises_inside_task_once(self):
+        """The soft limit is raised once inside the task; cleanup still runs."""
+        job = AsyncJob(soft_timeout=0.05, timeout=5)
+
+        with bind_job(job), pytest.raises(SoftTimeLimitExceeded):
+            run_in_worker_loop(asyncio.sleep(1))
+
+        # Cleanup after the soft limit (on_failure) is not cut short again
+        with bind_job(job):
+            assert run_in_worker_loop(asyncio.sleep(0.1, result="cleaned")) == "cleaned"
+
+    def test_hard_limit_stops_waiting(self):
+        """The hard limit stops waiting for the coroutine."""
+        job = AsyncJob(timeout=0.05)
+
+        with bind_job(job), pytest.raises(TimeLimitExceeded):
+            run_in_worker_loop(asyncio.sleep(1))
+
+    def test_cancel_terminates_waiting_task(self):
+        """Cancelling a job terminates the task waiting on it."""
+        job = AsyncJob()
+        errors: list[BaseException] = []
+
+        def task():
+            with bind_job(job):
+                try:
+                    run_in_worker_loop(asyncio.sleep(5))
+                except BaseException as exc:
+                    errors.append(exc)
+
+        thread = threading.Thread(target=task)
+        thread.start()
+        while not job._futures:
+            threading.Event().wait(0.01)
+        job.cancel()
+        thread.join(timeout=2)
+
+        assert isinstance(errors[0], Terminated)
+
+    def test_stop_disposes_shared_engine(self):
+        """Stopping the shared loop disposes its engine."""
+        engine = MagicMock(dispose=AsyncMock())
+        worker_engine(lambda: engine)
+
+        stop_shared_loop()
+
+        engine.dispose.assert_awaited_once()
+        assert not shared_loop_active()
@@ -0,0 +1,132 @@
+"""Persistent partial downloads: resume across task retries, crash tail, lock, temp sweep."""
+
+import json
+import os
+import time
+
+import httpx
+import pytest
+
+from video_download_module.core import base as base_module
+from video_download_module.core.partial import PartialDownload, PartialDownloadBusyError, sweep_stale_partials
+from video_download_module.downloader import ZoomDownloader
+
+SOURCE = "https://zoom.us/rec/download/abc"
+
+
+def _interrupted(directory, data: bytes, etag: str = '"v1"') -> None:
+    """A previous attempt that wrote ``data`` and died."""
+    partial = PartialDownload.open(directory, 7, ".mp4", SOURCE)
+    partial.remember({"etag": etag})
+    with partial.path.open("wb") as f:
+        f.write(data)
+        partial.checkpoint(f)
+    partial.close()
+
+
+@pytest.mark.unit
+class TestPartialDownload:
+    def test_retry_resumes_with_validator(self, tmp_path):
+        """A retry resumes from the saved offset with If-Range."""
+        _interrupted(tmp_path, b"01234")
+
+        partial = PartialDownload.open(tmp_path, 7, ".mp4", SOURCE)
+
+        assert partial.offset == 5
+        assert partial.range_headers(partial.offset) == {"Range": "bytes=5-", "If-Range": '"v1"'}
+        partial.close()
+
+    def test_unsynced_tail_dropped(self, tmp_path):
+        """Bytes written after the last checkpoint are truncated."""
+        _interrupted(tmp_path, b"01234")
+        with (tmp_path / "rec_7.mp4").open("ab") as f:
+            f.write(b"torn")  # written after the last checkpoint, then the worker died
+
+        partial = PartialDownload.open(tmp_path, 7, ".mp4", SOURCE)
+
+        assert partial.path.read_bytes() == b"01234"
+        partial.close()
+
+    def test_other_source_starts_over(self, tmp_path):
+        """A partial from another source URL is discarded."""
+        _interrupted(tmp_path, b"01234")
+
+        partial = PartialDownload.open(tmp_path, 7, ".mp4", "https://zoom.us/rec/download/other")
+
+        assert partial.offset == 0
+        assert not partial.state_path.exists()
+        partial.close()
+
+    def test_weak_etag_falls_back_to_last_modified(self, tmp_path):
+        """A weak ETag is not used for If-Range; Last-Modified is."""
+        partial = PartialDownload.open(tmp_path, 7, ".mp4", SOURCE)
+
+        partial.remember({"etag": 'W/"v1"', "last-modified": "Sat, 17 Oct 2026 10:00:00 GMT"})
+
+        assert partial.validator == "Sat, 17 Oct 2026 10:00:00 GMT"
+        partial.close()
+
+    def test_concurrent_download_rejected(self, tmp_path):
+        """A second download of the same recording is refused while the lock is held."""
+        partial = PartialDownload.open(tmp_path, 7, ".mp4", SOURCE)
+
+        with pytest.raises(PartialDownloadBusyError):
+            PartialDownload.open(tmp_path, 7, ".mp4", SOURCE)
+        partial.close()
+
+
+@pytest.mark.unit
+def test_sweep_keeps_active_and_recent_partials(tmp_path):
+    """The sweep removes only idle, old partials."""
+    _interrupted(tmp_path, b"idle")
+    old = time.time() - 7200
+    for name in ("rec_7.mp4", "rec_7.mp4.json", "rec_7.mp4.lock"):
+        os.utime(tmp_path / name, (old, old))
+    active = PartialDownload.open(tmp_path, 8, ".mp4", SOURCE)
+    with active.path.open("wb") as f:
+        f.write(b"busy")
+        active.checkpoint(f)
+    os.utime(active.path, (old, old))
+    os.utime(active.state_path, (old, old))
+    os.utime(active.lock_path, (old, old))
+    recent = PartialDownload.open(tmp_path, 9, ".mp4", SOURCE)
+    recent.path.write_bytes(b"new")
+    recent.close()
+
+    assert sweep_stale_partials(tmp_path, max_age_seconds=3600) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "rec_8.mp4",
+        "rec_8.mp4.json",
+        "rec_8.mp4.lock",
+        "rec_9.mp4",
+        "rec_9.mp4.lock",
+    ]
+    active.close()
+
+
+@pytest.mark.unit
+async def test_download_url_resumes_saved_partial(tmp_path, mocker):
+    """_download_url continues a saved partial with a Range request."""
+    _interrupted(tmp_path, b"01234")
+    seen = {}
+
+    def handler(request):
+        seen.update(request.headers)
+        return httpx.Response(206, headers={"content-range": "bytes 5-9/10", "etag": '"v1"'}, content=b"56789")
+
+    real_client = httpx.AsyncClient
+    mocker.patch.object(
+        base_module.httpx, "AsyncClient", lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw)
+    )
+    downloader = ZoomDownloader(user_slug=1)
+    mocker.patch.object(downloader, "_validate_file", return_value=True)
+
+    partial = PartialDownload.open(tmp_path, 7, ".mp4", SOURCE)
+    ok = await downloader._download_url(SOURCE, partial.path, partial=partial)
+    partial.close()
+
+    assert ok
+    assert seen["range"] == "bytes=5-"
+    assert seen["if-range"] == '"v1"'
+    assert partial.path.read_bytes() == b"0123456789"
+    assert json.loads(partial.state_path.read_text())["bytes"] == 10
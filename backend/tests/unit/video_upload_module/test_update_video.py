@@ -0,0 +1,74 @@
+"""Post-upload metadata/visibility patch (early upload publish step)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from video_upload_module.config_factory import VKConfig, YouTubeConfig
+from video_upload_module.platforms.vk.uploader import VKUploader
+from video_upload_module.platforms.youtube.uploader import YouTubeUploader
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_youtube_update_keeps_category_and_flips_privacy() -> None:
+    """YouTube update keeps the category and changes privacy."""
+    uploader = YouTubeUploader(YouTubeConfig())
+    uploader._authenticated = True
+    uploader.service = MagicMock()
+    videos = uploader.service.videos.return_value
+    videos.list.return_value.execute.return_value = {
+        "items": [
+            {
+                "snippet": {"title": "draft", "description": "", "categoryId": "27"},
+                "status": {"privacyStatus": "private", "embeddable": True},
+            }
+        ]
+    }
+
+    assert await uploader.update_video("vid1", title="Lecture", description="a > b", privacy_status="public")
+
+    body = videos.update.call_args.kwargs["body"]
+    assert body["id"] == "vid1"
+    assert body["snippet"] == {"title": "Lecture", "description": "a ＞ b", "categoryId": "27"}
+    assert body["status"] == {"privacyStatus": "public", "embeddable": True}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_youtube_update_missing_video_returns_false() -> None:
+    """Updating a YouTube video that no longer exists returns False."""
+    uploader = YouTubeUploader(YouTubeConfig())
+    uploader._authenticated = True
+    uploader.service = MagicMock()
+    uploader.service.videos.return_value.list.return_value.execute.return_value = {"items": []}
+
+    assert await uploader.update_video("gone", title="t") is False
+    uploader.service.videos.return_value.update.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_vk_update_sends_video_edit() -> None:
+    """VK update is sent as video.edit."""
+    uploader = VKUploader(VKConfig(access_token="test"))
+    uploader._authenticated = True
+    captured: dict = {}
+
+    async def fake_request(method: str, params: dict) -> int:
+        captured["method"] = method
+        captured["params"] = params
+        return 1
+
+    uploader._make_request = fake_request  # type: ignore[method-assign]
+
+    assert await uploader.update_video("42", title="Lecture", description="desc", privacy_view=0, owner_id=-7)
+
+    assert captured["method"] == "video.edit"
+    assert captured["params"] == {
+        "video_id": "42",
+        "owner_id": -7,
+        "name": "Lecture",
+        "desc": "desc",
+        "privacy_view": 0,
+    }
@@ -4,27 +4,45 @@ All persistent files live in the storage backend (S3 in production, local FS in
 Methods that perform I/O are ``async`` — they go through ``StorageBackend.load``/``save``.
 Pure path helpers (``get_dir``) stay synchronous since they only build keys.
 
+Cache files and subtitles are derived from the in-memory words/segments in one
+pass (``derive_artifacts``) right after ``save_master``, so neither master.json
+nor segments.txt has to be read back to produce them.
+
+Topic/summary versions are stored one object per version plus a small manifest
+updated by compare-and-swap (``StorageBackend.save_if_match``), so adding or
+editing a version never rewrites the others and concurrent writers cannot drop
+each other's versions. A legacy ``extracted.json`` is still read as-is and is
+split into this layout on the first write.
+
 File layout (storage keys, relative to backend root):
     users/{user_slug:06d}/recordings/{rec_id}/transcriptions/master.json     — raw ASR result
-    users/{user_slug:06d}/recordings/{rec_id}/transcriptions/extracted.json  — topics/summary versions
+    users/{user_slug:06d}/recordings/{rec_id}/transcriptions/extracted/manifest.json  — active pointer + version list
+    users/{user_slug:06d}/recordings/{rec_id}/transcriptions/extracted/versions/{version_id}.json  — one version
     users/{user_slug:06d}/recordings/{rec_id}/transcriptions/cache/segments.txt
     users/{user_slug:06d}/recordings/{rec_id}/transcriptions/cache/words.txt
     users/{user_slug:06d}/recordings/{rec_id}/transcriptions/cache/subtitles.{srt,vtt}
 """
 
+import asyncio
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 
+from api.shared.types import VERSION_ID_REGEX
+from file_storage.backends.base import PreconditionFailedError
 from file_storage.factory import get_storage_backend
 from file_storage.path_builder import StoragePathBuilder, to_storage_key
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+VERSION_ID_PATTERN = re.compile(VERSION_ID_REGEX)
+MANIFEST_CAS_ATTEMPTS = 8
+
 
 class TranscriptionManager:
-    """Manage transcription files (master.json) and extraction (extracted.json, cache).
+    """Manage transcription files (master.json), extraction versions and cache files.
 
     All methods that touch storage are ``async``. ``get_dir`` is sync and returns
     a ``Path`` that can be passed to ``to_storage_key`` to obtain the storage key.
@@ -105,15 +123,26 @@ class TranscriptionManager:
             raise FileNotFoundError(f"master.json not found for recording {recording_id}: {key}")
         return json.loads(await storage.load(key))
 
-    # ------------------------------------------------------------ extracted.json
+    # ------------------------------------------------------- extracted versions
+    def _manifest_key(self, recording_id: int, user_slug: int) -> str:
+        return to_storage_key(self._builder.transcription_extracted_manifest(user_slug, recording_id))
+
+    def _version_key(self, recording_id: int, user_slug: int, version_id: str) -> str:
+        if not VERSION_ID_PATTERN.match(version_id):
+            raise ValueError(f"Invalid extracted version id: {version_id!r}")
+        return to_storage_key(self._builder.transcription_extracted_version(user_slug, recording_id, version_id))
+
     async def has_extracted(self, recording_id: int, user_slug: int) -> bool:
-        """Check if extracted.json exists (topics, summary from DeepSeek)."""
-        return await get_storage_backend().exists(self._extracted_key(recording_id, user_slug))
+        """Check if extraction versions exist (manifest or legacy extracted.json)."""
+        storage = get_storage_backend()
+        return await storage.exists(self._manifest_key(recording_id, user_slug)) or await storage.exists(
+            self._extracted_key(recording_id, user_slug)
+        )
 
     async def add_extracted_version(
         self,
         recording_id: int,
-        version_id: str,
+        version_id: str | None,
         model: str,
         granularity: str,
         main_topics: list[str],
@@ -126,29 +155,17 @@ class TranscriptionManager:
         user_slug: int | None = None,
         **meta,
     ) -> str:
-        """Add new extraction version to extracted.json."""
+        """Store a new extraction version as its own object and register it in the manifest.
+
+        ``version_id=None`` allocates the next free ``vN`` (safe against concurrent
+        writers); an explicit id that already exists replaces that version.
+        Returns the version id.
+        """
         if user_slug is None:
             raise ValueError("user_slug is required. Get it from recording.owner.user_slug or user.user_slug")
 
-        key = self._extracted_key(recording_id, user_slug)
         storage = get_storage_backend()
-
-        if await storage.exists(key):
-            extracted_file = json.loads(await storage.load(key))
-        else:
-            extracted_file = {
-                "recording_id": recording_id,
-                "active_version": None,
-                "versions": [],
-            }
-
-        if is_active:
-            versions = extracted_file.get("versions", [])
-            if isinstance(versions, list):
-                for v in versions:
-                    if isinstance(v, dict):
-                        v["is_active"] = False
-            extracted_file["active_version"] = version_id
+        await self._migrate_legacy_extracted(recording_id, user_slug)
 
         version_data = {
             "id": version_id,
@@ -165,44 +182,76 @@ class TranscriptionManager:
             **meta,
         }
 
-        versions_list = extracted_file.get("versions")
-        if not isinstance(versions_list, list):
-            versions_list = []
-            extracted_file["versions"] = versions_list
-        versions_list.append(version_data)
-
-        payload = json.dumps(extracted_file, ensure_ascii=False, indent=2).encode("utf-8")
-        await storage.save(key, payload)
+        written_id: str | None = None
+        taken: set[str] = set()
+        manifest: dict | None
+        for _ in range(MANIFEST_CAS_ATTEMPTS):
+            manifest, tag = await self._read_manifest(recording_id, user_slug)
+            if manifest is None:
+                manifest = {"recording_id": recording_id, "active_version": None, "versions": []}
+
+            if written_id is None:
+                if version_id is not None:
+                    written_id = version_id
+                    await storage.save(self._version_key(recording_id, user_slug, written_id), self._dump(version_data))
+                else:
+                    candidate = self._next_version_id(manifest, taken)
+                    version_data["id"] = candidate
+                    try:
+                        # Create-only: a concurrent writer may hold the id but not be in the manifest yet
+                        await storage.save_if_match(
+                            self._version_key(recording_id, user_slug, candidate), self._dump(version_data), None
+                        )
+                    except PreconditionFailedError:
+                        taken.add(candidate)
+                        continue
+                    written_id = candidate
+
+            manifest["versions"] = [e for e in manifest.get("versions", []) if e.get("id") != written_id]
+            manifest["versions"].append(self._manifest_entry(version_data))
+            if is_active:
+                manifest["active_version"] = written_id
+            try:
+                await storage.save_if_match(self._manifest_key(recording_id, user_slug), self._dump(manifest), tag)
+            except PreconditionFailedError:
+                continue
+            break
+        else:
+            raise PreconditionFailedError(f"Extracted manifest of recording {recording_id} kept changing")
 
         logger.info(
-            f"Added extracted version {version_id} for recording {recording_id}: "
+            f"Added extracted version {written_id} for recording {recording_id}: "
             f"topics={len(topic_timestamps)}, model={model}"
         )
-        return key
+        return written_id
 
     async def load_extracted(self, recording_id: int, user_slug: int) -> dict:
-        """Load extraction data from extracted.json."""
-        key = self._extracted_key(recording_id, user_slug)
-        storage = get_storage_backend()
-        if not await storage.exists(key):
-            raise FileNotFoundError(f"extracted.json not found for recording {recording_id}: {key}")
-        return json.loads(await storage.load(key))
+        """All versions as ``{recording_id, active_version, versions}`` (legacy extracted.json shape)."""
+        manifest, _ = await self._read_manifest(recording_id, user_slug)
+        if manifest is None:
+            return await self._load_legacy_extracted(recording_id, user_slug)
+
+        active_id = manifest.get("active_version")
+        versions = await asyncio.gather(
+            *(self._load_version(recording_id, user_slug, entry["id"], active_id) for entry in manifest["versions"])
+        )
+        return {"recording_id": recording_id, "active_version": active_id, "versions": list(versions)}
 
     async def get_active_extracted(self, recording_id: int, user_slug: int) -> dict | None:
         """Return active extraction version (topics, summary) or None if not found."""
-        try:
-            extracted_data = await self.load_extracted(recording_id, user_slug)
-        except FileNotFoundError:
-            return None
-
-        active_version_id = extracted_data.get("active_version")
-        if not active_version_id:
+        manifest, _ = await self._read_manifest(recording_id, user_slug)
+        if manifest is None:
+            try:
+                extracted_data = await self._load_legacy_extracted(recording_id, user_slug)
+            except FileNotFoundError:
+                return None
+            active_version_id = extracted_data.get("active_version")
+            return next((v for v in extracted_data.get("versions", []) if v.get("id") == active_version_id), None)
+
+        active_id = manifest.get("active_version")
+        if not active_id or all(entry.get("id") != active_id for entry in manifest["versions"]):
             return None
-
-        for version in extracted_data.get("versions", []):
-            if version.get("id") == active_version_id:
-                return version
-        return None
+        return await self._load_version(recording_id, user_slug, active_id, active_id)
 
     async def update_active_version(
         self,
@@ -210,59 +259,177 @@ class TranscriptionManager:
         user_slug: int,
         fields: dict,
     ) -> dict:
-        """Partially update fields of the active extracted.json version in-place.
+        """Partially update fields of the active version (compare-and-swap on its object).
 
         Sets ``manually_edited = True`` on the version. Returns the updated version dict.
         """
-        extracted_file = await self.load_extracted(recording_id, user_slug)
-        active_id = extracted_file.get("active_version")
-        versions = extracted_file.get("versions", [])
-
-        active_version = next((v for v in versions if v.get("id") == active_id), None)
-        if active_version is None:
-            raise ValueError(f"Active version '{active_id}' not found in extracted.json for recording {recording_id}")
-
-        active_version.update(fields)
-        active_version["manually_edited"] = True
-
-        key = self._extracted_key(recording_id, user_slug)
-        payload = json.dumps(extracted_file, ensure_ascii=False, indent=2).encode("utf-8")
-        await get_storage_backend().save(key, payload)
+        storage = get_storage_backend()
+        await self._migrate_legacy_extracted(recording_id, user_slug)
+        manifest, _ = await self._read_manifest(recording_id, user_slug)
+        if manifest is None:
+            raise FileNotFoundError(f"No extracted versions for recording {recording_id}")
+
+        active_id = manifest.get("active_version")
+        if not active_id or all(entry.get("id") != active_id for entry in manifest["versions"]):
+            raise ValueError(
+                f"Active version '{active_id}' not found in extracted versions for recording {recording_id}"
+            )
+
+        key = self._version_key(recording_id, user_slug, active_id)
+        for _ in range(MANIFEST_CAS_ATTEMPTS):
+            content, tag = await storage.load_versioned(key)
+            active_version = json.loads(content)
+            active_version.update(fields)
+            active_version["manually_edited"] = True
+            try:
+                await storage.save_if_match(key, self._dump(active_version), tag)
+            except PreconditionFailedError:
+                continue
+            break
+        else:
+            raise PreconditionFailedError(f"Extracted version {active_id} of recording {recording_id} kept changing")
 
+        active_version["is_active"] = True
         logger.info(f"Updated active extracted version {active_id} for recording {recording_id}: fields={list(fields)}")
         return active_version
 
     async def generate_version_id(self, recording_id: int, user_slug: int) -> str:
-        """Generate next version ID (v1, v2, ...) for extracted.json."""
+        """Next free version ID (v1, v2, ...). ``add_extracted_version(version_id=None)`` allocates atomically."""
+        manifest, _ = await self._read_manifest(recording_id, user_slug)
+        if manifest is None:
+            try:
+                manifest = await self._load_legacy_extracted(recording_id, user_slug)
+            except FileNotFoundError:
+                return "v1"
+        return self._next_version_id(manifest, set())
+
+    async def _read_manifest(self, recording_id: int, user_slug: int) -> tuple[dict | None, str | None]:
+        """Manifest and its version tag for ``save_if_match`` (None, None if absent)."""
         try:
-            extracted_data = await self.load_extracted(recording_id, user_slug)
-            version_count = len(extracted_data.get("versions", []))
-            return f"v{version_count + 1}"
+            content, tag = await get_storage_backend().load_versioned(self._manifest_key(recording_id, user_slug))
         except FileNotFoundError:
-            return "v1"
+            return None, None
+        return json.loads(content), tag
+
+    async def _load_version(self, recording_id: int, user_slug: int, version_id: str, active_id: str | None) -> dict:
+        version = json.loads(await get_storage_backend().load(self._version_key(recording_id, user_slug, version_id)))
+        version["is_active"] = version_id == active_id
+        return version
+
+    async def _load_legacy_extracted(self, recording_id: int, user_slug: int) -> dict:
+        key = self._extracted_key(recording_id, user_slug)
+        storage = get_storage_backend()
+        if not await storage.exists(key):
+            raise FileNotFoundError(f"extracted.json not found for recording {recording_id}: {key}")
+        return json.loads(await storage.load(key))
+
+    async def _migrate_legacy_extracted(self, recording_id: int, user_slug: int) -> None:
+        """Split a legacy extracted.json into version objects + manifest before the first write.
+
+        Version objects and the manifest are created only if absent, so concurrent
+        migrations are harmless and never overwrite a version written meanwhile;
+        extracted.json is removed once the manifest exists.
+        """
+        storage = get_storage_backend()
+        legacy_key = self._extracted_key(recording_id, user_slug)
+        if not await storage.exists(legacy_key):
+            return
+
+        legacy = json.loads(await storage.load(legacy_key))
+        versions: dict[str, dict] = {}
+        for version in legacy.get("versions") or []:
+            # Legacy files may repeat an id; the first one is what readers used to get
+            if isinstance(version, dict) and version.get("id"):
+                versions.setdefault(version["id"], version)
+
+        async def _create_version(version_id: str, version: dict) -> None:
+            # Create-only: a concurrent migration or a newer write may already own the object
+            try:
+                await storage.save_if_match(
+                    self._version_key(recording_id, user_slug, version_id), self._dump(version), None
+                )
+            except PreconditionFailedError:
+                logger.debug(f"Extracted version {version_id} already exists for recording {recording_id}")
+
+        await asyncio.gather(*(_create_version(version_id, version) for version_id, version in versions.items()))
+        manifest = {
+            "recording_id": recording_id,
+            "active_version": legacy.get("active_version"),
+            "versions": [self._manifest_entry(version) for version in versions.values()],
+        }
+        try:
+            await storage.save_if_match(self._manifest_key(recording_id, user_slug), self._dump(manifest), None)
+        except PreconditionFailedError:
+            logger.debug(f"Extracted manifest already exists for recording {recording_id}")
+        await storage.delete(legacy_key)
+        logger.info(f"Migrated extracted.json of recording {recording_id}: versions={len(versions)}")
+
+    @staticmethod
+    def _manifest_entry(version: dict) -> dict:
+        return {key: version.get(key) for key in ("id", "model", "granularity", "created_at")}
+
+    @staticmethod
+    def _next_version_id(manifest: dict, taken: set[str]) -> str:
+        ids = {entry.get("id") for entry in manifest.get("versions", [])} | taken
+        numbers = [int(vid[1:]) for vid in ids if vid and vid.startswith("v") and vid[1:].isdigit()]
+        number = max([len(manifest.get("versions", [])), *numbers]) + 1
+        while f"v{number}" in ids:
+            number += 1
+        return f"v{number}"
+
+    @staticmethod
+    def _dump(data: dict) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
     # ----------------------------------------------------------- cache (text files)
-    async def generate_cache_files(self, recording_id: int, user_slug: int) -> dict[str, str]:
-        """Generate cache files (segments.txt, words.txt) from master.json.
+    async def derive_artifacts(
+        self,
+        recording_id: int,
+        user_slug: int,
+        words: list[dict],
+        segments: list[dict],
+        subtitle_formats: list[str] | tuple[str, ...] = ("srt", "vtt"),
+        text_files: bool = True,
+    ) -> dict[str, str]:
+        """Render cache files and subtitles from in-memory words/segments and write them concurrently.
 
-        Returns a dict of logical name → storage key.
+        Subtitle cues are cut from word timings (``SubtitleGenerator.entries_from_words``).
+
+        Returns a dict of logical name → storage key: ``segments_txt``/``words_txt``
+        and one entry per subtitle format (``srt``, ``vtt``).
         """
-        master = await self.load_master(recording_id, user_slug)
+        from subtitle_module import SubtitleGenerator
+
         cache_key_dir = self._cache_dir_key(recording_id, user_slug)
-        storage = get_storage_backend()
+        payloads: dict[str, tuple[str, str]] = {}
+
+        if text_files:
+            payloads["segments_txt"] = (f"{cache_key_dir}/segments.txt", self._format_segments(segments))
+            payloads["words_txt"] = (f"{cache_key_dir}/words.txt", self._format_words(words))
 
-        files: dict[str, str] = {}
+        if subtitle_formats:
+            generator = SubtitleGenerator()
+            entries = generator.entries_from_words(words, segments)
+            if not entries:
+                raise ValueError(f"No subtitle entries for recording {recording_id}")
+            for fmt in subtitle_formats:
+                payloads[fmt] = (f"{cache_key_dir}/subtitles.{fmt}", generator.render(entries, fmt))
 
-        segments_key = f"{cache_key_dir}/segments.txt"
-        await storage.save(segments_key, self._format_segments(master["segments"]).encode("utf-8"))
-        files["segments_txt"] = segments_key
+        storage = get_storage_backend()
+        await asyncio.gather(*(storage.save(key, body.encode("utf-8")) for key, body in payloads.values()))
 
-        words_key = f"{cache_key_dir}/words.txt"
-        await storage.save(words_key, self._format_words(master["words"]).encode("utf-8"))
-        files["words_txt"] = words_key
+        logger.info(f"Derived transcript artifacts for recording {recording_id}: {list(payloads)}")
+        return {name: key for name, (key, _) in payloads.items()}
 
-        logger.info(f"Generated cache files for recording {recording_id}: {list(files.keys())}")
-        return files
+    async def generate_cache_files(self, recording_id: int, user_slug: int) -> dict[str, str]:
+        """Generate cache files (segments.txt, words.txt) from master.json.
+
+        Returns a dict of logical name → storage key.
+        """
+        master = await self.load_master(recording_id, user_slug)
+        return await self.derive_artifacts(
+            recording_id, user_slug, master["words"], master["segments"], subtitle_formats=()
+        )
 
     async def ensure_segments_txt(self, recording_id: int, user_slug: int) -> str:
         """Ensure segments.txt exists, generating it from master.json if needed.
@@ -278,17 +445,10 @@ class TranscriptionManager:
         return segments_key
 
     async def generate_subtitles(self, recording_id: int, formats: list[str], user_slug: int) -> dict[str, str]:
-        """Generate subtitle files in requested formats. Returns dict of format → storage key."""
-        from subtitle_module import SubtitleGenerator
-
-        segments_key = await self.ensure_segments_txt(recording_id, user_slug)
-        cache_dir_key = self._cache_dir_key(recording_id, user_slug)
-
-        generator = SubtitleGenerator()
-        result = await generator.generate_from_transcription(
-            transcription_key=segments_key,
-            output_dir_key=cache_dir_key,
-            formats=formats,
+        """Generate subtitle files in requested formats from master.json. Returns dict of format → storage key."""
+        master = await self.load_master(recording_id, user_slug)
+        result = await self.derive_artifacts(
+            recording_id, user_slug, master["words"], master["segments"], subtitle_formats=formats, text_files=False
         )
 
         logger.info(f"Generated subtitles for recording {recording_id}: {formats}")
@@ -1,9 +1,102 @@
-"""Shared normalization helpers for ASR provider responses → LEAP format."""
+"""Shared normalization helpers for ASR provider responses → LEAP format.
+
+Provider words are turned into columns once (``WordTimeline``): master.json words
+and heuristic segments are built from the same columns, with gaps, sentence-end
+masks and duration limits computed as NumPy array operations. The per-word loop
+implementations at the end of this module are the reference the tests compare
+against and the fallback when NumPy cannot be imported. Both paths produce
+identical output.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from itertools import pairwise
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:  # fall back to the per-word loops
+    np = None
+
+SENTENCE_ENDINGS = (".", "!", "?", "…")
+COMMA_PUNCTUATION = (",",)
+PAUSE_FOR_COMMA = 0.25
+MIN_GROUP_DURATION_FOR_PAUSE_BREAK = 0.7
+MIN_WORDS_FOR_BREAK = 3
+SHORT_SEGMENT_DURATION = 1.2
+SHORT_SEGMENT_WORDS = 3
+MIN_WORD_DURATION = 0.1
+
+
+@dataclass(slots=True)
+class WordTimeline:
+    """Normalized words as parallel columns, sorted by start (seconds).
+
+    Built once from the provider response; ``to_words()`` gives the master.json
+    word dicts and ``build_segments()`` works on the same columns.
+    """
+
+    ids: list[int]
+    start: list[float]
+    end: list[float]
+    text: list[str]
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @classmethod
+    def from_words(cls, words: list[dict[str, Any]]) -> WordTimeline:
+        """Columns of LEAP word dicts (already in seconds); words with empty text are dropped."""
+        kept = [(w, text) for w in words if (text := (w.get("word") or "").strip())]
+        start = [float(w.get("start", 0.0)) for w, _ in kept]
+        end = [float(w.get("end", 0.0)) for w, _ in kept]
+        return cls(
+            ids=[w.get("id", idx) for idx, (w, _) in enumerate(kept)],
+            start=start,
+            end=[e if e > s else s + MIN_WORD_DURATION for s, e in zip(start, end, strict=True)],
+            text=[text for _, text in kept],
+        )
+
+    def to_words(self) -> list[dict[str, Any]]:
+        return [
+            {"id": word_id, "start": start, "end": end, "word": text}
+            for word_id, start, end, text in zip(self.ids, self.start, self.end, self.text, strict=True)
+        ]
+
+
+def word_timeline(raw_words: list[Any]) -> WordTimeline:
+    """Normalize AssemblyAI words into a ``WordTimeline`` (ms → s, end > start, sorted by start).
+
+    Ids are positions in the provider order (before sorting), as in ``extract_words``.
+    """
+    if np is None:
+        return WordTimeline.from_words(_extract_words_loop(raw_words))
+
+    texts: list[str] = []
+    starts_ms: list[float] = []
+    ends_ms: list[float] = []
+    for item in raw_words:
+        word_dict = item if type(item) is dict else _as_dict(item)
+        if word_dict is None:
+            continue
+        text = (word_dict.get("text") or word_dict.get("word") or "").strip()
+        if not text:
+            continue
+        start_ms = word_dict.get("start") or 0
+        end_ms = word_dict.get("end") or 0
+        texts.append(text)
+        starts_ms.append(start_ms if isinstance(start_ms, (int, float)) else 0)
+        ends_ms.append(end_ms if isinstance(end_ms, (int, float)) else 0)
+
+    start = np.asarray(starts_ms, dtype=np.float64) / 1000.0
+    end = np.asarray(ends_ms, dtype=np.float64) / 1000.0
+    end = np.where(end > start, end, start + MIN_WORD_DURATION)
+    # Stable, like list.sort: equal starts keep the provider order
+    order = np.argsort(start, kind="stable")
+    ids = order.tolist()
+    return WordTimeline(ids=ids, start=start[order].tolist(), end=end[order].tolist(), text=[texts[i] for i in ids])
+
 
 def extract_words(raw_words: list[Any]) -> list[dict[str, Any]]:
     """Normalize word list from AssemblyAI response to LEAP format.
@@ -11,15 +104,214 @@ def extract_words(raw_words: list[Any]) -> list[dict[str, Any]]:
     AssemblyAI words have start/end in milliseconds → convert to seconds.
     Output shape: [{id, start, end, word}]
     """
+    if np is None:
+        return _extract_words_loop(raw_words)
+    return word_timeline(raw_words).to_words()
+
+
+def _as_dict(item: Any) -> dict[str, Any] | None:
+    if isinstance(item, dict):
+        return item
+    if hasattr(item, "model_dump"):
+        return item.model_dump()
+    if hasattr(item, "to_dict"):
+        return item.to_dict()
+    return None
+
+
+# Heuristic segment builder (pause/punctuation/duration thresholds).
+# Primary path uses AssemblyAI /sentences endpoint; this is the fallback.
+def build_segments_from_words(
+    words: list[dict[str, Any]],
+    max_duration_seconds: float = 8.0,
+    pause_threshold_seconds: float = 0.4,
+) -> list[dict[str, Any]]:
+    """Build segments from word list using sentence boundaries, pauses, duration limits."""
+    if np is None:
+        return _build_segments_loop(words, max_duration_seconds, pause_threshold_seconds)
+    return build_segments(WordTimeline.from_words(words), max_duration_seconds, pause_threshold_seconds)
+
+
+def build_segments(
+    timeline: WordTimeline,
+    max_duration_seconds: float = 8.0,
+    pause_threshold_seconds: float = 0.4,
+) -> list[dict[str, Any]]:
+    """Segments of a ``WordTimeline``; same rules and output as ``build_segments_from_words``.
+
+    Breaks *before* a word on a pause (or comma + shorter pause) or when the group
+    would exceed ``max_duration_seconds`` — once the group has some length — and
+    *after* a sentence-ending word. Short segments are merged into the previous one.
+    Gaps, punctuation masks and the merge pass are array operations; only segment
+    starts are walked in Python.
+    """
+    if not len(timeline):
+        return []
+    if np is None:
+        return _build_segments_loop(timeline.to_words(), max_duration_seconds, pause_threshold_seconds)
+
+    start = np.asarray(timeline.start, dtype=np.float64)
+    end = np.asarray(timeline.end, dtype=np.float64)
+    text = np.asarray(timeline.text)
+
+    sentence_end = np.zeros(len(timeline), dtype=bool)
+    for ending in SENTENCE_ENDINGS:
+        sentence_end |= np.strings.endswith(text, ending)
+    comma_end = np.strings.endswith(text, COMMA_PUNCTUATION[0])
+
+    gap = np.zeros_like(start)
+    np.subtract(start[1:], end[:-1], out=gap[1:])
+    break_before = ((gap > pause_threshold_seconds) | (comma_end & (gap > PAUSE_FOR_COMMA))) & ~sentence_end
+
+    # Per word index: next sentence end at/after it, next pause/comma break after it,
+    # first word ending past the duration limit of a segment starting at it
+    # (running max of ends keeps searchsorted valid for unsorted ends)
+    positions = np.arange(len(timeline))
+    sentence_idx = np.append(np.flatnonzero(sentence_end), len(timeline))
+    break_idx = np.append(np.flatnonzero(break_before), len(timeline))
+    bounds = _segment_bounds(
+        timeline.start,
+        timeline.end,
+        sentence_idx[np.searchsorted(sentence_idx[:-1], positions)].tolist(),
+        break_idx[np.searchsorted(break_idx[:-1], positions, side="right")].tolist(),
+        np.searchsorted(np.maximum.accumulate(end), start + max_duration_seconds, side="right").tolist(),
+        max_duration_seconds,
+    )
+    firsts = np.fromiter((b[0] for b in bounds), dtype=np.intp, count=len(bounds))
+    stops = np.fromiter((b[1] for b in bounds), dtype=np.intp, count=len(bounds))
+
+    seg_start = start[firsts]
+    seg_end = end[stops - 1]
+    seg_end = np.where(seg_end <= seg_start, seg_start + MIN_WORD_DURATION, seg_end)
+    # A short segment joins the previous merged one; runs of short segments chain.
+    # Every word is at least one whitespace token, so only segments of < 3 words
+    # can be short; those few are recounted exactly (a "word" may contain spaces).
+    merge = (stops - firsts < SHORT_SEGMENT_WORDS) & (seg_end - seg_start < SHORT_SEGMENT_DURATION)
+    merge[0] = False
+    for k in np.flatnonzero(merge).tolist():
+        first, stop = bounds[k]
+        merge[k] = sum(len(word.split()) for word in timeline.text[first:stop]) < SHORT_SEGMENT_WORDS
+    leaders = np.flatnonzero(~merge)
+    lasts = np.append(leaders[1:] - 1, len(bounds) - 1)
+
+    return [
+        {"id": idx, "start": seg_first_start, "end": seg_last_end, "text": " ".join(timeline.text[first:stop])}
+        for idx, (first, stop, seg_first_start, seg_last_end) in enumerate(
+            zip(
+                firsts[leaders].tolist(),
+                stops[lasts].tolist(),
+                seg_start[leaders].tolist(),
+                seg_end[lasts].tolist(),
+                strict=True,
+            )
+        )
+    ]
+
+
+def _segment_bounds(
+    start: list[float],
+    end: list[float],
+    next_sentence: list[int],
+    next_break: list[int],
+    past_limit: list[int],
+    max_duration_seconds: float,
+) -> list[tuple[int, int]]:
+    """Word index ranges ``[first, stop)`` of segments.
+
+    Walks segment starts only; the lookups are precomputed per word. The inner
+    loops run only while the group is still too short to break (< 3 words and
+    < 0.7 s) or when word ends are out of order.
+    """
+    word_count = len(start)
+    bounds: list[tuple[int, int]] = []
+    first = 0
+    while first < word_count:
+        group_start = start[first]
+        # Breaks before a word may happen up to (not including) the sentence end
+        stop = next_sentence[first]
+
+        split = next_break[first]
+        while split < stop and not _enough_group(end, first, group_start, split):
+            split = next_break[split]
+
+        limit = group_start + max_duration_seconds
+        idx = max(past_limit[first], first + 1)
+        while idx < split and idx < stop and not (end[idx] > limit and _enough_group(end, first, group_start, idx)):
+            idx += 1
+        split = min(split, idx, stop)
+
+        if split < stop:
+            bounds.append((first, split))
+            first = split
+        else:
+            last = stop + 1 if stop < word_count else word_count
+            bounds.append((first, last))
+            first = last
+    return bounds
+
+
+def _enough_group(end: list[float], first: int, group_start: float, idx: int) -> bool:
+    """Whether the group ``[first, idx)`` is long enough (words or duration) to break before ``idx``."""
+    return idx - first >= MIN_WORDS_FOR_BREAK or end[idx - 1] - group_start >= MIN_GROUP_DURATION_FOR_PAUSE_BREAK
+
+
+def _merge_short_segments(segments: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Merge segments shorter than SHORT_SEGMENT_WORDS / SHORT_SEGMENT_DURATION into the previous one."""
+    merged: list[dict[str, Any]] = []
+    for seg in segments:
+        word_count = len(seg.get("text", "").split())
+        duration = seg.get("end", 0.0) - seg.get("start", 0.0)
+        if merged and word_count < SHORT_SEGMENT_WORDS and duration < SHORT_SEGMENT_DURATION:
+            prev = merged.pop()
+            merged.append(
+                {
+                    "id": prev["id"],
+                    "start": prev["start"],
+                    "end": seg["end"],
+                    "text": f"{prev['text']} {seg['text']}".strip(),
+                }
+            )
+        else:
+            merged.append(seg)
+
+    for idx, seg in enumerate(merged):
+        seg["id"] = idx
+
+    return merged
+
+
+def detect_long_pauses(segments: list[dict[str, Any]], min_gap_seconds: float) -> list[dict[str, Any]]:
+    """Gaps of at least ``min_gap_seconds`` between consecutive segments (sorted by start).
+
+    Returns [{"start", "end", "duration_minutes"}, ...].
+    """
+    if len(segments) < 2:
+        return []
+    if np is None:
+        return _detect_long_pauses_loop(segments, min_gap_seconds)
+
+    starts = [float(s.get("start", 0) or 0) for s in segments]
+    ends = [float(s.get("end", s.get("start", 0) or 0)) for s in segments]
+    order = np.argsort(np.asarray(starts, dtype=np.float64), kind="stable")
+    start = np.asarray(starts, dtype=np.float64)[order]
+    end = np.asarray(ends, dtype=np.float64)[order]
+    gap = start[1:] - end[:-1]
+    idx = np.flatnonzero(gap >= min_gap_seconds)
+    return [
+        {"start": pause_start, "end": pause_end, "duration_minutes": pause_gap / 60}
+        for pause_start, pause_end, pause_gap in zip(
+            end[idx].tolist(), start[idx + 1].tolist(), gap[idx].tolist(), strict=True
+        )
+    ]
+
+
+# Per-word loop implementations: used without NumPy, and as the reference in
+# tests and scripts/benchmark_transcript_normalize.py.
+def _extract_words_loop(raw_words: list[Any]) -> list[dict[str, Any]]:
     words: list[dict[str, Any]] = []
     for item in raw_words:
-        if isinstance(item, dict):
-            word_dict = item
-        elif hasattr(item, "model_dump"):
-            word_dict = item.model_dump()
-        elif hasattr(item, "to_dict"):
-            word_dict = item.to_dict()
-        else:
+        word_dict = _as_dict(item)
+        if word_dict is None:
             continue
 
         text = (word_dict.get("text") or word_dict.get("word") or "").strip()
@@ -33,7 +325,7 @@ def extract_words(raw_words: list[Any]) -> list[dict[str, Any]]:
         end_s = float(end_ms) / 1000.0 if isinstance(end_ms, (int, float)) else 0.0
 
         if end_s <= start_s:
-            end_s = start_s + 0.1
+            end_s = start_s + MIN_WORD_DURATION
 
         words.append({"id": len(words), "start": start_s, "end": end_s, "word": text})
 
@@ -41,123 +333,78 @@ def extract_words(raw_words: list[Any]) -> list[dict[str, Any]]:
     return words
 
 
-# Legacy: heuristic segment builder (pause/punctuation/duration thresholds).
-# Primary path uses AssemblyAI /sentences endpoint; this is the fallback.
-def build_segments_from_words(
+def _build_segments_loop(
     words: list[dict[str, Any]],
-    max_duration_seconds: float = 8.0,
-    pause_threshold_seconds: float = 0.4,
+    max_duration_seconds: float,
+    pause_threshold_seconds: float,
 ) -> list[dict[str, Any]]:
-    """Build segments from word list using sentence boundaries, pauses, duration limits."""
-    if not words:
-        return []
-
-    sentence_endings = (".", "!", "?", "…")
-    comma_punctuation = (",",)
-    pause_for_comma = 0.25
-    min_group_duration_for_pause_break = 0.7
-    min_words_for_break = 3
-    short_segment_duration = 1.2
-    short_segment_words = 3
-
     segments: list[dict[str, Any]] = []
     current_group: list[dict[str, Any]] = []
     current_start: float | None = None
-    segment_id = 0
-
-    def _finalize(group: list[dict[str, Any]], start: float) -> dict[str, Any] | None:
-        if not group or start is None:
-            return None
-        group_text = " ".join(w.get("word", "").strip() for w in group)
-        if not group_text.strip():
-            return None
-        group_end = float(group[-1].get("end", 0.0))
+
+    def _finalize(group: list[dict[str, Any]], start: float) -> None:
+        group_end = float(group[-1]["end"])
         if group_end <= start:
-            group_end = start + 0.1
-        return {"id": segment_id, "start": start, "end": group_end, "text": group_text.strip()}
+            group_end = start + MIN_WORD_DURATION
+        segments.append(
+            {"id": len(segments), "start": start, "end": group_end, "text": " ".join(w["word"] for w in group)}
+        )
 
     for word_item in words:
         word_start = float(word_item.get("start", 0.0))
         word_end = float(word_item.get("end", 0.0))
-        word_text = word_item.get("word", "").strip()
+        word_text = (word_item.get("word") or "").strip()
 
         if not word_text:
             continue
         if word_end <= word_start:
-            word_end = word_start + 0.1
+            word_end = word_start + MIN_WORD_DURATION
 
-        word_item = {**word_item, "start": word_start, "end": word_end}
+        word_item = {"start": word_start, "end": word_end, "word": word_text}
 
         if current_start is None:
             current_start = word_start
 
-        pause_duration = 0.0
-        if current_group:
-            pause_duration = word_start - float(current_group[-1].get("end", 0.0))
-
-        ends_with_sentence = word_text.endswith(sentence_endings)
-        ends_with_comma = word_text.endswith(comma_punctuation)
-        current_group_duration = (
-            (float(current_group[-1].get("end", 0.0)) - current_start)
-            if current_group and current_start is not None
-            else 0.0
-        )
+        pause_duration = word_start - current_group[-1]["end"] if current_group else 0.0
+        ends_with_sentence = word_text.endswith(SENTENCE_ENDINGS)
+        ends_with_comma = word_text.endswith(COMMA_PUNCTUATION)
+        current_group_duration = current_group[-1]["end"] - current_start if current_group else 0.0
         enough_group = (
-            current_group_duration >= min_group_duration_for_pause_break or len(current_group) >= min_words_for_break
+            current_group_duration >= MIN_GROUP_DURATION_FOR_PAUSE_BREAK or len(current_group) >= MIN_WORDS_FOR_BREAK
         )
 
         should_break_pause = pause_duration > pause_threshold_seconds and enough_group
-        should_break_comma = ends_with_comma and pause_duration > pause_for_comma and enough_group
-        group_duration_after = word_end - current_start
-        should_break_duration = group_duration_after > max_duration_seconds and enough_group
+        should_break_comma = ends_with_comma and pause_duration > PAUSE_FOR_COMMA and enough_group
+        should_break_duration = word_end - current_start > max_duration_seconds and enough_group
         should_break_before = (
             should_break_pause or should_break_comma or should_break_duration
         ) and not ends_with_sentence
 
-        if should_break_before and current_group and current_start is not None:
-            seg = _finalize(current_group, current_start)
-            if seg:
-                segments.append(seg)
-                segment_id += 1
+        if should_break_before and current_group:
+            _finalize(current_group, current_start)
             current_group = []
             current_start = word_start
 
         current_group.append(word_item)
 
-        if ends_with_sentence and current_group and current_start is not None:
-            seg = _finalize(current_group, current_start)
-            if seg:
-                segments.append(seg)
-                segment_id += 1
+        if ends_with_sentence:
+            _finalize(current_group, current_start)
             current_group = []
             current_start = None
 
     if current_group and current_start is not None:
-        seg = _finalize(current_group, current_start)
-        if seg:
-            segments.append(seg)
+        _finalize(current_group, current_start)
 
-    if not segments:
-        return segments
+    return _merge_short_segments(segments)
 
-    merged: list[dict[str, Any]] = []
-    for seg in segments:
-        word_count = len(seg.get("text", "").split())
-        duration = seg.get("end", 0.0) - seg.get("start", 0.0)
-        if merged and word_count < short_segment_words and duration < short_segment_duration:
-            prev = merged.pop()
-            merged.append(
-                {
-                    "id": prev["id"],
-                    "start": prev["start"],
-                    "end": seg["end"],
-                    "text": f"{prev['text']} {seg['text']}".strip(),
-                }
-            )
-        else:
-            merged.append(seg)
 
-    for idx, seg in enumerate(merged):
-        seg["id"] = idx
-
-    return merged
+def _detect_long_pauses_loop(segments: list[dict[str, Any]], min_gap_seconds: float) -> list[dict[str, Any]]:
+    pauses: list[dict[str, Any]] = []
+    sorted_segments = sorted(segments, key=lambda s: s.get("start", 0) or 0)
+    for current, nxt in pairwise(sorted_segments):
+        current_end = float(current.get("end", current.get("start", 0) or 0))
+        next_start = float(nxt.get("start", 0) or 0)
+        gap = next_start - current_end
+        if gap >= min_gap_seconds:
+            pauses.append({"start": current_end, "end": next_start, "duration_minutes": gap / 60})
+    return pauses
@@ -0,0 +1,257 @@
+"""Shared pooled httpx clients for outbound integrations.
+
+One ``httpx.AsyncClient`` per provider per event loop: requests to the same
+provider reuse keep-alive connections (and HTTP/2 when ``h2`` is installed)
+instead of paying a TCP + TLS handshake per call.
+
+Clients are bound to the loop that created them, so the registry is keyed by
+the running loop. Celery tasks run on the worker thread's persistent loop
+(``BaseTask.run_async``, ``utils.worker_loop``): clients and their keep-alive
+connections carry over from task to task and are closed when the worker shuts
+down. The API process has one loop and closes its clients on shutdown.
+
+Usage::
+
+    client = get_http_client("zoom")
+    response = await client.get(url, extensions=api_endpoint("recordings.list"))
+
+Do not close the returned client and do not use it as a context manager.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from api.observability import external_api_connections_total, external_api_retries_total, track_external_api
+from config.settings import get_settings
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+# Request extension carrying the stable `endpoint` label for metrics
+ENDPOINT_EXTENSION = "leap_endpoint"
+
+RETRYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRYABLE_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class ProviderProfile:
+    """Pool size and default timeout of one provider's client."""
+
+    timeout: httpx.Timeout
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    follow_redirects: bool = False
+
+
+PROVIDER_PROFILES: dict[str, ProviderProfile] = {
+    # Status lookups and chunk jobs run concurrently (get_statuses, chunked mode)
+    "assemblyai": ProviderProfile(
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        max_connections=32,
+        max_keepalive_connections=16,
+    ),
+    "zoom": ProviderProfile(timeout=httpx.Timeout(30.0, connect=10.0)),
+    # Upload/download links redirect to storage nodes
+    "yandex_disk": ProviderProfile(
+        timeout=httpx.Timeout(timeout=60.0, connect=15.0, read=30.0),
+        follow_redirects=True,
+    ),
+    "vk": ProviderProfile(timeout=httpx.Timeout(30.0, connect=10.0)),
+    # Chat completions (AsyncOpenAI sets the per-request timeout); batch extraction runs many at once
+    "deepseek": ProviderProfile(
+        timeout=httpx.Timeout(600.0, connect=10.0),
+        max_connections=32,
+        max_keepalive_connections=16,
+    ),
+}
+
+
+def api_endpoint(name: str) -> dict[str, Any]:
+    """Request ``extensions`` naming the operation for the latency metric."""
+    return {ENDPOINT_EXTENSION: name}
+
+
+class RetryBudget:
+    """Retries allowed as a fraction of the requests sent to a provider.
+
+    Every request deposits ``ratio`` tokens, every retry spends one. ``minimum``
+    tokens are available from the start (and cap the bucket), so a quiet
+    provider can still retry, while an outage cannot multiply its traffic.
+    Shared by all loops of the process: the budget outlives a Celery task.
+    """
+
+    def __init__(self, ratio: float, minimum: int):
+        self.ratio = ratio
+        self.capacity = float(max(minimum, 1))
+        self.tokens = float(minimum)
+
+    def deposit(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Wraps the pooled transport with metrics and budgeted retries.
+
+    Only idempotent methods are retried, so streamed request bodies (uploads)
+    are never replayed.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        transport: httpx.AsyncBaseTransport,
+        budget: RetryBudget,
+        max_retries: int,
+        backoff: float,
+    ):
+        self.provider = provider
+        self._transport = transport
+        self._budget = budget
+        self._max_retries = max_retries
+        self._backoff = backoff
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = request.extensions.get(ENDPOINT_EXTENSION) or request.method.lower()
+        retryable = request.method in RETRYABLE_METHODS
+        self._budget.deposit()
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(request, endpoint)
+            except RETRYABLE_ERRORS as exc:
+                if not self._may_retry(retryable, attempt):
+                    raise
+                reason = type(exc).__name__
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or not self._may_retry(retryable, attempt):
+                    return response
+                reason = f"HTTP {response.status_code}"
+                await response.aclose()
+
+            attempt += 1
+            logger.debug(
+                f"Retrying outbound request | {format_details(provider=self.provider, endpoint=endpoint, attempt=attempt, reason=reason)}"
+            )
+            await asyncio.sleep(self._backoff * 2 ** (attempt - 1))
+
+    async def _send(self, request: httpx.Request, endpoint: str) -> httpx.Response:
+        new_connection = False
+        user_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal new_connection
+            if event_name == "connection.connect_tcp.started":
+                new_connection = True
+            if user_trace is not None:
+                await user_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            with track_external_api(self.provider, endpoint):
+                response = await self._transport.handle_async_request(request)
+        finally:
+            if user_trace is None:
+                request.extensions.pop("trace", None)
+            else:
+                request.extensions["trace"] = user_trace
+
+        external_api_connections_total.labels(
+            provider=self.provider, connection="new" if new_connection else "reused"
+        ).inc()
+        return response
+
+    def _may_retry(self, retryable: bool, attempt: int) -> bool:
+        if not retryable or attempt >= self._max_retries:
+            return False
+        if not self._budget.try_spend():
+            external_api_retries_total.labels(provider=self.provider, outcome="budget_exhausted").inc()
+            return False
+        external_api_retries_total.labels(provider=self.provider, outcome="retried").inc()
+        return True
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# id(loop) -> (loop, {provider: client}); the loop is kept to detect id reuse
+_clients: dict[int, tuple[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]] = {}
+_budgets: dict[str, RetryBudget] = {}
+
+
+def _retry_budget(provider: str) -> RetryBudget:
+    budget = _budgets.get(provider)
+    if budget is None:
+        settings = get_settings().http_client
+        budget = _budgets[provider] = RetryBudget(settings.retry_budget_ratio, settings.retry_budget_min)
+    return budget
+
+
+def _build_client(provider: str) -> httpx.AsyncClient:
+    profile = PROVIDER_PROFILES.get(provider)
+    if profile is None:
+        raise ValueError(f"Unknown HTTP client provider: {provider}")
+
+    settings = get_settings().http_client
+    http2 = settings.http2 and H2_AVAILABLE
+    limits = httpx.Limits(
+        max_connections=profile.max_connections,
+        max_keepalive_connections=profile.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+    transport = PooledTransport(
+        provider,
+        httpx.AsyncHTTPTransport(http2=http2, limits=limits),
+        _retry_budget(provider),
+        max_retries=settings.max_retries,
+        backoff=settings.retry_backoff,
+    )
+    logger.debug(f"HTTP client created | {format_details(provider=provider, http2=http2)}")
+    return httpx.AsyncClient(transport=transport, timeout=profile.timeout, follow_redirects=profile.follow_redirects)
+
+
+def get_http_client(provider: str) -> httpx.AsyncClient:
+    """Pooled client for ``provider`` bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(id(loop))
+    if entry is None or entry[0] is not loop:
+        # Drop registries of finished loops (their clients cannot be awaited any more)
+        for key in [key for key, (other, _) in _clients.items() if other.is_closed()]:
+            del _clients[key]
+        entry = _clients[id(loop)] = (loop, {})
+
+    clients = entry[1]
+    client = clients.get(provider)
+    if client is None or client.is_closed:
+        client = clients[provider] = _build_client(provider)
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the clients of the running loop (worker loop or API shutdown)."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(id(loop))
+    if entry is None or entry[0] is not loop:
+        return
+    del _clients[id(loop)]
+
+    results = await asyncio.gather(*(client.aclose() for client in entry[1].values()), return_exceptions=True)
+    for provider, result in zip(entry[1], results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning(f"HTTP client close failed | {format_details(provider=provider, error=repr(result))}")
@@ -0,0 +1,78 @@
+"""Streaming request bodies for large uploads.
+
+Files are read with aiofiles in fixed-size chunks and handed to httpx as async
+iterables, so memory use is one buffer per upload whatever the file size.
+Pass the matching ``Content-Length`` header: httpx then sends a sized body
+instead of chunked transfer encoding (not every upload endpoint accepts it).
+"""
+
+from __future__ import annotations
+
+import secrets
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+import aiofiles
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# (bytes_sent, total_bytes)
+ProgressCallback = Callable[[int, int], None]
+
+
+async def iter_file_chunks(
+    path: Path,
+    *,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    on_progress: ProgressCallback | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield ``path`` in ``chunk_size`` blocks, reporting progress after each one."""
+    total = path.stat().st_size
+    sent = 0
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            sent += len(chunk)
+            yield chunk
+            if on_progress is not None:
+                on_progress(sent, total)
+
+
+def file_upload_headers(path: Path, content_type: str = "application/octet-stream") -> dict[str, str]:
+    """Headers for a raw streamed file body (see :func:`iter_file_chunks`)."""
+    return {"Content-Type": content_type, "Content-Length": str(path.stat().st_size)}
+
+
+def multipart_file_body(
+    field: str,
+    path: Path,
+    *,
+    filename: str | None = None,
+    content_type: str = "application/octet-stream",
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    on_progress: ProgressCallback | None = None,
+) -> tuple[dict[str, str], AsyncIterator[bytes]]:
+    """Single-file ``multipart/form-data`` body as ``(headers, stream)``.
+
+    Replaces ``files=`` for large uploads: httpx multipart reads the file
+    synchronously on the event loop, this reads it with aiofiles.
+    """
+    boundary = secrets.token_hex(16)
+    name = (filename or path.name).replace('"', "%22")
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{name}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+        "Content-Length": str(len(head) + path.stat().st_size + len(tail)),
+    }
+
+    async def stream() -> AsyncIterator[bytes]:
+        yield head
+        async for chunk in iter_file_chunks(path, chunk_size=chunk_size, on_progress=on_progress):
+            yield chunk
+        yield tail
+
+    return headers, stream()
@@ -0,0 +1,349 @@
+"""Worker-lifetime event loops for Celery tasks.
+
+Every worker thread (``--pool=threads``) or process (prefork) keeps one event
+loop for its whole life, plus one pooled async DB engine bound to that loop.
+``BaseTask.run_async`` runs coroutines on it, so asyncpg connections and the
+pooled HTTP clients of ``utils.http_clients`` are reused from task to task
+instead of being opened for every ``run_async`` call.
+
+By default the loop is per thread rather than one shared loop: task coroutines
+may still call blocking SDKs, which would stall every other task on a shared
+loop. I/O-bound queues opt into the shared mode instead (``api.celery_pool``):
+one loop in a background thread runs the coroutines of every in-flight task,
+with per-task soft/hard time limits and cancellation (``AsyncJob``). Celery's
+``Task.request`` is thread-local; coroutines on the shared loop see the request
+of the task awaiting them through ``current_task_request()``.
+
+Usage::
+
+    result = run_in_worker_loop(coro)            # sync task code
+    engine = worker_engine(create_pooled_engine)  # None on a foreign loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from celery._state import get_current_task
+from celery.exceptions import SoftTimeLimitExceeded, Terminated, TimeLimitExceeded
+
+from logger import format_details, get_logger
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+
+@dataclass
+class _WorkerLoop:
+    loop: asyncio.AbstractEventLoop
+    engine: AsyncEngine | None = None
+    thread: threading.Thread | None = None
+    # Ordered background thread for short blocking calls made on the shared loop
+    offload: concurrent.futures.ThreadPoolExecutor | None = None
+
+
+_local = threading.local()
+_lock = threading.Lock()
+# Every live worker loop of the process, closed on worker shutdown
+_states: list[_WorkerLoop] = []
+# Loop shared by all tasks of an AsyncIOPool worker (None in per-thread mode)
+_shared: _WorkerLoop | None = None
+# Celery request of the task awaiting the current coroutine (shared loop only)
+_task_request: contextvars.ContextVar[Any] = contextvars.ContextVar("task_request", default=None)
+
+
+class AsyncJob:
+    """Time limits and cancellation of one task running on the shared loop.
+
+    Deadlines are ``time.monotonic()`` values and span every ``run_in_worker_loop``
+    call of the task. Each limit fires once: cleanup coroutines run from
+    ``on_failure`` after the limit are not cut short again.
+    """
+
+    def __init__(self, soft_timeout: float | None = None, timeout: float | None = None) -> None:
+        now = time.monotonic()
+        self.soft_deadline = now + soft_timeout if soft_timeout else None
+        self.hard_deadline = now + timeout if timeout else None
+        self.soft_timeout = soft_timeout
+        self.timeout = timeout
+        self.soft_fired = False
+        self.hard_fired = False
+        self.cancelled = False
+        self._futures: set[concurrent.futures.Future] = set()
+        self._futures_lock = threading.Lock()
+
+    def attach(self, future: concurrent.futures.Future) -> None:
+        with self._futures_lock:
+            self._futures.add(future)
+
+    def detach(self, future: concurrent.futures.Future) -> None:
+        with self._futures_lock:
+            self._futures.discard(future)
+
+    def cancel(self) -> None:
+        """Cancel the coroutines the task is waiting on (revoke with terminate=True)."""
+        self.cancelled = True
+        with self._futures_lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def soft_limit(self) -> float | None:
+        """Soft deadline still to enforce, if any."""
+        return None if self.soft_fired else self.soft_deadline
+
+    def hard_limit(self) -> float | None:
+        """Hard deadline still to enforce, if any."""
+        return None if self.hard_fired else self.hard_deadline
+
+
+@contextmanager
+def bind_job(job: AsyncJob) -> Generator[AsyncJob, None, None]:
+    """Make ``job`` the limits of every ``run_in_worker_loop`` call in this thread."""
+    previous = getattr(_local, "job", None)
+    _local.job = job
+    try:
+        yield job
+    finally:
+        _local.job = previous
+
+
+def _current_state() -> _WorkerLoop:
+    """The shared loop if active, else this thread's worker loop (created on first use)."""
+    if _shared is not None:
+        return _shared
+    state: _WorkerLoop | None = getattr(_local, "state", None)
+    if state is None or state.loop.is_closed():
+        state = _WorkerLoop(asyncio.new_event_loop())
+        _local.state = state
+        with _lock:
+            _states.append(state)
+        logger.debug(f"Worker event loop started | {format_details(thread=threading.current_thread().name)}")
+    return state
+
+
+def shared_loop_active() -> bool:
+    """True inside an AsyncIOPool worker (all tasks share one loop)."""
+    return _shared is not None
+
+
+def current_task_request() -> Any:
+    """Celery request of the task whose coroutine is running on the shared loop, else None."""
+    return _task_request.get()
+
+
+def run_off_loop(fn: Callable[..., Any], *args: Any) -> None:
+    """Run a short blocking call (sync Redis) without stalling the shared loop.
+
+    On the shared loop thread the call is queued to one background thread, in
+    order and without waiting for it; failures are logged. Anywhere else it
+    runs inline.
+    """
+    shared = _shared
+    if shared is None or shared.offload is None or not _in_loop_thread(shared.loop):
+        fn(*args)
+        return
+    future = shared.offload.submit(contextvars.copy_context().run, fn, *args)
+    future.add_done_callback(_log_offload_error)
+
+
+def _log_offload_error(future: concurrent.futures.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"Offloaded call failed | {format_details(error=repr(future.exception()))}")
+
+
+def run_in_worker_loop(coro: Awaitable[T]) -> T:
+    """Run ``coro`` to completion on this thread's worker loop (or the shared loop)."""
+    shared = _shared
+    if shared is None:
+        loop = _current_state().loop
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    return _run_on_shared_loop(shared.loop, coro)
+
+
+def _run_on_shared_loop(loop: asyncio.AbstractEventLoop, coro: Awaitable[T]) -> T:
+    if loop.is_running() and _in_loop_thread(loop):
+        raise RuntimeError("run_in_worker_loop() called from a coroutine on the shared worker loop")
+
+    task = get_current_task()
+    if task is not None:
+        coro = _with_request(coro, task.request)
+
+    job: AsyncJob | None = getattr(_local, "job", None)
+    if job is None:
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    future = asyncio.run_coroutine_threadsafe(_limited(coro, job, loop), loop)
+    job.attach(future)
+    try:
+        hard = job.hard_limit()
+        done, _ = concurrent.futures.wait([future], timeout=None if hard is None else max(hard - time.monotonic(), 0))
+        if not done:
+            job.hard_fired = True
+            future.cancel()
+            raise TimeLimitExceeded(job.timeout)
+        return future.result()
+    except concurrent.futures.CancelledError:
+        if job.cancelled:
+            raise Terminated("Task cancelled on the shared worker loop") from None
+        raise
+    finally:
+        job.detach(future)
+
+
+async def _with_request(coro: Awaitable[T], request: Any) -> T:
+    """Await ``coro`` with the calling thread's task request visible on the loop."""
+    _task_request.set(request)
+    return await coro
+
+
+async def _limited(coro: Awaitable[T], job: AsyncJob, loop: asyncio.AbstractEventLoop) -> T:
+    """Await ``coro`` under the job's soft limit, raising ``SoftTimeLimitExceeded`` once it fires."""
+    deadline = job.soft_limit()
+    if deadline is None:
+        return await coro
+    timeout = asyncio.timeout_at(loop.time() + (deadline - time.monotonic()))
+    try:
+        async with timeout:
+            return await coro
+    except TimeoutError:
+        if not timeout.expired():
+            raise  # the coroutine's own timeout, not ours
+        job.soft_fired = True
+        raise SoftTimeLimitExceeded(job.soft_timeout) from None
+
+
+def _in_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def worker_engine(factory: Callable[[], AsyncEngine]) -> AsyncEngine | None:
+    """Pooled engine of this thread's worker loop, built by ``factory`` on first use.
+
+    Also valid from sync code that prepares a session maker before
+    ``run_in_worker_loop``. Returns None when another loop is running (e.g. a
+    nested ``asyncio.run``): pooled connections cannot cross loops.
+    """
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if _shared is not None:
+        state = _shared
+    else:
+        state = getattr(_local, "state", None) if running is not None else _current_state()
+    if state is None or (running is not None and running is not state.loop):
+        return None
+    with _lock:
+        if state.engine is None:
+            state.engine = factory()
+    return state.engine
+
+
+def start_worker_loop() -> None:
+    """Start the loop of a freshly forked worker process (``worker_process_init``).
+
+    Loops inherited from the parent are dropped without closing: their
+    selector and connections belong to the parent process.
+    """
+    with _lock:
+        _states.clear()
+    _local.state = None
+    _current_state()
+
+
+def start_shared_loop(blocking_threads: int) -> None:
+    """Run one loop for all tasks of this process in a background thread (AsyncIOPool).
+
+    ``blocking_threads`` sizes the loop's default executor, which carries the
+    blocking SDK calls offloaded with ``run_in_executor(None, ...)``; short
+    fire-and-forget calls (``run_off_loop``) get a dedicated ordered thread.
+    """
+    global _shared
+    if _shared is not None:
+        return
+
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=blocking_threads, thread_name_prefix="worker-loop-io")
+    )
+    ready = threading.Event()
+
+    def _run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    thread = threading.Thread(target=_run, name="worker-loop", daemon=True)
+    thread.start()
+    ready.wait()
+    offload = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="worker-loop-offload")
+    _shared = _WorkerLoop(loop, thread=thread, offload=offload)
+    logger.info(f"Shared worker event loop started | {format_details(blocking_threads=blocking_threads)}")
+
+
+def stop_shared_loop() -> None:
+    """Dispose pooled clients/engine of the shared loop, then stop and close it."""
+    global _shared
+    state, _shared = _shared, None
+    if state is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_dispose(state), state.loop).result(timeout=30)
+        asyncio.run_coroutine_threadsafe(state.loop.shutdown_default_executor(), state.loop).result(timeout=30)
+    except Exception as e:
+        logger.warning(f"Shared worker loop cleanup failed | {format_details(error=repr(e))}")
+    finally:
+        if state.offload is not None:
+            state.offload.shutdown(wait=True)
+        state.loop.call_soon_threadsafe(state.loop.stop)
+        if state.thread is not None:
+            state.thread.join(timeout=10)
+        if not state.loop.is_running():
+            state.loop.close()
+
+
+async def _dispose(state: _WorkerLoop) -> None:
+    from utils.http_clients import close_http_clients
+
+    await close_http_clients()
+    if state.engine is not None:
+        await state.engine.dispose()
+    await state.loop.shutdown_asyncgens()
+
+
+def shutdown_worker_loops() -> None:
+    """Close pooled clients, dispose engines and close every idle worker loop."""
+    stop_shared_loop()
+
+    with _lock:
+        states = list(_states)
+        _states.clear()
+
+    for state in states:
+        if state.loop.is_closed() or state.loop.is_running():
+            continue
+        try:
+            state.loop.run_until_complete(_dispose(state))
+        except Exception as e:
+            logger.warning(f"Worker loop cleanup failed | {format_details(error=repr(e))}")
+        finally:
+            state.loop.close()
+    _local.state = None
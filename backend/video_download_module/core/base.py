@@ -3,7 +3,8 @@
 Downloaders stream remote video into a **local temp file** and then commit it
 to the storage backend (S3 or LOCAL) via ``save_file``. Resume of partial
 downloads happens against the temp file — once committed, the file lives only
-in storage.
+in storage. Recording downloads use a persistent partial (``core.partial``)
+so a task retry or worker restart resumes instead of starting over.
 """
 
 import asyncio
@@ -16,8 +17,11 @@ import httpx
 
 from file_storage.factory import get_storage_backend
 from file_storage.path_builder import StoragePathBuilder, to_storage_key
+from file_storage.scratch import get_artifact_scratch
 from logger import get_logger
 
+from .partial import PartialDownload
+
 logger = get_logger()
 
 
@@ -78,6 +82,15 @@ class BaseDownloader(ABC):
         suf = source_suffix if source_suffix.startswith(".") else f".{source_suffix}"
         return self.storage.create_temp_file(prefix="dl_", suffix=suf)
 
+    def _open_partial(self, recording_id: int, source_suffix: str, source: str) -> PartialDownload:
+        """Lock the recording's persistent partial download; ``source`` identifies the remote file.
+
+        Callers ``discard()`` it after commit and ``close()`` it in ``finally``;
+        on failure the bytes stay for the next attempt.
+        """
+        suf = source_suffix if source_suffix.startswith(".") else f".{source_suffix}"
+        return PartialDownload.open(self.storage.partials_dir(), recording_id, suf, source)
+
     async def _commit_temp_to_storage(self, temp_path: Path, target_key: str) -> int:
         """Move the temp file into storage and return final size in bytes.
 
@@ -87,6 +100,10 @@ class BaseDownloader(ABC):
         """
         size = temp_path.stat().st_size
         storage = get_storage_backend()
+        # Node affinity: keep a local copy for trim/upload on this node (before LOCAL moves the temp)
+        scratch = get_artifact_scratch()
+        if scratch is not None:
+            scratch.keep(target_key, temp_path)
         await storage.save_file(target_key, temp_path)
         # ``save_file`` consumes the temp file on the LOCAL backend (shutil.move);
         # on S3 the file is uploaded but the local copy remains. Ensure cleanup.
@@ -105,12 +122,15 @@ class BaseDownloader(ABC):
         max_retries: int = 10,
         description: str = "file",
         source_name: str | None = None,
+        partial: PartialDownload | None = None,
     ) -> bool:
         """Stream a remote URL into ``filepath`` with resume support.
 
         ``filepath`` should be a **local temp file**; caller is responsible for
         committing successfully-downloaded contents to storage via
         :meth:`_commit_temp_to_storage` and for deleting the temp on failure.
+        With ``partial`` (``filepath`` is ``partial.path``) progress is
+        checkpointed and resumes are conditional on the source's validator.
         """
         headers = dict(headers) if headers else {}
         params = dict(params) if params else {}
@@ -128,7 +148,9 @@ class BaseDownloader(ABC):
 
                 req_headers = dict(headers)
                 if downloaded > 0:
-                    req_headers["Range"] = f"bytes={downloaded}-"
+                    req_headers.update(
+                        partial.range_headers(downloaded) if partial else {"Range": f"bytes={downloaded}-"}
+                    )
 
                 async with httpx.AsyncClient(
                     timeout=httpx.Timeout(timeout=180.0, connect=30.0, read=60.0, write=30.0),
@@ -150,6 +172,10 @@ class BaseDownloader(ABC):
                             response.raise_for_status()
                             mode = "wb"
 
+                        if partial:
+                            partial.remember(response.headers)
+                            if mode == "wb":
+                                partial.restart()
                         filepath.parent.mkdir(parents=True, exist_ok=True)
 
                         content_range = response.headers.get("content-range")
@@ -164,9 +190,15 @@ class BaseDownloader(ABC):
                             total_size = expected_size
 
                         with filepath.open(mode) as f:
-                            async for chunk in response.aiter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
+                            try:
+                                async for chunk in response.aiter_bytes(chunk_size=8192):
+                                    f.write(chunk)
+                                    downloaded += len(chunk)
+                                    if partial:
+                                        partial.write_through(f)
+                            finally:
+                                if partial:
+                                    partial.checkpoint(f)
 
                         logger.info(f"Downloaded {downloaded / (1024 * 1024):.1f} MB")
 
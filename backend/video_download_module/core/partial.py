@@ -0,0 +1,182 @@
+"""Persistent partial downloads, resumable across task retries and worker restarts.
+
+A download streams into ``temp/partials/rec_<recording_id><suffix>`` next to a
+``.json`` sidecar holding the source identity, the server's validator (ETag or
+Last-Modified) and the number of bytes known to be durable on disk. A retried
+or redelivered download task finds the pair, drops any unsynced tail and
+continues with ``Range`` + ``If-Range``: a source that changed in between
+answers 200 and the download restarts from zero.
+
+While a download runs it holds an exclusive ``flock`` on ``<partial>.lock``, so
+the temp sweep (``sweep_stale_partials``) never deletes an active partial; idle
+ones waiting for a retry are kept for ``STORAGE_DOWNLOAD_PARTIAL_TTL_HOURS``.
+Partials are node-local: with node affinity a retry is routed back to the node
+holding the partial, otherwise a retry on another node starts over.
+"""
+
+import fcntl
+import json
+import os
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import BinaryIO
+
+from logger import format_details, get_logger
+
+logger = get_logger()
+
+CHECKPOINT_BYTES = 64 * 1024 * 1024
+_SIDECAR_SUFFIXES = (".json.tmp", ".json", ".lock")
+
+
+class PartialDownloadBusyError(RuntimeError):
+    """Another process on this node is downloading the same recording."""
+
+
+class PartialDownload:
+    """A recording's partial download: data file + sidecar state + lock."""
+
+    def __init__(self, path: Path, source: str):
+        self.path = path
+        self.state_path = path.with_name(f"{path.name}.json")
+        self.lock_path = path.with_name(f"{path.name}.lock")
+        self.source = source
+        self.validator: str | None = None
+        self.synced = 0
+        self._lock_fd: int | None = None
+
+    @classmethod
+    def open(cls, directory: Path, recording_id: int, suffix: str, source: str) -> "PartialDownload":
+        """Lock and load the recording's partial; an unusable one is discarded."""
+        directory.mkdir(parents=True, exist_ok=True)
+        partial = cls(directory / f"rec_{recording_id}{suffix}", source)
+        partial._lock()
+        partial._load()
+        return partial
+
+    def _lock(self) -> None:
+        fd = _try_lock(self.lock_path)
+        if fd is None:
+            raise PartialDownloadBusyError(f"Download already in progress: {self.path.name}")
+        self._lock_fd = fd
+
+    def _load(self) -> None:
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            state = None
+        size = self.path.stat().st_size if self.path.exists() else 0
+        synced = int(state.get("bytes", 0)) if state else 0
+
+        if not state or state.get("source") != self.source or size < synced:
+            if size or state:
+                logger.info(f"Discarding partial download | {format_details(file=self.path.name, size=size)}")
+            self.path.unlink(missing_ok=True)
+            self.state_path.unlink(missing_ok=True)
+            return
+
+        if size > synced:
+            # Written but never fsync'ed: not trusted after a crash
+            with self.path.open("r+b") as f:
+                f.truncate(synced)
+        self.validator = state.get("validator")
+        self.synced = synced
+        if synced:
+            logger.info(
+                f"Resuming partial download | {format_details(file=self.path.name, mb=round(synced / 1024**2, 1))}"
+            )
+
+    @property
+    def offset(self) -> int:
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def range_headers(self, offset: int) -> dict[str, str]:
+        """``Range`` from ``offset``, conditional on the stored validator."""
+        headers = {"Range": f"bytes={offset}-"}
+        if self.validator:
+            headers["If-Range"] = self.validator
+        return headers
+
+    def remember(self, headers: Mapping[str, str]) -> None:
+        """Keep the response's validator; ``If-Range`` only accepts a strong ETag or a date."""
+        etag = headers.get("etag")
+        self.validator = etag if etag and not etag.startswith("W/") else headers.get("last-modified")
+
+    def restart(self) -> None:
+        """The response starts from byte 0 (source changed or Range unsupported)."""
+        self.synced = 0
+
+    def write_through(self, f: BinaryIO) -> None:
+        """Checkpoint once ``CHECKPOINT_BYTES`` were written since the last one."""
+        if f.tell() - self.synced >= CHECKPOINT_BYTES:
+            self.checkpoint(f)
+
+    def checkpoint(self, f: BinaryIO) -> None:
+        """Make the bytes written so far durable and record them in the sidecar."""
+        f.flush()
+        os.fsync(f.fileno())
+        self.synced = f.tell()
+        state = {"source": self.source, "validator": self.validator, "bytes": self.synced, "updated_at": time.time()}
+        tmp = self.state_path.with_name(f"{self.state_path.name}.tmp")
+        tmp.write_text(json.dumps(state))
+        tmp.replace(self.state_path)
+
+    def discard(self) -> None:
+        """Drop the partial (after commit to storage)."""
+        self.path.unlink(missing_ok=True)
+        self.state_path.unlink(missing_ok=True)
+        self.synced = 0
+
+    def close(self) -> None:
+        """Release the lock; the partial (if any) stays for the next attempt."""
+        if self._lock_fd is None:
+            return
+        if not self.path.exists():
+            self.lock_path.unlink(missing_ok=True)
+        os.close(self._lock_fd)
+        self._lock_fd = None
+
+
+def _partial_name(name: str) -> str:
+    for suffix in _SIDECAR_SUFFIXES:
+        if name.endswith(suffix):
+            return name.removesuffix(suffix)
+    return name
+
+
+def _try_lock(lock_path: Path) -> int | None:
+    """Take the partial's lock without waiting. None while a download holds it."""
+    fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def sweep_stale_partials(directory: Path, max_age_seconds: float) -> int:
+    """Delete idle partials untouched for ``max_age_seconds``. Locked (active) ones are kept."""
+    if not directory.exists():
+        return 0
+    groups: dict[str, list[Path]] = {}
+    for child in directory.iterdir():
+        if child.is_file():
+            groups.setdefault(_partial_name(child.name), []).append(child)
+
+    cutoff = time.time() - max_age_seconds
+    deleted = 0
+    for name, files in groups.items():
+        if max(f.stat().st_mtime for f in files) >= cutoff:
+            continue
+        fd = _try_lock(directory / f"{name}.lock")
+        if fd is None:
+            continue
+        try:
+            for suffix in ("", ".json", ".json.tmp", ".lock"):
+                (directory / f"{name}{suffix}").unlink(missing_ok=True)
+        finally:
+            os.close(fd)
+        deleted += 1
+    return deleted
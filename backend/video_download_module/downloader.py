@@ -88,27 +88,28 @@ class ZoomDownloader(BaseDownloader):
             download_access_token=source_meta.get("download_access_token"),
         )
 
-        temp_path = self._new_temp_path(source_suffix)
+        # Persistent partial: a task retry or worker restart resumes from the bytes already on disk
+        partial = self._open_partial(recording_id, source_suffix, source=download_url)
         try:
             success = await self._download_url(
                 url=encoded_url,
-                filepath=temp_path,
+                filepath=partial.path,
                 headers=headers,
                 params=params,
                 expected_size=source_meta.get("file_size", 0) or None,
                 description="Zoom recording",
                 source_name=validate_name,
+                partial=partial,
             )
 
             if not success:
                 raise RuntimeError(f"Failed to download Zoom recording {recording_id}")
 
-            size = await self._commit_temp_to_storage(temp_path, target_key)
+            size = await self._commit_temp_to_storage(partial.path, target_key)
+            partial.discard()
             return DownloadResult(storage_key=target_key, file_size=size)
         finally:
-            # Safety: if commit threw, the temp may still be around.
-            if temp_path.exists():
-                temp_path.unlink(missing_ok=True)
+            partial.close()
 
     async def download_recording(
         self,
@@ -163,16 +164,17 @@ class ZoomDownloader(BaseDownloader):
             download_access_token=recording.download_access_token,
         )
 
-        temp_path = self._new_temp_path(source_suffix)
+        partial = self._open_partial(recording.db_id, source_suffix, source=recording.video_file_download_url)
         try:
             success = await self._download_url(
                 url=encoded_url,
-                filepath=temp_path,
+                filepath=partial.path,
                 headers=headers,
                 params=params,
                 expected_size=recording.video_file_size or None,
                 description="video file",
                 source_name=validate_as_name,
+                partial=partial,
             )
 
             if not success:
@@ -184,12 +186,12 @@ class ZoomDownloader(BaseDownloader):
                 logger.error(f"Download failed for recording {recording.db_id}")
                 return False
 
-            await self._commit_temp_to_storage(temp_path, target_key)
+            await self._commit_temp_to_storage(partial.path, target_key)
+            partial.discard()
             recording.local_video_path = target_key
             recording.update_status(ProcessingStatus.DOWNLOADED)
             recording.downloaded_at = datetime.now(UTC)
             logger.info(f"Downloaded | rec={recording.db_id}")
             return True
         finally:
-            if temp_path.exists():
-                temp_path.unlink(missing_ok=True)
+            partial.close()
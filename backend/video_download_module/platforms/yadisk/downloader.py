@@ -11,6 +11,7 @@ import httpx
 from file_storage.path_builder import StoragePathBuilder
 from logger import get_logger
 from video_download_module.core.base import BaseDownloader, DownloadResult
+from video_download_module.core.partial import PartialDownload
 
 logger = get_logger()
 
@@ -222,6 +223,12 @@ async def _yandex_web_public_download_url(
     return str(url) if url else None
 
 
+def _yandex_partial_source(source_meta: dict[str, Any]) -> str:
+    """Stable identity of a Yandex Disk file for partial downloads."""
+    keys = ("public_key", "path", "resource_id", "md5", "size")
+    return "yadisk:" + "|".join(str(source_meta.get(key) or "") for key in keys)
+
+
 class YandexDiskDownloader(BaseDownloader):
     """Downloads video files from Yandex Disk via REST API."""
 
@@ -244,20 +251,44 @@ class YandexDiskDownloader(BaseDownloader):
         expected_size: int | None,
         description: str,
         source_name: str | None = None,
+        partial: PartialDownload | None = None,
     ) -> bool:
-        """Stream one URL to disk using an existing client (keeps cookie jar)."""
+        """Stream one URL to disk using an existing client (keeps cookie jar).
+
+        With ``partial`` the stream resumes after the bytes already on disk.
+        """
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
-            async with client.stream("GET", url, headers=dict(headers)) as response:
+            downloaded = partial.offset if partial else 0
+            req_headers = dict(headers)
+            if partial and downloaded > 0:
+                req_headers.update(partial.range_headers(downloaded))
+            async with client.stream("GET", url, headers=req_headers) as response:
                 response.raise_for_status()
                 total_size = int(response.headers.get("content-length", 0))
+                mode = "wb"
+                if downloaded > 0 and response.status_code == 206:
+                    mode = "ab"
+                    cr = response.headers.get("content-range")
+                    total_size = int(cr.split("/")[-1]) if cr and "/" in cr else total_size + downloaded
+                else:
+                    downloaded = 0
                 if total_size == 0 and expected_size:
                     total_size = expected_size
-                downloaded = 0
-                with filepath.open("wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
+                if partial:
+                    partial.remember(response.headers)
+                    if mode == "wb":
+                        partial.restart()
+                with filepath.open(mode) as f:
+                    try:
+                        async for chunk in response.aiter_bytes(chunk_size=8192):
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if partial:
+                                partial.write_through(f)
+                    finally:
+                        if partial:
+                            partial.checkpoint(f)
             ref_size = total_size if total_size else expected_size
             if not self._validate_file(filepath, expected_size, ref_size, source_name=source_name):
                 if filepath.exists():
@@ -272,7 +303,8 @@ class YandexDiskDownloader(BaseDownloader):
             return False
         except Exception as e:
             logger.warning(f"Yandex stream | {description} | {e!s}")
-            if filepath.exists():
+            # A dropped connection leaves valid bytes: keep them for the next resume
+            if filepath.exists() and not (partial and isinstance(e, httpx.TransportError)):
                 filepath.unlink()
             return False
 
@@ -284,6 +316,7 @@ class YandexDiskDownloader(BaseDownloader):
         target_path: Path,
         expected_size: int | None,
         description: str,
+        partial: PartialDownload | None = None,
     ) -> bool:
         """One ``AsyncClient``: GET share page → POST download-url → GET file (cookie jar preserved)."""
         page_headers = {
@@ -340,6 +373,7 @@ class YandexDiskDownloader(BaseDownloader):
                         expected_size,
                         description,
                         source_name=source_meta.get("name"),
+                        partial=partial,
                     ):
                         return True
         return False
@@ -352,12 +386,14 @@ class YandexDiskDownloader(BaseDownloader):
         expected_size: int | None,
         description: str,
         source_name: str | None = None,
+        partial: PartialDownload | None = None,
     ) -> bool:
         """GET ``href`` from ``/resources/download`` with OAuth on Yandex hosts, without OAuth on storage CDN.
 
         ``httpx`` (like curl) does not forward ``Authorization`` to another host after a redirect; the
         first hop (``downloader.*.yandex.ru`` / similar) requires ``OAuth``, the final
-        ``*.storage.yandex.net`` URL is signed and must be fetched without it.
+        ``*.storage.yandex.net`` URL is signed and must be fetched without it. With ``partial``
+        progress is checkpointed and the resume is conditional on the file's validator.
         """
         timeout = httpx.Timeout(180.0, connect=30.0, read=120.0)
         limits = httpx.Limits(max_keepalive_connections=5, max_connections=10)
@@ -373,7 +409,7 @@ class YandexDiskDownloader(BaseDownloader):
                     if oauth_token and _yandex_disk_href_host_needs_oauth(host):
                         hdrs["Authorization"] = f"OAuth {oauth_token}"
                     if downloaded > 0:
-                        hdrs["Range"] = f"bytes={downloaded}-"
+                        hdrs.update(partial.range_headers(downloaded) if partial else {"Range": f"bytes={downloaded}-"})
 
                     async with client.stream("GET", current_url, headers=hdrs) as response:
                         if response.status_code in (301, 302, 303, 307, 308):
@@ -427,11 +463,21 @@ class YandexDiskDownloader(BaseDownloader):
                         if mode == "wb" and target_path.exists():
                             target_path.unlink()
                         write_base = downloaded if mode == "ab" else 0
+                        if partial:
+                            partial.remember(response.headers)
+                            if mode == "wb":
+                                partial.restart()
 
                         with target_path.open(mode) as f:
-                            async for chunk in response.aiter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                write_base += len(chunk)
+                            try:
+                                async for chunk in response.aiter_bytes(chunk_size=8192):
+                                    f.write(chunk)
+                                    write_base += len(chunk)
+                                    if partial:
+                                        partial.write_through(f)
+                            finally:
+                                if partial:
+                                    partial.checkpoint(f)
 
                         ref = total_size if total_size else expected_size
                         if not self._validate_file(target_path, expected_size, ref, source_name=source_name):
@@ -450,7 +496,8 @@ class YandexDiskDownloader(BaseDownloader):
             return False
         except Exception as e:
             logger.warning("Yandex API download | %s | %s", description, e)
-            if target_path.exists():
+            # A dropped connection leaves valid bytes: keep them for the next resume
+            if target_path.exists() and not (partial and isinstance(e, httpx.TransportError)):
                 target_path.unlink()
             return False
 
@@ -486,10 +533,6 @@ class YandexDiskDownloader(BaseDownloader):
             if existing_size > 1024:
                 return DownloadResult(storage_key=target_key, file_size=existing_size)
 
-        # Stream into a local temp file; the internal Yandex helpers below all write to this Path
-        # (with their own resume / fallback logic). On success we move it into storage.
-        target_path = self._new_temp_path(source_suffix)
-
         download_method = source_meta.get("download_method", "api")
         oauth_token = self.oauth_token or source_meta.get("oauth_token")
 
@@ -514,6 +557,38 @@ class YandexDiskDownloader(BaseDownloader):
 
         logger.info(f"Downloading from Yandex Disk: {source_meta.get('name', file_path)}")
 
+        # Stream into a persistent partial keyed by the resource (download hrefs are short-lived),
+        # so a task retry or worker restart resumes from the bytes already on disk.
+        partial = self._open_partial(recording_id, source_suffix, source=_yandex_partial_source(source_meta))
+        try:
+            success = await self._download_to_partial(partial, source_meta, download_url, download_method, oauth_token)
+            if not success:
+                raise RuntimeError(f"Failed to download from Yandex Disk: {source_meta.get('name', file_path)}")
+
+            size = await self._commit_temp_to_storage(partial.path, target_key)
+            partial.discard()
+            return DownloadResult(
+                storage_key=target_key,
+                file_size=size,
+                metadata={
+                    "name": source_meta.get("name"),
+                    "path": file_path,
+                    "download_method": download_method,
+                },
+            )
+        finally:
+            partial.close()
+
+    async def _download_to_partial(
+        self,
+        partial: PartialDownload,
+        source_meta: dict[str, Any],
+        download_url: str,
+        download_method: str,
+        oauth_token: str | None,
+    ) -> bool:
+        """Try the download strategies for this source into ``partial.path``."""
+        target_path = partial.path
         desc = f"Yandex Disk file: {source_meta.get('name', 'unknown')}"
         pk_url = (source_meta.get("public_key") or "").strip()
         success = False
@@ -525,6 +600,7 @@ class YandexDiskDownloader(BaseDownloader):
                 target_path,
                 source_meta.get("size"),
                 desc,
+                partial=partial,
             )
 
         if not success and download_method == "public":
@@ -573,6 +649,7 @@ class YandexDiskDownloader(BaseDownloader):
                             expected_size=source_meta.get("size"),
                             description=desc,
                             source_name=source_meta.get("name"),
+                            partial=partial,
                         )
                         if success:
                             break
@@ -592,6 +669,7 @@ class YandexDiskDownloader(BaseDownloader):
                         expected_size=source_meta.get("size"),
                         description=desc,
                         source_name=source_meta.get("name"),
+                        partial=partial,
                     )
                     if success:
                         break
@@ -608,24 +686,6 @@ class YandexDiskDownloader(BaseDownloader):
                     source_meta.get("size"),
                     desc,
                     source_name=source_meta.get("name"),
+                    partial=partial,
                 )
-
-        try:
-            if not success:
-                raise RuntimeError(f"Failed to download from Yandex Disk: {source_meta.get('name', file_path)}")
-
-            size = await self._commit_temp_to_storage(target_path, target_key)
-            return DownloadResult(
-                storage_key=target_key,
-                file_size=size,
-                metadata={
-                    "name": source_meta.get("name"),
-                    "path": file_path,
-                    "download_method": download_method,
-                },
-            )
-        finally:
-            # Belt-and-suspenders: the commit consumes the temp; this clears partial files
-            # left by the failure path.
-            if target_path.exists():
-                target_path.unlink(missing_ok=True)
+        return success
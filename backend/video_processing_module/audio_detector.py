@@ -62,6 +62,34 @@ class AudioDetector:
             logger.error(f"Error detecting audio boundaries: {e}")
             return None, None
 
+    async def detect_silence_periods(self, audio_path: str) -> list[tuple[float, float]]:
+        """All (start, end) silence periods in the file; empty list if ffmpeg fails."""
+        cmd = [
+            "ffmpeg",
+            "-threads",
+            "1",
+            "-i",
+            audio_path,
+            "-af",
+            f"silencedetect=noise={self.silence_threshold}dB:d={self.min_silence_duration}",
+            "-f",
+            "null",
+            "-",
+        ]
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            _stdout, stderr = await process.communicate()
+        except Exception as e:
+            logger.error(f"Error detecting silence: {e}")
+            return []
+
+        if process.returncode != 0:
+            logger.error(f"FFmpeg silence detection failed: {stderr.decode()}")
+            return []
+        return self._parse_silence_detection(stderr.decode())
+
     def _parse_silence_detection(self, ffmpeg_output: str) -> list[tuple[float, float]]:
         """Parse ffmpeg output to extract silence periods."""
         silence_periods = []
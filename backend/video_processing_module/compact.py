@@ -0,0 +1,120 @@
+"""Compact mode: cut long internal silences and map compacted time back to the video.
+
+Only the kept ranges (source-video seconds) are stored; compacted time runs
+through them back to back, so any timestamp produced on the compacted media
+(ASR words, segments, topics) can be projected onto the source timeline.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any
+
+
+def plan_keep_ranges(
+    silence_periods: list[tuple[float, float]],
+    start: float,
+    end: float,
+    *,
+    min_gap_seconds: float,
+    padding_seconds: float,
+) -> list[tuple[float, float]]:
+    """Ranges of ``[start, end]`` to keep when silences of ``min_gap_seconds`` or longer are cut.
+
+    ``padding_seconds`` of each cut silence is kept on both sides so speech is not
+    clipped. Returns ``[]`` when nothing qualifies (no compaction needed).
+    """
+    keep: list[tuple[float, float]] = []
+    cursor = start
+    for silence_start, silence_end in sorted(silence_periods):
+        # Only internal breaks: leading/trailing silence is the trim window's job
+        if silence_start <= start or silence_end >= end or silence_end - silence_start < min_gap_seconds:
+            continue
+        cut_start = silence_start + padding_seconds
+        cut_end = silence_end - padding_seconds
+        if cut_end <= cut_start or cut_start <= cursor:
+            continue
+        keep.append((cursor, cut_start))
+        cursor = cut_end
+    if not keep:
+        return []
+    keep.append((cursor, end))
+    return keep
+
+
+@dataclass(frozen=True)
+class OffsetMap:
+    """Kept source ranges in order; ``video_offset`` is where the processed video starts in source time.
+
+    ``video_compacted`` tells whether the processed video was cut the same way as
+    the audio; if so its timeline already equals compacted time.
+    """
+
+    ranges: tuple[tuple[float, float], ...]
+    video_offset: float = 0.0
+    video_compacted: bool = False
+    # Start of every range in compacted time
+    _compact_starts: list[float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        lengths = [end - start for start, end in self.ranges]
+        object.__setattr__(self, "_compact_starts", [0.0, *accumulate(lengths)][:-1] if lengths else [])
+
+    @property
+    def compact_duration(self) -> float:
+        return sum(end - start for start, end in self.ranges)
+
+    @property
+    def removed_seconds(self) -> float:
+        if not self.ranges:
+            return 0.0
+        return (self.ranges[-1][1] - self.ranges[0][0]) - self.compact_duration
+
+    def to_source(self, t: float, *, is_end: bool = False) -> float:
+        """Source time of compacted time ``t``.
+
+        At a cut boundary a start maps to the next range and an end (``is_end``)
+        to the previous one, so nothing spans a removed silence by accident.
+        Times past the end extrapolate from the last range.
+        """
+        if not self.ranges:
+            return t
+        starts = self._compact_starts
+        idx = (bisect_left(starts, t) if is_end else bisect_right(starts, t)) - 1
+        idx = min(max(idx, 0), len(self.ranges) - 1)
+        return self.ranges[idx][0] + (t - starts[idx])
+
+    def to_video(self, t: float, *, is_end: bool = False) -> float:
+        """Processed-video time of compacted time ``t``."""
+        if self.video_compacted:
+            return t
+        return self.to_source(t, is_end=is_end) - self.video_offset
+
+    def project(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Copies of words/segments with ``start``/``end`` moved to processed-video time."""
+        return [
+            {
+                **item,
+                "start": round(self.to_video(float(item.get("start", 0.0))), 3),
+                "end": round(self.to_video(float(item.get("end", 0.0)), is_end=True), 3),
+            }
+            for item in items
+        ]
+
+    def to_meta(self) -> dict[str, Any]:
+        return {
+            "ranges": [[start, end] for start, end in self.ranges],
+            "video_offset": self.video_offset,
+            "video_compacted": self.video_compacted,
+            "removed_seconds": round(self.removed_seconds, 3),
+        }
+
+    @classmethod
+    def from_meta(cls, meta: dict[str, Any]) -> OffsetMap:
+        return cls(
+            ranges=tuple((float(start), float(end)) for start, end in meta.get("ranges") or []),
+            video_offset=float(meta.get("video_offset") or 0.0),
+            video_compacted=bool(meta.get("video_compacted")),
+        )
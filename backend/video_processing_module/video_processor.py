@@ -58,6 +58,15 @@ def output_suffix_for_trim(video_codec: str | None, audio_codec: str | None) ->
     return ".mkv"
 
 
+def concat_list(input_path: str, ranges: list[tuple[float, float]]) -> str:
+    """ffconcat script that plays ``ranges`` of one input back to back."""
+    quoted = "'" + str(input_path).replace("'", "'\\''") + "'"
+    lines = ["ffconcat version 1.0"]
+    for start, end in ranges:
+        lines.extend([f"file {quoted}", f"inpoint {start:.3f}", f"outpoint {end:.3f}"])
+    return "\n".join(lines) + "\n"
+
+
 class VideoProcessor:
     """Video processor for trimming, audio extraction and segmentation."""
 
@@ -246,26 +255,95 @@ class VideoProcessor:
             str(duration),
         ]
 
+        cmd.extend(self._output_args(has_video=has_video, has_audio=has_audio))
+        cmd.extend(["-y", output_path])
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            _stdout, stderr = await process.communicate()
+
+            if process.returncode != 0:
+                logger.error(f"FFmpeg trimming failed: {_format_ffmpeg_stderr(stderr)}")
+                return False
+
+            if Path(output_path).exists():
+                return True
+
+            logger.error(f"Trimmed video not created: {output_path}")
+            return False
+
+        except Exception as e:
+            logger.error(f"Video trimming error: {e}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            return False
+
+    def _output_args(self, *, has_video: bool, has_audio: bool) -> list[str]:
+        """Stream mapping and codec arguments for trimmed/compacted video output."""
+        args: list[str] = []
         if has_video:
-            cmd.extend(["-map", "0:v:0"])
+            args.extend(["-map", "0:v:0"])
         if has_audio:
-            cmd.extend(["-map", "0:a:0"])
+            args.extend(["-map", "0:a:0"])
 
         if has_video:
-            cmd.extend(["-c:v", self.config.video_codec])
+            args.extend(["-c:v", self.config.video_codec])
         if has_audio:
-            cmd.extend(["-c:a", self.config.audio_codec])
+            args.extend(["-c:a", self.config.audio_codec])
 
         if self.config.video_bitrate != "original":
-            cmd.extend(["-b:v", self.config.video_bitrate])
+            args.extend(["-b:v", self.config.video_bitrate])
         if self.config.audio_bitrate != "original":
-            cmd.extend(["-b:a", self.config.audio_bitrate])
+            args.extend(["-b:a", self.config.audio_bitrate])
         if self.config.video_codec != "copy" and self.config.fps > 0:
-            cmd.extend(["-r", str(self.config.fps)])
+            args.extend(["-r", str(self.config.fps)])
         if self.config.resolution != "original":
-            cmd.extend(["-s", self.config.resolution])
+            args.extend(["-s", self.config.resolution])
+        return args
 
-        cmd.extend(["-y", output_path])
+    async def keep_ranges(
+        self, input_path: str, output_path: str, ranges: list[tuple[float, float]], *, stream_copy: bool = False
+    ) -> bool:
+        """Join the given time ranges of the input into one file (compact mode).
+
+        Uses the concat demuxer over the same input with inpoint/outpoint, so the
+        cut-out silences are never decoded. ``stream_copy`` copies all streams
+        (transcription audio); otherwise the trim codec settings apply.
+        """
+        if not ranges or any(end <= start for start, end in ranges):
+            logger.error(f"Compact rejected: invalid ranges {ranges}")
+            return False
+        input_path = str(input_path)
+        output_path = str(output_path)
+
+        if stream_copy:
+            output_args = ["-map", "0", "-c", "copy"]
+        else:
+            try:
+                info = await self.get_video_info(input_path)
+            except Exception as e:
+                logger.error(f"Cannot probe input file before compact: {e}")
+                return False
+            output_args = self._output_args(
+                has_video=bool(info.get("video_codec")), has_audio=bool(info.get("audio_codec"))
+            )
+
+        list_path = Path(output_path).with_name(Path(output_path).name + ".ffconcat")
+        list_path.write_text(concat_list(input_path, ranges), encoding="utf-8")
+        cmd = [
+            "ffmpeg",
+            *_FFMPEG_LOG_ARGS,
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_path),
+            *output_args,
+            "-y",
+            output_path,
+        ]
 
         try:
             process = await asyncio.create_subprocess_exec(
@@ -274,19 +352,20 @@ class VideoProcessor:
             _stdout, stderr = await process.communicate()
 
             if process.returncode != 0:
-                logger.error(f"FFmpeg trimming failed: {_format_ffmpeg_stderr(stderr)}")
+                logger.error(f"FFmpeg compact failed: {_format_ffmpeg_stderr(stderr)}")
                 return False
 
             if Path(output_path).exists():
                 return True
 
-            logger.error(f"Trimmed video not created: {output_path}")
+            logger.error(f"Compacted file not created: {output_path}")
             return False
 
         except Exception as e:
-            logger.error(f"Video trimming error: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error(f"Compact error: {e}")
             return False
+        finally:
+            list_path.unlink(missing_ok=True)
 
     async def process_segment(self, segment: VideoSegment, input_path: str) -> bool:
         """Process single video segment."""
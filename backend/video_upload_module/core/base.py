@@ -6,6 +6,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from logger import get_logger
+from utils.upload_streams import ProgressCallback
+
+logger = get_logger()
+
 
 @dataclass
 class UploadResult:
@@ -72,6 +77,21 @@ class BaseUploader(ABC):
 
         return True, "OK"
 
+    @staticmethod
+    def _progress_callback(progress, task_id) -> ProgressCallback | None:
+        """Byte-level upload progress → percent on a rich-style ``progress`` task."""
+        if not progress or task_id is None:
+            return None
+
+        def update(sent: int, total: int) -> None:
+            try:
+                if task_id in progress.task_ids:
+                    progress.update(task_id, completed=int(sent * 100 / total) if total else 100, total=100)
+            except Exception as e:
+                logger.warning(f"Progress update failed: {e}")
+
+        return update
+
     def _create_result(
         self,
         video_id: str,
@@ -99,3 +119,14 @@ class BaseUploader(ABC):
     ) -> bool:
         """Upload captions (not implemented by default)."""
         return False
+
+    async def update_video(
+        self,
+        video_id: str,  # noqa: ARG002
+        *,
+        title: str | None = None,  # noqa: ARG002
+        description: str | None = None,  # noqa: ARG002
+        **kwargs,  # noqa: ARG002
+    ) -> bool:
+        """Update metadata/visibility of an uploaded video (not implemented by default)."""
+        return False
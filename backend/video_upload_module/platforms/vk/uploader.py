@@ -8,6 +8,8 @@ from typing import Any
 import httpx
 
 from logger import get_logger
+from utils.http_clients import api_endpoint, get_http_client
+from utils.upload_streams import multipart_file_body
 
 from ...config_factory import VKConfig
 from ...core.base import BaseUploader, UploadResult
@@ -100,28 +102,29 @@ class VKUploader(BaseUploader):
     async def _validate_token(self) -> bool:
         """Validate VK access token."""
         try:
-            async with httpx.AsyncClient() as client:
-                params = {"access_token": self.config.access_token, "v": "5.131"}
-                response = await client.post(f"{self.base_url}/users.get", data=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if "error" in data:
-                        error_info = data["error"]
-                        error_code = error_info.get("error_code")
-                        error_msg = error_info.get("error_msg", "Unknown error")
-
-                        # Token errors are expected, not critical
-                        if error_code in (5, 28):
-                            logger.warning(f"VK token invalid or expired: {error_msg}")
-                        else:
-                            logger.error(f"VK API Error [{error_code}]: {error_msg}")
-                        return False
-                    self._authenticated = True
-                    logger.info("VK authentication successful")
-                    return True
-                logger.warning(f"VK API HTTP error: {response.status_code}")
-                return False
+            params = {"access_token": self.config.access_token, "v": "5.131"}
+            response = await get_http_client("vk").post(
+                f"{self.base_url}/users.get", data=params, extensions=api_endpoint("users.get")
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                if "error" in data:
+                    error_info = data["error"]
+                    error_code = error_info.get("error_code")
+                    error_msg = error_info.get("error_msg", "Unknown error")
+
+                    # Token errors are expected, not critical
+                    if error_code in (5, 28):
+                        logger.warning(f"VK token invalid or expired: {error_msg}")
+                    else:
+                        logger.error(f"VK API Error [{error_code}]: {error_msg}")
+                    return False
+                self._authenticated = True
+                logger.info("VK authentication successful")
+                return True
+            logger.warning(f"VK API HTTP error: {response.status_code}")
+            return False
         except Exception as e:
             logger.error(f"VK token validation exception: {e}")
             return False
@@ -198,6 +201,44 @@ class VKUploader(BaseUploader):
             logger.error(f"VK video upload error: {e}")
             return None
 
+    async def update_video(
+        self,
+        video_id: str,
+        *,
+        title: str | None = None,
+        description: str | None = None,
+        privacy_view: int | None = None,
+        owner_id: int | None = None,
+        **kwargs,  # noqa: ARG002
+    ) -> bool:
+        """Patch name/description and view privacy of an uploaded video (video.edit)."""
+        if not self._authenticated:
+            if not await self.authenticate():
+                return False
+
+        params: dict[str, Any] = {"video_id": video_id}
+        if owner_id:
+            params["owner_id"] = owner_id
+        if title:
+            params["name"] = title
+        if description is not None:
+            params["desc"] = description
+        if privacy_view is not None:
+            params["privacy_view"] = privacy_view
+
+        try:
+            response = await asyncio.wait_for(self._make_request("video.edit", params), timeout=30.0)
+
+            if response:
+                logger.info(f"Video updated | video={video_id} • privacy_view={privacy_view}")
+                return True
+            logger.error(f"Video update error: {video_id}")
+            return False
+
+        except TimeoutError:
+            logger.error(f"Timeout updating video {video_id}")
+            return False
+
     async def get_video_info(self, video_id: str) -> dict[str, Any] | None:
         """Get video information."""
         if not self._authenticated:
@@ -297,7 +338,7 @@ class VKUploader(BaseUploader):
     async def _upload_video_file(
         self, upload_url: str, video_path: str, progress=None, task_id=None
     ) -> dict[str, Any] | None:
-        """Upload video file to VK using streaming for large files."""
+        """Stream the video file to VK as multipart/form-data (one buffer in memory)."""
         try:
             file_size = Path(video_path).stat().st_size
             logger.info(f"Uploading video file | size={file_size / (1024**2):.1f}MB")
@@ -306,32 +347,32 @@ class VKUploader(BaseUploader):
             timeout_seconds = 600 + (file_size // (1024**3)) * 120
             timeout = httpx.Timeout(timeout_seconds, read=300.0)
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                with Path(video_path).open("rb") as video_file:
-                    files = {"video_file": (Path(video_path).name, video_file)}
-
-                    response = await client.post(upload_url, files=files)
-
-                    if response.status_code == 200:
-                        result_data = response.json()
+            headers, body = multipart_file_body(
+                "video_file",
+                Path(video_path),
+                on_progress=self._progress_callback(progress, task_id),
+            )
+            response = await get_http_client("vk").post(
+                upload_url,
+                content=body,
+                headers=headers,
+                timeout=timeout,
+                extensions=api_endpoint("video.upload"),
+            )
 
-                        if "error" in result_data:
-                            logger.error(f"VK Upload Error: {result_data['error']}")
-                            return None
+            if response.status_code == 200:
+                result_data = response.json()
 
-                        if progress and task_id is not None:
-                            try:
-                                if task_id in progress.task_ids:
-                                    progress.update(task_id, completed=100, total=100)
-                            except Exception as e:
-                                logger.warning(f"Progress update failed: {e}")
+                if "error" in result_data:
+                    logger.error(f"VK Upload Error: {result_data['error']}")
+                    return None
 
-                        logger.info(f"Video uploaded | video={result_data.get('video_id')}")
-                        return result_data
+                logger.info(f"Video uploaded | video={result_data.get('video_id')}")
+                return result_data
 
-                    error_text = response.text
-                    logger.error(f"VK upload failed: HTTP {response.status_code}, {error_text[:200]}")
-                    return None
+            error_text = response.text
+            logger.error(f"VK upload failed: HTTP {response.status_code}, {error_text[:200]}")
+            return None
 
         except httpx.TimeoutException:
             logger.error(f"Upload timeout after {timeout_seconds}s for file {Path(video_path).name}")
@@ -347,30 +388,31 @@ class VKUploader(BaseUploader):
         params["v"] = "5.131"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(f"{self.base_url}/{method}", data=params)
+            response = await get_http_client("vk").post(
+                f"{self.base_url}/{method}", data=params, extensions=api_endpoint(method)
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
+            if response.status_code == 200:
+                data = response.json()
 
-                    # Return full response to allow decorator to check for token errors
-                    if "error" in data:
-                        error_info = data["error"]
-                        error_code = error_info.get("error_code")
+                # Return full response to allow decorator to check for token errors
+                if "error" in data:
+                    error_info = data["error"]
+                    error_code = error_info.get("error_code")
 
-                        # Token errors - let decorator handle them
-                        if error_code in (5, 28):
-                            return data
+                    # Token errors - let decorator handle them
+                    if error_code in (5, 28):
+                        return data
 
-                        # Other errors
-                        logger.error(f"VK API Error: {error_info}")
-                        return None
+                    # Other errors
+                    logger.error(f"VK API Error: {error_info}")
+                    return None
 
-                    return data.get("response")
+                return data.get("response")
 
-                error_text = response.text
-                logger.error(f"HTTP Error: {response.status_code}, Response: {error_text[:500]}")
-                return None
+            error_text = response.text
+            logger.error(f"HTTP Error: {response.status_code}, Response: {error_text[:500]}")
+            return None
         except TokenRefreshError:
             raise
         except Exception as e:
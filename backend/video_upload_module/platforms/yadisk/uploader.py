@@ -12,6 +12,7 @@ from video_upload_module.core.base import BaseUploader, UploadResult
 from yandex_disk_module.client import YandexDiskClient, YandexDiskError
 
 if TYPE_CHECKING:
+    from utils.upload_streams import ProgressCallback
     from video_upload_module.credentials_provider import DatabaseCredentialProvider
 
 logger = get_logger()
@@ -84,8 +85,8 @@ class YandexDiskUploader(BaseUploader):
         video_path: str,
         title: str,
         description: str = "",  # noqa: ARG002
-        progress=None,  # noqa: ARG002
-        task_id=None,  # noqa: ARG002
+        progress=None,
+        task_id=None,
         **kwargs,
     ) -> UploadResult | None:
         """Upload video to Yandex Disk.
@@ -117,17 +118,18 @@ class YandexDiskUploader(BaseUploader):
 
         await self._maybe_refresh_before_request()
         client = YandexDiskClient(oauth_token=self.oauth_token)
+        on_progress = self._progress_callback(progress, task_id)
 
         try:
             return await self._do_upload(
-                client, local_path, disk_path, folder_path, filename, overwrite, publish, title
+                client, local_path, disk_path, folder_path, filename, overwrite, publish, title, on_progress
             )
         except YandexDiskError as e:
             if e.status_code == 401 and await self._try_refresh_token():
                 client = YandexDiskClient(oauth_token=self.oauth_token)
                 try:
                     return await self._do_upload(
-                        client, local_path, disk_path, folder_path, filename, overwrite, publish, title
+                        client, local_path, disk_path, folder_path, filename, overwrite, publish, title, on_progress
                     )
                 except YandexDiskError as e2:
                     logger.error(f"Yandex Disk upload failed after refresh: {e2}")
@@ -161,11 +163,13 @@ class YandexDiskUploader(BaseUploader):
         overwrite: bool,
         publish: bool,
         title: str,
+        on_progress: ProgressCallback | None = None,
     ) -> UploadResult:
         success = await client.upload_file(
             local_path=local_path,
             disk_path=disk_path,
             overwrite=overwrite,
+            on_progress=on_progress,
         )
 
         if not success:
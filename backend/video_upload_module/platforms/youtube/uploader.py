@@ -185,9 +185,11 @@ class YouTubeUploader(BaseUploader):
             assert self.service is not None, "Service not initialized"
             request = self.service.videos().insert(part=",".join(body.keys()), body=body, media_body=media)
 
+            # Chunks go through the executor: a blocking call here would stall the worker loop
+            loop = asyncio.get_event_loop()
             response = None
             while response is None:
-                status, response = request.next_chunk()
+                status, response = await loop.run_in_executor(None, request.next_chunk)
                 if status:
                     upload_progress = int(status.progress() * 100)
                     if progress and task_id is not None:
@@ -324,6 +326,76 @@ class YouTubeUploader(BaseUploader):
             logger.error(f"Caption upload error: {e}")
             return False
 
+    @requires_valid_token(max_retries=1)
+    async def update_video(
+        self,
+        video_id: str,
+        *,
+        title: str | None = None,
+        description: str | None = None,
+        privacy_status: str | None = None,
+        publish_at: str | None = None,
+        **kwargs,  # noqa: ARG002
+    ) -> bool:
+        """Patch title/description and visibility of an uploaded video."""
+        if not self._authenticated:
+            if not await self.authenticate():
+                return False
+
+        try:
+            assert self.service is not None, "Service not initialized"
+            loop = asyncio.get_event_loop()
+            # videos.update replaces the whole part: start from the current snippet/status
+            # (snippet.categoryId is required on update)
+            request = self.service.videos().list(part="snippet,status", id=video_id)
+            response = await asyncio.wait_for(loop.run_in_executor(None, request.execute), timeout=30.0)
+            if not response.get("items"):
+                logger.error(f"Video not found for update: {video_id}")
+                return False
+
+            video = response["items"][0]
+            snippet = {
+                key: video["snippet"][key]
+                for key in ("title", "description", "categoryId", "tags", "defaultLanguage", "defaultAudioLanguage")
+                if key in video["snippet"]
+            }
+            if title:
+                snippet["title"] = title
+            if description is not None:
+                snippet["description"] = _sanitize_youtube_description(description)
+
+            status = {
+                key: video["status"][key]
+                for key in ("privacyStatus", "embeddable", "license", "publicStatsViewable", "selfDeclaredMadeForKids")
+                if key in video["status"]
+            }
+            if privacy_status:
+                status["privacyStatus"] = privacy_status
+            if publish_at:
+                status["publishAt"] = publish_at
+                status["privacyStatus"] = "private"
+
+            request = self.service.videos().update(
+                part="snippet,status", body={"id": video_id, "snippet": snippet, "status": status}
+            )
+            await asyncio.wait_for(loop.run_in_executor(None, request.execute), timeout=60.0)
+
+            logger.info(f"Video updated | video={video_id} • privacy={status.get('privacyStatus')}")
+            return True
+
+        except TimeoutError:
+            logger.error(f"Timeout updating video {video_id}")
+            return False
+        except TokenRefreshError as e:
+            logger.error(f"Token error during update_video: {e}")
+            return False
+        except HttpError as e:
+            logger.error(f"YouTube API error during update: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Video update error: {e}")
+            return False
+
     @requires_valid_token(max_retries=1)
     async def get_video_info(self, video_id: str) -> dict[str, Any] | None:
         """Get video information."""
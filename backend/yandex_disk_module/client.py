@@ -8,6 +8,8 @@ import httpx
 
 from config.settings import storage_video_ingress_suffixes
 from logger import format_details, get_logger
+from utils.http_clients import api_endpoint, get_http_client
+from utils.upload_streams import ProgressCallback, file_upload_headers, iter_file_chunks
 
 logger = get_logger(__name__)
 
@@ -55,42 +57,43 @@ class YandexDiskClient:
             return {}
         return {"Authorization": f"OAuth {self.oauth_token}"}
 
-    def _build_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout=60.0, connect=15.0, read=30.0),
-            follow_redirects=True,
-        )
+    def _client(self) -> httpx.AsyncClient:
+        """Shared keep-alive pool for Disk API calls (do not close)."""
+        return get_http_client("yandex_disk")
 
     async def _request(self, method: str, url: str, **kwargs) -> dict[str, Any]:
         """Make an authenticated API request."""
         headers = kwargs.pop("headers", {})
         merged = {**self._json_headers(), **headers}
 
-        async with self._build_client() as client:
-            response = await client.request(method, url, headers=merged, **kwargs)
-
-            if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    msg = error_data.get("message", error_data.get("description", response.text))
-                    err = error_data.get("error")
-                    desc = error_data.get("description")
-                except Exception:
-                    msg = response.text
-                    err = None
-                    desc = None
-                raise YandexDiskError(
-                    f"Yandex Disk API error: {msg}",
-                    response.status_code,
-                    error_code=err,
-                    description=desc if isinstance(desc, str) else None,
-                )
-
-            if response.status_code == 204:
-                return {}
-            if not response.content:
-                return {}
-            return response.json()
+        # Stable metric label: API path without the base (resource paths travel in params)
+        endpoint = (url.removeprefix(BASE_URL) or "/disk") if url.startswith(BASE_URL) else method.lower()
+        response = await self._client().request(
+            method, url, headers=merged, extensions=api_endpoint(endpoint), **kwargs
+        )
+
+        if response.status_code >= 400:
+            try:
+                error_data = response.json()
+                msg = error_data.get("message", error_data.get("description", response.text))
+                err = error_data.get("error")
+                desc = error_data.get("description")
+            except Exception:
+                msg = response.text
+                err = None
+                desc = None
+            raise YandexDiskError(
+                f"Yandex Disk API error: {msg}",
+                response.status_code,
+                error_code=err,
+                description=desc if isinstance(desc, str) else None,
+            )
+
+        if response.status_code == 204:
+            return {}
+        if not response.content:
+            return {}
+        return response.json()
 
     # --- Disk / resource metadata ---
 
@@ -374,8 +377,9 @@ class YandexDiskClient:
         local_path: Path,
         disk_path: str,
         overwrite: bool = False,
+        on_progress: ProgressCallback | None = None,
     ) -> bool:
-        """Upload a local file to Yandex Disk (two-step: get URL, then PUT)."""
+        """Upload a local file to Yandex Disk (two-step: get URL, then streamed PUT)."""
         if not local_path.exists():
             raise FileNotFoundError(f"Local file not found: {local_path}")
 
@@ -388,18 +392,21 @@ class YandexDiskClient:
 
         logger.info(f"Uploading {local_path.name} to {disk_path}")
 
-        async with self._build_client() as client:
-            with local_path.open("rb") as f:
-                response = await client.put(upload_url, content=f)
+        response = await self._client().put(
+            upload_url,
+            content=iter_file_chunks(local_path, on_progress=on_progress),
+            headers=file_upload_headers(local_path),
+            extensions=api_endpoint("upload"),
+        )
 
-            if response.status_code in (201, 202):
-                logger.info(f"Uploaded {local_path.name} to {disk_path}")
-                return True
+        if response.status_code in (201, 202):
+            logger.info(f"Uploaded {local_path.name} to {disk_path}")
+            return True
 
-            raise YandexDiskError(
-                f"Upload failed with status {response.status_code}: {response.text}",
-                response.status_code,
-            )
+        raise YandexDiskError(
+            f"Upload failed with status {response.status_code}: {response.text}",
+            response.status_code,
+        )
 
     async def _ensure_folder_exists(self, path: str) -> None:
         """Create folder and all parent folders if needed."""
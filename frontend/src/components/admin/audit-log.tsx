@@ -36,6 +36,7 @@ const ACTION_LABELS: Record<string, string> = {
   "plan.created": "Plan created",
   "plan.updated": "Plan updated",
   "plan.deleted": "Plan deleted",
+  "transcription_cache.evicted": "Transcription cache evicted",
 };
 
 /** Renders `{field: {from, to}}` as "field: a → b", falling back to raw values. */